@@ -11,7 +11,8 @@ import atexit
 from pathlib import Path
 
 from src.api.v1.api import api_router
-from src.core.db import init_db
+from src.core.db import dispose_async_engine, init_db
+from src.services.db_maintenance_service import get_db_maintenance_service
 
 # 데이터베이스 초기화
 from contextlib import asynccontextmanager
@@ -21,9 +22,12 @@ async def lifespan(app: FastAPI):
     """애플리케이션 생명주기 관리"""
     # 시작 시 실행
     init_db()
+    maintenance = get_db_maintenance_service()
+    maintenance.start()
     yield
-    # 종료 시 실행 (필요시)
-    pass
+    # 종료 시 실행
+    maintenance.shutdown()
+    await dispose_async_engine()
 
 # FastAPI 애플리케이션 생성 (수정)
 app = FastAPI(
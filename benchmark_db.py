@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+SQLite 동시 쓰기 벤치마크 스크립트
+
+여러 프로세스(API, 배치 스케줄러 등)와 스레드가 같은 SQLite 파일에 동시에
+실행 기록(run 생성 → 메시지 저장 → 종료)을 쓰고, 다른 스레드가 실행 목록/통계를 읽는 부하를
+SQLite 연결 프로필별(SQLITE_PROFILE=default, wal)로 실행하고
+초당 쓰기 수, 쓰기 지연(p50/p95/최대), "database is locked" 오류 수를 비교합니다.
+
+실행 방법:
+    python benchmark_db.py
+    python benchmark_db.py --processes 3 --threads 4 --readers 2 --duration 15
+    python benchmark_db.py --profiles wal --messages-per-run 50
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from multiprocessing import get_context
+from typing import Any, Callable, Dict, List, Optional
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="SQLite 동시 쓰기 벤치마크")
+    parser.add_argument("--profiles", default="default,wal", help="비교할 SQLite 연결 프로필 (default, wal)")
+    parser.add_argument("--processes", type=int, default=2, help="DB를 공유하는 프로세스 수")
+    parser.add_argument("--threads", type=int, default=4, help="프로세스당 쓰기 스레드 수")
+    parser.add_argument("--readers", type=int, default=2, help="프로세스당 읽기 스레드 수")
+    parser.add_argument("--duration", type=float, default=10.0, help="프로필별 실행 시간 (초)")
+    parser.add_argument("--messages-per-run", type=int, default=20, help="실행(run) 하나에 저장할 메시지 수")
+    parser.add_argument("--message-chars", type=int, default=800, help="메시지 하나의 길이 (문자 수)")
+    parser.add_argument("--dir", default=None, help="벤치마크 DB를 만들 디렉터리 (기본: 임시 디렉터리)")
+    return parser.parse_args()
+
+
+def percentile(samples: List[float], p: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(p / 100 * (len(ordered) - 1))))]
+
+
+def init_worker(db_url: str, profile: str) -> None:
+    """src 모듈을 불러오기 전에 벤치마크용 DB와 연결 프로필을 설정 (프로세스마다 한 번)"""
+    os.environ["DATABASE_URL"] = db_url
+    os.environ["SQLITE_PROFILE"] = profile
+
+
+def prepare_db() -> None:
+    from src.core.db import init_db
+
+    init_db()
+
+
+def run_worker(worker_id: int, args: argparse.Namespace, start_at: float) -> Dict[str, Any]:
+    """한 프로세스 안에서 쓰기/읽기 스레드를 실행하고 결과를 모아 반환"""
+    from sqlalchemy.exc import OperationalError
+
+    from src.core.db import SessionLocal
+    from src.repositories.agent_logs import AgentMessageRepository, AgentRunRepository
+
+    content = "벤치마크 메시지 " * (args.message_chars // 9 + 1)
+    content = content[:args.message_chars]
+    lock = threading.Lock()
+    result: Dict[str, Any] = {"writes": 0, "runs": 0, "reads": 0, "locked": 0, "errors": 0, "write_latencies": []}
+
+    def record(key: str, latency: Optional[float] = None) -> None:
+        with lock:
+            result[key] += 1
+            if latency is not None:
+                result["write_latencies"].append(latency)
+
+    def timed_write(fn: Callable[[], Any]) -> Any:
+        """쓰기 하나를 실행하고 지연을 기록 (잠금 오류는 세고 건너뜀)"""
+        started = time.perf_counter()
+        try:
+            value = fn()
+            record("writes", time.perf_counter() - started)
+            return value
+        except OperationalError as e:
+            record("locked" if "locked" in str(e) else "errors")
+            raise
+
+    def writer(thread_id: int) -> None:
+        db = SessionLocal()
+        run_repo = AgentRunRepository(db)
+        msg_repo = AgentMessageRepository(db)
+        team_name = f"bench_team_{thread_id % 3}"
+        while time.time() < deadline:
+            try:
+                run = timed_write(lambda: run_repo.create(team_name=team_name, task=f"벤치마크 작업 {worker_id}-{thread_id}"))
+                for index in range(args.messages_per_run):
+                    timed_write(lambda: msg_repo.add(run.id, f"agent_{index % 2}", "assistant", content))
+                timed_write(lambda: run_repo.finish(run.id, status="completed"))
+                record("runs")
+            except OperationalError:
+                db.rollback()
+        db.close()
+
+    def reader() -> None:
+        db = SessionLocal()
+        run_repo = AgentRunRepository(db)
+        while time.time() < deadline:
+            try:
+                run_repo.list_summaries(limit=50)
+                run_repo.team_statistics("bench_team_0", since=datetime.utcnow() - timedelta(hours=1))
+                db.rollback()  # 읽기 트랜잭션을 끝내 다음 조회가 최신 데이터를 보도록 함
+                record("reads")
+            except OperationalError as e:
+                db.rollback()
+                record("locked" if "locked" in str(e) else "errors")
+        db.close()
+
+    # 모든 프로세스가 같은 시각에 시작하도록 대기
+    time.sleep(max(0.0, start_at - time.time()))
+    deadline = start_at + args.duration
+    threads = [threading.Thread(target=writer, args=(index,)) for index in range(args.threads)]
+    threads += [threading.Thread(target=reader) for _ in range(args.readers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return result
+
+
+def run_profile(profile: str, args: argparse.Namespace, base_dir: str) -> Dict[str, Any]:
+    db_path = os.path.join(base_dir, f"bench_{profile}.db")
+    for suffix in ("", "-wal", "-shm", "-journal"):
+        if os.path.exists(db_path + suffix):
+            os.remove(db_path + suffix)
+    db_url = f"sqlite:///{db_path}"
+
+    with ProcessPoolExecutor(
+        max_workers=args.processes,
+        mp_context=get_context("spawn"),
+        initializer=init_worker,
+        initargs=(db_url, profile),
+    ) as executor:
+        executor.submit(prepare_db).result()
+        # 프로세스 시작/모듈 임포트 시간이 측정에 섞이지 않도록 잠시 뒤에 함께 시작
+        start_at = time.time() + 3.0
+        futures = [executor.submit(run_worker, index, args, start_at) for index in range(args.processes)]
+        results = [future.result() for future in futures]
+
+    total: Dict[str, Any] = {"writes": 0, "runs": 0, "reads": 0, "locked": 0, "errors": 0, "write_latencies": []}
+    for result in results:
+        for key, value in result.items():
+            total[key] += value
+    return total
+
+
+def main(args: argparse.Namespace) -> None:
+    base_dir = args.dir or tempfile.mkdtemp(prefix="db_bench_")
+    profiles = [profile.strip() for profile in args.profiles.split(",") if profile.strip()]
+
+    print("=" * 80)
+    print(f"🏁 SQLite 동시 쓰기 벤치마크 (프로세스 {args.processes} x 쓰기 스레드 {args.threads} + 읽기 스레드 {args.readers}, "
+          f"{args.duration:g}초, 실행당 메시지 {args.messages_per_run}개)")
+    print(f"🗄️ 벤치마크 DB 디렉터리: {base_dir}")
+    print("=" * 80)
+
+    summaries = {}
+    for profile in profiles:
+        total = run_profile(profile, args, base_dir)
+        latencies = total["write_latencies"]
+        summaries[profile] = total["writes"] / args.duration
+        print(f"\n📊 [{profile}] 쓰기 {total['writes']}회 (초당 {total['writes'] / args.duration:.1f}회), "
+              f"완료한 실행 {total['runs']}개, 읽기 {total['reads']}회 (초당 {total['reads'] / args.duration:.1f}회)")
+        print(f"   - 쓰기 지연 p50 {1000 * percentile(latencies, 50):.1f}ms / p95 {1000 * percentile(latencies, 95):.1f}ms / "
+              f"최대 {1000 * max(latencies, default=0.0):.1f}ms")
+        print(f"   - database is locked 오류 {total['locked']}회, 기타 DB 오류 {total['errors']}회")
+
+    if "default" in summaries and "wal" in summaries and summaries["default"]:
+        print(f"\n⚡ wal 프로필 쓰기 처리량: default 대비 {summaries['wal'] / summaries['default']:.1f}배")
+    print("\n" + "=" * 80)
+    print("벤치마크 완료!")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    main(parse_args())
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+오케스트레이터 처리량 벤치마크 스크립트
+
+스크립트 기반 가짜 모델 클라이언트(MODEL_CLIENT_BACKEND=scripted)로 Gemini 할당량 없이
+run_team_task, TeamManager.run_hierarchical_task, AdvancedTeamManager.execute_workflow를
+N개씩 동시에 실행하고 지연 시간(p50/p95), 초당 메시지 수, DB 기록 오버헤드,
+프롬프트 캐시 적중 토큰 비율(직전 요청과 겹치는 앞부분 기준 근사치)을 출력합니다.
+
+실행 방법:
+    python benchmark_orchestrator.py --concurrency 8
+    python benchmark_orchestrator.py --targets team,advanced --latency-mean 0.05 --turns 6
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+from typing import Awaitable, Callable, Dict, List
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="오케스트레이터 처리량 벤치마크")
+    parser.add_argument("--targets", default="team,hierarchical,advanced", help="실행할 대상 (team, hierarchical, advanced)")
+    parser.add_argument("--concurrency", type=int, default=4, help="대상별 동시 실행 수")
+    parser.add_argument("--distribution", default="lognormal", choices=["fixed", "uniform", "lognormal"], help="모델 응답 지연 분포")
+    parser.add_argument("--latency-mean", type=float, default=0.1, help="모델 응답 평균 지연 (초)")
+    parser.add_argument("--latency-stddev", type=float, default=0.03, help="모델 응답 지연 표준편차 (초)")
+    parser.add_argument("--turns", type=int, default=4, help="팀 실행을 끝낼 대화 메시지 수")
+    parser.add_argument("--completion-tokens", type=int, default=150, help="응답당 출력 토큰 수")
+    parser.add_argument("--tool-calls", action="store_true", help="도구 호출 포함 (SEARCH_BACKEND=local 권장)")
+    parser.add_argument("--db", default=None, help="벤치마크용 SQLite 파일 경로 (기본: 임시 파일)")
+    parser.add_argument("--verbose", action="store_true", help="팀 실행 로그 출력")
+    return parser.parse_args()
+
+
+def configure_environment(args: argparse.Namespace) -> None:
+    """src 모듈을 불러오기 전에 가짜 모델 클라이언트와 벤치마크용 DB를 설정"""
+    db_path = args.db or os.path.join(tempfile.mkdtemp(prefix="orchestrator_bench_"), "bench.db")
+    os.environ["DATABASE_URL"] = f"sqlite:///{db_path}"
+    os.environ["MODEL_CLIENT_BACKEND"] = "scripted"
+    os.environ["MODEL_ROUTING_ENABLED"] = "false"
+    os.environ["SCRIPTED_MODEL_LATENCY_DISTRIBUTION"] = args.distribution
+    os.environ["SCRIPTED_MODEL_LATENCY_MEAN_SECONDS"] = str(args.latency_mean)
+    os.environ["SCRIPTED_MODEL_LATENCY_STDDEV_SECONDS"] = str(args.latency_stddev)
+    os.environ["SCRIPTED_MODEL_TURNS_BEFORE_TERMINATE"] = str(args.turns)
+    os.environ["SCRIPTED_MODEL_COMPLETION_TOKENS"] = str(args.completion_tokens)
+    os.environ["SCRIPTED_MODEL_TOOL_CALLS"] = "true" if args.tool_calls else "false"
+    print(f"🗄️ 벤치마크 DB: {db_path}")
+
+
+def percentile(samples: List[float], p: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(p / 100 * (len(ordered) - 1))))]
+
+
+async def main(args: argparse.Namespace) -> None:
+    from src.core.db import SessionLocal, init_db
+    from src.repositories.agent_logs import AgentMessageRepository, AgentRunRepository
+    from src.repositories.agent_message_writer import get_agent_message_writer
+    from src.ai.agents.base import create_model_client
+    from src.ai.agents.prompt_cache import get_prompt_cache_stats
+    from src.ai.agents.web_search_agent import create_web_search_agent
+    from src.ai.agents.data_analyst_agent import create_data_analyst_agent
+    from src.ai.orchestrator.team import create_team, run_team_task
+    from src.ai.orchestrator.hierarchical_team import TeamManager
+    from src.ai.orchestrator.advanced_team import get_advanced_team_manager, shutdown_advanced_team_managers
+
+    class TimedMessageRepository(AgentMessageRepository):
+        """팀 실행 루프 안의 메시지 기록 시간을 측정하는 저장소 (실제 저장은 쓰기 스레드에서 수행)"""
+
+        def __init__(self, db):
+            super().__init__(db)
+            self.write_count = 0
+            self.write_seconds = 0.0
+
+        def enqueue(self, *args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return super().enqueue(*args, **kwargs)
+            finally:
+                self.write_seconds += time.perf_counter() - started
+                self.write_count += 1
+
+    init_db()
+    db = SessionLocal()
+    run_repo = AgentRunRepository(db)
+    model_client = create_model_client()
+    task = "2024년 국내 전기차 판매량 추세를 분석하고 전망을 정리해줘"
+
+    def prompt_cache_totals() -> Dict[str, int]:
+        stats = get_prompt_cache_stats().values()
+        return {key: sum(item[key] for item in stats) for key in ("prompt_tokens", "cached_tokens")}
+
+    async def run_single_team(run_id: int, msg_repo: AgentMessageRepository) -> None:
+        team = create_team([create_web_search_agent(model_client), create_data_analyst_agent(model_client)], model_client)
+        await run_team_task(team, task, run_id, msg_repo)
+
+    async def run_hierarchical(run_id: int, msg_repo: AgentMessageRepository) -> None:
+        # TeamManager의 팀은 동시에 두 번 실행할 수 없으므로 실행마다 생성
+        team_manager = TeamManager(model_client)
+        await team_manager.run_hierarchical_task(team_manager.create_auto_task(task), run_id, msg_repo)
+
+    async def run_advanced(run_id: int, msg_repo: AgentMessageRepository) -> None:
+        # 운영과 같이 캐시된 관리자 하나를 공유 (같은 팀에 대한 동시 요청은 팀 인스턴스 풀에서 빌린 인스턴스로 병렬 실행)
+        result = await get_advanced_team_manager(model_client).execute_workflow("standard_analysis", task, run_id, msg_repo)
+        if not result.success:
+            raise RuntimeError(str(result.errors))
+
+    targets: Dict[str, Callable[[int, AgentMessageRepository], Awaitable[None]]] = {
+        "team": run_single_team,
+        "hierarchical": run_hierarchical,
+        "advanced": run_advanced,
+    }
+
+    print("=" * 80)
+    print(f"🏁 오케스트레이터 벤치마크 (동시 실행 {args.concurrency}, 모델 지연 {args.distribution} "
+          f"평균 {args.latency_mean}s, 종료 턴 {args.turns})")
+    print("=" * 80)
+
+    for name in [target.strip() for target in args.targets.split(",") if target.strip()]:
+        if name not in targets:
+            print(f"❌ 알 수 없는 대상: {name}")
+            continue
+
+        msg_repo = TimedMessageRepository(db)
+        run_ids = [run_repo.create(team_name=f"bench_{name}", task=task, model="scripted").id for _ in range(args.concurrency)]
+        latencies: List[float] = []
+        failures: List[str] = []
+        calls_before = model_client.call_count
+        writer_before = get_agent_message_writer().get_stats()
+        cache_before = prompt_cache_totals()
+
+        async def timed_run(run_id: int) -> None:
+            started = time.perf_counter()
+            try:
+                await targets[name](run_id, msg_repo)
+                latencies.append(time.perf_counter() - started)
+            except Exception as e:
+                failures.append(str(e))
+
+        output = contextlib.nullcontext() if args.verbose else contextlib.redirect_stdout(io.StringIO())
+        wall_started = time.perf_counter()
+        with output:
+            await asyncio.gather(*(timed_run(run_id) for run_id in run_ids))
+        wall = time.perf_counter() - wall_started
+
+        for run_id in run_ids:
+            run_repo.finish(run_id, status="completed")
+
+        model_calls = model_client.call_count - calls_before
+        writer_after = get_agent_message_writer().get_stats()
+        batches = writer_after["batches"] - writer_before["batches"]
+        background_seconds = writer_after["write_seconds"] - writer_before["write_seconds"]
+        cache_after = prompt_cache_totals()
+        prompt_tokens = cache_after["prompt_tokens"] - cache_before["prompt_tokens"]
+        cached_tokens = cache_after["cached_tokens"] - cache_before["cached_tokens"]
+        print(f"\n📊 [{name}] 실행 {len(latencies)}/{args.concurrency} 성공, 전체 {wall:.2f}s")
+        print(f"   - 실행 지연 p50 {percentile(latencies, 50):.3f}s / p95 {percentile(latencies, 95):.3f}s")
+        print(f"   - 메시지 {msg_repo.write_count}개, 초당 {msg_repo.write_count / wall:.1f}개, 모델 호출 {model_calls}회")
+        print(f"   - 루프 내 메시지 기록 {msg_repo.write_seconds:.3f}s (메시지당 {1000 * msg_repo.write_seconds / max(msg_repo.write_count, 1):.3f}ms, "
+              f"전체 시간의 {100 * msg_repo.write_seconds / wall:.1f}%)")
+        print(f"   - 쓰기 스레드 저장 {batches}회, {background_seconds:.3f}s (평균 {msg_repo.write_count / max(batches, 1):.1f}개/회)")
+        print(f"   - 입력 토큰 {prompt_tokens}개 중 캐시 적중 {cached_tokens}개 ({100 * cached_tokens / max(prompt_tokens, 1):.1f}%)")
+        for failure in failures[:3]:
+            print(f"   ❌ {failure}")
+
+    await shutdown_advanced_team_managers()
+    db.close()
+    print("\n" + "=" * 80)
+    print("벤치마크 완료!")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    arguments = parse_args()
+    configure_environment(arguments)
+    asyncio.run(main(arguments))
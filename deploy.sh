@@ -33,7 +33,16 @@ echo "🧹 기존 컨테이너 정리 중..."
 docker stop dean-agent-app 2>/dev/null || true
 docker rm dean-agent-app 2>/dev/null || true
 
-# 4. 새 컨테이너 실행
+# 4. DB 디렉터리 준비 (WAL 모드의 -wal/-shm 파일이 DB 파일과 함께 보존되도록 디렉터리를 마운트)
+mkdir -p data
+if [ -f app.db ] && [ ! -f data/app.db ]; then
+    echo "📦 기존 app.db를 data/app.db로 옮깁니다."
+    mv app.db data/app.db
+    [ -f app.db-wal ] && mv app.db-wal data/app.db-wal
+    [ -f app.db-shm ] && mv app.db-shm data/app.db-shm
+fi
+
+# 5. 새 컨테이너 실행
 echo "🚀 새 컨테이너 실행 중..."
 docker run -d \
     --name dean-agent-app \
@@ -43,7 +52,8 @@ docker run -d \
     -e NOTION_API_KEY="$NOTION_API_KEY" \
     -e HOST=0.0.0.0 \
     -e PORT=8000 \
-    -v $(pwd)/app.db:/app/app.db \
+    -e DATABASE_URL=sqlite:////app/data/app.db \
+    -v $(pwd)/data:/app/data \
     --restart unless-stopped \
     dean-agent-framework
 
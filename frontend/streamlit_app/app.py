@@ -19,6 +19,9 @@ except ImportError:
 
 from frontend.streamlit_app.services.api import BackendAPIClient
 
+# 시간대별 실행 트렌드에 표시할 기간 (일)
+TREND_WINDOW_DAYS = 30
+
 
 def main():
     """스트림릿 메인 애플리케이션 (홈페이지)"""
@@ -64,20 +67,23 @@ def show_home_content():
         st.error(f"API 클라이언트 초기화 실패: {str(e)}")
         return
     
+    # 실행 현황은 서버 측 롤업 한 번 조회로 지표/차트에 함께 사용
+    overview = get_run_overview(client)
+    
     # 실시간 상태 대시보드
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
         st.metric(
             label="🟢 활성 실행",
-            value=get_active_runs_count(client),
+            value=overview.get('running_runs', 0),
             delta=None
         )
     
     with col2:
         st.metric(
             label="✅ 완료된 실행",
-            value=get_completed_runs_count(client),
+            value=overview.get('completed_runs', 0),
             delta=None
         )
     
@@ -128,12 +134,10 @@ def show_home_content():
     st.subheader("📈 실행 상태 분포")
     
     try:
-        all_runs = client.list_runs(limit=100)
-        if all_runs:
-            df = pd.DataFrame(all_runs)
-            
+        runs_by_status = overview.get('runs_by_status', {})
+        if runs_by_status:
             # 상태별 카운트
-            status_counts = df['status'].value_counts() if 'status' in df.columns else pd.Series()
+            status_counts = pd.Series(runs_by_status).sort_values(ascending=False)
             
             if not status_counts.empty:
                 if PLOTLY_AVAILABLE:
@@ -166,17 +170,16 @@ def show_home_content():
     st.subheader("⏰ 시간대별 실행 트렌드")
     
     try:
-        all_runs = client.list_runs(limit=200)
-        if all_runs:
-            df = pd.DataFrame(all_runs)
+        rollups = client.get_run_rollups(granularity="day", window_hours=TREND_WINDOW_DAYS * 24)
+        if rollups:
+            df = pd.DataFrame(rollups)
             
-            if 'started_at' in df.columns:
+            if 'bucket_start' in df.columns:
                 # 날짜 변환
-                df['started_at'] = pd.to_datetime(df['started_at'])
-                df['date'] = df['started_at'].dt.date
+                df['date'] = pd.to_datetime(df['bucket_start']).dt.date
                 
-                # 일별 카운트
-                daily_counts = df.groupby('date').size().reset_index(name='count')
+                # 일별 카운트 (상태별 롤업 합산)
+                daily_counts = df.groupby('date')['run_count'].sum().reset_index(name='count')
                 
                 if PLOTLY_AVAILABLE:
                     # 라인 차트
@@ -211,17 +214,13 @@ def show_home_content():
     st.subheader("👥 팀별 통계")
     
     try:
-        all_runs = client.list_runs(limit=100)
-        if all_runs:
-            df = pd.DataFrame(all_runs)
+        teams = overview.get('teams', [])
+        if teams:
+            df = pd.DataFrame(teams)
             
             if 'team_name' in df.columns:
-                team_stats = df.groupby('team_name').agg({
-                    'id': 'count',
-                    'status': lambda x: (x == 'completed').sum()
-                }).reset_index()
-                team_stats.columns = ['팀명', '총 실행', '완료']
-                team_stats['완료율'] = (team_stats['완료'] / team_stats['총 실행'] * 100).round(1)
+                team_stats = df[['team_name', 'total_runs', 'completed_runs', 'completion_rate']]
+                team_stats.columns = ['팀명', '총 실행', '완료', '완료율']
                 
                 st.dataframe(team_stats, use_container_width=True, hide_index=True)
             else:
@@ -233,24 +232,12 @@ def show_home_content():
         st.error(f"팀 통계 조회 실패: {str(e)}")
 
 
-def get_active_runs_count(client: BackendAPIClient) -> int:
-    """활성 실행 수 조회"""
+def get_run_overview(client: BackendAPIClient) -> dict:
+    """실행 현황 조회 (상태별/팀별 실행 수)"""
     try:
-        runs = client.list_runs(limit=100)
-        active_count = sum(1 for run in runs if run.get('status') == 'running')
-        return active_count
+        return client.get_run_overview()
     except:
-        return 0
-
-
-def get_completed_runs_count(client: BackendAPIClient) -> int:
-    """완료된 실행 수 조회"""
-    try:
-        runs = client.list_runs(limit=100)
-        completed_count = sum(1 for run in runs if run.get('status') == 'completed')
-        return completed_count
-    except:
-        return 0
+        return {}
 
 
 def get_registered_pages_count(client: BackendAPIClient) -> int:
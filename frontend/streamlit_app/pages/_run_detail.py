@@ -59,8 +59,8 @@ def main():
 
         # 실행 상세 정보 조회
         try:
-            # API를 통해 직접 실행 정보 조회
-            run_data = client.get_run(int(run_id))
+            # API를 통해 직접 실행 정보 조회 (전체 작업 내용 포함, 메시지는 아래에서 따로 조회)
+            run_data = client.get_run(int(run_id), include_messages=False)
             
             # 실행 기본 정보 표시
             show_run_overview(run_data)
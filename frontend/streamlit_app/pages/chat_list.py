@@ -2,6 +2,7 @@ import streamlit as st
 from datetime import datetime, timedelta
 import sys
 import os
+import html
 import urllib.parse
 
 # 프로젝트 루트 경로를 sys.path에 추가
@@ -52,6 +53,23 @@ def main():
     with col3:
         limit = st.number_input("조회 개수", min_value=10, max_value=1000, value=50)
     
+    # 내용 검색 (서버 측 전문 검색 인덱스 사용)
+    search_col1, search_col2 = st.columns([4, 1])
+    with search_col1:
+        search_query = st.text_input("🔎 내용 검색", placeholder="메시지 또는 작업 내용에서 검색할 단어")
+    with search_col2:
+        search_target = st.selectbox("검색 대상", ["messages", "runs"], format_func=lambda t: "메시지" if t == "messages" else "작업 내용")
+    
+    if search_query.strip():
+        show_search_results(
+            client,
+            search_query.strip(),
+            search_target,
+            None if team_filter == "전체" else team_filter,
+            int(limit),
+        )
+        return
+    
     # 실행 목록 조회
     try:
         # 필터 파라미터 설정
@@ -87,6 +105,37 @@ def main():
         st.error(f"실행 기록 조회 실패: {str(e)}")
 
 
+def show_search_results(client: BackendAPIClient, query: str, target: str, team_name, limit: int):
+    """검색 결과를 관련도 순으로 표시"""
+    try:
+        result = client.search_logs(query, target=target, team_name=team_name, limit=min(limit, 100))
+    except Exception as e:
+        st.error(f"검색 실패: {str(e)}")
+        return
+    
+    items = result.get('items', [])
+    if not items:
+        st.info(f"'{query}'에 대한 검색 결과가 없습니다.")
+        return
+    
+    st.markdown("---")
+    st.subheader(f"검색 결과 ({len(items)}개{' 이상' if result.get('next_offset') else ''})")
+    
+    for i, item in enumerate(items):
+        with st.container(border=True):
+            col1, col2 = st.columns([5, 1])
+            with col1:
+                # 원문은 이스케이프하고 서버가 표시한 강조 태그만 살림
+                snippet = html.escape(item.get('snippet', '')).replace("&lt;mark&gt;", "<mark>").replace("&lt;/mark&gt;", "</mark>")
+                st.markdown(snippet, unsafe_allow_html=True)
+                source = f"{item.get('agent_name')} ({item.get('role')})" if item.get('message_id') else "작업 내용"
+                st.caption(f"실행 #{item.get('run_id')} · 팀: {item.get('team_name')} · {source} · {item.get('created_at', '')[:19]}")
+            with col2:
+                if st.button("🔍 상세 보기", key=f"search_detail_{i}_{item.get('run_id')}", type="secondary"):
+                    st.session_state.selected_run_id = item.get('run_id')
+                    st.switch_page("pages/_run_detail.py")
+
+
 def show_run_card(run: dict, index: int):
     """개별 실행 기록을 카드 형태로 표시"""
     
@@ -150,9 +199,9 @@ def show_run_card(run: dict, index: int):
 def get_team_list(client: BackendAPIClient) -> list:
     """팀 목록 조회"""
     try:
-        runs = client.list_runs(limit=1000)
-        teams = list(set(run.get('team_name') for run in runs if run.get('team_name')))
-        return sorted(teams)
+        # 실행 목록 대신 서버 측 실행 현황(팀별 롤업)에서 팀 이름만 사용
+        teams = client.get_run_overview().get('teams', [])
+        return sorted(team['team_name'] for team in teams)
     except:
         return []
 
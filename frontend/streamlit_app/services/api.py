@@ -25,16 +25,27 @@ class BackendAPIClient:
         self.session = requests.Session()
 
     # ----------------------------- Runs ----------------------------------
-    def list_runs(self, team_name: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
+    def list_runs(
+        self,
+        team_name: Optional[str] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        after_id: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
         params: Dict[str, Any] = {"limit": limit}
         if team_name:
             params["team_name"] = team_name
+        if cursor:
+            params["cursor"] = cursor
+        if after_id is not None:
+            params["after_id"] = after_id
         resp = self.session.get(f"{self.base_url}/runs", params=params, timeout=15)
         resp.raise_for_status()
         return resp.json()
 
-    def get_run(self, run_id: int) -> Dict[str, Any]:
-        resp = self.session.get(f"{self.base_url}/runs/{run_id}", timeout=15)
+    def get_run(self, run_id: int, include_messages: bool = True) -> Dict[str, Any]:
+        params = {"include_messages": str(include_messages).lower()}
+        resp = self.session.get(f"{self.base_url}/runs/{run_id}", params=params, timeout=15)
         resp.raise_for_status()
         return resp.json()
 
@@ -43,8 +54,34 @@ class BackendAPIClient:
         resp.raise_for_status()
         return resp.json()
 
+    def get_run_overview(self, team_name: Optional[str] = None) -> Dict[str, Any]:
+        """상태별/팀별 실행 현황 (서버 측 롤업 조회)"""
+        params: Dict[str, Any] = {}
+        if team_name:
+            params["team_name"] = team_name
+        resp = self.session.get(f"{self.base_url}/stats/overview", params=params, timeout=15)
+        resp.raise_for_status()
+        return resp.json()
+
+    def get_run_rollups(
+        self,
+        granularity: str = "day",
+        window_hours: Optional[float] = None,
+        team_name: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """시간/일 단위 실행 추이 (버킷·상태별 합계)"""
+        params: Dict[str, Any] = {"granularity": granularity}
+        if window_hours:
+            params["window_hours"] = window_hours
+        if team_name:
+            params["team_name"] = team_name
+        resp = self.session.get(f"{self.base_url}/stats/rollups", params=params, timeout=15)
+        resp.raise_for_status()
+        return resp.json()
+
     # --------------------------- Messages ---------------------------------
-    def list_messages_by_run(self, run_id: int | str) -> List[Dict[str, Any]]:
+    def list_messages_by_run(self, run_id: int | str, page_size: int = 200) -> List[Dict[str, Any]]:
+        """실행의 전체 메시지 조회 (서버 커서 페이지를 끝까지 이어서 받음)"""
         # run_id를 정수로 변환
         if isinstance(run_id, str):
             try:
@@ -52,7 +89,31 @@ class BackendAPIClient:
             except ValueError:
                 raise ValueError(f"Invalid run_id format: {run_id}")
         
-        resp = self.session.get(f"{self.base_url}/runs/{run_id}/messages", timeout=15)
+        messages: List[Dict[str, Any]] = []
+        params: Dict[str, Any] = {"limit": page_size}
+        while True:
+            resp = self.session.get(f"{self.base_url}/runs/{run_id}/messages", params=params, timeout=15)
+            resp.raise_for_status()
+            messages.extend(resp.json())
+            cursor = resp.headers.get("X-Next-Cursor")
+            if not cursor:
+                return messages
+            params["cursor"] = cursor
+
+    # --------------------------- Search ---------------------------------
+    def search_logs(
+        self,
+        query: str,
+        target: str = "messages",
+        team_name: Optional[str] = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> Dict[str, Any]:
+        """메시지/작업 내용 전문 검색 (items, next_offset)"""
+        params: Dict[str, Any] = {"q": query, "target": target, "limit": limit, "offset": offset}
+        if team_name:
+            params["team_name"] = team_name
+        resp = self.session.get(f"{self.base_url}/search", params=params, timeout=15)
         resp.raise_for_status()
         return resp.json()
 
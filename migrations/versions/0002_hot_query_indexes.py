@@ -0,0 +1,63 @@
+"""hot query indexes
+
+자주 실행되는 조회에 맞춘 복합 인덱스를 추가하고, 복합 인덱스의 앞부분과 겹치는 단일 컬럼 인덱스를 제거합니다.
+
+- notion_todos (notion_page_id, status, checked): 배치 사이클의 pending 투두 조회
+- notion_todos (notion_page_id, block_index): 페이지 투두 목록 (block_index 순)
+- notion_batch_statuses (notion_page_id, updated_at): 페이지별 최신 상태 조회
+- 실행 목록 (team_name, started_at, id) / 실행별 메시지 (run_id, created_at, id) 인덱스는 0001에 있으므로
+  같은 컬럼으로 시작하는 ix_agent_runs_team_name, ix_agent_messages_run_id는 제거 (메시지 저장 시 갱신할 인덱스 감소)
+
+init_db()가 기존 DB를 0001로 표시한 뒤 실행할 때는 인덱스가 이미 있을 수 있으므로 있는지 확인하고 변경합니다.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19 06:29:25.191919
+
+"""
+from typing import List
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+
+def _index_names(table_name: str) -> set:
+    return {index["name"] for index in sa.inspect(op.get_bind()).get_indexes(table_name)}
+
+
+def _create_index(table_name: str, index_name: str, columns: List[str]) -> None:
+    # --sql(오프라인) 모드에서는 DB를 조회할 수 없으므로 이전 리비전 상태라고 보고 그대로 생성
+    if context.is_offline_mode() or index_name not in _index_names(table_name):
+        op.create_index(index_name, table_name, columns, unique=False)
+
+
+def _drop_index(table_name: str, index_name: str) -> None:
+    if context.is_offline_mode() or index_name in _index_names(table_name):
+        op.drop_index(index_name, table_name=table_name)
+
+
+def upgrade() -> None:
+    _create_index('notion_todos', 'ix_notion_todos_page_status_checked', ['notion_page_id', 'status', 'checked'])
+    _create_index('notion_todos', 'ix_notion_todos_page_block_index', ['notion_page_id', 'block_index'])
+    _create_index('notion_batch_statuses', 'ix_notion_batch_statuses_page_updated_at', ['notion_page_id', 'updated_at'])
+
+    _drop_index('notion_todos', 'ix_notion_todos_notion_page_id')
+    _drop_index('agent_messages', 'ix_agent_messages_run_id')
+    _drop_index('agent_runs', 'ix_agent_runs_team_name')
+
+
+def downgrade() -> None:
+    _create_index('agent_runs', 'ix_agent_runs_team_name', ['team_name'])
+    _create_index('agent_messages', 'ix_agent_messages_run_id', ['run_id'])
+    _create_index('notion_todos', 'ix_notion_todos_notion_page_id', ['notion_page_id'])
+
+    _drop_index('notion_batch_statuses', 'ix_notion_batch_statuses_page_updated_at')
+    _drop_index('notion_todos', 'ix_notion_todos_page_block_index')
+    _drop_index('notion_todos', 'ix_notion_todos_page_status_checked')
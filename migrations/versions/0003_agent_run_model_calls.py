@@ -0,0 +1,36 @@
+"""agent run model calls
+
+실행별 모델 티어 호출 기록(ModelCallLog.to_dict)을 agent_runs.model_calls JSON 컬럼에 저장합니다.
+(이전에는 ModelRouter system 메시지로 저장해 대화 기록/메시지 수/전문 검색에 섞였음)
+
+init_db()가 기존 DB를 0001로 표시하기 전에 빠진 컬럼을 보충할 수 있으므로 있는지 확인하고 추가합니다.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19 09:12:41.503118
+
+"""
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+
+def _column_names(table_name: str) -> set:
+    return {column["name"] for column in sa.inspect(op.get_bind()).get_columns(table_name)}
+
+
+def upgrade() -> None:
+    # --sql(오프라인) 모드에서는 DB를 조회할 수 없으므로 이전 리비전 상태라고 보고 그대로 추가
+    if context.is_offline_mode() or 'model_calls' not in _column_names('agent_runs'):
+        op.add_column('agent_runs', sa.Column('model_calls', sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('agent_runs') as batch_op:
+        batch_op.drop_column('model_calls')
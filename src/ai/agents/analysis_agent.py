@@ -12,6 +12,7 @@ from autogen_ext.models.openai import OpenAIChatCompletionClient
 
 from src.core.config import ANALYSIS_AGENT_SYSTEM_MESSAGE, DEVIL_ADVOCATE_SYSTEM_MESSAGE
 from src.ai.agents.base import create_model_client
+from src.ai.agents.context import create_model_context
 
 
 def create_analysis_agent(model_client: OpenAIChatCompletionClient) -> AssistantAgent:
@@ -30,6 +31,7 @@ def create_analysis_agent(model_client: OpenAIChatCompletionClient) -> Assistant
         model_client=model_client,
         # 도구 없이 순수 LLM 분석 능력 활용
         system_message=ANALYSIS_AGENT_SYSTEM_MESSAGE,
+        model_context=create_model_context(),
     )
 
 def create_devil_advocate_analyst_agent(model_client: OpenAIChatCompletionClient) -> AssistantAgent:
@@ -50,6 +52,7 @@ def create_devil_advocate_analyst_agent(model_client: OpenAIChatCompletionClient
         description="악마의 대변인 관점에서 비판적 분석을 수행하는 에이전트입니다. 단순 검색 정보를 요구할때는 사용하지 않아도 됩니다.",
         model_client=model_client,
         system_message=DEVIL_ADVOCATE_SYSTEM_MESSAGE,
+        model_context=create_model_context(),
     )
 
 
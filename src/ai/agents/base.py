@@ -7,13 +7,16 @@
 from autogen_ext.models.openai import OpenAIChatCompletionClient
 from autogen_core.models import ModelInfo
 
-from src.core.config import DEFAULT_MODEL, GEMINI_API_KEY, AVAILABLE_GEMINI_MODELS
+from src.core.config import DEFAULT_MODEL, GEMINI_API_KEY, AVAILABLE_GEMINI_MODELS, MODEL_CLIENT_BACKEND
+from src.ai.agents.prompt_cache import install_prompt_cache_instrumentation
 
 
 def create_model_client(model: str = DEFAULT_MODEL, api_key: str = GEMINI_API_KEY) -> OpenAIChatCompletionClient:
     """
     Gemini 모델 클라이언트를 생성합니다.
     
+    MODEL_CLIENT_BACKEND=scripted이면 API를 호출하지 않는 스크립트 기반 클라이언트를 반환합니다 (벤치마크용).
+    
     Args:
         model (str): 사용할 Gemini 모델 이름
         api_key (str): Gemini API 키
@@ -21,6 +24,13 @@ def create_model_client(model: str = DEFAULT_MODEL, api_key: str = GEMINI_API_KE
     Returns:
         OpenAIChatCompletionClient: 설정된 모델 클라이언트
     """
+    # 응답의 캐시된 입력 토큰 수 집계 (get_prompt_cache_stats로 조회)
+    install_prompt_cache_instrumentation()
+    
+    if MODEL_CLIENT_BACKEND == "scripted":
+        from src.ai.agents.scripted_model_client import ScriptedChatCompletionClient
+        return ScriptedChatCompletionClient(model=model)
+    
     return OpenAIChatCompletionClient(
         model=model,
         model_info=ModelInfo(
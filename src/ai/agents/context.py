@@ -0,0 +1,190 @@
+"""
+에이전트 대화 컨텍스트 관리
+
+SelectorGroupChat은 매 턴마다 에이전트의 전체 대화 기록을 모델에 다시 보냅니다.
+검색 도구 결과처럼 큰 메시지가 쌓이면 프롬프트가 계속 커지므로,
+첫 작업 메시지와 최근 메시지는 원문으로 유지하고 오래된 도구 결과와 오래된 큰 메시지만 줄입니다.
+압축 경계는 compaction_step 단위로만 옮겨, 그 사이의 턴에는 앞부분 프롬프트가 그대로 유지되어
+제공자 측 프롬프트 캐시가 적중하도록 합니다.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from autogen_core import Component
+from autogen_core.model_context import ChatCompletionContext, UnboundedChatCompletionContext
+from autogen_core.models import (
+    AssistantMessage,
+    FunctionExecutionResult,
+    FunctionExecutionResultMessage,
+    LLMMessage,
+    UserMessage,
+)
+from pydantic import BaseModel
+from typing_extensions import Self
+
+from src.core.config import (
+    AGENT_CONTEXT_STRATEGY,
+    CONTEXT_COMPACTION_STEP,
+    CONTEXT_KEEP_RECENT_MESSAGES,
+    CONTEXT_MAX_MESSAGE_CHARS,
+    CONTEXT_TOOL_SUMMARY_CHARS,
+)
+
+
+def extract_text(text: str, max_chars: int) -> str:
+    """
+    긴 텍스트를 앞부분 위주의 발췌본으로 줄입니다.
+
+    Args:
+        text: 원본 텍스트
+        max_chars: 최대 문자 수
+
+    Returns:
+        str: 원본 길이 이하이면 원본, 아니면 앞/뒤 발췌와 생략 표시
+    """
+    if len(text) <= max_chars:
+        return text
+    head = text[: int(max_chars * 0.8)]
+    tail = text[-int(max_chars * 0.2):] if max_chars >= 50 else ""
+    return f"{head}\n…(중략: 원본 {len(text)}자)…\n{tail}"
+
+
+def summarize_tool_result(text: str, max_chars: int) -> str:
+    """
+    오래된 도구 결과를 짧은 요약으로 줄입니다. (추가 LLM 호출 없이 공백 정리 후 앞부분만 유지)
+
+    Args:
+        text: 도구 결과 텍스트
+        max_chars: 요약 최대 문자 수
+
+    Returns:
+        str: 요약 텍스트
+    """
+    if len(text) <= max_chars:
+        return text
+    collapsed = " ".join(text.split())
+    return f"[이전 도구 결과 요약, 원본 {len(text)}자] {collapsed[:max_chars]}…"
+
+
+def _content_length(message: LLMMessage) -> int:
+    content = getattr(message, "content", "")
+    if isinstance(content, str):
+        return len(content)
+    if isinstance(content, list):
+        return sum(len(item.content) if isinstance(item, FunctionExecutionResult) else len(str(item)) for item in content)
+    return 0
+
+
+class CompactChatCompletionContextConfig(BaseModel):
+    keep_recent: int
+    tool_summary_chars: int
+    max_message_chars: int
+    compaction_step: int = 1
+    initial_messages: Optional[List[LLMMessage]] = None
+
+
+class CompactChatCompletionContext(ChatCompletionContext, Component[CompactChatCompletionContextConfig]):
+    """
+    첫 메시지(작업)와 최근 keep_recent개 메시지는 원문으로 유지하고,
+    그 이전의 도구 결과는 요약으로, 그 이전의 큰 대화 메시지는 발췌본으로 줄이는 컨텍스트
+
+    최근 메시지 중에서는 도구 결과만 max_message_chars로 자릅니다. 이전 팀 결과(sub_results, {team}_output)처럼
+    다음 에이전트가 그대로 읽어야 하는 작업/대화 메시지는 잘리지 않습니다.
+
+    압축 경계는 compaction_step개 단위로만 앞으로 옮기므로 원문으로 남는 최근 메시지 수는
+    keep_recent ~ keep_recent + compaction_step - 1개 사이이고, 이미 압축된 앞부분은 매 턴 같은 내용입니다.
+
+    원본 메시지는 그대로 보관하고 get_messages()에서만 압축본을 만들기 때문에
+    메시지 순서와 도구 호출/결과 쌍의 구조는 유지됩니다.
+    """
+
+    component_config_schema = CompactChatCompletionContextConfig
+    component_provider_override = "src.ai.agents.context.CompactChatCompletionContext"
+
+    def __init__(
+        self,
+        keep_recent: int = CONTEXT_KEEP_RECENT_MESSAGES,
+        tool_summary_chars: int = CONTEXT_TOOL_SUMMARY_CHARS,
+        max_message_chars: int = CONTEXT_MAX_MESSAGE_CHARS,
+        compaction_step: int = CONTEXT_COMPACTION_STEP,
+        initial_messages: Optional[List[LLMMessage]] = None,
+    ) -> None:
+        super().__init__(initial_messages)
+        self.keep_recent = keep_recent
+        self.tool_summary_chars = tool_summary_chars
+        self.max_message_chars = max_message_chars
+        self.compaction_step = max(compaction_step, 1)
+        self.last_stats: Dict[str, Any] = {}
+
+    async def get_messages(self) -> List[LLMMessage]:
+        cutoff = max(len(self._messages) - self.keep_recent, 0)
+        cutoff -= cutoff % self.compaction_step
+        compacted = [
+            message if index == 0 else self._compact(message, is_recent=index >= cutoff)
+            for index, message in enumerate(self._messages)
+        ]
+
+        raw_chars = sum(_content_length(message) for message in self._messages)
+        compacted_chars = sum(_content_length(message) for message in compacted)
+        self.last_stats = {
+            "messages": len(self._messages),
+            "raw_chars": raw_chars,
+            "compacted_chars": compacted_chars,
+        }
+        return compacted
+
+    def _compact(self, message: LLMMessage, is_recent: bool) -> LLMMessage:
+        if isinstance(message, FunctionExecutionResultMessage):
+            limit = self.max_message_chars if is_recent else self.tool_summary_chars
+            shorten = extract_text if is_recent else summarize_tool_result
+            results = [
+                result.model_copy(update={"content": shorten(result.content, limit)})
+                if len(result.content) > limit else result
+                for result in message.content
+            ]
+            return message.model_copy(update={"content": results})
+
+        if is_recent:
+            return message
+
+        if isinstance(message, (UserMessage, AssistantMessage)) and isinstance(message.content, str):
+            if len(message.content) > self.max_message_chars:
+                return message.model_copy(update={"content": extract_text(message.content, self.max_message_chars)})
+
+        return message
+
+    def _to_config(self) -> CompactChatCompletionContextConfig:
+        return CompactChatCompletionContextConfig(
+            keep_recent=self.keep_recent,
+            tool_summary_chars=self.tool_summary_chars,
+            max_message_chars=self.max_message_chars,
+            compaction_step=self.compaction_step,
+            initial_messages=self._initial_messages,
+        )
+
+    @classmethod
+    def _from_config(cls, config: CompactChatCompletionContextConfig) -> Self:
+        return cls(
+            keep_recent=config.keep_recent,
+            tool_summary_chars=config.tool_summary_chars,
+            max_message_chars=config.max_message_chars,
+            compaction_step=config.compaction_step,
+            initial_messages=config.initial_messages,
+        )
+
+
+def create_model_context(strategy: str = AGENT_CONTEXT_STRATEGY) -> ChatCompletionContext:
+    """
+    에이전트용 모델 컨텍스트를 생성합니다. 컨텍스트는 상태를 가지므로 에이전트마다 새로 만들어야 합니다.
+
+    Args:
+        strategy: "compact" 또는 "unbounded"
+
+    Returns:
+        ChatCompletionContext: 모델 컨텍스트
+    """
+    if strategy == "unbounded":
+        return UnboundedChatCompletionContext()
+    if strategy == "compact":
+        return CompactChatCompletionContext()
+    raise ValueError(f"알 수 없는 컨텍스트 전략입니다: {strategy}")
@@ -10,8 +10,10 @@ from autogen_agentchat.agents import AssistantAgent
 from autogen_ext.models.openai import OpenAIChatCompletionClient
 
 from src.core.config import DATA_ANALYST_AGENT_SYSTEM_MESSAGE
-from src.ai.tools.data_analysis_tool import percentage_change_tool
+from src.ai.tools.data_analysis_tool import batch_analysis_tool, percentage_change_tool
+from src.ai.tools.tool_execution import managed_tool
 from src.ai.agents.base import create_model_client
+from src.ai.agents.context import create_model_context
 
 
 def create_data_analyst_agent(model_client: OpenAIChatCompletionClient) -> AssistantAgent:
@@ -28,8 +30,9 @@ def create_data_analyst_agent(model_client: OpenAIChatCompletionClient) -> Assis
         "DataAnalystAgent",
         description="계산 및 데이터 분석을 수행하는 에이전트입니다.",
         model_client=model_client,
-        tools=[percentage_change_tool],
+        tools=[managed_tool(percentage_change_tool), managed_tool(batch_analysis_tool)],
         system_message=DATA_ANALYST_AGENT_SYSTEM_MESSAGE,
+        model_context=create_model_context(),
     )
 
 
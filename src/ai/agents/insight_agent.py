@@ -12,6 +12,7 @@ from autogen_ext.models.openai import OpenAIChatCompletionClient
 
 from src.core.config import INSIGHT_AGENT_SYSTEM_MESSAGE
 from src.ai.agents.base import create_model_client
+from src.ai.agents.context import create_model_context
 
 
 def create_insight_agent(model_client: OpenAIChatCompletionClient) -> AssistantAgent:
@@ -30,6 +31,7 @@ def create_insight_agent(model_client: OpenAIChatCompletionClient) -> AssistantA
         model_client=model_client,
         # 도구 없이 순수 LLM 인사이트 도출 능력 활용
         system_message=INSIGHT_AGENT_SYSTEM_MESSAGE,
+        model_context=create_model_context(),
     )
 
 async def test_insight_agent():
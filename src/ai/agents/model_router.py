@@ -0,0 +1,273 @@
+"""
+모델 라우터
+
+역할(발화자 선택, 도구 사용 에이전트, 분석, 요약, 마스터 팀)과 작업 난이도에 따라
+티어별 모델 클라이언트를 배정합니다. 단순 조회성 작업은 lite 티어로 보내고,
+복잡한 분석 작업만 상위 티어 모델을 사용합니다.
+"""
+
+import re
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, AsyncGenerator, Deque, Dict, Iterator, Optional, Union
+
+from autogen_core.models import ChatCompletionClient, CreateResult, ModelInfo, RequestUsage
+
+from src.core.config import (
+    GEMINI_API_KEY,
+    MODEL_ROLE_TIERS,
+    MODEL_ROUTING_ENABLED,
+    MODEL_TIERS,
+    SIMPLE_TASK_MAX_CHARS,
+)
+from src.ai.agents.base import create_model_client
+from src.ai.agents.prompt_cache import capture_cached_tokens
+from src.ai.orchestrator.token_usage import estimate_cost
+
+
+SIMPLE = "simple"
+COMPLEX = "complex"
+
+# 에이전트 팩토리별 역할 (team_configs.yaml의 factory 이름 기준)
+AGENT_FACTORY_ROLES = {
+    "create_web_search_agent": "tool_agent",
+    "create_google_search_agent": "tool_agent",
+    "create_data_analyst_agent": "tool_agent",
+    "create_analysis_agent": "analyst",
+    "create_devil_advocate_analyst_agent": "analyst",
+    "create_insight_agent": "analyst",
+    "create_summary_agent": "summarizer",
+}
+
+_COMPLEX_KEYWORDS = re.compile(
+    r"분석|비교|전망|전략|평가|검토|예측|원인|인사이트|보고서|종합|계산|추세|트렌드|"
+    r"analy[sz]e|compare|forecast|strategy|evaluate|report|trend"
+)
+
+
+def classify_task_complexity(task: str) -> str:
+    """
+    작업 난이도를 분류합니다.
+
+    짧고 분석 키워드가 없는 한 줄짜리 작업(예: "jtbc 마라톤 일정 알려줘")은 단순 작업,
+    그 외(긴 작업, 여러 항목, 분석/비교/전망 요청)는 복잡한 작업으로 봅니다.
+
+    Args:
+        task: 작업 내용
+
+    Returns:
+        str: "simple" 또는 "complex"
+    """
+    text = task.strip()
+    if len(text) > SIMPLE_TASK_MAX_CHARS:
+        return COMPLEX
+    if text.count("\n") >= 2:
+        return COMPLEX
+    if _COMPLEX_KEYWORDS.search(text.lower()):
+        return COMPLEX
+    return SIMPLE
+
+
+# ============================================================================
+# 티어별 호출 기록
+# ============================================================================
+
+@dataclass
+class TierStats:
+    """티어별 모델 호출 지표"""
+    model: str
+    calls: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    # 제공자 측 프롬프트 캐시에 적중한 입력 토큰 수
+    cached_prompt_tokens: int = 0
+    latency_samples: Deque[float] = field(default_factory=lambda: deque(maxlen=1000))
+
+    def record(self, latency: float, usage: Optional[RequestUsage], cached_tokens: int = 0) -> None:
+        self.calls += 1
+        self.latency_samples.append(latency)
+        self.cached_prompt_tokens += cached_tokens
+        if usage is not None:
+            self.prompt_tokens += usage.prompt_tokens
+            self.completion_tokens += usage.completion_tokens
+
+    @property
+    def estimated_cost(self) -> float:
+        return estimate_cost(self.model, self.prompt_tokens, self.completion_tokens)
+
+    def to_dict(self) -> Dict[str, Any]:
+        ordered = sorted(self.latency_samples)
+
+        def percentile(p: float) -> float:
+            if not ordered:
+                return 0.0
+            return ordered[min(len(ordered) - 1, int(round(p / 100 * (len(ordered) - 1))))]
+
+        return {
+            "model": self.model,
+            "calls": self.calls,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "cached_prompt_tokens": self.cached_prompt_tokens,
+            "cached_ratio": round(self.cached_prompt_tokens / self.prompt_tokens, 4) if self.prompt_tokens else 0.0,
+            "latency_total": round(sum(ordered), 3),
+            "latency_p50": round(percentile(50), 3),
+            "latency_p95": round(percentile(95), 3),
+            "estimated_cost": round(self.estimated_cost, 6),
+        }
+
+
+@dataclass
+class ModelCallLog:
+    """실행(run) 하나의 티어별 모델 호출 기록"""
+    complexity: Optional[str] = None
+    tiers: Dict[str, TierStats] = field(default_factory=dict)
+
+    def record(self, tier: str, model: str, latency: float, usage: Optional[RequestUsage], cached_tokens: int = 0) -> None:
+        self.tiers.setdefault(tier, TierStats(model=model)).record(latency, usage, cached_tokens)
+
+    @property
+    def estimated_cost(self) -> float:
+        return sum(stats.estimated_cost for stats in self.tiers.values())
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "complexity": self.complexity,
+            "estimated_cost": round(self.estimated_cost, 6),
+            "tiers": {tier: stats.to_dict() for tier, stats in self.tiers.items()},
+        }
+
+
+# 현재 실행 중인 run의 호출 기록 (team.run_stream 안에서 생성되는 태스크로 전파됨)
+_current_call_log: ContextVar[Optional[ModelCallLog]] = ContextVar("model_call_log", default=None)
+
+
+@contextmanager
+def track_model_calls(complexity: Optional[str] = None, log: Optional[ModelCallLog] = None) -> Iterator[ModelCallLog]:
+    """
+    with 블록 안에서 발생한 티어별 모델 호출을 기록합니다.
+
+    Args:
+        complexity: 작업 난이도 (새 기록을 만들 때 사용)
+        log: 이어서 기록할 기존 호출 기록 (여러 태스크에 걸친 run을 하나로 모을 때)
+    """
+    log = log or ModelCallLog(complexity=complexity)
+    token = _current_call_log.set(log)
+    try:
+        yield log
+    finally:
+        _current_call_log.reset(token)
+
+
+class TieredModelClient(ChatCompletionClient):
+    """티어 정보를 달고 호출 지연 시간과 사용량을 기록하는 모델 클라이언트 래퍼"""
+
+    def __init__(self, tier: str, model: str, inner: ChatCompletionClient):
+        self.tier = tier
+        self.model = model
+        self._inner = inner
+        self.stats = TierStats(model=model)
+
+    def _record(self, latency: float, usage: Optional[RequestUsage], cached_tokens: int = 0) -> None:
+        self.stats.record(latency, usage, cached_tokens)
+        log = _current_call_log.get()
+        if log is not None:
+            log.record(self.tier, self.model, latency, usage, cached_tokens)
+
+    async def create(self, *args: Any, **kwargs: Any) -> CreateResult:
+        started = time.monotonic()
+        # 캐시 토큰 수는 내부 클라이언트가 호출 중에 남기는 LLMCallEvent에서 읽음 (스트리밍 응답에는 없음)
+        with capture_cached_tokens() as capture:
+            result = await self._inner.create(*args, **kwargs)
+        self._record(time.monotonic() - started, result.usage, capture.cached_tokens)
+        return result
+
+    async def create_stream(self, *args: Any, **kwargs: Any) -> AsyncGenerator[Union[str, CreateResult], None]:
+        started = time.monotonic()
+        async for chunk in self._inner.create_stream(*args, **kwargs):
+            if isinstance(chunk, CreateResult):
+                self._record(time.monotonic() - started, chunk.usage)
+            yield chunk
+
+    async def close(self) -> None:
+        await self._inner.close()
+
+    def actual_usage(self) -> RequestUsage:
+        return self._inner.actual_usage()
+
+    def total_usage(self) -> RequestUsage:
+        return self._inner.total_usage()
+
+    def count_tokens(self, *args: Any, **kwargs: Any) -> int:
+        return self._inner.count_tokens(*args, **kwargs)
+
+    def remaining_tokens(self, *args: Any, **kwargs: Any) -> int:
+        return self._inner.remaining_tokens(*args, **kwargs)
+
+    @property
+    def capabilities(self) -> Any:  # type: ignore[override]
+        return self._inner.capabilities
+
+    @property
+    def model_info(self) -> ModelInfo:
+        return self._inner.model_info
+
+
+class ModelRouter:
+    """역할/난이도별 모델 클라이언트 배정기 (티어별 클라이언트는 한 번만 생성해 재사용)"""
+
+    def __init__(
+        self,
+        tiers: Optional[Dict[str, str]] = None,
+        role_tiers: Optional[Dict[str, str]] = None,
+        enabled: bool = MODEL_ROUTING_ENABLED,
+        api_key: str = GEMINI_API_KEY,
+    ):
+        self.tiers = dict(tiers or MODEL_TIERS)
+        self.role_tiers = dict(role_tiers or MODEL_ROLE_TIERS)
+        self.enabled = enabled
+        self.api_key = api_key
+        self._clients: Dict[str, TieredModelClient] = {}
+
+    def tier_for_role(self, role: str, complexity: str = COMPLEX) -> str:
+        """역할과 난이도에 맞는 티어 이름"""
+        if not self.enabled:
+            return "standard"
+        if complexity == SIMPLE:
+            return "lite"
+        return self.role_tiers.get(role, "standard")
+
+    def client_for_tier(self, tier: str) -> TieredModelClient:
+        """티어별 모델 클라이언트 (캐시)"""
+        if tier not in self._clients:
+            if tier not in self.tiers:
+                raise ValueError(f"알 수 없는 모델 티어입니다: {tier}")
+            model = self.tiers[tier]
+            self._clients[tier] = TieredModelClient(tier, model, create_model_client(model, self.api_key))
+        return self._clients[tier]
+
+    def client_for_role(self, role: str, complexity: str = COMPLEX) -> TieredModelClient:
+        """역할과 난이도에 맞는 모델 클라이언트"""
+        return self.client_for_tier(self.tier_for_role(role, complexity))
+
+    def client_for_factory(self, factory_name: str, complexity: str = COMPLEX) -> TieredModelClient:
+        """에이전트 팩토리 이름에 맞는 모델 클라이언트"""
+        return self.client_for_role(AGENT_FACTORY_ROLES.get(factory_name, "tool_agent"), complexity)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """프로세스 전체 티어별 지표"""
+        return {tier: client.stats.to_dict() for tier, client in self._clients.items()}
+
+
+_model_router: Optional[ModelRouter] = None
+
+
+def get_model_router() -> ModelRouter:
+    """모델 라우터 인스턴스 반환"""
+    global _model_router
+    if _model_router is None:
+        _model_router = ModelRouter()
+    return _model_router
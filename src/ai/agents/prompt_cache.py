@@ -0,0 +1,120 @@
+"""
+프롬프트 캐시 지표
+
+autogen의 RequestUsage에는 캐시된 입력 토큰 수가 없으므로, 모델 클라이언트가 호출마다
+autogen_core 이벤트 로거로 남기는 LLMCallEvent의 원본 응답(usage.prompt_tokens_details.cached_tokens)에서
+제공자 측 프롬프트 캐시에 적중한 입력 토큰 수를 읽어 모델별로 집계합니다.
+"""
+
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, Mapping, Optional
+
+from autogen_core import EVENT_LOGGER_NAME
+from autogen_core.logging import LLMCallEvent
+
+
+@dataclass
+class PromptCacheStats:
+    """모델별 프롬프트 캐시 적중 지표"""
+    calls: int = 0
+    prompt_tokens: int = 0
+    cached_tokens: int = 0
+    cache_hit_calls: int = 0
+
+    def record(self, prompt_tokens: int, cached_tokens: int) -> None:
+        self.calls += 1
+        self.prompt_tokens += prompt_tokens
+        self.cached_tokens += cached_tokens
+        if cached_tokens > 0:
+            self.cache_hit_calls += 1
+
+    @property
+    def cached_ratio(self) -> float:
+        return self.cached_tokens / self.prompt_tokens if self.prompt_tokens else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "prompt_tokens": self.prompt_tokens,
+            "cached_tokens": self.cached_tokens,
+            "cached_ratio": round(self.cached_ratio, 4),
+            "cache_hit_calls": self.cache_hit_calls,
+        }
+
+
+@dataclass
+class CachedTokenCapture:
+    """with 블록 안의 모델 호출에서 읽은 캐시 토큰 수"""
+    cached_tokens: int = 0
+
+
+def cached_tokens_from_response(response: Mapping[str, Any]) -> int:
+    """
+    모델 응답(usage 포함 dict)에서 캐시된 입력 토큰 수를 읽습니다.
+
+    Args:
+        response: ChatCompletion 응답을 dict로 바꾼 값
+
+    Returns:
+        int: 캐시된 입력 토큰 수 (정보가 없으면 0)
+    """
+    usage = response.get("usage") or {}
+    details = usage.get("prompt_tokens_details") or {}
+    return int(details.get("cached_tokens") or usage.get("cached_tokens") or 0)
+
+
+_stats: Dict[str, PromptCacheStats] = {}
+# 현재 모델 호출의 캐시 토큰 수를 받을 대상 (TieredModelClient가 호출마다 설정)
+_current_capture: ContextVar[Optional[CachedTokenCapture]] = ContextVar("cached_token_capture", default=None)
+
+
+class _CachedTokenHandler(logging.Handler):
+    """LLMCallEvent에서 캐시 토큰 수를 읽는 이벤트 로거 핸들러"""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        event = record.msg
+        if not isinstance(event, LLMCallEvent):
+            return
+        response = event.kwargs.get("response") or {}
+        cached_tokens = cached_tokens_from_response(response)
+        model = str(response.get("model") or "unknown")
+        _stats.setdefault(model, PromptCacheStats()).record(event.prompt_tokens, cached_tokens)
+
+        capture = _current_capture.get()
+        if capture is not None:
+            capture.cached_tokens += cached_tokens
+
+
+_handler: Optional[_CachedTokenHandler] = None
+
+
+def install_prompt_cache_instrumentation() -> None:
+    """이벤트 로거에 캐시 토큰 집계 핸들러를 한 번만 등록합니다."""
+    global _handler
+    if _handler is not None:
+        return
+    event_logger = logging.getLogger(EVENT_LOGGER_NAME)
+    # LLMCallEvent는 INFO 레벨로 기록되므로 더 높은 레벨이 설정된 경우에만 낮춤
+    if event_logger.getEffectiveLevel() > logging.INFO:
+        event_logger.setLevel(logging.INFO)
+    _handler = _CachedTokenHandler(level=logging.INFO)
+    event_logger.addHandler(_handler)
+
+
+@contextmanager
+def capture_cached_tokens() -> Iterator[CachedTokenCapture]:
+    """with 블록 안에서 발생한 모델 호출의 캐시 토큰 수를 모읍니다."""
+    capture = CachedTokenCapture()
+    token = _current_capture.set(capture)
+    try:
+        yield capture
+    finally:
+        _current_capture.reset(token)
+
+
+def get_prompt_cache_stats() -> Dict[str, Dict[str, Any]]:
+    """프로세스 전체 모델별 프롬프트 캐시 지표"""
+    return {model: stats.to_dict() for model, stats in _stats.items()}
@@ -0,0 +1,294 @@
+"""
+스크립트 기반 가짜 모델 클라이언트
+
+Gemini 할당량을 쓰지 않고 SelectorGroupChat/오케스트레이터 오버헤드를 측정하기 위한
+ChatCompletionClient 구현입니다. 응답 지연 분포, 도구 호출, 토큰 사용량을 설정할 수 있고
+같은 대화 상태에는 항상 같은 응답을 돌려줍니다. 같은 시스템 메시지로 보낸 직전 요청과 겹치는
+앞부분을 캐시된 입력 토큰으로 보고해 프롬프트 앞부분 고정 여부를 확인할 수 있습니다.
+
+MODEL_CLIENT_BACKEND=scripted로 설정하면 create_model_client가 이 클라이언트를 반환합니다.
+"""
+
+import asyncio
+import json
+import logging
+import math
+import os
+import random
+import re
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, AsyncGenerator, Dict, Mapping, Optional, Sequence, Tuple, Union
+
+from autogen_core import EVENT_LOGGER_NAME, CancellationToken, FunctionCall
+from autogen_core.logging import LLMCallEvent
+from autogen_core.models import (
+    ChatCompletionClient,
+    CreateResult,
+    FunctionExecutionResultMessage,
+    LLMMessage,
+    ModelInfo,
+    RequestUsage,
+    SystemMessage,
+)
+from autogen_core.tools import Tool, ToolSchema
+
+from src.core.config import (
+    SCRIPTED_MODEL_COMPLETION_TOKENS,
+    SCRIPTED_MODEL_LATENCY_DISTRIBUTION,
+    SCRIPTED_MODEL_LATENCY_MEAN_SECONDS,
+    SCRIPTED_MODEL_LATENCY_STDDEV_SECONDS,
+    SCRIPTED_MODEL_SEED,
+    SCRIPTED_MODEL_TOOL_CALLS,
+    SCRIPTED_MODEL_TURNS_BEFORE_TERMINATE,
+)
+
+
+# SelectorGroupChat의 발화자 선택 프롬프트에 들어가는 후보 목록 형식: ['AgentA', 'AgentB']
+_PARTICIPANTS_PATTERN = re.compile(r"\[\s*'[^'\n]+'(?:\s*,\s*'[^'\n]+')*\s*\]")
+_FILLER_WORDS = ["분석", "결과", "데이터", "검색", "요약", "근거", "추세", "비교", "확인", "정리"]
+
+event_logger = logging.getLogger(EVENT_LOGGER_NAME)
+
+
+def _message_text(message: LLMMessage) -> str:
+    content = getattr(message, "content", "")
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        return " ".join(getattr(item, "content", None) or str(item) for item in content)
+    return str(content)
+
+
+@dataclass
+class LatencyDistribution:
+    """응답 지연 분포 (단위: 초)"""
+    kind: str = "fixed"
+    mean: float = 0.0
+    stddev: float = 0.0
+
+    def sample(self, rng: random.Random) -> float:
+        if self.mean <= 0:
+            return 0.0
+        if self.kind == "uniform":
+            half_width = self.stddev * math.sqrt(3)
+            return max(rng.uniform(self.mean - half_width, self.mean + half_width), 0.0)
+        if self.kind == "lognormal" and self.stddev > 0:
+            sigma2 = math.log(1 + (self.stddev / self.mean) ** 2)
+            mu = math.log(self.mean) - sigma2 / 2
+            return rng.lognormvariate(mu, math.sqrt(sigma2))
+        return self.mean
+
+
+@dataclass
+class ScriptedResponse:
+    """재생할 응답 하나 (content 또는 tool_call 중 하나)"""
+    content: Optional[str] = None
+    tool_call: Optional[Tuple[str, Dict[str, Any]]] = None
+
+
+class ScriptedChatCompletionClient(ChatCompletionClient):
+    """
+    정해진 규칙/스크립트로 응답하는 모델 클라이언트
+
+    - 발화자 선택 요청(도구 없이 후보 목록이 담긴 프롬프트)에는 후보 중 한 명의 이름을 반환
+    - script가 있으면 에이전트 요청마다 순서대로 재생(끝나면 처음부터 반복)
+    - 없으면 도구가 있고 tool_calls가 켜져 있으면 도구 호출, 아니면 채움 텍스트 응답
+    - 대화 메시지가 turns_before_terminate개 이상이면 응답 끝에 TERMINATE 추가
+    """
+
+    def __init__(
+        self,
+        model: str = "scripted",
+        latency: Optional[LatencyDistribution] = None,
+        script: Optional[Sequence[ScriptedResponse]] = None,
+        turns_before_terminate: int = SCRIPTED_MODEL_TURNS_BEFORE_TERMINATE,
+        completion_tokens: int = SCRIPTED_MODEL_COMPLETION_TOKENS,
+        tool_calls: bool = SCRIPTED_MODEL_TOOL_CALLS,
+        seed: int = SCRIPTED_MODEL_SEED,
+    ):
+        self.model = model
+        self.latency = latency or LatencyDistribution(
+            kind=SCRIPTED_MODEL_LATENCY_DISTRIBUTION,
+            mean=SCRIPTED_MODEL_LATENCY_MEAN_SECONDS,
+            stddev=SCRIPTED_MODEL_LATENCY_STDDEV_SECONDS,
+        )
+        self.script = list(script or [])
+        self.turns_before_terminate = turns_before_terminate
+        self.completion_tokens = completion_tokens
+        self.tool_calls = tool_calls
+        self._rng = random.Random(seed)
+        self._script_index = 0
+        self._call_count = 0
+        self._total_usage = RequestUsage(prompt_tokens=0, completion_tokens=0)
+        self._actual_usage = RequestUsage(prompt_tokens=0, completion_tokens=0)
+        # 시스템 메시지(첫 메시지) + 도구 목록별 직전 요청 프롬프트 (제공자 측 프롬프트 캐시 흉내)
+        self._last_prompts: "OrderedDict[int, str]" = OrderedDict()
+        self._model_info = ModelInfo(
+            vision=False,
+            function_calling=True,
+            json_output=False,
+            family="unknown",
+            structured_output=False,
+        )
+
+    async def create(
+        self,
+        messages: Sequence[LLMMessage],
+        *,
+        tools: Sequence[Tool | ToolSchema] = [],
+        tool_choice: Any = "auto",
+        json_output: Optional[Any] = None,
+        extra_create_args: Mapping[str, Any] = {},
+        cancellation_token: Optional[CancellationToken] = None,
+    ) -> CreateResult:
+        await asyncio.sleep(self.latency.sample(self._rng))
+        self._call_count += 1
+
+        content, finish_reason = self._respond(messages, tools)
+        prompt_tokens = self.count_tokens(messages, tools=tools)
+        completion_tokens = (
+            self.count_tokens([SystemMessage(content=content)]) if isinstance(content, str) else len(json.dumps([c.arguments for c in content])) // 4
+        )
+        usage = RequestUsage(prompt_tokens=prompt_tokens, completion_tokens=completion_tokens)
+        self._actual_usage = usage
+        self._total_usage = RequestUsage(
+            prompt_tokens=self._total_usage.prompt_tokens + prompt_tokens,
+            completion_tokens=self._total_usage.completion_tokens + completion_tokens,
+        )
+        if event_logger.isEnabledFor(logging.INFO):
+            event_logger.info(
+                LLMCallEvent(
+                    messages=[{"role": type(message).__name__, "content": _message_text(message)} for message in messages],
+                    response={
+                        "model": self.model,
+                        "usage": {
+                            "prompt_tokens": prompt_tokens,
+                            "completion_tokens": completion_tokens,
+                            "prompt_tokens_details": {"cached_tokens": self._cached_prompt_tokens(messages, tools)},
+                        },
+                    },
+                    prompt_tokens=prompt_tokens,
+                    completion_tokens=completion_tokens,
+                )
+            )
+        return CreateResult(finish_reason=finish_reason, content=content, usage=usage, cached=False)
+
+    async def create_stream(
+        self,
+        messages: Sequence[LLMMessage],
+        *,
+        tools: Sequence[Tool | ToolSchema] = [],
+        tool_choice: Any = "auto",
+        json_output: Optional[Any] = None,
+        extra_create_args: Mapping[str, Any] = {},
+        cancellation_token: Optional[CancellationToken] = None,
+    ) -> AsyncGenerator[Union[str, CreateResult], None]:
+        result = await self.create(messages, tools=tools, cancellation_token=cancellation_token)
+        if isinstance(result.content, str):
+            yield result.content
+        yield result
+
+    def _respond(self, messages: Sequence[LLMMessage], tools: Sequence[Tool | ToolSchema]) -> Tuple[Any, str]:
+        # 발화자 선택 요청: 대화 상태(프롬프트)에 따라 결정적으로 후보 선택
+        if not tools and messages:
+            prompt = _message_text(messages[0])
+            match = _PARTICIPANTS_PATTERN.search(prompt)
+            if match:
+                candidates = re.findall(r"'([^'\n]+)'", match.group(0))
+                return candidates[zlib.crc32(prompt.encode()) % len(candidates)], "stop"
+
+        conversation_turns = sum(1 for message in messages if not isinstance(message, SystemMessage))
+        after_tool_result = bool(messages) and isinstance(messages[-1], FunctionExecutionResultMessage)
+
+        if self.script:
+            response = self.script[self._script_index % len(self.script)]
+            self._script_index += 1
+            if response.tool_call is not None and tools and not after_tool_result:
+                name, arguments = response.tool_call
+                return [FunctionCall(id=f"call_{self._call_count}", name=name, arguments=json.dumps(arguments, ensure_ascii=False))], "function_calls"
+            return self._with_termination(response.content or "", conversation_turns), "stop"
+
+        # 핸드오프(transfer_to_*) 도구는 팀 흐름을 바꾸므로 자동 호출 대상에서 제외
+        callable_tools = [tool for tool in tools if not self._tool_schema(tool)["name"].startswith("transfer_to_")]
+        if self.tool_calls and callable_tools and not after_tool_result:
+            schema = self._tool_schema(callable_tools[conversation_turns % len(callable_tools)])
+            task_text = next((_message_text(m) for m in messages if not isinstance(m, SystemMessage)), "")
+            arguments = self._tool_arguments(schema, task_text)
+            return [FunctionCall(id=f"call_{self._call_count}", name=schema["name"], arguments=json.dumps(arguments, ensure_ascii=False))], "function_calls"
+
+        return self._with_termination(self._filler_text(conversation_turns), conversation_turns), "stop"
+
+    def _cached_prompt_tokens(self, messages: Sequence[LLMMessage], tools: Sequence[Tool | ToolSchema]) -> int:
+        # 도구 스키마 -> 메시지 순서로 이어 붙인 프롬프트가 직전 요청과 겹치는 앞부분을 캐시 적중으로 계산
+        tool_text = json.dumps([self._tool_schema(tool) for tool in tools], ensure_ascii=False)
+        prompt = tool_text + "".join(f"\n<{type(message).__name__}>{_message_text(message)}" for message in messages)
+        # 첫 메시지 앞부분으로 같은 에이전트/발화자 선택 요청을 묶음 (선택 프롬프트는 뒤쪽에 대화 기록이 붙음)
+        key = zlib.crc32((tool_text + (_message_text(messages[0])[:256] if messages else "")).encode())
+        previous = self._last_prompts.pop(key, "")
+        self._last_prompts[key] = prompt
+        while len(self._last_prompts) > 256:
+            self._last_prompts.popitem(last=False)
+        return len(os.path.commonprefix([previous, prompt])) // 4
+
+    def _with_termination(self, content: str, conversation_turns: int) -> str:
+        if conversation_turns >= self.turns_before_terminate and "TERMINATE" not in content:
+            return f"{content}\nTERMINATE"
+        return content
+
+    def _filler_text(self, conversation_turns: int) -> str:
+        # 한 단어를 약 1토큰으로 보고 completion_tokens 길이의 응답 생성
+        words = [_FILLER_WORDS[(conversation_turns + i) % len(_FILLER_WORDS)] for i in range(self.completion_tokens)]
+        return f"[{self.model}] 턴 {conversation_turns} 응답: " + " ".join(words)
+
+    @staticmethod
+    def _tool_schema(tool: Tool | ToolSchema) -> ToolSchema:
+        return tool.schema if hasattr(tool, "schema") else tool
+
+    @staticmethod
+    def _tool_arguments(schema: ToolSchema, query_text: str) -> Dict[str, Any]:
+        parameters = schema.get("parameters") or {}
+        properties = parameters.get("properties", {})
+        arguments: Dict[str, Any] = {}
+        for name in parameters.get("required", list(properties)):
+            kind = properties.get(name, {}).get("type", "string")
+            if kind in ("number", "integer"):
+                arguments[name] = 1
+            elif kind == "boolean":
+                arguments[name] = False
+            elif kind == "array":
+                arguments[name] = []
+            else:
+                arguments[name] = " ".join(query_text.split())[:100] or "query"
+        return arguments
+
+    async def close(self) -> None:
+        return None
+
+    def actual_usage(self) -> RequestUsage:
+        return self._actual_usage
+
+    def total_usage(self) -> RequestUsage:
+        return self._total_usage
+
+    def count_tokens(self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool | ToolSchema] = []) -> int:
+        # 문자 4개당 1토큰 + 메시지당 4토큰으로 근사
+        chars = sum(len(_message_text(message)) for message in messages)
+        chars += sum(len(json.dumps(self._tool_schema(tool), ensure_ascii=False)) for tool in tools)
+        return chars // 4 + 4 * len(messages)
+
+    def remaining_tokens(self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool | ToolSchema] = []) -> int:
+        return max(1_000_000 - self.count_tokens(messages, tools=tools), 0)
+
+    @property
+    def capabilities(self) -> Any:  # type: ignore[override]
+        return self._model_info
+
+    @property
+    def model_info(self) -> ModelInfo:
+        return self._model_info
+
+    @property
+    def call_count(self) -> int:
+        return self._call_count
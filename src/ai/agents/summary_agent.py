@@ -12,6 +12,7 @@ from autogen_ext.models.openai import OpenAIChatCompletionClient
 
 from src.core.config import SUMMARY_AGENT_SYSTEM_MESSAGE
 from src.ai.agents.base import create_model_client
+from src.ai.agents.context import create_model_context
 
 
 def create_summary_agent(model_client: OpenAIChatCompletionClient) -> AssistantAgent:
@@ -30,6 +31,7 @@ def create_summary_agent(model_client: OpenAIChatCompletionClient) -> AssistantA
         model_client=model_client,
         # 도구 없이 순수 LLM 요약 능력 활용
         system_message=SUMMARY_AGENT_SYSTEM_MESSAGE,
+        model_context=create_model_context(),
     )
 
 
@@ -7,12 +7,14 @@
 import asyncio
 
 from autogen_agentchat.agents import AssistantAgent
-from autogen_core.tools import FunctionTool
 from autogen_ext.models.openai import OpenAIChatCompletionClient
 
 from src.core.config import WEB_SEARCH_AGENT_SYSTEM_MESSAGE
 from src.ai.tools.web_search_tool import search_web_tool
+from src.ai.tools.search_backend import get_google_search_backend
+from src.ai.tools.tool_execution import managed_tool
 from src.ai.agents.base import create_model_client
+from src.ai.agents.context import create_model_context
 
 
 def create_web_search_agent(model_client: OpenAIChatCompletionClient) -> AssistantAgent:
@@ -29,63 +31,26 @@ def create_web_search_agent(model_client: OpenAIChatCompletionClient) -> Assista
         "WebSearchAgent",
         description="웹 정보를 검색하는 에이전트입니다.",
         handoffs=["GoogleSearchAgent"],
-        tools=[search_web_tool],
+        tools=[managed_tool(search_web_tool)],
         model_client=model_client,
         system_message=WEB_SEARCH_AGENT_SYSTEM_MESSAGE,
+        model_context=create_model_context(),
     )
 
-def google_search(query: str, num_results: int = 2, max_chars: int = 500) -> list:  # type: ignore[type-arg]
-    import os
-    import time
-
-    import requests
-    from bs4 import BeautifulSoup
-    from dotenv import load_dotenv
-
-    load_dotenv()
-
-    api_key = os.getenv("GOOGLE_API_KEY")
-    search_engine_id = os.getenv("GOOGLE_SEARCH_ENGINE_ID")
-
-    if not api_key or not search_engine_id:
-        raise ValueError("API key or Search Engine ID not found in environment variables")
-
-    url = "https://customsearch.googleapis.com/customsearch/v1"
-    params = {"key": str(api_key), "cx": str(search_engine_id), "q": str(query), "num": str(num_results)}
-
-    response = requests.get(url, params=params)
-
-    if response.status_code != 200:
-        print(response.json())
-        raise Exception(f"Error in API request: {response.status_code}")
-
-    results = response.json().get("items", [])
-
-    def get_page_content(url: str) -> str:
-        try:
-            response = requests.get(url, timeout=10)
-            soup = BeautifulSoup(response.content, "html.parser")
-            text = soup.get_text(separator=" ", strip=True)
-            words = text.split()
-            content = ""
-            for word in words:
-                if len(content) + len(word) + 1 > max_chars:
-                    break
-                content += " " + word
-            return content.strip()
-        except Exception as e:
-            print(f"Error fetching {url}: {str(e)}")
-            return ""
-
-    enriched_results = []
-    for item in results:
-        body = get_page_content(item["link"])
-        enriched_results.append(
-            {"title": item["title"], "link": item["link"], "snippet": item["snippet"], "body": body}
-        )
-        time.sleep(1)  # Be respectful to the servers
+async def google_search(query: str, num_results: int = 2, max_chars: int = 500) -> list:  # type: ignore[type-arg]
+    """
+    Google Custom Search(또는 설정된 검색 백엔드)로 검색하고 결과 페이지 본문 일부를 함께 반환합니다.
+    
+    결과 페이지들은 공유 HTTP 클라이언트로 동시에 가져오며, 호스트별 요청 제한을 적용합니다.
+    """
+    backend = get_google_search_backend()
+    results = await backend.search(query, num_results)
+    bodies = await backend.fetch_bodies(query, results, max_chars)
 
-    return enriched_results
+    return [
+        {"title": result.title, "link": result.url, "snippet": result.content, "body": body}
+        for result, body in zip(results, bodies)
+    ]
 
 def create_google_search_agent(model_client: OpenAIChatCompletionClient) -> AssistantAgent:
     """
@@ -97,7 +62,7 @@ def create_google_search_agent(model_client: OpenAIChatCompletionClient) -> Assi
     Returns:
         AssistantAgent: Google 검색 에이전트
     """
-    google_search_tool = FunctionTool(
+    google_search_tool = managed_tool(
         google_search,
         description="Google에서 정보를 검색하고, 스니펫과 본문 내용이 포함된 결과를 반환합니다",
         name="google_search"
@@ -109,6 +74,7 @@ def create_google_search_agent(model_client: OpenAIChatCompletionClient) -> Assi
         tools=[google_search_tool],
         model_client=model_client,
         system_message="You are a helpful AI assistant. Solve tasks using your tools. You can use the WebSearchAgent to search the web for information.",
+        model_context=create_model_context(),
     )
 
 async def test_web_search_agent():
@@ -6,19 +6,23 @@
 """
 
 import asyncio
-from typing import Dict, List, Any, Optional, Union
-from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Tuple, Union
+from dataclasses import dataclass, field
 
 from autogen_agentchat.agents import AssistantAgent
 from autogen_agentchat.messages import TextMessage
 from autogen_agentchat.conditions import MaxMessageTermination, TextMentionTermination
-from autogen_agentchat.teams import SelectorGroupChat
+from autogen_agentchat.teams import BaseGroupChat, RoundRobinGroupChat, SelectorGroupChat
 from autogen_ext.models.openai import OpenAIChatCompletionClient
 
-from src.core.config import MAX_MESSAGES
+from src.core.config import MAX_MESSAGES, SELECTOR_PROMPT, DEFAULT_MODEL, TEAM_MAX_CONCURRENT_RUNS
 from src.repositories.agent_logs import AgentMessageRepository
+from src.ai.agents.model_router import COMPLEX, ModelCallLog, ModelRouter, track_model_calls
+from src.ai.tools.tool_execution import ToolRunCache, tool_run_scope
 from .team_config import TeamConfigManager, get_config_manager
-from .message_bus import MessageBus, TeamCoordinator, MessageType, TeamMessage, get_message_bus, get_team_coordinator
+from .workflow_dag import DagWorkflowExecutor, render_task_template
+from .token_usage import TokenUsageTracker, create_token_budget_termination
+from .message_bus import MessageBus, TeamCoordinator, MessageType, TeamMessage
 
 
 @dataclass
@@ -29,69 +33,143 @@ class ExecutionResult:
     errors: Dict[str, str]
     execution_time: float
     team_statuses: Dict[str, Any]
+    team_timings: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    critical_path: List[str] = field(default_factory=list)
+    critical_path_time: float = 0.0
+    token_usage: Dict[str, Any] = field(default_factory=dict)
+    model_calls: Dict[str, Any] = field(default_factory=dict)
 
 
 class AdvancedTeamManager:
     """고급 팀 관리자"""
     
-    def __init__(self, model_client: OpenAIChatCompletionClient):
+    def __init__(self, model_client: OpenAIChatCompletionClient, model_router: Optional[ModelRouter] = None):
         self.model_client = model_client
+        # 모델 라우터가 있으면 역할별 티어 모델을 사용 (없으면 model_client 하나로 모든 역할 수행)
+        self.model_router = model_router
         self.config_manager = get_config_manager()
-        self.message_bus = get_message_bus()
-        self.coordinator = get_team_coordinator()
-        self.teams: Dict[str, SelectorGroupChat] = {}
+        # 관리자마다 별도의 버스를 사용해 모델 설정별 관리자들의 팀 구독이 서로 겹치지 않도록 함
+        self.message_bus = MessageBus()
+        self.coordinator = TeamCoordinator(self.message_bus)
+        # 팀별 유휴 인스턴스 풀 (그룹챗 하나는 동시에 한 실행만 가능하므로 동시 요청마다 인스턴스를 빌려 씀)
+        self._idle_teams: Dict[str, List[BaseGroupChat]] = {}
+        # 설정이 바뀌거나 다시 초기화되면 증가시켜, 이전 세대의 인스턴스는 풀에 돌려놓지 않음
+        self._team_generation = 0
         self.team_handlers: Dict[str, callable] = {}
         self._initialized = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # run_id별 토큰 사용량 (요청 메시지의 metadata["run_id"]로 연결)
+        self._run_usage: Dict[int, TokenUsageTracker] = {}
+        # run_id별 티어별 모델 호출 기록
+        self._run_call_logs: Dict[int, ModelCallLog] = {}
+        # run_id별 도구 결과 캐시 (같은 run의 팀들이 공유)
+        self._run_tool_caches: Dict[int, ToolRunCache] = {}
     
     async def initialize(self):
-        """시스템 초기화"""
-        if self._initialized:
+        """
+        시스템 초기화
+        
+        팀 자체는 첫 작업 요청 시점에 생성합니다. 이전과 다른 이벤트 루프에서 호출되면
+        (예: 반복된 asyncio.run) 루프에 묶인 버스 워커와 팀을 다시 준비합니다.
+        """
+        loop = asyncio.get_running_loop()
+        if self._initialized and self._loop is loop:
             return
         
         # 메시지 버스 시작
         await self.message_bus.start()
         
-        # 모든 팀 생성
-        for team_name in self.config_manager.list_teams():
-            await self._create_team(team_name)
-        
-        # 팀별 메시지 핸들러 등록
+        # 팀별 메시지 핸들러 등록 (팀 생성은 지연)
+        self._discard_idle_teams()
         self._register_team_handlers()
         
+        self._loop = loop
         self._initialized = True
         print("✅ 고급 팀 관리자 초기화 완료")
     
-    async def _create_team(self, team_name: str):
+    def _refresh_config(self):
+        """설정 파일이 바뀌었으면 다시 로드하고 캐시된 팀을 폐기"""
+        if not self.config_manager.reload_if_changed():
+            return
+        
+        self._discard_idle_teams()
+        for team_name in list(self.team_handlers.keys()):
+            if team_name not in self.config_manager.list_teams():
+                self.message_bus.unsubscribe(team_name)
+                del self.team_handlers[team_name]
+        self._register_team_handlers()
+    
+    def _discard_idle_teams(self):
+        """풀의 팀 인스턴스를 모두 버림 (실행 중인 인스턴스는 끝난 뒤 풀로 돌아오지 않음)"""
+        self._idle_teams.clear()
+        self._team_generation += 1
+    
+    async def _acquire_team(self, team_name: str) -> Tuple[BaseGroupChat, int]:
+        """풀에서 유휴 팀 인스턴스를 빌리고, 없으면 생성 (인스턴스와 세대 번호 반환)"""
+        generation = self._team_generation
+        idle = self._idle_teams.get(team_name)
+        if idle:
+            return idle.pop(), generation
+        return await self._create_team(team_name), generation
+    
+    def _release_team(self, team_name: str, team: BaseGroupChat, generation: int):
+        """정상적으로 끝난 팀 인스턴스를 풀에 반환"""
+        if generation != self._team_generation:
+            return
+        idle = self._idle_teams.setdefault(team_name, [])
+        if len(idle) < TEAM_MAX_CONCURRENT_RUNS:
+            idle.append(team)
+    
+    async def _create_team(self, team_name: str) -> BaseGroupChat:
         """팀 생성"""
         team_def = self.config_manager.get_team_definition(team_name)
         if not team_def:
             raise ValueError(f"팀 정의를 찾을 수 없습니다: {team_name}")
         
-        # 에이전트 생성
-        agents = self.config_manager.create_agents_for_team(team_name, self.model_client)
+        # 에이전트 생성 (라우터가 있으면 마스터 팀은 master 티어, 그 외는 에이전트 역할별 티어)
+        selector_client = self.model_client
+        client_for_factory = None
+        if self.model_router is not None:
+            selector_client = self.model_router.client_for_role("selector")
+            if self.config_manager.is_master_team(team_name):
+                master_client = self.model_router.client_for_role("master")
+                client_for_factory = lambda factory_name: master_client
+            else:
+                client_for_factory = self.model_router.client_for_factory
+        agents = self.config_manager.create_agents_for_team(team_name, self.model_client, client_for_factory)
         
         # 팀 생성
         termination = TextMentionTermination(team_def.termination_keyword) | MaxMessageTermination(max_messages=team_def.max_messages)
+        token_budget = create_token_budget_termination(team_def.max_total_tokens)
+        if token_budget is not None:
+            termination = termination | token_budget
         
-        team = SelectorGroupChat(
-            participants=agents,
-            termination_condition=termination,
-            model_client=self.model_client,
-        )
-        
-        self.teams[team_name] = team
+        if len(agents) < 2:
+            # SelectorGroupChat은 참여자가 2명 이상이어야 하므로 단일 에이전트 팀(마스터팀 등)은 라운드 로빈으로 실행
+            team = RoundRobinGroupChat(participants=agents, termination_condition=termination)
+        else:
+            team = SelectorGroupChat(
+                participants=agents,
+                termination_condition=termination,
+                model_client=selector_client,
+                selector_prompt=SELECTOR_PROMPT,
+            )
         
-        # 팀 상태 초기화
-        self.message_bus.update_team_status(team_name, "idle")
+        if not self.message_bus.get_team_status(team_name):
+            self.message_bus.update_team_status(team_name, "idle")
         
         print(f"✅ 팀 생성 완료: {team_name}")
+        return team
     
     def _register_team_handlers(self):
         """팀별 메시지 핸들러 등록"""
-        for team_name in self.teams.keys():
+        for team_name in self.config_manager.list_teams():
             handler = self._create_team_handler(team_name)
             self.team_handlers[team_name] = handler
-            self.message_bus.subscribe(team_name, handler)
+            # 같은 팀 요청도 TEAM_MAX_CONCURRENT_RUNS개까지 각자의 팀 인스턴스로 동시에 실행
+            self.message_bus.subscribe(team_name, handler, concurrency=TEAM_MAX_CONCURRENT_RUNS)
+            if not self.message_bus.get_team_status(team_name):
+                self.message_bus.update_team_status(team_name, "idle")
     
     def _create_team_handler(self, team_name: str):
         """팀별 메시지 핸들러 생성"""
@@ -108,7 +186,11 @@ class AdvancedTeamManager:
             self.message_bus.update_team_status(team_name, "running", current_task=message.content)
             
             # 작업 실행
-            result = await self._execute_team_task(team_name, message.content)
+            run_id = message.metadata.get("run_id")
+            usage = self._run_usage.get(run_id)
+            # 버스 워커 태스크는 요청자의 컨텍스트를 물려받지 않으므로 run의 호출 기록/도구 캐시를 직접 연결
+            with track_model_calls(log=self._run_call_logs.get(run_id)), tool_run_scope(self._run_tool_caches.get(run_id)):
+                result = await self._execute_team_task(team_name, message.content, usage)
             
             # 결과 전송
             result_message = TeamMessage(
@@ -124,6 +206,10 @@ class AdvancedTeamManager:
             # 팀 상태 업데이트
             self.message_bus.update_team_status(team_name, "completed", result=result)
             
+        except asyncio.CancelledError:
+            # 요청 시간 초과로 버스가 핸들러를 취소함 (실행 도중 끊긴 팀 인스턴스는 풀로 돌아가지 않음)
+            self.message_bus.update_team_status(team_name, "error", error="요청 시간 초과로 실행이 취소되었습니다")
+            raise
         except Exception as e:
             # 오류 전송
             error_message = TeamMessage(
@@ -139,17 +225,31 @@ class AdvancedTeamManager:
             # 팀 상태 업데이트
             self.message_bus.update_team_status(team_name, "error", error=str(e))
     
-    async def _execute_team_task(self, team_name: str, task: str) -> str:
-        """팀 작업 실행"""
-        team = self.teams[team_name]
+    async def _execute_team_task(
+        self,
+        team_name: str,
+        task: str,
+        usage_tracker: Optional[TokenUsageTracker] = None
+    ) -> str:
+        """
+        팀 작업 실행 (usage_tracker를 주면 팀 이름 범위로 토큰 사용량 집계)
+        
+        풀에서 빌린 팀 인스턴스는 정상 종료 시에만 돌려놓고, 오류/취소로 끝나면 버립니다.
+        """
+        team, generation = await self._acquire_team(team_name)
+        # 이전 실행의 대화 기록이 섞이지 않도록 재사용 전에 초기화
+        await team.reset()
         
         stream = team.run_stream(task=task)
         final_result = ""
         
         async for message in stream:
+            if usage_tracker is not None:
+                usage_tracker.record(message, scope=team_name)
             if hasattr(message, 'source') and hasattr(message, 'content'):
                 final_result = str(message.content)
         
+        self._release_team(team_name, team, generation)
         return final_result
     
     async def execute_workflow(
@@ -160,14 +260,19 @@ class AdvancedTeamManager:
         msg_repo: AgentMessageRepository
     ) -> ExecutionResult:
         """워크플로우 실행"""
-        if not self._initialized:
-            await self.initialize()
+        await self.initialize()
+        self._refresh_config()
         
         workflow = self.config_manager.get_workflow(workflow_name)
         if not workflow:
             raise ValueError(f"워크플로우를 찾을 수 없습니다: {workflow_name}")
         
         start_time = asyncio.get_event_loop().time()
+        usage = TokenUsageTracker(model=getattr(self.model_client, "model", None) or DEFAULT_MODEL)
+        self._run_usage[run_id] = usage
+        call_log = ModelCallLog(complexity=COMPLEX)
+        self._run_call_logs[run_id] = call_log
+        self._run_tool_caches[run_id] = ToolRunCache()
         
         try:
             print(f"\n{'='*80}")
@@ -179,34 +284,59 @@ class AdvancedTeamManager:
             team_tasks = {}
             for team_name in workflow.teams:
                 task_template = workflow.task_templates.get(team_name, "{main_task}")
-                team_task = task_template.format(main_task=main_task)
+                team_task = render_task_template(task_template, main_task=main_task)
                 team_tasks[team_name] = team_task
             
+            errors: Dict[str, str] = {}
+            team_timings: Dict[str, Dict[str, float]] = {}
+            critical_path: List[str] = []
+            critical_path_time = 0.0
+            
             # 워크플로우 실행 전략에 따른 실행
-            if workflow.execution_strategy == "parallel":
+            if workflow.execution_strategy == "dag":
+                report = await self._execute_dag_workflow(workflow, main_task, run_id, msg_repo)
+                results = report.results
+                errors = report.errors
+                team_timings = {
+                    team_name: {
+                        "started_at": timing.started_at,
+                        "finished_at": timing.finished_at,
+                        "duration": timing.duration,
+                    }
+                    for team_name, timing in report.timings.items()
+                }
+                critical_path = report.critical_path
+                critical_path_time = report.critical_path_time
+            elif workflow.execution_strategy == "parallel":
                 results = await self._execute_parallel_workflow(team_tasks, run_id, msg_repo)
             else:
                 results = await self._execute_sequential_workflow(team_tasks, run_id, msg_repo)
             
             # 마스터 팀이 있는 경우 결과 종합
-            if workflow.master_team and workflow.master_team in self.teams:
+            if workflow.master_team and workflow.master_team in self.team_handlers:
                 master_result = await self._execute_master_team(
                     workflow.master_team, 
                     main_task, 
                     results, 
                     run_id, 
-                    msg_repo
+                    msg_repo,
+                    workflow_name
                 )
                 results[workflow.master_team] = master_result
             
             execution_time = asyncio.get_event_loop().time() - start_time
             
             return ExecutionResult(
-                success=True,
+                success=not errors,
                 results=results,
-                errors={},
+                errors=errors,
                 execution_time=execution_time,
-                team_statuses=self.message_bus.get_all_team_statuses()
+                team_statuses=self.message_bus.get_all_team_statuses(),
+                team_timings=team_timings,
+                critical_path=critical_path,
+                critical_path_time=critical_path_time,
+                token_usage=usage.to_dict(),
+                model_calls=call_log.to_dict()
             )
             
         except Exception as e:
@@ -216,8 +346,16 @@ class AdvancedTeamManager:
                 results={},
                 errors={"workflow_error": str(e)},
                 execution_time=execution_time,
-                team_statuses=self.message_bus.get_all_team_statuses()
+                team_statuses=self.message_bus.get_all_team_statuses(),
+                token_usage=usage.to_dict(),
+                model_calls=call_log.to_dict()
             )
+        finally:
+            # 팀 결과 메시지는 쓰기 스레드가 저장하므로 run을 끝내기 전에 저장 완료를 기다림
+            await msg_repo.flush(run_id)
+            self._run_usage.pop(run_id, None)
+            self._run_call_logs.pop(run_id, None)
+            self._run_tool_caches.pop(run_id, None)
     
     async def _execute_parallel_workflow(
         self, 
@@ -229,12 +367,12 @@ class AdvancedTeamManager:
         print("🔄 병렬 워크플로우 실행 시작")
         
         # 모든 팀에 병렬로 작업 요청
-        results = await self.coordinator.coordinate_parallel_tasks(team_tasks)
+        results = await self.coordinator.coordinate_parallel_tasks(team_tasks, metadata={"run_id": run_id})
         
         # 결과를 메시지 저장소에 기록
         for team_name, result in results.items():
             if result:
-                msg_repo.add(
+                msg_repo.enqueue(
                     run_id=run_id,
                     agent_name=team_name,
                     role="assistant",
@@ -254,12 +392,12 @@ class AdvancedTeamManager:
         print("🔄 순차 워크플로우 실행 시작")
         
         team_task_list = list(team_tasks.items())
-        results = await self.coordinator.coordinate_sequential_tasks(team_task_list)
+        results = await self.coordinator.coordinate_sequential_tasks(team_task_list, metadata={"run_id": run_id})
         
         # 결과를 메시지 저장소에 기록
         for i, (team_name, result) in enumerate(zip(team_tasks.keys(), results)):
             if result:
-                msg_repo.add(
+                msg_repo.enqueue(
                     run_id=run_id,
                     agent_name=team_name,
                     role="assistant",
@@ -269,13 +407,47 @@ class AdvancedTeamManager:
         
         return dict(zip(team_tasks.keys(), results))
     
+    async def _execute_dag_workflow(
+        self,
+        workflow,
+        main_task: str,
+        run_id: int,
+        msg_repo: AgentMessageRepository
+    ):
+        """의존성(DAG) 워크플로우 실행"""
+        print("🔄 DAG 워크플로우 실행 시작")
+        
+        async def run_team(team_name: str, team_task: str) -> str:
+            result = await self.coordinator.request_task_from_team(team_name, team_task, metadata={"run_id": run_id})
+            if result:
+                msg_repo.enqueue(
+                    run_id=run_id,
+                    agent_name=team_name,
+                    role="assistant",
+                    content=result,
+                    tool_name=None,
+                )
+            return result
+        
+        executor = DagWorkflowExecutor(run_team)
+        report = await executor.execute(
+            workflow.teams,
+            workflow.depends_on,
+            workflow.task_templates,
+            main_task,
+        )
+        
+        print(f"⏱️ 크리티컬 패스: {' → '.join(report.critical_path)} ({report.critical_path_time:.2f}초)")
+        return report
+    
     async def _execute_master_team(
         self, 
         master_team_name: str, 
         main_task: str, 
         sub_results: Dict[str, str], 
         run_id: int, 
-        msg_repo: AgentMessageRepository
+        msg_repo: AgentMessageRepository,
+        workflow_name: str = "standard_analysis"
     ) -> str:
         """마스터 팀 실행"""
         print(f"🎖️ 마스터 팀 실행: {master_team_name}")
@@ -284,7 +456,7 @@ class AdvancedTeamManager:
         master_task = self.config_manager.create_task_for_team(
             master_team_name, 
             main_task, 
-            "standard_analysis"
+            workflow_name
         )
         
         # 하위 팀 결과를 마스터 작업에 포함
@@ -297,10 +469,10 @@ class AdvancedTeamManager:
         master_task = master_task.replace("{sub_results}", sub_results_text)
         
         # 마스터 팀 실행
-        result = await self.coordinator.request_task_from_team(master_team_name, master_task)
+        result = await self.coordinator.request_task_from_team(master_team_name, master_task, metadata={"run_id": run_id})
         
         # 결과 저장
-        msg_repo.add(
+        msg_repo.enqueue(
             run_id=run_id,
             agent_name=master_team_name,
             role="assistant",
@@ -313,7 +485,9 @@ class AdvancedTeamManager:
     async def shutdown(self):
         """시스템 종료"""
         await self.message_bus.stop()
+        self._discard_idle_teams()
         self._initialized = False
+        self._loop = None
         print("🛑 고급 팀 관리자 종료 완료")
     
     def get_team_status(self, team_name: str) -> Optional[Any]:
@@ -325,13 +499,54 @@ class AdvancedTeamManager:
         return self.message_bus.get_all_team_statuses()
 
 
+# 모델 설정별로 재사용하는 관리자 캐시
+_team_managers: Dict[str, AdvancedTeamManager] = {}
+
+
+def _model_config_key(model_client: OpenAIChatCompletionClient) -> str:
+    """모델 클라이언트 설정을 캐시 키로 변환 (API 키는 마스킹된 형태로 직렬화됨)"""
+    try:
+        return model_client.dump_component().model_dump_json()
+    except Exception:
+        return f"client:{id(model_client)}"
+
+
+def get_advanced_team_manager(
+    model_client: OpenAIChatCompletionClient,
+    model_router: Optional[ModelRouter] = None
+) -> AdvancedTeamManager:
+    """
+    모델 설정별로 한 번만 생성되는 AdvancedTeamManager를 반환합니다.
+    
+    초기화(버스 시작, 핸들러 등록)는 첫 워크플로우 실행 시, 팀 생성은 첫 작업 요청 시 이루어집니다.
+    같은 팀에 대한 동시 요청은 팀별 인스턴스 풀(최대 TEAM_MAX_CONCURRENT_RUNS개)로 나누어 실행합니다.
+    """
+    key = _model_config_key(model_client)
+    if model_router is not None:
+        key = f"{key}|router:{id(model_router)}"
+    team_manager = _team_managers.get(key)
+    if team_manager is None:
+        team_manager = AdvancedTeamManager(model_client, model_router)
+        _team_managers[key] = team_manager
+    return team_manager
+
+
+async def shutdown_advanced_team_managers():
+    """캐시된 모든 관리자 종료 (애플리케이션 종료 시 호출)"""
+    managers = list(_team_managers.values())
+    _team_managers.clear()
+    for team_manager in managers:
+        await team_manager.shutdown()
+
+
 # 편의 함수들
 async def run_advanced_hierarchical_task(
     task: str,
     run_id: int,
     msg_repo: AgentMessageRepository,
     model_client: OpenAIChatCompletionClient,
-    workflow_name: str = "standard_analysis"
+    workflow_name: str = "standard_analysis",
+    model_router: Optional[ModelRouter] = None
 ) -> ExecutionResult:
     """
     고급 계층적 팀 작업 실행
@@ -342,17 +557,13 @@ async def run_advanced_hierarchical_task(
         msg_repo: 메시지 저장소
         model_client: 사용할 모델 클라이언트
         workflow_name: 사용할 워크플로우 이름
+        model_router: 역할별 티어 모델을 배정할 모델 라우터 (없으면 model_client만 사용)
         
     Returns:
         ExecutionResult: 실행 결과
     """
-    team_manager = AdvancedTeamManager(model_client)
-    
-    try:
-        result = await team_manager.execute_workflow(workflow_name, task, run_id, msg_repo)
-        return result
-    finally:
-        await team_manager.shutdown()
+    team_manager = get_advanced_team_manager(model_client, model_router)
+    return await team_manager.execute_workflow(workflow_name, task, run_id, msg_repo)
 
 
 async def test_advanced_team_system():
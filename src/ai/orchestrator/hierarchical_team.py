@@ -13,11 +13,13 @@ from enum import Enum
 from autogen_agentchat.agents import AssistantAgent
 from autogen_agentchat.messages import TextMessage
 from autogen_agentchat.conditions import MaxMessageTermination, TextMentionTermination
-from autogen_agentchat.teams import SelectorGroupChat
+from autogen_agentchat.teams import BaseGroupChat, RoundRobinGroupChat, SelectorGroupChat
 from autogen_ext.models.openai import OpenAIChatCompletionClient
 
-from src.core.config import MAX_MESSAGES
+from src.core.config import MAX_MESSAGES, SELECTOR_PROMPT, SUB_TEAM_MAX_CONCURRENCY, TEAM_MAX_TOTAL_TOKENS
 from src.repositories.agent_logs import AgentMessageRepository
+from src.ai.orchestrator.token_usage import TokenUsageTracker, create_token_budget_termination
+from src.ai.tools.tool_execution import tool_run_scope
 
 
 class TeamType(Enum):
@@ -36,6 +38,7 @@ class TeamConfig:
     agent_factories: List[Callable[[OpenAIChatCompletionClient], AssistantAgent]]
     max_messages: int = MAX_MESSAGES
     termination_keyword: str = "TERMINATE"
+    max_total_tokens: Optional[int] = TEAM_MAX_TOTAL_TOKENS
 
 
 @dataclass
@@ -45,6 +48,7 @@ class TeamResult:
     result: str
     success: bool = True
     error: Optional[str] = None
+    token_usage: Dict[str, Any] = field(default_factory=dict)
 
 
 @dataclass
@@ -58,9 +62,10 @@ class HierarchicalTask:
 class TeamManager:
     """계층적 팀 관리자"""
     
-    def __init__(self, model_client: OpenAIChatCompletionClient):
+    def __init__(self, model_client: OpenAIChatCompletionClient, max_concurrency: int = SUB_TEAM_MAX_CONCURRENCY):
         self.model_client = model_client
-        self.teams: Dict[str, SelectorGroupChat] = {}
+        self.max_concurrency = max_concurrency
+        self.teams: Dict[str, BaseGroupChat] = {}
         self.team_configs: Dict[str, TeamConfig] = {}
         self._setup_default_teams()
     
@@ -110,12 +115,20 @@ class TeamManager:
         agents = [factory(self.model_client) for factory in config.agent_factories]
         
         termination = TextMentionTermination(config.termination_keyword) | MaxMessageTermination(max_messages=config.max_messages)
+        token_budget = create_token_budget_termination(config.max_total_tokens)
+        if token_budget is not None:
+            termination = termination | token_budget
         
-        team = SelectorGroupChat(
-            participants=agents,
-            termination_condition=termination,
-            model_client=self.model_client,
-        )
+        if len(agents) < 2:
+            # SelectorGroupChat은 참여자가 2명 이상이어야 하므로 단일 에이전트 팀(마스터팀 등)은 라운드 로빈으로 실행
+            team = RoundRobinGroupChat(participants=agents, termination_condition=termination)
+        else:
+            team = SelectorGroupChat(
+                participants=agents,
+                termination_condition=termination,
+                model_client=self.model_client,
+                selector_prompt=SELECTOR_PROMPT,
+            )
         
         self.teams[config.name] = team
     
@@ -140,15 +153,17 @@ class TeamManager:
             
             stream = team.run_stream(task=task)
             final_result = ""
+            usage = TokenUsageTracker()
             
             async for message in stream:
+                usage.record(message)
                 if hasattr(message, 'source') and hasattr(message, 'content'):
                     print(f"\n---------- {message.source} ----------")
                     print(message.content)
                     
                     final_result = str(message.content)
                     
-                    msg_repo.add(
+                    msg_repo.enqueue(
                         run_id=run_id,
                         agent_name=f"{team_name}_{message.source}",
                         role="assistant",
@@ -156,8 +171,8 @@ class TeamManager:
                         tool_name=getattr(message, "tool", None),
                     )
             
-            print(f"\n✅ {team_name} 작업 완료!")
-            return TeamResult(team_name, final_result, True)
+            print(f"\n✅ {team_name} 작업 완료! (토큰 {usage.total.total_tokens})")
+            return TeamResult(team_name, final_result, True, token_usage=usage.to_dict())
             
         except Exception as e:
             error_msg = f"팀 '{team_name}' 실행 중 오류: {str(e)}"
@@ -178,24 +193,26 @@ class TeamManager:
         
         results = {}
         
-        # 1단계: 하위 팀들 병렬 실행
-        if task.sub_tasks:
-            sub_team_tasks = []
-            for team_name, sub_task in task.sub_tasks.items():
-                if team_name in self.teams:
-                    task_coroutine = self.run_team_task(team_name, sub_task, run_id, msg_repo)
-                    sub_team_tasks.append((team_name, task_coroutine))
+        # 하위 팀과 마스터 팀이 같은 run의 도구 결과 캐시를 공유
+        # 메시지는 쓰기 스레드가 모아서 저장하고, 끝나면(실패 포함) 남은 메시지 저장을 기다림
+        with tool_run_scope():
+            try:
+                # 1단계: 하위 팀들 병렬 실행
+                if task.sub_tasks:
+                    sub_tasks = {
+                        team_name: sub_task
+                        for team_name, sub_task in task.sub_tasks.items()
+                        if team_name in self.teams
+                    }
+                    results.update(await self._run_sub_teams_concurrently(sub_tasks, run_id, msg_repo))
             
-            # 병렬 실행
-            for team_name, task_coroutine in sub_team_tasks:
-                result = await task_coroutine
-                results[team_name] = result
-        
-        # 2단계: 마스터 팀이 결과 종합
-        if "마스터팀" in self.teams and results:
-            master_task = self._create_master_task(task.main_task, results)
-            master_result = await self.run_team_task("마스터팀", master_task, run_id, msg_repo)
-            results["마스터팀"] = master_result
+                # 2단계: 마스터 팀이 결과 종합
+                if "마스터팀" in self.teams and results:
+                    master_task = self._create_master_task(task.main_task, results)
+                    master_result = await self.run_team_task("마스터팀", master_task, run_id, msg_repo)
+                    results["마스터팀"] = master_result
+            finally:
+                await msg_repo.flush(run_id)
         
         print(f"\n{'='*80}")
         print("🎉 계층적 팀 작업 완료!")
@@ -203,6 +220,41 @@ class TeamManager:
         
         return results
     
+    async def _run_sub_teams_concurrently(
+        self,
+        sub_tasks: Dict[str, str],
+        run_id: int,
+        msg_repo: AgentMessageRepository
+    ) -> Dict[str, TeamResult]:
+        """
+        하위 팀들을 동시 실행 수 제한 아래에서 병렬로 실행합니다.
+        
+        한 팀의 실패(예외 포함)는 해당 팀의 TeamResult로만 기록되며
+        다른 팀의 실행에는 영향을 주지 않습니다.
+        """
+        limit = self.max_concurrency if self.max_concurrency > 0 else len(sub_tasks)
+        semaphore = asyncio.Semaphore(max(limit, 1))
+        
+        async def run_limited(team_name: str, sub_task: str) -> TeamResult:
+            async with semaphore:
+                return await self.run_team_task(team_name, sub_task, run_id, msg_repo)
+        
+        team_names = list(sub_tasks.keys())
+        outcomes = await asyncio.gather(
+            *(run_limited(team_name, sub_tasks[team_name]) for team_name in team_names),
+            return_exceptions=True,
+        )
+        
+        results: Dict[str, TeamResult] = {}
+        for team_name, outcome in zip(team_names, outcomes):
+            if isinstance(outcome, BaseException):
+                error_msg = f"팀 '{team_name}' 실행 중 오류: {str(outcome)}"
+                print(f"❌ {error_msg}")
+                results[team_name] = TeamResult(team_name, "", False, error_msg)
+            else:
+                results[team_name] = outcome
+        return results
+    
     def _create_master_task(self, main_task: str, sub_results: Dict[str, TeamResult]) -> str:
         """마스터 팀용 종합 작업 생성"""
         results_text = ""
@@ -0,0 +1,513 @@
+"""
+팀 간 메시지 버스
+
+asyncio 기반 인프로세스 pub/sub 버스입니다.
+구독자(팀)마다 크기가 제한된 큐를 두어 팀 fan-out이 무한정 쌓이지 않도록 하고,
+correlation_id 기반 요청/응답과 큐 깊이·지연 시간 지표를 제공합니다.
+구독자마다 concurrency개의 워커가 같은 큐를 처리하므로 같은 팀에 대한 요청도 동시에 실행될 수 있습니다.
+"""
+
+import asyncio
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+from src.core.config import (
+    MESSAGE_BUS_PUBLISH_TIMEOUT_SECONDS,
+    MESSAGE_BUS_QUEUE_SIZE,
+    TEAM_RUN_TIMEOUT_SECONDS,
+)
+
+
+class MessageType(Enum):
+    """메시지 타입 정의"""
+    TASK_REQUEST = "task_request"
+    TASK_RESULT = "task_result"
+    STATUS_UPDATE = "status_update"
+    ERROR = "error"
+
+
+@dataclass
+class TeamMessage:
+    """팀 간 주고받는 메시지"""
+    type: MessageType
+    sender: str
+    recipient: Optional[str]  # None이면 발신자를 제외한 모든 구독자에게 브로드캐스트
+    content: Any
+    correlation_id: Optional[str] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)  # 예: {"run_id": 1}
+    created_at: float = field(default_factory=time.monotonic)
+
+
+@dataclass
+class TeamStatus:
+    """팀 상태"""
+    team_name: str
+    status: str  # idle | running | completed | error
+    current_task: Optional[str] = None
+    result: Optional[str] = None
+    error: Optional[str] = None
+    updated_at: datetime = field(default_factory=datetime.utcnow)
+
+
+class MessageBusOverloadedError(RuntimeError):
+    """구독자 큐가 가득 찬 상태가 발행 제한 시간 이상 지속된 경우"""
+
+
+class MessageBusNoSubscriberError(LookupError):
+    """요청 수신자(팀)를 구독한 핸들러가 없어 응답을 받을 수 없는 경우"""
+
+
+MessageHandler = Callable[[TeamMessage], Awaitable[None]]
+
+
+@dataclass
+class SubscriberMetrics:
+    """구독자별 지표"""
+    delivered: int = 0
+    handled: int = 0
+    failed: int = 0
+    rejected: int = 0
+    cancelled: int = 0  # 요청 시간 초과로 취소된 핸들러
+    dropped: int = 0  # 처리 전에 요청이 포기되어 건너뛴 메시지
+    max_queue_depth: int = 0
+    queue_wait_samples: Deque[float] = field(default_factory=lambda: deque(maxlen=500))
+    handler_samples: Deque[float] = field(default_factory=lambda: deque(maxlen=500))
+
+
+def _percentile(samples: Deque[float], percentile: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(percentile / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+class _Subscriber:
+    """구독자 하나의 큐와 처리 워커"""
+
+    def __init__(self, name: str, handler: MessageHandler, maxsize: int, concurrency: int = 1):
+        self.name = name
+        self.handler = handler
+        self.maxsize = maxsize
+        self.concurrency = max(1, concurrency)
+        self.queue: Optional[asyncio.Queue] = None
+        self.workers: List[asyncio.Task] = []
+        self.active = 0  # 실행 중인 핸들러 수
+        self.metrics = SubscriberMetrics()
+
+
+class MessageBus:
+    """asyncio 기반 인프로세스 메시지 버스"""
+
+    def __init__(
+        self,
+        queue_size: int = MESSAGE_BUS_QUEUE_SIZE,
+        publish_timeout: float = MESSAGE_BUS_PUBLISH_TIMEOUT_SECONDS,
+    ):
+        self.queue_size = queue_size
+        self.publish_timeout = publish_timeout
+        self._subscribers: Dict[str, _Subscriber] = {}
+        self._pending: Dict[str, asyncio.Future] = {}
+        # correlation_id별: 큐에서 처리를 기다리는 요청, 실행 중인 핸들러 태스크, 처리 전에 포기된(시간 초과/취소) 요청
+        self._queued: Set[str] = set()
+        # correlation_id별 핸들러 시작 신호 (요청 제한 시간은 핸들러가 시작될 때부터 계산)
+        self._started: Dict[str, asyncio.Future] = {}
+        self._handler_tasks: Dict[str, asyncio.Task] = {}
+        self._abandoned: Set[str] = set()
+        self._team_statuses: Dict[str, TeamStatus] = {}
+        self._request_samples: Deque[float] = deque(maxlen=500)
+        self._request_timeouts = 0
+        self._request_unroutable = 0
+        self._running = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    # ------------------------------------------------------------------
+    # 생명주기
+    # ------------------------------------------------------------------
+
+    async def start(self):
+        """버스 시작 (현재 이벤트 루프에 큐와 워커를 생성)"""
+        loop = asyncio.get_running_loop()
+        if self._running and self._loop is loop:
+            return
+        if self._running:
+            # 이전 이벤트 루프(예: 반복된 asyncio.run)에서 시작된 워커와 요청은 더 이상 유효하지 않음
+            self._pending.clear()
+            self._queued.clear()
+            self._started.clear()
+            self._handler_tasks.clear()
+            self._abandoned.clear()
+        self._running = True
+        self._loop = loop
+        for subscriber in self._subscribers.values():
+            self._start_workers(subscriber)
+
+    async def stop(self):
+        """버스 종료 (워커 취소 및 대기 중인 요청 취소)"""
+        if not self._running:
+            return
+        self._running = False
+        self._loop = None
+
+        workers = [worker for s in self._subscribers.values() for worker in s.workers]
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        for subscriber in self._subscribers.values():
+            subscriber.workers = []
+            subscriber.queue = None
+            subscriber.active = 0
+
+        for future in list(self._pending.values()) + list(self._started.values()):
+            if not future.done():
+                future.cancel()
+        self._pending.clear()
+        self._queued.clear()
+        self._started.clear()
+        self._handler_tasks.clear()
+        self._abandoned.clear()
+
+    def _start_workers(self, subscriber: _Subscriber):
+        # 큐는 사용하는 이벤트 루프에 묶이므로 시작할 때마다 새로 만듭니다
+        subscriber.queue = asyncio.Queue(maxsize=subscriber.maxsize)
+        subscriber.workers = [
+            asyncio.create_task(self._run_worker(subscriber)) for _ in range(subscriber.concurrency)
+        ]
+
+    async def _run_worker(self, subscriber: _Subscriber):
+        queue = subscriber.queue
+        metrics = subscriber.metrics
+        while True:
+            message: TeamMessage = await queue.get()
+            try:
+                correlation_id = message.correlation_id
+                self._queued.discard(correlation_id)
+                if correlation_id and correlation_id in self._abandoned:
+                    # 요청자가 이미 포기한 요청은 실행하지 않음
+                    self._abandoned.discard(correlation_id)
+                    metrics.dropped += 1
+                    continue
+                started = time.monotonic()
+                metrics.queue_wait_samples.append(started - message.created_at)
+                await self._run_handler(subscriber, message)
+                metrics.handler_samples.append(time.monotonic() - started)
+            finally:
+                queue.task_done()
+
+    async def _run_handler(self, subscriber: _Subscriber, message: TeamMessage):
+        """핸들러를 별도 태스크로 실행 (요청 시간 초과 시 request()가 correlation_id로 취소할 수 있도록)"""
+        metrics = subscriber.metrics
+        task = asyncio.create_task(subscriber.handler(message))
+        if message.correlation_id:
+            self._handler_tasks[message.correlation_id] = task
+            started_signal = self._started.pop(message.correlation_id, None)
+            if started_signal is not None and not started_signal.done():
+                started_signal.set_result(None)
+        subscriber.active += 1
+        try:
+            # 핸들러가 취소되어도 워커는 계속 돌아야 하므로 await task 대신 wait 사용
+            await asyncio.wait({task})
+        except asyncio.CancelledError:
+            # 워커 자체가 취소됨 (버스 종료): 실행 중인 핸들러도 함께 취소
+            task.cancel()
+            raise
+        finally:
+            subscriber.active -= 1
+            if message.correlation_id and self._handler_tasks.get(message.correlation_id) is task:
+                del self._handler_tasks[message.correlation_id]
+
+        if task.cancelled():
+            metrics.cancelled += 1
+        elif task.exception() is not None:
+            metrics.failed += 1
+            print(f"❌ 메시지 처리 오류 ({subscriber.name}): {str(task.exception())}")
+        else:
+            metrics.handled += 1
+
+    # ------------------------------------------------------------------
+    # 구독 / 발행
+    # ------------------------------------------------------------------
+
+    def subscribe(
+        self,
+        name: str,
+        handler: MessageHandler,
+        queue_size: Optional[int] = None,
+        concurrency: int = 1,
+    ):
+        """
+        구독자 등록 (같은 이름으로 다시 등록하면 핸들러를 교체)
+
+        Args:
+            concurrency: 이 구독자의 메시지를 동시에 처리할 워커 수
+        """
+        existing = self._subscribers.get(name)
+        if existing:
+            existing.handler = handler
+            return
+
+        subscriber = _Subscriber(name, handler, queue_size or self.queue_size, concurrency)
+        self._subscribers[name] = subscriber
+        if self._running:
+            self._start_workers(subscriber)
+
+    def unsubscribe(self, name: str):
+        """구독자 해제"""
+        subscriber = self._subscribers.pop(name, None)
+        if subscriber:
+            for worker in subscriber.workers:
+                worker.cancel()
+
+    async def publish(self, message: TeamMessage) -> int:
+        """
+        메시지 발행
+
+        대기 중인 요청의 응답(correlation_id 일치)은 해당 Future로 바로 전달하고,
+        나머지는 수신자 큐에 넣습니다. 큐가 가득 차면 publish_timeout 동안 기다린 뒤
+        MessageBusOverloadedError를 발생시킵니다.
+
+        Returns:
+            int: 메시지를 넣은 구독자 큐 수
+        """
+        if message.type in (MessageType.TASK_RESULT, MessageType.ERROR) and message.correlation_id:
+            future = self._pending.pop(message.correlation_id, None)
+            if future is not None:
+                if not future.done():
+                    future.set_result(message)
+                return 0
+
+        if message.recipient is None:
+            targets = [s for name, s in self._subscribers.items() if name != message.sender]
+        else:
+            subscriber = self._subscribers.get(message.recipient)
+            targets = [subscriber] if subscriber else []
+
+        for subscriber in targets:
+            await self._enqueue(subscriber, message)
+        return len(targets)
+
+    async def _enqueue(self, subscriber: _Subscriber, message: TeamMessage):
+        if not self._running or subscriber.queue is None:
+            raise RuntimeError("메시지 버스가 시작되지 않았습니다")
+
+        metrics = subscriber.metrics
+        try:
+            await asyncio.wait_for(subscriber.queue.put(message), timeout=self.publish_timeout)
+        except asyncio.TimeoutError:
+            metrics.rejected += 1
+            raise MessageBusOverloadedError(
+                f"'{subscriber.name}' 큐가 가득 찼습니다 (크기 {subscriber.maxsize})"
+            )
+        if message.correlation_id:
+            self._queued.add(message.correlation_id)
+        metrics.delivered += 1
+        metrics.max_queue_depth = max(metrics.max_queue_depth, subscriber.queue.qsize())
+
+    async def request(self, message: TeamMessage, timeout: Optional[float] = TEAM_RUN_TIMEOUT_SECONDS) -> TeamMessage:
+        """
+        요청 메시지를 발행하고 같은 correlation_id의 응답을 기다립니다.
+
+        timeout은 핸들러가 요청을 꺼내 실행을 시작한 시점부터 계산합니다. (큐 대기 시간은 제외)
+        응답 없이 끝나면(시간 초과 또는 요청자 취소) 실행 중인 핸들러를 취소하고,
+        아직 큐에서 기다리는 요청은 워커가 건너뛰도록 표시합니다.
+
+        Raises:
+            MessageBusNoSubscriberError: 수신자를 구독한 핸들러가 없는 경우 (기다리지 않고 바로 발생)
+            asyncio.TimeoutError: timeout 안에 응답이 오지 않은 경우
+        """
+        if not message.correlation_id:
+            message.correlation_id = uuid.uuid4().hex
+        correlation_id = message.correlation_id
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        started_signal = loop.create_future()
+        self._pending[correlation_id] = future
+        self._started[correlation_id] = started_signal
+        started = time.monotonic()
+        try:
+            if not await self.publish(message):
+                self._request_unroutable += 1
+                raise MessageBusNoSubscriberError(f"'{message.recipient or '*'}' 수신자를 구독한 핸들러가 없습니다")
+            # 큐에서 기다리는 동안은 제한 시간을 적용하지 않음 (앞선 요청들은 각자의 제한 시간으로 끝남)
+            await asyncio.wait({started_signal, future}, return_when=asyncio.FIRST_COMPLETED)
+            return await asyncio.wait_for(future, timeout=timeout)
+        except asyncio.TimeoutError:
+            self._request_timeouts += 1
+            raise
+        finally:
+            self._pending.pop(correlation_id, None)
+            self._started.pop(correlation_id, None)
+            if not future.done() or future.cancelled():
+                self._abandon(correlation_id)
+            self._request_samples.append(time.monotonic() - started)
+
+    def _abandon(self, correlation_id: str):
+        """응답을 더 이상 기다리지 않는 요청의 핸들러를 취소 (아직 시작 전이면 건너뛰도록 표시)"""
+        task = self._handler_tasks.pop(correlation_id, None)
+        if task is not None:
+            if not task.done():
+                task.cancel()
+        elif correlation_id in self._queued:
+            self._abandoned.add(correlation_id)
+
+    # ------------------------------------------------------------------
+    # 팀 상태
+    # ------------------------------------------------------------------
+
+    def update_team_status(self, team_name: str, status: str, **kwargs):
+        """팀 상태 업데이트"""
+        team_status = self._team_statuses.get(team_name) or TeamStatus(team_name=team_name, status=status)
+        team_status.status = status
+        for key, value in kwargs.items():
+            if hasattr(team_status, key):
+                setattr(team_status, key, value)
+        team_status.updated_at = datetime.utcnow()
+        self._team_statuses[team_name] = team_status
+
+    def get_team_status(self, team_name: str) -> Optional[TeamStatus]:
+        """팀 상태 조회"""
+        return self._team_statuses.get(team_name)
+
+    def get_all_team_statuses(self) -> Dict[str, TeamStatus]:
+        """모든 팀 상태 조회"""
+        return dict(self._team_statuses)
+
+    # ------------------------------------------------------------------
+    # 지표
+    # ------------------------------------------------------------------
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """큐 깊이 및 지연 시간 지표 조회 (시간 단위: 초)"""
+        subscribers = {}
+        for name, subscriber in self._subscribers.items():
+            metrics = subscriber.metrics
+            subscribers[name] = {
+                "queue_depth": subscriber.queue.qsize() if subscriber.queue else 0,
+                "queue_capacity": subscriber.maxsize,
+                "concurrency": subscriber.concurrency,
+                "active_handlers": subscriber.active,
+                "max_queue_depth": metrics.max_queue_depth,
+                "delivered": metrics.delivered,
+                "handled": metrics.handled,
+                "failed": metrics.failed,
+                "rejected": metrics.rejected,
+                "cancelled": metrics.cancelled,
+                "dropped": metrics.dropped,
+                "queue_wait_p50": _percentile(metrics.queue_wait_samples, 50),
+                "queue_wait_p95": _percentile(metrics.queue_wait_samples, 95),
+                "handler_p50": _percentile(metrics.handler_samples, 50),
+                "handler_p95": _percentile(metrics.handler_samples, 95),
+            }
+
+        return {
+            "running": self._running,
+            "pending_requests": len(self._pending),
+            "request_timeouts": self._request_timeouts,
+            "request_unroutable": self._request_unroutable,
+            "request_latency_p50": _percentile(self._request_samples, 50),
+            "request_latency_p95": _percentile(self._request_samples, 95),
+            "subscribers": subscribers,
+        }
+
+
+class TeamCoordinator:
+    """메시지 버스를 통해 팀에 작업을 요청하고 결과를 모으는 조정자"""
+
+    def __init__(self, message_bus: MessageBus, name: str = "coordinator"):
+        self.message_bus = message_bus
+        self.name = name
+
+    async def request_task_from_team(
+        self,
+        team_name: str,
+        task: str,
+        timeout: Optional[float] = TEAM_RUN_TIMEOUT_SECONDS,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """
+        팀에 작업을 요청하고 결과를 반환합니다.
+
+        Raises:
+            RuntimeError: 팀이 오류 메시지로 응답한 경우
+            MessageBusNoSubscriberError: 등록되지 않은 팀인 경우
+            asyncio.TimeoutError: timeout 안에 응답이 없는 경우
+        """
+        request = TeamMessage(
+            type=MessageType.TASK_REQUEST,
+            sender=self.name,
+            recipient=team_name,
+            content=task,
+            correlation_id=uuid.uuid4().hex,
+            metadata=dict(metadata or {}),
+        )
+        response = await self.message_bus.request(request, timeout=timeout)
+        if response.type == MessageType.ERROR:
+            raise RuntimeError(f"팀 '{team_name}' 작업 실패: {response.content}")
+        return str(response.content)
+
+    async def _request_or_empty(self, team_name: str, task: str, metadata: Optional[Dict[str, Any]]) -> str:
+        try:
+            return await self.request_task_from_team(team_name, task, metadata=metadata)
+        except asyncio.TimeoutError:
+            print(f"❌ 팀 '{team_name}' 응답 시간 초과")
+        except Exception as e:
+            print(f"❌ {str(e)}")
+        return ""
+
+    async def coordinate_parallel_tasks(
+        self,
+        team_tasks: Dict[str, str],
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, str]:
+        """
+        여러 팀에 동시에 작업을 요청합니다.
+
+        실패하거나 시간이 초과된 팀의 결과는 빈 문자열입니다.
+        """
+        team_names = list(team_tasks.keys())
+        results = await asyncio.gather(
+            *(self._request_or_empty(team_name, team_tasks[team_name], metadata) for team_name in team_names)
+        )
+        return dict(zip(team_names, results))
+
+    async def coordinate_sequential_tasks(
+        self,
+        team_tasks: List[Tuple[str, str]],
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> List[str]:
+        """
+        팀 작업을 순서대로 요청합니다.
+
+        실패하거나 시간이 초과된 팀의 결과는 빈 문자열입니다.
+        """
+        results = []
+        for team_name, task in team_tasks:
+            results.append(await self._request_or_empty(team_name, task, metadata))
+        return results
+
+
+# 전역 인스턴스
+_message_bus: Optional[MessageBus] = None
+_team_coordinator: Optional[TeamCoordinator] = None
+
+
+def get_message_bus() -> MessageBus:
+    """메시지 버스 인스턴스 반환"""
+    global _message_bus
+    if _message_bus is None:
+        _message_bus = MessageBus()
+    return _message_bus
+
+
+def get_team_coordinator() -> TeamCoordinator:
+    """팀 조정자 인스턴스 반환"""
+    global _team_coordinator
+    if _team_coordinator is None:
+        _team_coordinator = TeamCoordinator(get_message_bus())
+    return _team_coordinator
@@ -6,22 +6,27 @@
 """
 
 import asyncio
-from typing import List, Optional, Dict, Any
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 
 from autogen_agentchat.agents import AssistantAgent
 from autogen_agentchat.messages import TextMessage
 from autogen_agentchat.conditions import MaxMessageTermination, TextMentionTermination
 from autogen_agentchat.teams import SelectorGroupChat
+from autogen_core.models import ChatCompletionClient
 from autogen_ext.models.openai import OpenAIChatCompletionClient
 
-from src.core.config import MAX_MESSAGES, TEAM_RUN_TIMEOUT_SECONDS, DEVILS_ADVOCATE_PREVIEW_ROUNDS
+from src.core.config import MAX_MESSAGES, TEAM_RUN_TIMEOUT_SECONDS, DEVILS_ADVOCATE_PREVIEW_ROUNDS, TEAM_MAX_TOTAL_TOKENS, SELECTOR_PROMPT
 from src.repositories.agent_logs import AgentMessageRepository
+from src.ai.orchestrator.token_usage import TokenUsageTracker, create_token_budget_termination
+from src.ai.tools.tool_execution import tool_run_scope
 
 
 def create_team(
     agents: List[AssistantAgent],
     model_client: OpenAIChatCompletionClient,
-    max_messages: int = MAX_MESSAGES
+    max_messages: int = MAX_MESSAGES,
+    max_total_tokens: Optional[int] = TEAM_MAX_TOTAL_TOKENS,
+    selector_model_client: Optional[ChatCompletionClient] = None
 ) -> SelectorGroupChat:
     """
     멀티 에이전트 팀을 생성합니다.
@@ -30,29 +35,22 @@ def create_team(
         agents: 팀에 참여할 에이전트 리스트
         model_client: 사용할 모델 클라이언트
         max_messages: 최대 메시지 수
+        max_total_tokens: 실행당 최대 토큰 수 (None 또는 0 이하이면 제한 없음)
+        selector_model_client: 발화자 선택에 사용할 모델 클라이언트 (기본값: model_client)
         
     Returns:
         SelectorGroupChat: 설정된 팀
     """
     termination = TextMentionTermination("TERMINATE") | MaxMessageTermination(max_messages=max_messages)
+    token_budget = create_token_budget_termination(max_total_tokens)
+    if token_budget is not None:
+        termination = termination | token_budget
     
-    selector_prompt = """다음 작업을 수행할 에이전트를 선택하세요.
-
-    {roles}
-
-    현재 대화 맥락:
-    {history}
-
-    위 대화를 읽고, {participants} 중에서 다음 작업을 수행할 에이전트를 선택하세요.
-    다른 에이전트가 작업을 시작하기 전에 플래너 에이전트가 작업을 할당했는지 확인하세요.
-    한 명의 에이전트만 선택하세요.
-    """
-
     return SelectorGroupChat(
         participants=agents,
         termination_condition=termination,
-        model_client=model_client,
-        selector_prompt=selector_prompt,
+        model_client=selector_model_client or model_client,
+        selector_prompt=SELECTOR_PROMPT,
         # allow_multiple_speaker=True,
     )
 
@@ -63,11 +61,20 @@ def print_section_header(title: str) -> None:
     print("=" * 80)
 
 
+def _print_turn_usage(message) -> None:
+    """모델 호출이 포함된 메시지의 턴별 토큰 사용량을 출력합니다."""
+    usage = getattr(message, "models_usage", None)
+    if usage is not None:
+        print(f"🔢 [턴 토큰] 입력 {usage.prompt_tokens} / 출력 {usage.completion_tokens}")
+
+
 async def run_team_task(
     team: SelectorGroupChat,
     task: str,
     run_id: int,
     msg_repo: AgentMessageRepository,
+    usage_tracker: Optional[TokenUsageTracker] = None,
+    on_message: Optional[Callable[[Any], Awaitable[None]]] = None,
 ) -> str:
     """
     팀에 작업을 할당하고 결과를 스트리밍 방식으로 출력합니다.
@@ -77,6 +84,8 @@ async def run_team_task(
         task: 수행할 작업 설명
         run_id: 실행 ID
         msg_repo: 메시지 저장소
+        usage_tracker: 전달하면 메시지별 토큰 사용량을 집계
+        on_message: 전달하면 에이전트 메시지마다 호출 (진행 상황 중간 보고용)
         
     Returns:
         str: 팀의 최종 처리 결과
@@ -85,26 +94,42 @@ async def run_team_task(
     print(f"\n질문: {task}\n")
     print("=" * 80)
     
-    stream = team.run_stream(task=task)
-    final_result = ""
-    
-    async for message in stream:
-        if hasattr(message, 'source') and hasattr(message, 'content'):
-            print(f"\n---------- {message.source} ----------")
-            print(message.content)
+    # run 안에서 같은 인자로 다시 호출된 검색/분석 도구는 결과를 재사용
+    with tool_run_scope() as tool_cache:
+        stream = team.run_stream(task=task)
+        final_result = ""
+    
+        # 메시지는 쓰기 스레드가 모아서 저장하고, 실행이 끝나면(실패 포함) 남은 메시지 저장을 기다림
+        try:
+            async for message in stream:
+                if usage_tracker is not None:
+                    usage_tracker.record(message)
+                if hasattr(message, 'source') and hasattr(message, 'content'):
+                    print(f"\n---------- {message.source} ----------")
+                    print(message.content)
+                    _print_turn_usage(message)
             
-            # 마지막 메시지를 최종 결과로 저장
-            final_result = str(message.content)
-
-            msg_repo.add(
-                run_id=run_id,
-                agent_name=str(message.source),
-                role="assistant",  # 필요 시 매핑 로직 적용
-                content=str(message.content),
-                tool_name=getattr(message, "tool", None),
-            )
+                    # 마지막 메시지를 최종 결과로 저장
+                    final_result = str(message.content)
+
+                    msg_repo.enqueue(
+                        run_id=run_id,
+                        agent_name=str(message.source),
+                        role="assistant",  # 필요 시 매핑 로직 적용
+                        content=str(message.content),
+                        tool_name=getattr(message, "tool", None),
+                    )
+            
+                    if on_message is not None:
+                        await on_message(message)
+        finally:
+            await msg_repo.flush(run_id)
     
     print_section_header("작업 완료!")
+    if tool_cache.hits:
+        print(f"♻️ 도구 결과 재사용: {tool_cache.hits}회")
+    if usage_tracker is not None:
+        print(f"🔢 토큰 사용량: {usage_tracker.total.total_tokens} (입력 {usage_tracker.total.prompt_tokens} / 출력 {usage_tracker.total.completion_tokens})")
     return final_result
 
 
@@ -185,6 +210,7 @@ async def run_sub_team_task(
     team_name: str,
     run_id: int,
     msg_repo: AgentMessageRepository,
+    usage_tracker: Optional[TokenUsageTracker] = None,
 ) -> str:
     """
     하위 팀에 작업을 할당하고 결과를 반환합니다.
@@ -194,7 +220,8 @@ async def run_sub_team_task(
         task: 수행할 작업 설명
         team_name: 팀 이름
         run_id: 실행 ID
-        msg_repo: 메시지 저장소
+        msg_repo: 메시지 저장소 (메시지는 쓰기 스레드로 넘기므로 run을 끝내는 쪽에서 msg_repo.flush 호출)
+        usage_tracker: 전달하면 메시지별 토큰 사용량을 집계
         
     Returns:
         str: 팀의 최종 결과
@@ -207,14 +234,17 @@ async def run_sub_team_task(
     final_result = ""
     
     async for message in stream:
+        if usage_tracker is not None:
+            usage_tracker.record(message)
         if hasattr(message, 'source') and hasattr(message, 'content'):
             print(f"\n---------- {message.source} ----------")
             print(message.content)
+            _print_turn_usage(message)
             
             # 마지막 메시지를 최종 결과로 저장
             final_result = str(message.content)
             
-            msg_repo.add(
+            msg_repo.enqueue(
                 run_id=run_id,
                 agent_name=f"{team_name}_{message.source}",
                 role="assistant",
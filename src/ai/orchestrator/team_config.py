@@ -4,14 +4,21 @@
 YAML 또는 JSON 기반으로 팀 구성을 정의하고 관리합니다.
 """
 
+import logging
 import yaml
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, field
 from pathlib import Path
 
 from autogen_agentchat.agents import AssistantAgent
 from autogen_ext.models.openai import OpenAIChatCompletionClient
 
+from src.core.config import TEAM_MAX_TOTAL_TOKENS
+from .workflow_dag import render_task_template, topological_order
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class AgentConfig:
@@ -32,6 +39,7 @@ class TeamDefinition:
     max_messages: int = 20
     termination_keyword: str = "TERMINATE"
     execution_order: Optional[List[str]] = None
+    max_total_tokens: Optional[int] = TEAM_MAX_TOTAL_TOKENS  # 실행당 토큰 예산 (0 이하이면 제한 없음)
 
 
 @dataclass
@@ -40,9 +48,10 @@ class HierarchicalWorkflow:
     name: str
     description: str
     teams: List[str]  # 팀 이름들
-    execution_strategy: str = "parallel"  # "parallel" 또는 "sequential"
+    execution_strategy: str = "parallel"  # "parallel", "sequential" 또는 "dag"
     master_team: Optional[str] = None
     task_templates: Dict[str, str] = field(default_factory=dict)
+    depends_on: Dict[str, List[str]] = field(default_factory=dict)  # 팀별 선행 팀 목록 (dag 전략)
 
 
 class TeamConfigManager:
@@ -53,6 +62,7 @@ class TeamConfigManager:
         self.team_definitions: Dict[str, TeamDefinition] = {}
         self.workflows: Dict[str, HierarchicalWorkflow] = {}
         self.agent_factories: Dict[str, callable] = {}
+        self._config_mtime: Optional[float] = None
         self._load_agent_factories()
         self._load_configs()
     
@@ -74,14 +84,31 @@ class TeamConfigManager:
         }
     
     def _load_configs(self):
-        """설정 파일 로드"""
+        """
+        설정 파일 로드
+        
+        새 설정을 끝까지 파싱/검증한 뒤에만 교체하고 mtime을 기록하므로,
+        잘못된 파일이면 예외가 나고 기존 설정과 mtime은 그대로 남습니다.
+        """
         config_file = Path(self.config_path)
         if not config_file.exists():
             self._create_default_config()
-            return
         
+        mtime = config_file.stat().st_mtime
         with open(config_file, 'r', encoding='utf-8') as f:
-            config_data = yaml.safe_load(f)
+            config_data = yaml.safe_load(f) or {}
+        
+        team_definitions, workflows = self._parse_configs(config_data)
+        self.team_definitions = team_definitions
+        self.workflows = workflows
+        self._config_mtime = mtime
+    
+    def _parse_configs(
+        self, config_data: Dict[str, Any]
+    ) -> Tuple[Dict[str, TeamDefinition], Dict[str, HierarchicalWorkflow]]:
+        """설정 데이터를 팀 정의/워크플로우로 변환 (DAG 워크플로우는 순환/미정의 팀 참조 검증)"""
+        team_definitions: Dict[str, TeamDefinition] = {}
+        workflows: Dict[str, HierarchicalWorkflow] = {}
         
         # 팀 정의 로드
         for team_data in config_data.get('teams', []):
@@ -92,9 +119,10 @@ class TeamConfigManager:
                 agents=agents,
                 max_messages=team_data.get('max_messages', 20),
                 termination_keyword=team_data.get('termination_keyword', 'TERMINATE'),
-                execution_order=team_data.get('execution_order')
+                execution_order=team_data.get('execution_order'),
+                max_total_tokens=team_data.get('max_total_tokens', TEAM_MAX_TOTAL_TOKENS)
             )
-            self.team_definitions[team_def.name] = team_def
+            team_definitions[team_def.name] = team_def
         
         # 워크플로우 정의 로드
         for workflow_data in config_data.get('workflows', []):
@@ -104,9 +132,15 @@ class TeamConfigManager:
                 teams=workflow_data['teams'],
                 execution_strategy=workflow_data.get('execution_strategy', 'parallel'),
                 master_team=workflow_data.get('master_team'),
-                task_templates=workflow_data.get('task_templates', {})
+                task_templates=workflow_data.get('task_templates', {}),
+                depends_on=workflow_data.get('depends_on', {})
             )
-            self.workflows[workflow.name] = workflow
+            if workflow.execution_strategy == "dag":
+                # 순환/미정의 팀 참조는 로드 시점에 바로 드러나도록 검증
+                topological_order(workflow.teams, workflow.depends_on)
+            workflows[workflow.name] = workflow
+        
+        return team_definitions, workflows
     
     def _create_default_config(self):
         """기본 설정 파일 생성"""
@@ -165,6 +199,22 @@ class TeamConfigManager:
                         '검증팀': '다음 작업의 결과를 검증하고 요약해주세요: {main_task}',
                         '마스터팀': '다음 하위 팀 결과들을 종합하여 최종 보고서를 작성해주세요:\n{sub_results}'
                     }
+                },
+                {
+                    'name': 'dag_analysis',
+                    'description': '데이터 수집 후 분석, 검증은 병행하는 의존성 기반 워크플로우',
+                    'teams': ['데이터수집팀', '분석팀', '검증팀'],
+                    'execution_strategy': 'dag',
+                    'master_team': '마스터팀',
+                    'depends_on': {
+                        '분석팀': ['데이터수집팀']
+                    },
+                    'task_templates': {
+                        '데이터수집팀': '다음 작업에 필요한 데이터를 수집해주세요: {main_task}',
+                        '분석팀': '다음 작업을 수집된 데이터를 바탕으로 분석해주세요: {main_task}\n\n수집된 데이터:\n{데이터수집팀_output}',
+                        '검증팀': '다음 작업의 결과를 검증하고 요약해주세요: {main_task}',
+                        '마스터팀': '다음 하위 팀 결과들을 종합하여 최종 보고서를 작성해주세요:\n{sub_results}'
+                    }
                 }
             ]
         }
@@ -177,6 +227,30 @@ class TeamConfigManager:
         
         print(f"기본 설정 파일이 생성되었습니다: {config_file}")
     
+    def reload_if_changed(self) -> bool:
+        """
+        설정 파일이 마지막 로드 이후 변경되었으면 다시 로드합니다.
+        
+        파일이 잘못되었으면(YAML 문법 오류, DAG 순환 등) 오류를 기록하고 기존 설정을 유지하며,
+        mtime을 갱신하지 않으므로 다음 호출에서 다시 시도합니다.
+        
+        Returns:
+            bool: 다시 로드했으면 True
+        """
+        config_file = Path(self.config_path)
+        mtime = config_file.stat().st_mtime if config_file.exists() else None
+        if mtime is not None and mtime == self._config_mtime:
+            return False
+        
+        try:
+            self._load_configs()
+        except Exception as e:
+            print(f"❌ 팀 설정 다시 로드 실패, 기존 설정을 유지합니다: {str(e)}")
+            logger.error(f"팀 설정 다시 로드 실패 - 파일: {config_file}, 오류: {str(e)}")
+            return False
+        print(f"🔄 팀 설정을 다시 로드했습니다: {config_file}")
+        return True
+    
     def get_team_definition(self, team_name: str) -> Optional[TeamDefinition]:
         """팀 정의 조회"""
         return self.team_definitions.get(team_name)
@@ -185,8 +259,21 @@ class TeamConfigManager:
         """워크플로우 정의 조회"""
         return self.workflows.get(workflow_name)
     
-    def create_agents_for_team(self, team_name: str, model_client: OpenAIChatCompletionClient) -> List[AssistantAgent]:
-        """팀에 필요한 에이전트들 생성"""
+    def is_master_team(self, team_name: str) -> bool:
+        """어느 워크플로우에서든 마스터 팀으로 쓰이는지 여부"""
+        return any(workflow.master_team == team_name for workflow in self.workflows.values())
+    
+    def create_agents_for_team(
+        self,
+        team_name: str,
+        model_client: OpenAIChatCompletionClient,
+        client_for_factory: Optional[Callable[[str], OpenAIChatCompletionClient]] = None
+    ) -> List[AssistantAgent]:
+        """
+        팀에 필요한 에이전트들 생성
+        
+        client_for_factory를 주면 팩토리 이름별로 모델 클라이언트를 골라 사용합니다 (모델 티어 라우팅).
+        """
         team_def = self.get_team_definition(team_name)
         if not team_def:
             raise ValueError(f"팀 '{team_name}'을 찾을 수 없습니다")
@@ -197,7 +284,8 @@ class TeamConfigManager:
             if not factory:
                 raise ValueError(f"에이전트 팩토리 '{agent_config.factory}'을 찾을 수 없습니다")
             
-            agent = factory(model_client)
+            agent_client = client_for_factory(agent_config.factory) if client_for_factory else model_client
+            agent = factory(agent_client)
             agents.append(agent)
         
         return agents
@@ -220,7 +308,7 @@ class TeamConfigManager:
         if not template:
             return main_task
         
-        return template.format(main_task=main_task)
+        return render_task_template(template, main_task=main_task)
 
 
 # 전역 설정 관리자 인스턴스
@@ -0,0 +1,130 @@
+"""
+토큰 사용량 집계 및 예산
+
+팀 실행 중 스트리밍되는 메시지의 models_usage(모델 클라이언트가 보고한 요청별 사용량)를
+모아 실행 단위/범위(팀, 에이전트) 단위로 집계하고, 토큰 예산 종료 조건을 만듭니다.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from autogen_agentchat.conditions import TokenUsageTermination
+
+from src.core.config import DEFAULT_MODEL, MODEL_PRICING_PER_MILLION_TOKENS, TEAM_MAX_TOTAL_TOKENS
+
+
+def estimate_cost(model: Optional[str], prompt_tokens: int, completion_tokens: int) -> float:
+    """
+    토큰 수로 예상 비용(USD)을 계산합니다.
+
+    Args:
+        model: 모델 이름 (가격표에 없으면 0)
+        prompt_tokens: 입력 토큰 수
+        completion_tokens: 출력 토큰 수
+
+    Returns:
+        float: 예상 비용 (USD)
+    """
+    input_price, output_price = MODEL_PRICING_PER_MILLION_TOKENS.get(model or "", (0.0, 0.0))
+    return (prompt_tokens * input_price + completion_tokens * output_price) / 1_000_000
+
+
+def create_token_budget_termination(max_total_tokens: Optional[int] = TEAM_MAX_TOTAL_TOKENS) -> Optional[TokenUsageTermination]:
+    """
+    토큰 예산 종료 조건을 생성합니다.
+
+    Args:
+        max_total_tokens: 실행당 최대 토큰 수 (None 또는 0 이하이면 제한 없음)
+
+    Returns:
+        Optional[TokenUsageTermination]: 종료 조건 (제한이 없으면 None)
+    """
+    if not max_total_tokens or max_total_tokens <= 0:
+        return None
+    return TokenUsageTermination(max_total_token=max_total_tokens)
+
+
+@dataclass
+class TokenUsage:
+    """토큰 사용량"""
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    max_prompt_tokens: int = 0  # 단일 모델 호출의 최대 입력 토큰 (컨텍스트 크기 지표)
+    model_calls: int = 0
+
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
+
+    def add(self, prompt_tokens: int, completion_tokens: int) -> None:
+        self.prompt_tokens += prompt_tokens
+        self.completion_tokens += completion_tokens
+        self.max_prompt_tokens = max(self.max_prompt_tokens, prompt_tokens)
+        self.model_calls += 1
+
+    def merge(self, other: "TokenUsage") -> None:
+        self.prompt_tokens += other.prompt_tokens
+        self.completion_tokens += other.completion_tokens
+        self.max_prompt_tokens = max(self.max_prompt_tokens, other.max_prompt_tokens)
+        self.model_calls += other.model_calls
+
+    def to_dict(self, model: Optional[str] = None) -> Dict[str, Any]:
+        return {
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "total_tokens": self.total_tokens,
+            "max_prompt_tokens": self.max_prompt_tokens,
+            "model_calls": self.model_calls,
+            "estimated_cost": round(estimate_cost(model, self.prompt_tokens, self.completion_tokens), 6),
+        }
+
+
+@dataclass
+class TokenUsageTracker:
+    """
+    실행 단위 토큰 사용량 집계기
+
+    공유 모델 클라이언트의 total_usage()는 동시에 실행되는 다른 run의 사용량까지 섞이므로,
+    각 run의 스트림 메시지에 실린 models_usage만 집계합니다.
+    (SelectorGroupChat의 발화자 선택 호출은 메시지로 노출되지 않아 포함되지 않습니다.)
+    """
+    model: Optional[str] = DEFAULT_MODEL
+    total: TokenUsage = field(default_factory=TokenUsage)
+    by_scope: Dict[str, TokenUsage] = field(default_factory=dict)
+    # 모델 호출(턴)별 입력/출력 토큰 기록 - 컨텍스트 압축 효과 확인용
+    turns: List[Dict[str, Any]] = field(default_factory=list)
+
+    def record(self, message: Any, scope: Optional[str] = None) -> None:
+        """메시지에 사용량 정보가 있으면 집계"""
+        usage = getattr(message, "models_usage", None)
+        if usage is None:
+            return
+
+        scope = scope or str(getattr(message, "source", "unknown"))
+        self.total.add(usage.prompt_tokens, usage.completion_tokens)
+        self.by_scope.setdefault(scope, TokenUsage()).add(usage.prompt_tokens, usage.completion_tokens)
+        self.turns.append({
+            "scope": scope,
+            "prompt_tokens": usage.prompt_tokens,
+            "completion_tokens": usage.completion_tokens,
+        })
+
+    def merge(self, other: "TokenUsageTracker", scope: Optional[str] = None) -> None:
+        """다른 집계기의 사용량을 합산 (scope를 주면 해당 범위로 묶어서 합산)"""
+        self.total.merge(other.total)
+        self.turns.extend(other.turns)
+        if scope:
+            self.by_scope.setdefault(scope, TokenUsage()).merge(other.total)
+        else:
+            for name, usage in other.by_scope.items():
+                self.by_scope.setdefault(name, TokenUsage()).merge(usage)
+
+    @property
+    def estimated_cost(self) -> float:
+        return estimate_cost(self.model, self.total.prompt_tokens, self.total.completion_tokens)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = self.total.to_dict(self.model)
+        data["by_scope"] = {name: usage.to_dict(self.model) for name, usage in self.by_scope.items()}
+        data["turns"] = list(self.turns)
+        return data
@@ -0,0 +1,199 @@
+"""
+DAG 기반 워크플로우 실행기
+
+팀 간 의존성(depends_on)을 그래프로 보고, 입력이 준비된 팀부터 즉시 실행합니다.
+팀별 실행 구간과 크리티컬 패스(가장 오래 걸린 의존 체인)를 함께 계산합니다.
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, List, Optional
+
+
+class _SafeFormatDict(dict):
+    """존재하지 않는 플레이스홀더는 그대로 남겨두는 format_map용 딕셔너리"""
+
+    def __missing__(self, key: str) -> str:
+        return "{" + key + "}"
+
+
+def render_task_template(template: str, **values: str) -> str:
+    """
+    작업 템플릿의 플레이스홀더를 치환합니다.
+
+    알 수 없는 플레이스홀더(예: 마스터팀의 {sub_results})는 KeyError 없이 그대로 남습니다.
+
+    Args:
+        template: 작업 템플릿 문자열
+        **values: 치환할 값들
+
+    Returns:
+        str: 치환된 작업 문자열
+    """
+    return template.format_map(_SafeFormatDict(values))
+
+
+def team_output_key(team_name: str) -> str:
+    """팀 결과 플레이스홀더 이름 (예: '데이터수집팀' -> '데이터수집팀_output')"""
+    return f"{team_name}_output"
+
+
+def topological_order(teams: List[str], depends_on: Dict[str, List[str]]) -> List[str]:
+    """
+    의존성을 만족하는 팀 실행 순서를 반환합니다.
+
+    Args:
+        teams: 워크플로우에 포함된 팀 이름들
+        depends_on: 팀별 선행 팀 목록
+
+    Returns:
+        List[str]: 위상 정렬된 팀 이름 목록 (동일 레벨은 teams 순서 유지)
+
+    Raises:
+        ValueError: 알 수 없는 팀을 참조하거나 순환 의존성이 있는 경우
+    """
+    team_set = set(teams)
+    for team_name, deps in depends_on.items():
+        if team_name not in team_set:
+            raise ValueError(f"depends_on에 워크플로우에 없는 팀이 있습니다: {team_name}")
+        for dep in deps:
+            if dep not in team_set:
+                raise ValueError(f"팀 '{team_name}'이 알 수 없는 팀 '{dep}'에 의존합니다")
+
+    remaining = {team_name: set(depends_on.get(team_name, [])) for team_name in teams}
+    order: List[str] = []
+    while remaining:
+        ready = [team_name for team_name in teams if team_name in remaining and not remaining[team_name]]
+        if not ready:
+            raise ValueError(f"순환 의존성이 감지되었습니다: {sorted(remaining)}")
+        for team_name in ready:
+            order.append(team_name)
+            del remaining[team_name]
+        for deps in remaining.values():
+            deps.difference_update(ready)
+    return order
+
+
+@dataclass
+class TeamTiming:
+    """팀 실행 구간 (워크플로우 시작 기준 초 단위 오프셋)"""
+    team_name: str
+    started_at: float
+    finished_at: float
+    depends_on: List[str] = field(default_factory=list)
+
+    @property
+    def duration(self) -> float:
+        return self.finished_at - self.started_at
+
+
+@dataclass
+class DagExecutionReport:
+    """DAG 실행 결과"""
+    results: Dict[str, str]
+    errors: Dict[str, str]
+    timings: Dict[str, TeamTiming]
+    critical_path: List[str]
+    critical_path_time: float
+
+
+def compute_critical_path(timings: Dict[str, TeamTiming]) -> List[str]:
+    """
+    가장 늦게 끝난 팀에서 출발해, 가장 늦게 끝난 선행 팀을 따라 올라가며 크리티컬 패스를 구합니다.
+
+    Args:
+        timings: 팀별 실행 구간
+
+    Returns:
+        List[str]: 시작 팀부터 마지막 팀까지의 크리티컬 패스
+    """
+    if not timings:
+        return []
+
+    current: Optional[TeamTiming] = max(timings.values(), key=lambda t: t.finished_at)
+    path: List[str] = []
+    while current is not None:
+        path.append(current.team_name)
+        upstream = [timings[dep] for dep in current.depends_on if dep in timings]
+        current = max(upstream, key=lambda t: t.finished_at) if upstream else None
+    path.reverse()
+    return path
+
+
+class DagWorkflowExecutor:
+    """의존성이 준비되는 즉시 팀을 실행하는 DAG 실행기"""
+
+    def __init__(self, run_team: Callable[[str, str], Awaitable[str]]):
+        """
+        Args:
+            run_team: (팀 이름, 작업) -> 결과 문자열을 반환하는 코루틴 함수
+        """
+        self.run_team = run_team
+
+    async def execute(
+        self,
+        teams: List[str],
+        depends_on: Dict[str, List[str]],
+        task_templates: Dict[str, str],
+        main_task: str,
+    ) -> DagExecutionReport:
+        """
+        DAG 워크플로우를 실행합니다.
+
+        선행 팀이 실패한 팀은 실행하지 않고 오류로 기록합니다.
+        """
+        order = topological_order(teams, depends_on)
+        loop = asyncio.get_event_loop()
+        origin = loop.time()
+
+        results: Dict[str, str] = {}
+        errors: Dict[str, str] = {}
+        timings: Dict[str, TeamTiming] = {}
+        nodes: Dict[str, asyncio.Task] = {}
+
+        async def run_node(team_name: str) -> None:
+            deps = depends_on.get(team_name, [])
+            if deps:
+                await asyncio.gather(*(nodes[dep] for dep in deps))
+
+            failed = [dep for dep in deps if dep in errors]
+            if failed:
+                errors[team_name] = f"선행 팀 실패로 실행하지 않았습니다: {', '.join(failed)}"
+                return
+
+            values = {"main_task": main_task}
+            values.update({team_output_key(dep): results.get(dep, "") for dep in deps})
+            values["upstream_results"] = "\n".join(
+                f"**{dep} 결과**:\n{results.get(dep, '')}\n" for dep in deps
+            )
+            template = task_templates.get(team_name, "{main_task}")
+            team_task = render_task_template(template, **values)
+
+            started_at = loop.time() - origin
+            try:
+                results[team_name] = await self.run_team(team_name, team_task)
+            except Exception as e:
+                errors[team_name] = str(e)
+            finally:
+                timings[team_name] = TeamTiming(
+                    team_name=team_name,
+                    started_at=started_at,
+                    finished_at=loop.time() - origin,
+                    depends_on=list(deps),
+                )
+
+        # 위상 순서로 생성하므로 선행 팀의 Task가 항상 먼저 존재합니다
+        for team_name in order:
+            nodes[team_name] = asyncio.create_task(run_node(team_name))
+        await asyncio.gather(*nodes.values())
+
+        critical_path = compute_critical_path(timings)
+        critical_path_time = timings[critical_path[-1]].finished_at if critical_path else 0.0
+
+        return DagExecutionReport(
+            results=results,
+            errors=errors,
+            timings=timings,
+            critical_path=critical_path,
+            critical_path_time=critical_path_time,
+        )
@@ -4,11 +4,13 @@ tools 패키지
 AI 에이전트가 사용하는 도구 함수들을 포함합니다.
 """
 
-from src.ai.tools.web_search_tool import search_web_tool
-from src.ai.tools.data_analysis_tool import percentage_change_tool
+from src.ai.tools.web_search_tool import search_web_tool, get_web_search_metrics
+from src.ai.tools.data_analysis_tool import percentage_change_tool, batch_analysis_tool
 
 __all__ = [
     "search_web_tool",
+    "get_web_search_metrics",
     "percentage_change_tool",
+    "batch_analysis_tool",
 ]
 
@@ -4,7 +4,14 @@
 통계 계산 및 데이터 분석을 위한 도구들입니다.
 """
 
+import io
+import json
 import logging
+import re
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
 
 # 로거 설정
 logger = logging.getLogger(__name__)
@@ -36,3 +43,179 @@ def percentage_change_tool(start: float, end: float) -> float:
         logger.error(f"퍼센트 변화 계산 오류 - 시작: {start}, 종료: {end}, 오류: {str(e)}")
         raise
 
+
+
+# 응답에 포함할 시계열(퍼센트 변화, 이동평균)의 최대 길이 (최근 값 기준)
+_MAX_SERIES_POINTS = 60
+BATCH_ANALYSIS_METRICS = ("pct_change", "cagr", "moving_average", "volatility", "drawdown", "correlation")
+# 열 이름에 이 단어가 있으면 숫자여도 데이터가 아닌 라벨(인덱스) 열로 취급 (예: year, fiscal_year, date, 연도)
+_LABEL_COLUMN_WORDS = {
+    "date", "datetime", "time", "timestamp", "year", "yr", "month", "quarter", "week", "day", "period",
+    "날짜", "일자", "일시", "연도", "년도", "년", "월", "분기", "주", "일", "기간", "시점",
+}
+
+
+def _is_label_name(column: Any) -> bool:
+    return any(word in _LABEL_COLUMN_WORDS for word in re.split(r"[\W_]+", str(column).lower()))
+
+
+def _is_consecutive_integers(values: pd.Series) -> bool:
+    """1씩 증가하는 정수 열 (2021, 2022, 2023 같은 연도나 1, 2, 3 같은 순번)인지 확인"""
+    if values.size < 2 or values.isna().any() or (values % 1 != 0).any():
+        return False
+    # 두 개뿐인 값은 연도 범위일 때만 라벨로 취급 (우연히 1 차이 나는 데이터 값 제외)
+    if values.size < 3 and not values.between(1900, 2100).all():
+        return False
+    return bool((values.diff().iloc[1:] == 1).all())
+
+
+def _parse_series_payload(data: str) -> pd.DataFrame:
+    """
+    JSON(숫자 배열, {이름: 배열}, 레코드 배열) 또는 CSV 텍스트를 DataFrame으로 변환합니다.
+    date/year/period 같은 이름의 열, 숫자가 아닌 첫 번째 열, 또는 (다른 숫자 열이 있을 때) 1씩 증가하는
+    정수 첫 열 순서로 하나를 골라 인덱스로 사용합니다.
+    """
+    try:
+        payload = json.loads(data)
+    except (TypeError, ValueError):
+        frame = pd.read_csv(io.StringIO(data))
+    else:
+        if isinstance(payload, list) and payload and not isinstance(payload[0], dict):
+            frame = pd.DataFrame({"value": payload})
+        else:
+            frame = pd.DataFrame(payload)
+
+    label_column = next((column for column in frame.columns if _is_label_name(column)), None)
+    numeric = {}
+    for column in frame.columns:
+        if column == label_column:
+            continue
+        values = frame[column]
+        if values.dtype == object:
+            # "1,234" 같은 천 단위 구분 기호 허용
+            values = pd.to_numeric(values.astype(str).str.replace(",", "").str.strip(), errors="coerce")
+            if values.notna().sum() < len(values) / 2:
+                if label_column is None:
+                    label_column = column
+                continue
+        numeric[str(column)] = values.astype(float)
+
+    if label_column is None and len(numeric) > 1:
+        first_column = next(iter(numeric))
+        if _is_consecutive_integers(numeric[first_column]):
+            label_column = frame.columns[list(map(str, frame.columns)).index(first_column)]
+            del numeric[first_column]
+
+    if not numeric:
+        raise ValueError("숫자 데이터 열을 찾을 수 없습니다.")
+
+    result = pd.DataFrame(numeric)
+    if label_column is not None:
+        labels = frame[label_column]
+        if pd.api.types.is_float_dtype(labels) and (labels.dropna() % 1 == 0).all():
+            # JSON/CSV에서 실수로 읽힌 연도(2024.0)는 정수 라벨로 표시
+            labels = labels.astype("Int64")
+        result.index = labels.astype(str)
+    return result
+
+
+def _round_series(series: pd.Series, digits: int = 4) -> Dict[str, Optional[float]]:
+    tail = series.tail(_MAX_SERIES_POINTS).round(digits)
+    return {str(label): (None if pd.isna(value) else float(value)) for label, value in tail.items()}
+
+
+def _analyze_column(values: pd.Series, metrics: List[str], window: int, periods_per_year: int) -> Dict[str, Any]:
+    values = values.dropna()
+    result: Dict[str, Any] = {"count": int(values.size)}
+    if values.empty:
+        return result
+
+    first, last = float(values.iloc[0]), float(values.iloc[-1])
+    result.update({"first": first, "last": last, "min": float(values.min()), "max": float(values.max())})
+    returns = values.pct_change().replace([np.inf, -np.inf], np.nan)
+
+    if "pct_change" in metrics:
+        result["total_change_pct"] = round((last - first) / first * 100, 4) if first else None
+        result["pct_change"] = _round_series(returns * 100)
+
+    if "cagr" in metrics and values.size > 1 and first > 0 and last > 0:
+        years = (values.size - 1) / periods_per_year
+        result["cagr_pct"] = round(((last / first) ** (1 / years) - 1) * 100, 4)
+
+    if "moving_average" in metrics:
+        result["moving_average"] = _round_series(values.rolling(window=window, min_periods=window).mean())
+
+    if "volatility" in metrics and returns.count() > 1:
+        volatility = float(returns.std(ddof=1))
+        result["volatility_pct"] = round(volatility * 100, 4)
+        if periods_per_year > 1:
+            result["annualized_volatility_pct"] = round(volatility * np.sqrt(periods_per_year) * 100, 4)
+
+    if "drawdown" in metrics:
+        drawdown = values / values.cummax() - 1
+        result["max_drawdown_pct"] = round(float(drawdown.min()) * 100, 4)
+        result["max_drawdown_at"] = str(drawdown.idxmin())
+
+    return result
+
+
+def batch_analysis_tool(
+    data: str,
+    metrics: str = "all",
+    window: int = 3,
+    periods_per_year: int = 1,
+) -> str:
+    """
+    여러 값으로 이루어진 시계열을 한 번에 분석하는 도구 (NumPy/pandas 벡터 연산)
+    
+    퍼센트 변화, CAGR, 이동평균, 변동성, 최대 낙폭(drawdown), 열 간 상관계수를 한 번의 호출로 계산합니다.
+    
+    Args:
+        data (str): 분석할 데이터. JSON 숫자 배열([100, 120, 90]), JSON 객체({"삼성": [...], "LG": [...]}),
+            JSON 레코드 배열([{"date": "2024-01", "price": 100}, ...]) 또는 헤더가 있는 CSV 텍스트
+        metrics (str): 계산할 지표 (쉼표 구분: pct_change, cagr, moving_average, volatility, drawdown, correlation 또는 all)
+        window (int): 이동평균 구간 길이
+        periods_per_year (int): 1년당 데이터 개수 (연간 1, 분기 4, 월간 12, 일간 252) - CAGR/연환산 변동성 계산용
+        
+    Returns:
+        str: 열별 분석 결과 JSON 문자열
+    """
+    print(f"\n📊 [배치 분석] 지표: {metrics}, 이동평균 구간: {window}, 연간 기간 수: {periods_per_year}")
+    logger.info(f"배치 분석 시도 - 지표: {metrics}, 데이터 길이: {len(data)}")
+    
+    try:
+        requested = [m.strip() for m in metrics.split(",") if m.strip()]
+        if not requested or "all" in requested:
+            requested = list(BATCH_ANALYSIS_METRICS)
+        unknown = [m for m in requested if m not in BATCH_ANALYSIS_METRICS]
+        if unknown:
+            raise ValueError(f"알 수 없는 지표입니다: {', '.join(unknown)}")
+        window = max(int(window), 1)
+        periods_per_year = max(int(periods_per_year), 1)
+        
+        frame = _parse_series_payload(data)
+        result: Dict[str, Any] = {
+            "columns": {
+                column: _analyze_column(frame[column], requested, window, periods_per_year)
+                for column in frame.columns
+            }
+        }
+        
+        if "correlation" in requested and frame.shape[1] > 1:
+            # 수준(level)이 아닌 기간 수익률 기준 상관계수
+            returns = frame.pct_change().replace([np.inf, -np.inf], np.nan)
+            correlation = returns.corr().round(4)
+            result["correlation"] = {
+                row: {column: (None if pd.isna(value) else float(value)) for column, value in values.items()}
+                for row, values in correlation.to_dict(orient="index").items()
+            }
+        
+        print(f"✅ [분석 완료] {frame.shape[1]}개 열, {frame.shape[0]}개 행")
+        logger.info(f"배치 분석 완료 - 열: {list(frame.columns)}, 행: {frame.shape[0]}")
+        return json.dumps(result, ensure_ascii=False)
+    
+    except Exception as e:
+        error_msg = f"분석 중 오류 발생: {str(e)}"
+        print(f"❌ [분석 오류] {error_msg}")
+        logger.error(f"배치 분석 오류 - 지표: {metrics}, 오류: {str(e)}")
+        return error_msg
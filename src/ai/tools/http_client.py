@@ -0,0 +1,63 @@
+"""
+검색 도구 공용 비동기 HTTP 클라이언트
+
+도구 호출마다 클라이언트를 새로 만들지 않고 연결 풀을 공유합니다.
+httpx.AsyncClient는 생성된 이벤트 루프에 묶이므로 클라이언트를 루프별로 하나씩 보관합니다.
+배치처럼 여러 스레드가 각자 asyncio.run으로 루프를 돌려도 서로의 클라이언트를 교체하지 않고,
+run_with_http_client로 실행하면 루프가 끝나기 전에 해당 루프의 클라이언트를 닫습니다.
+"""
+
+import asyncio
+import threading
+import weakref
+from typing import Awaitable, TypeVar
+
+import httpx
+
+from src.core.config import WEB_SEARCH_MAX_CONNECTIONS, WEB_SEARCH_TIMEOUT_SECONDS
+
+T = TypeVar("T")
+
+# 이벤트 루프 -> 그 루프에서 공유하는 클라이언트 (루프가 사라지면 항목도 함께 정리)
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+_clients_lock = threading.Lock()
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """현재 이벤트 루프에서 공유하는 비동기 HTTP 클라이언트 반환"""
+    loop = asyncio.get_running_loop()
+    with _clients_lock:
+        client = _clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                timeout=WEB_SEARCH_TIMEOUT_SECONDS,
+                follow_redirects=True,
+                limits=httpx.Limits(
+                    max_connections=WEB_SEARCH_MAX_CONNECTIONS,
+                    max_keepalive_connections=WEB_SEARCH_MAX_CONNECTIONS,
+                ),
+            )
+            _clients[loop] = client
+        return client
+
+
+async def close_async_http_client() -> None:
+    """현재 이벤트 루프의 공유 HTTP 클라이언트 종료 (루프/애플리케이션 종료 시 호출)"""
+    with _clients_lock:
+        client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
+
+def run_with_http_client(main: Awaitable[T]) -> T:
+    """
+    asyncio.run과 같이 새 이벤트 루프에서 실행하고, 루프를 닫기 전에 그 루프의 공유 HTTP 클라이언트를 닫습니다.
+    (배치처럼 작업마다 asyncio.run을 호출하는 곳에서 연결이 닫히지 않고 남지 않도록 사용)
+    """
+    async def _run() -> T:
+        try:
+            return await main
+        finally:
+            await close_async_http_client()
+
+    return asyncio.run(_run())
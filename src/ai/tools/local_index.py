@@ -0,0 +1,232 @@
+"""
+로컬 문서 검색 인덱스
+
+디렉터리의 텍스트 문서(.txt, .md)로 역색인을 한 번 만들어 파일로 저장하고,
+검색 시에는 포스팅 파일을 메모리 매핑해 BM25 점수로 순위를 매깁니다.
+네트워크 없이 에이전트 파이프라인을 재현 가능하게 실행/측정하기 위한 용도입니다.
+"""
+
+import hashlib
+import heapq
+import json
+import math
+import mmap
+import os
+import re
+from array import array
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+
+INDEX_VERSION = 1
+DOCUMENT_EXTENSIONS = (".txt", ".md")
+
+_WORD_PATTERN = re.compile(r"\w+")
+_HANGUL_PATTERN = re.compile(r"[가-힣]{3,}")
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    검색용 토큰 분리
+
+    단어 단위 토큰에 더해, 조사가 붙은 한글 단어도 찾을 수 있도록 3글자 이상 한글 단어는 2-gram을 추가합니다.
+    """
+    lowered = text.lower()
+    tokens = _WORD_PATTERN.findall(lowered)
+    for word in _HANGUL_PATTERN.findall(lowered):
+        tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+    return tokens
+
+
+def _read_text(path: str) -> str:
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        return f.read()
+
+
+def _document_title(text: str, path: str) -> str:
+    for line in text.splitlines():
+        line = line.strip().lstrip("#").strip()
+        if line:
+            return line[:200]
+    return os.path.basename(path)
+
+
+def _list_documents(corpus_dir: str) -> List[str]:
+    paths = []
+    for root, _, files in os.walk(corpus_dir):
+        for name in files:
+            if name.lower().endswith(DOCUMENT_EXTENSIONS):
+                paths.append(os.path.join(root, name))
+    return sorted(paths)
+
+
+def corpus_signature(corpus_dir: str) -> str:
+    """문서 목록/크기/수정 시각으로 만든 코퍼스 서명 (바뀌면 인덱스 재생성)"""
+    digest = hashlib.sha1()
+    for path in _list_documents(corpus_dir):
+        stat = os.stat(path)
+        digest.update(f"{os.path.relpath(path, corpus_dir)}|{stat.st_size}|{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+def build_local_index(corpus_dir: str, index_dir: str) -> Dict[str, object]:
+    """
+    코퍼스 디렉터리로 역색인을 만들어 index_dir에 저장합니다.
+
+    저장 파일:
+        manifest.json   - 버전, 코퍼스 서명, 문서 수, 평균 문서 길이
+        docs.json       - 문서 경로와 제목
+        terms.json      - 용어 -> [포스팅 시작 위치, 문서 빈도]
+        postings.bin    - (문서 번호, 용어 빈도) uint32 쌍의 연속 배열
+        doc_lengths.bin - 문서별 토큰 수 uint32 배열
+
+    Returns:
+        Dict: manifest 내용
+    """
+    os.makedirs(index_dir, exist_ok=True)
+    paths = _list_documents(corpus_dir)
+
+    docs = []
+    doc_lengths = array("I")
+    term_postings: Dict[str, List[Tuple[int, int]]] = {}
+    for doc_id, path in enumerate(paths):
+        text = _read_text(path)
+        tokens = tokenize(text)
+        docs.append({"path": os.path.abspath(path), "title": _document_title(text, path)})
+        doc_lengths.append(len(tokens))
+        for term, tf in Counter(tokens).items():
+            term_postings.setdefault(term, []).append((doc_id, tf))
+
+    postings = array("I")
+    terms: Dict[str, List[int]] = {}
+    for term in sorted(term_postings):
+        entries = term_postings[term]
+        terms[term] = [len(postings) // 2, len(entries)]
+        for doc_id, tf in entries:
+            postings.append(doc_id)
+            postings.append(tf)
+
+    with open(os.path.join(index_dir, "postings.bin"), "wb") as f:
+        postings.tofile(f)
+    with open(os.path.join(index_dir, "doc_lengths.bin"), "wb") as f:
+        doc_lengths.tofile(f)
+    with open(os.path.join(index_dir, "terms.json"), "w", encoding="utf-8") as f:
+        json.dump(terms, f, ensure_ascii=False)
+    with open(os.path.join(index_dir, "docs.json"), "w", encoding="utf-8") as f:
+        json.dump(docs, f, ensure_ascii=False)
+
+    manifest = {
+        "version": INDEX_VERSION,
+        "corpus_dir": os.path.abspath(corpus_dir),
+        "signature": corpus_signature(corpus_dir),
+        "doc_count": len(docs),
+        "avg_doc_length": (sum(doc_lengths) / len(doc_lengths)) if doc_lengths else 0.0,
+    }
+    # manifest를 마지막에 기록해 중간에 실패한 인덱스는 유효하지 않게 함
+    with open(os.path.join(index_dir, "manifest.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False)
+    return manifest
+
+
+@dataclass
+class IndexHit:
+    """검색 결과 문서"""
+    doc_id: int
+    score: float
+    path: str
+    title: str
+
+
+class LocalIndex:
+    """메모리 매핑된 BM25 역색인"""
+
+    def __init__(self, index_dir: str, k1: float = 1.5, b: float = 0.75):
+        self.index_dir = index_dir
+        self.k1 = k1
+        self.b = b
+        with open(os.path.join(index_dir, "manifest.json"), "r", encoding="utf-8") as f:
+            self.manifest = json.load(f)
+        with open(os.path.join(index_dir, "terms.json"), "r", encoding="utf-8") as f:
+            self.terms: Dict[str, List[int]] = json.load(f)
+        with open(os.path.join(index_dir, "docs.json"), "r", encoding="utf-8") as f:
+            self.docs: List[Dict[str, str]] = json.load(f)
+
+        self._postings_file = open(os.path.join(index_dir, "postings.bin"), "rb")
+        self._postings_map: Optional[mmap.mmap] = None
+        self.postings = memoryview(b"").cast("I")
+        if os.fstat(self._postings_file.fileno()).st_size > 0:
+            self._postings_map = mmap.mmap(self._postings_file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.postings = memoryview(self._postings_map).cast("I")
+
+        self.doc_lengths = array("I")
+        with open(os.path.join(index_dir, "doc_lengths.bin"), "rb") as f:
+            self.doc_lengths.frombytes(f.read())
+
+        self.doc_count = self.manifest["doc_count"]
+        self.avg_doc_length = self.manifest["avg_doc_length"] or 1.0
+
+    @classmethod
+    def open_or_build(cls, corpus_dir: str, index_dir: str) -> "LocalIndex":
+        """저장된 인덱스가 없거나 코퍼스가 바뀌었으면 다시 만든 뒤 엽니다."""
+        manifest_path = os.path.join(index_dir, "manifest.json")
+        rebuild = True
+        if os.path.exists(manifest_path):
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+            rebuild = (
+                manifest.get("version") != INDEX_VERSION
+                or manifest.get("signature") != corpus_signature(corpus_dir)
+            )
+        if rebuild:
+            print(f"📚 [로컬 검색] 인덱스 생성 중: {corpus_dir}")
+            build_local_index(corpus_dir, index_dir)
+        return cls(index_dir)
+
+    def search(self, query: str, max_results: int) -> List[IndexHit]:
+        """BM25 점수 상위 문서 검색"""
+        scores: Dict[int, float] = {}
+        for term in set(tokenize(query)):
+            entry = self.terms.get(term)
+            if entry is None:
+                continue
+            start, df = entry
+            idf = math.log(1 + (self.doc_count - df + 0.5) / (df + 0.5))
+            postings = self.postings[start * 2:(start + df) * 2]
+            for i in range(0, len(postings), 2):
+                doc_id, tf = postings[i], postings[i + 1]
+                norm = self.k1 * (1 - self.b + self.b * self.doc_lengths[doc_id] / self.avg_doc_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (self.k1 + 1) / (tf + norm)
+
+        top = heapq.nlargest(max_results, scores.items(), key=lambda item: item[1])
+        return [
+            IndexHit(doc_id=doc_id, score=score, path=self.docs[doc_id]["path"], title=self.docs[doc_id]["title"])
+            for doc_id, score in top
+        ]
+
+    def close(self) -> None:
+        """메모리 매핑 해제"""
+        self.postings.release()
+        if self._postings_map is not None:
+            self._postings_map.close()
+        self._postings_file.close()
+
+
+def document_excerpt(path: str, query: str, max_chars: int) -> str:
+    """
+    문서에서 검색어가 처음 나오는 부분 주변을 발췌합니다.
+
+    Args:
+        path: 문서 경로
+        query: 검색어
+        max_chars: 발췌 최대 문자 수
+
+    Returns:
+        str: 공백을 정리한 발췌 텍스트
+    """
+    text = " ".join(_read_text(path).split())
+    lowered = text.lower()
+    positions = [lowered.find(word) for word in _WORD_PATTERN.findall(query.lower())]
+    positions = [pos for pos in positions if pos >= 0]
+    start = max(min(positions) - max_chars // 4, 0) if positions else 0
+    return text[start:start + max_chars]
@@ -0,0 +1,215 @@
+"""
+검색 결과 페이지 본문 수집
+
+여러 결과 페이지를 공유 HTTP 클라이언트로 동시에 가져옵니다.
+서버 부담은 전역 sleep 대신 호스트별 동시 요청 수와 요청 간격으로 조절합니다.
+응답은 바이트 상한까지만 스트리밍하면서 바로 텍스트를 추출하고,
+필요한 길이의 본문을 얻으면 다운로드를 중단합니다.
+"""
+
+import asyncio
+import codecs
+import threading
+import time
+import weakref
+from html.parser import HTMLParser
+from typing import Dict, List
+from urllib.parse import urlsplit
+
+from src.core.config import (
+    PAGE_FETCH_MAX_BYTES,
+    PAGE_FETCH_PER_HOST_CONCURRENCY,
+    PAGE_FETCH_PER_HOST_INTERVAL_SECONDS,
+    PAGE_FETCH_TIMEOUT_SECONDS,
+)
+from src.ai.tools.http_client import get_async_http_client
+
+
+# 본문 텍스트로 취급하지 않는 태그
+_SKIP_TAGS = {"script", "style", "noscript", "template", "svg", "head"}
+# 공백 없이 붙어 있어도 단어를 나누는 태그 (블록 요소, 줄바꿈)
+_BREAK_TAGS = _SKIP_TAGS | {
+    "address", "article", "aside", "blockquote", "br", "dd", "div", "dl", "dt", "footer", "form",
+    "h1", "h2", "h3", "h4", "h5", "h6", "header", "hr", "li", "main", "nav", "ol", "p", "pre",
+    "section", "table", "td", "th", "title", "tr", "ul",
+}
+
+
+class _TextExtractor(HTMLParser):
+    """
+    스트리밍으로 입력받은 HTML에서 보이는 텍스트 단어를 max_chars까지만 모으는 파서
+
+    전체 DOM을 만들지 않고 단어 목록만 유지하므로, 본문이 충분히 모이면 즉시 멈출 수 있습니다.
+    네트워크 청크 경계에서 잘린 단어는 실제 공백이나 블록 태그가 나올 때까지(또는 close()까지) 이어 붙입니다.
+    """
+
+    def __init__(self, max_chars: int):
+        super().__init__(convert_charrefs=True)
+        self.max_chars = max_chars
+        self.words: List[str] = []
+        self.length = 0
+        self.done = False
+        self._skip_depth = 0
+        # 아직 공백을 만나지 않은 마지막 단어 조각
+        self._partial = ""
+
+    def handle_starttag(self, tag, attrs):
+        if tag in _BREAK_TAGS:
+            self._flush_partial()
+        if tag in _SKIP_TAGS:
+            self._skip_depth += 1
+
+    def handle_endtag(self, tag):
+        if tag in _BREAK_TAGS:
+            self._flush_partial()
+        if tag in _SKIP_TAGS and self._skip_depth > 0:
+            self._skip_depth -= 1
+
+    def handle_data(self, data):
+        if self.done or self._skip_depth:
+            return
+        text = self._partial + data
+        self._partial = ""
+        words = text.split()
+        if words and not text[-1].isspace():
+            self._partial = words.pop()
+        for word in words:
+            if not self._add_word(word):
+                return
+
+    def close(self):
+        super().close()
+        self._flush_partial()
+
+    def _flush_partial(self) -> None:
+        word, self._partial = self._partial, ""
+        if word and not self.done:
+            self._add_word(word)
+
+    def _add_word(self, word: str) -> bool:
+        # 단어 사이 공백 1자 포함
+        added = len(word) + (1 if self.words else 0)
+        if self.length + added > self.max_chars:
+            self.done = True
+            self._partial = ""
+            return False
+        self.words.append(word)
+        self.length += added
+        return True
+
+    @property
+    def text(self) -> str:
+        return " ".join(self.words)
+
+
+class HostRateLimiter:
+    """
+    호스트별 동시 요청 수와 요청 시작 간격 제한
+
+    세마포어는 이벤트 루프에 묶이므로 루프별로 따로 보관합니다. 배치처럼 여러 스레드가 각자 asyncio.run으로
+    루프를 돌려도 서로의 세마포어를 지우거나 해제하지 않고, 루프가 사라지면 해당 세마포어도 함께 정리됩니다.
+    요청 시작 간격은 모든 루프가 공유합니다.
+    """
+
+    def __init__(
+        self,
+        per_host_concurrency: int = PAGE_FETCH_PER_HOST_CONCURRENCY,
+        min_interval: float = PAGE_FETCH_PER_HOST_INTERVAL_SECONDS,
+    ):
+        self.per_host_concurrency = max(per_host_concurrency, 1)
+        self.min_interval = min_interval
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._next_slot: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def _semaphore(self, host: str) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            semaphores = self._semaphores.setdefault(loop, {})
+            if host not in semaphores:
+                semaphores[host] = asyncio.Semaphore(self.per_host_concurrency)
+            return semaphores[host]
+
+    def _reserve_slot(self, host: str) -> float:
+        """다음 요청 시작 시각을 먼저 예약해 같은 호스트 요청들이 간격을 두고 시작되도록 함 (대기할 초 반환)"""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, 0.0))
+            self._next_slot[host] = slot + self.min_interval
+            return slot - now
+
+    async def acquire(self, host: str) -> asyncio.Semaphore:
+        """
+        호스트 요청 슬롯을 얻습니다.
+
+        Returns:
+            asyncio.Semaphore: 얻은 세마포어 (요청이 끝나면 이 객체의 release()를 호출)
+        """
+        semaphore = self._semaphore(host)
+        await semaphore.acquire()
+        delay = self._reserve_slot(host)
+        if delay > 0:
+            try:
+                await asyncio.sleep(delay)
+            except BaseException:
+                semaphore.release()
+                raise
+        return semaphore
+
+
+_host_limiter = HostRateLimiter()
+
+
+async def fetch_page_text(
+    url: str,
+    max_chars: int,
+    max_bytes: int = PAGE_FETCH_MAX_BYTES,
+    timeout: float = PAGE_FETCH_TIMEOUT_SECONDS,
+) -> str:
+    """
+    페이지 본문 텍스트를 max_chars 길이까지 가져옵니다.
+
+    Args:
+        url: 페이지 URL
+        max_chars: 본문 최대 문자 수
+        max_bytes: 다운로드할 최대 바이트 수
+        timeout: 요청 제한 시간(초)
+
+    Returns:
+        str: 본문 텍스트 (HTML이 아니거나 실패하면 빈 문자열)
+    """
+    host = urlsplit(url).netloc.lower()
+    semaphore = await _host_limiter.acquire(host)
+    try:
+        async with get_async_http_client().stream("GET", url, timeout=timeout) as response:
+            content_type = response.headers.get("content-type", "")
+            if response.status_code >= 400 or ("html" not in content_type and "text" not in content_type):
+                return ""
+
+            decoder = codecs.getincrementaldecoder(response.charset_encoding or "utf-8")(errors="replace")
+            extractor = _TextExtractor(max_chars)
+            received = 0
+            async for chunk in response.aiter_bytes():
+                chunk = chunk[: max_bytes - received]
+                received += len(chunk)
+                extractor.feed(decoder.decode(chunk))
+                if extractor.done or received >= max_bytes:
+                    break
+            extractor.close()
+            return extractor.text
+
+    except LookupError:
+        # 알 수 없는 문자 인코딩
+        return ""
+    except Exception as e:
+        print(f"Error fetching {url}: {str(e)}")
+        return ""
+    finally:
+        semaphore.release()
+
+
+async def fetch_page_texts(urls: List[str], max_chars: int) -> List[str]:
+    """여러 페이지 본문을 동시에 가져옵니다 (입력 순서 유지)."""
+    return list(await asyncio.gather(*(fetch_page_text(url, max_chars) for url in urls)))
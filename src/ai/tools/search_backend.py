@@ -0,0 +1,185 @@
+"""
+검색 백엔드
+
+search_web_tool과 google_search가 사용하는 검색 백엔드 인터페이스와 구현체입니다.
+SEARCH_BACKEND=local이면 두 도구 모두 로컬 문서 인덱스(BM25)를 사용해
+네트워크 없이 재현 가능한 실행과 오케스트레이터 오버헤드 측정이 가능합니다.
+"""
+
+import asyncio
+import os
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import List, Optional
+
+from src.core.config import (
+    LOCAL_SEARCH_CORPUS_DIR,
+    LOCAL_SEARCH_INDEX_DIR,
+    SEARCH_BACKEND,
+    TAVILY_API_KEY,
+)
+from src.ai.tools.http_client import get_async_http_client
+from src.ai.tools.local_index import LocalIndex, document_excerpt
+from src.ai.tools.page_fetcher import fetch_page_texts
+
+
+TAVILY_SEARCH_URL = "https://api.tavily.com/search"
+GOOGLE_SEARCH_URL = "https://customsearch.googleapis.com/customsearch/v1"
+
+
+@dataclass
+class SearchResult:
+    """검색 결과 항목"""
+    title: str
+    url: str
+    content: str
+
+
+class SearchBackend(ABC):
+    """검색 백엔드 인터페이스"""
+
+    name: str = "base"
+
+    @abstractmethod
+    async def search(self, query: str, max_results: int) -> List[SearchResult]:
+        """쿼리 검색 결과 목록 반환"""
+
+    async def fetch_bodies(self, query: str, results: List[SearchResult], max_chars: int) -> List[str]:
+        """결과별 본문 텍스트 (기본: 결과 페이지를 동시에 가져와 추출)"""
+        return await fetch_page_texts([result.url for result in results], max_chars)
+
+
+class TavilySearchBackend(SearchBackend):
+    """Tavily API 검색"""
+
+    name = "tavily"
+
+    def __init__(self, api_key: Optional[str] = TAVILY_API_KEY):
+        self.api_key = api_key
+
+    async def search(self, query: str, max_results: int) -> List[SearchResult]:
+        response = await get_async_http_client().post(
+            TAVILY_SEARCH_URL,
+            headers={"Authorization": f"Bearer {self.api_key}"},
+            json={"query": query, "max_results": max_results},
+        )
+        response.raise_for_status()
+        return [
+            SearchResult(
+                title=item.get('title', 'No title'),
+                url=item.get('url', 'No URL'),
+                content=item.get('content', 'No description'),
+            )
+            for item in response.json().get('results') or []
+        ]
+
+
+class GoogleSearchBackend(SearchBackend):
+    """Google Custom Search API 검색"""
+
+    name = "google"
+
+    def __init__(self, api_key: Optional[str] = None, search_engine_id: Optional[str] = None):
+        self.api_key = api_key or os.getenv("GOOGLE_API_KEY")
+        self.search_engine_id = search_engine_id or os.getenv("GOOGLE_SEARCH_ENGINE_ID")
+
+    async def search(self, query: str, max_results: int) -> List[SearchResult]:
+        if not self.api_key or not self.search_engine_id:
+            raise ValueError("API key or Search Engine ID not found in environment variables")
+
+        params = {"key": str(self.api_key), "cx": str(self.search_engine_id), "q": str(query), "num": str(max_results)}
+        response = await get_async_http_client().get(GOOGLE_SEARCH_URL, params=params)
+
+        if response.status_code != 200:
+            print(response.json())
+            raise Exception(f"Error in API request: {response.status_code}")
+
+        return [
+            SearchResult(title=item["title"], url=item["link"], content=item.get("snippet", ""))
+            for item in response.json().get("items", [])
+        ]
+
+
+class LocalSearchBackend(SearchBackend):
+    """로컬 문서 디렉터리 BM25 검색 (인덱스는 처음 사용할 때 열거나 생성)"""
+
+    name = "local"
+
+    def __init__(
+        self,
+        corpus_dir: str = LOCAL_SEARCH_CORPUS_DIR,
+        index_dir: str = LOCAL_SEARCH_INDEX_DIR,
+        snippet_chars: int = 300,
+    ):
+        self.corpus_dir = corpus_dir
+        self.index_dir = index_dir
+        self.snippet_chars = snippet_chars
+        self._index: Optional[LocalIndex] = None
+        # 동시에 처음 사용해도 인덱스를 한 번만 열거나 생성
+        self._index_lock = threading.Lock()
+
+    @property
+    def index(self) -> LocalIndex:
+        """인덱스를 열거나 생성 (첫 사용 시 코퍼스 전체를 읽으므로 이벤트 루프 밖의 스레드에서 호출)"""
+        if self._index is None:
+            with self._index_lock:
+                if self._index is None:
+                    if not os.path.isdir(self.corpus_dir):
+                        raise ValueError(f"로컬 검색 코퍼스 디렉터리가 없습니다: {self.corpus_dir}")
+                    self._index = LocalIndex.open_or_build(self.corpus_dir, self.index_dir)
+        return self._index
+
+    async def search(self, query: str, max_results: int) -> List[SearchResult]:
+        # 인덱스 생성과 BM25 검색은 CPU/디스크 작업이므로 스레드에서 실행해 다른 실행을 막지 않음
+        hits = await asyncio.to_thread(lambda: self.index.search(query, max_results))
+        snippets = await asyncio.to_thread(
+            lambda: [document_excerpt(hit.path, query, self.snippet_chars) for hit in hits]
+        )
+        return [
+            SearchResult(title=hit.title, url=f"file://{hit.path}", content=snippet)
+            for hit, snippet in zip(hits, snippets)
+        ]
+
+    async def fetch_bodies(self, query: str, results: List[SearchResult], max_chars: int) -> List[str]:
+        paths = [result.url[len("file://"):] for result in results]
+        return await asyncio.to_thread(
+            lambda: [document_excerpt(path, query, max_chars) for path in paths]
+        )
+
+
+_web_search_backend: Optional[SearchBackend] = None
+_google_search_backend: Optional[SearchBackend] = None
+_local_search_backend: Optional[LocalSearchBackend] = None
+
+
+def _get_local_search_backend() -> LocalSearchBackend:
+    global _local_search_backend
+    if _local_search_backend is None:
+        _local_search_backend = LocalSearchBackend()
+    return _local_search_backend
+
+
+def get_web_search_backend() -> SearchBackend:
+    """search_web_tool용 검색 백엔드 반환 (SEARCH_BACKEND=local이면 로컬 인덱스)"""
+    global _web_search_backend
+    if _web_search_backend is None:
+        _web_search_backend = _get_local_search_backend() if SEARCH_BACKEND == "local" else TavilySearchBackend()
+    return _web_search_backend
+
+
+def get_google_search_backend() -> SearchBackend:
+    """google_search용 검색 백엔드 반환 (SEARCH_BACKEND=local이면 로컬 인덱스)"""
+    global _google_search_backend
+    if _google_search_backend is None:
+        _google_search_backend = _get_local_search_backend() if SEARCH_BACKEND == "local" else GoogleSearchBackend()
+    return _google_search_backend
+
+
+def set_search_backend(backend: Optional[SearchBackend]) -> None:
+    """
+    두 검색 도구의 백엔드를 교체합니다 (벤치마크/테스트용). None이면 설정값 기준으로 다시 선택합니다.
+    """
+    global _web_search_backend, _google_search_backend
+    _web_search_backend = backend
+    _google_search_backend = backend
@@ -0,0 +1,181 @@
+"""
+도구 실행 정책
+
+에이전트 도구에 도구별 실행 제한 시간과 run 단위 결과 메모이제이션을 적용합니다.
+같은 턴의 여러 도구 호출은 AssistantAgent가 이미 동시에 실행하므로(asyncio.gather),
+느린 도구 하나가 턴 전체를 붙잡지 않도록 제한 시간을 걸고,
+같은 run 안에서 같은 인자로 다시 호출된 순수/멱등 도구는 이전 결과(또는 진행 중인 호출)를 재사용합니다.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterator, Mapping, Optional, Tuple
+
+from autogen_core import CancellationToken
+from autogen_core.tools import FunctionTool
+from pydantic import BaseModel
+
+from src.core.config import (
+    TOOL_ANALYSIS_TIMEOUT_SECONDS,
+    TOOL_DEFAULT_TIMEOUT_SECONDS,
+    TOOL_MEMOIZATION_ENABLED,
+    TOOL_SEARCH_TIMEOUT_SECONDS,
+)
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ToolPolicy:
+    """도구별 실행 정책"""
+    timeout: float = TOOL_DEFAULT_TIMEOUT_SECONDS
+    # 같은 run 안에서 같은 인자의 결과를 재사용해도 되는 순수/멱등 도구인지 여부
+    memoize: bool = False
+    # 이 접두사로 시작하는 문자열 결과는 일시적인 오류 응답으로 보고 재사용하지 않음
+    error_prefixes: Tuple[str, ...] = ()
+
+    def is_cacheable(self, result: Any) -> bool:
+        return not (isinstance(result, str) and result.startswith(self.error_prefixes))
+
+
+TOOL_POLICIES: Dict[str, ToolPolicy] = {
+    "search_web_tool": ToolPolicy(timeout=TOOL_SEARCH_TIMEOUT_SECONDS, memoize=True, error_prefixes=("검색 중 오류",)),
+    "google_search": ToolPolicy(timeout=TOOL_SEARCH_TIMEOUT_SECONDS, memoize=True),
+    "percentage_change_tool": ToolPolicy(timeout=TOOL_ANALYSIS_TIMEOUT_SECONDS, memoize=True),
+    "batch_analysis_tool": ToolPolicy(timeout=TOOL_ANALYSIS_TIMEOUT_SECONDS, memoize=True),
+}
+
+
+def tool_call_key(name: str, arguments: Mapping[str, Any]) -> str:
+    """도구 이름과 정규화한 인자(JSON, 키 정렬)로 만든 메모이제이션 키"""
+    payload = json.dumps(arguments, sort_keys=True, ensure_ascii=False, default=str)
+    return f"{name}:{hashlib.sha256(payload.encode()).hexdigest()}"
+
+
+class ToolRunCache:
+    """run 하나의 도구 호출 결과 캐시 (진행 중인 같은 호출은 결과를 함께 기다림)"""
+
+    def __init__(self):
+        self._results: Dict[str, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+
+    async def get_or_run(
+        self,
+        key: str,
+        run: Callable[[], Awaitable[Any]],
+        is_cacheable: Callable[[Any], bool],
+    ) -> Any:
+        future = self._results.get(key)
+        if future is not None:
+            self.hits += 1
+            return await asyncio.shield(future)
+
+        self.misses += 1
+        future = asyncio.ensure_future(run())
+        self._results[key] = future
+
+        def _forget_failed(done: asyncio.Future) -> None:
+            # 예외/취소/오류 응답은 남기지 않아 다음 호출이 다시 실행되도록 함
+            if done.cancelled() or done.exception() is not None or not is_cacheable(done.result()):
+                if self._results.get(key) is done:
+                    del self._results[key]
+
+        future.add_done_callback(_forget_failed)
+        return await asyncio.shield(future)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._results
+
+    def to_dict(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._results)}
+
+
+# 현재 실행 중인 run의 도구 결과 캐시 (team.run_stream 안에서 생성되는 태스크로 전파됨)
+_current_tool_cache: ContextVar[Optional[ToolRunCache]] = ContextVar("tool_run_cache", default=None)
+
+
+@contextmanager
+def tool_run_scope(cache: Optional[ToolRunCache] = None) -> Iterator[ToolRunCache]:
+    """
+    with 블록 안의 도구 호출을 하나의 run으로 묶어 결과를 메모이제이션합니다.
+
+    Args:
+        cache: 이어서 사용할 기존 캐시 (없으면 바깥 범위의 캐시, 그것도 없으면 새로 생성)
+    """
+    cache = cache or _current_tool_cache.get() or ToolRunCache()
+    token = _current_tool_cache.set(cache)
+    try:
+        yield cache
+    finally:
+        _current_tool_cache.reset(token)
+
+
+class PolicyFunctionTool(FunctionTool):
+    """실행 제한 시간과 run 단위 메모이제이션을 적용하는 FunctionTool"""
+
+    def __init__(
+        self,
+        func: Callable[..., Any],
+        description: str,
+        name: Optional[str] = None,
+        policy: Optional[ToolPolicy] = None,
+    ):
+        super().__init__(func, description=description, name=name)
+        self.policy = policy or TOOL_POLICIES.get(self.name, ToolPolicy())
+
+    async def run(self, args: BaseModel, cancellation_token: CancellationToken) -> Any:
+        cache = _current_tool_cache.get() if self.policy.memoize and TOOL_MEMOIZATION_ENABLED else None
+        if cache is None:
+            return await self._run_with_timeout(args, cancellation_token)
+
+        key = tool_call_key(self.name, args.model_dump())
+        if key in cache:
+            print(f"♻️ [도구 캐시] '{self.name}' 같은 인자의 이전 결과를 재사용합니다.")
+        return await cache.get_or_run(
+            key, lambda: self._run_with_timeout(args, cancellation_token), self.policy.is_cacheable
+        )
+
+    async def _run_with_timeout(self, args: BaseModel, cancellation_token: CancellationToken) -> Any:
+        if self.policy.timeout <= 0:
+            return await super().run(args, cancellation_token)
+        try:
+            return await asyncio.wait_for(super().run(args, cancellation_token), timeout=self.policy.timeout)
+        except asyncio.TimeoutError:
+            # 동기 도구는 스레드에서 계속 실행될 수 있지만 에이전트 턴은 오류 결과로 바로 진행
+            error_msg = f"도구 '{self.name}' 실행이 {self.policy.timeout:g}초 안에 끝나지 않았습니다."
+            print(f"⏰ [도구 시간 초과] {error_msg}")
+            logger.warning(error_msg)
+            raise TimeoutError(error_msg) from None
+
+
+def managed_tool(
+    func: Callable[..., Any],
+    name: Optional[str] = None,
+    description: Optional[str] = None,
+    policy: Optional[ToolPolicy] = None,
+) -> PolicyFunctionTool:
+    """
+    함수를 실행 정책이 적용된 도구로 감쌉니다.
+
+    Args:
+        func: 도구 함수 (동기 함수는 스레드 풀에서 실행)
+        name: 도구 이름 (기본: 함수 이름)
+        description: 도구 설명 (기본: 함수 docstring)
+        policy: 실행 정책 (기본: TOOL_POLICIES의 도구 이름별 정책)
+
+    Returns:
+        PolicyFunctionTool: AssistantAgent의 tools에 넣을 수 있는 도구
+    """
+    return PolicyFunctionTool(
+        func,
+        description=description if description is not None else (func.__doc__ or ""),
+        name=name,
+        policy=policy,
+    )
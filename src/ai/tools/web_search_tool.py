@@ -1,56 +1,239 @@
 """
 웹 검색 도구
 
-Tavily API를 사용하여 웹 검색을 수행하는 도구입니다.
+검색 백엔드(기본 Tavily API, SEARCH_BACKEND=local이면 로컬 문서 인덱스)로 웹 검색을 수행하는 도구입니다.
+공유 연결 풀로 비동기 요청을 보내고, 정규화한 쿼리 기준으로 결과를 TTL 캐시에 보관하며,
+동시에 같은 쿼리를 요청한 에이전트들은 진행 중인 요청 하나를 함께 기다립니다.
 """
 
+import asyncio
 import logging
-from tavily import TavilyClient
-from src.core.config import MAX_SEARCH_RESULTS, TAVILY_API_KEY
+import threading
+import time
+import weakref
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, Optional
+
+from src.core.config import (
+    MAX_SEARCH_RESULTS,
+    WEB_SEARCH_CACHE_MAX_ENTRIES,
+    WEB_SEARCH_CACHE_TTL_SECONDS,
+)
+from src.ai.tools.search_backend import SearchBackend, get_web_search_backend
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
 
-def search_web_tool(query: str) -> str:
+def normalize_query(query: str) -> str:
+    """캐시 키용 쿼리 정규화 (앞뒤 공백 제거, 연속 공백 축약, 소문자화)"""
+    return " ".join(query.split()).lower()
+
+
+def _percentile(samples: Deque[float], percentile: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(percentile / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+@dataclass
+class SearchMetrics:
+    """웹 검색 캐시/지연 시간 지표"""
+    requests: int = 0
+    cache_hits: int = 0
+    inflight_hits: int = 0
+    api_calls: int = 0
+    errors: int = 0
+    latency_samples: Deque[float] = field(default_factory=lambda: deque(maxlen=1000))
+    api_latency_samples: Deque[float] = field(default_factory=lambda: deque(maxlen=1000))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "cache_hits": self.cache_hits,
+            "inflight_hits": self.inflight_hits,
+            "api_calls": self.api_calls,
+            "errors": self.errors,
+            "cache_hit_rate": round(self.cache_hits / self.requests, 4) if self.requests else 0.0,
+            "latency_p50": round(_percentile(self.latency_samples, 50), 3),
+            "latency_p95": round(_percentile(self.latency_samples, 95), 3),
+            "api_latency_p50": round(_percentile(self.api_latency_samples, 50), 3),
+            "api_latency_p95": round(_percentile(self.api_latency_samples, 95), 3),
+        }
+
+
+class WebSearchClient:
+    """검색 백엔드 앞단의 클라이언트 (TTL 캐시 + 진행 중 요청 공유)"""
+
+    def __init__(
+        self,
+        backend: Optional[SearchBackend] = None,
+        max_results: int = MAX_SEARCH_RESULTS,
+        cache_ttl: float = WEB_SEARCH_CACHE_TTL_SECONDS,
+        cache_max_entries: int = WEB_SEARCH_CACHE_MAX_ENTRIES,
+    ):
+        # None이면 호출 시점의 설정된 백엔드 사용 (set_search_backend로 교체 가능)
+        self._backend = backend
+        self.max_results = max_results
+        self.cache_ttl = cache_ttl
+        self.cache_max_entries = cache_max_entries
+        self.metrics = SearchMetrics()
+        # 정규화된 쿼리 -> (만료 시각, 포맷된 결과)
+        self._cache: "OrderedDict[str, tuple[float, str]]" = OrderedDict()
+        # 이벤트 루프 -> (정규화된 쿼리 -> 진행 중인 API 요청)
+        # 태스크는 루프에 묶이므로 루프별로 보관 (여러 스레드가 각자 루프를 돌려도 서로의 요청을 기다리지 않음)
+        self._inflight: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Task]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._inflight_lock = threading.Lock()
+
+    async def search(self, query: str) -> str:
+        """
+        검색을 수행하고 포맷된 결과를 반환합니다. API 오류는 예외로 전달됩니다.
+
+        Args:
+            query: 검색할 쿼리 문자열
+
+        Returns:
+            str: 검색 결과를 포맷팅한 문자열
+        """
+        started = time.monotonic()
+        backend = self.backend
+        key = f"{backend.name}:{normalize_query(query)}"
+        self.metrics.requests += 1
+        try:
+            cached = self._get_cached(key)
+            if cached is not None:
+                self.metrics.cache_hits += 1
+                print(f"♻️ [검색 캐시] '{query}' 결과를 재사용합니다.")
+                return cached
+
+            inflight = self._loop_inflight()
+            task = inflight.get(key)
+            if task is None:
+                task = asyncio.ensure_future(self._fetch(backend, query, key))
+                inflight[key] = task
+                task.add_done_callback(lambda _: inflight.pop(key, None))
+            else:
+                self.metrics.inflight_hits += 1
+                print(f"⏳ [검색 공유] '{query}' 진행 중인 요청 결과를 기다립니다.")
+
+            # 한 호출자가 취소되어도 같은 요청을 기다리는 다른 호출자에 영향이 없도록 shield
+            return await asyncio.shield(task)
+        finally:
+            self.metrics.latency_samples.append(time.monotonic() - started)
+
+    def _loop_inflight(self) -> Dict[str, asyncio.Task]:
+        """현재 이벤트 루프의 진행 중 요청 목록 (해당 루프의 스레드에서만 읽고 씀)"""
+        loop = asyncio.get_running_loop()
+        with self._inflight_lock:
+            return self._inflight.setdefault(loop, {})
+
+    @property
+    def backend(self) -> SearchBackend:
+        return self._backend or get_web_search_backend()
+
+    async def _fetch(self, backend: SearchBackend, query: str, key: str) -> str:
+        """검색 백엔드 호출 (성공한 결과만 캐시)"""
+        started = time.monotonic()
+        self.metrics.api_calls += 1
+        try:
+            results = await backend.search(query, self.max_results)
+        except Exception:
+            self.metrics.errors += 1
+            raise
+        finally:
+            self.metrics.api_latency_samples.append(time.monotonic() - started)
+
+        if not results:
+            print(f"❌ [검색 실패] 검색 결과를 찾을 수 없습니다.")
+            logger.warning(f"검색 결과 없음 - 쿼리: {query}")
+            formatted = "검색 결과를 찾을 수 없습니다."
+        else:
+            formatted_results = []
+            for i, result in enumerate(results, 1):
+                formatted_results.append(
+                    f"{i}. {result.title}\n"
+                    f"   출처: {result.url}\n"
+                    f"   내용: {result.content}\n"
+                )
+            formatted = "\n".join(formatted_results)
+            print(f"✅ [검색 성공] {len(results)}개의 결과를 찾았습니다.")
+            logger.info(f"검색 성공 - 쿼리: {query}, 결과 수: {len(results)}")
+
+        self._set_cached(key, formatted)
+        return formatted
+
+    def _get_cached(self, key: str) -> Optional[str]:
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return value
+
+    def _set_cached(self, key: str, value: str) -> None:
+        if self.cache_ttl <= 0 or self.cache_max_entries <= 0:
+            return
+        self._cache[key] = (time.monotonic() + self.cache_ttl, value)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_max_entries:
+            self._cache.popitem(last=False)
+
+    def clear_cache(self) -> None:
+        """검색 결과 캐시 비우기"""
+        self._cache.clear()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """캐시 적중률 및 검색 지연 시간 지표 (시간 단위: 초)"""
+        data = self.metrics.to_dict()
+        data["cache_entries"] = len(self._cache)
+        with self._inflight_lock:
+            data["inflight"] = sum(len(inflight) for inflight in list(self._inflight.values()))
+        return data
+
+
+_search_client: Optional[WebSearchClient] = None
+
+
+def get_web_search_client() -> WebSearchClient:
+    """웹 검색 클라이언트 인스턴스 반환"""
+    global _search_client
+    if _search_client is None:
+        _search_client = WebSearchClient()
+    return _search_client
+
+
+def get_web_search_metrics() -> Dict[str, Any]:
+    """웹 검색 지표 조회"""
+    return get_web_search_client().get_metrics()
+
+
+async def search_web_tool(query: str) -> str:
     """
-    Tavily API를 사용하여 실제 웹 검색을 수행하는 도구
-    
+    Tavily API(또는 설정된 검색 백엔드)를 사용하여 웹 검색을 수행하는 도구
+
     Args:
         query (str): 검색할 쿼리 문자열
-        
+
     Returns:
         str: 검색 결과를 포맷팅한 문자열
     """
     # 검색 시도 로깅
     print(f"\n🔍 [웹 검색 시도] 검색 쿼리: '{query}'")
     logger.info(f"웹 검색 시도 - 쿼리: {query}")
-    
+
     try:
-        tavily = TavilyClient(api_key=TAVILY_API_KEY)
-        response = tavily.search(query, max_results=MAX_SEARCH_RESULTS)
-        
-        if not response.get('results'):
-            print(f"❌ [검색 실패] 검색 결과를 찾을 수 없습니다.")
-            logger.warning(f"검색 결과 없음 - 쿼리: {query}")
-            return "검색 결과를 찾을 수 없습니다."
-        
-        formatted_results = []
-        for i, result in enumerate(response['results'], 1):
-            formatted_results.append(
-                f"{i}. {result.get('title', 'No title')}\n"
-                f"   출처: {result.get('url', 'No URL')}\n"
-                f"   내용: {result.get('content', 'No description')}\n"
-            )
-        
-        print(f"✅ [검색 성공] {len(response['results'])}개의 결과를 찾았습니다.")
-        logger.info(f"검색 성공 - 쿼리: {query}, 결과 수: {len(response['results'])}")
-        
-        return "\n".join(formatted_results)
-        
+        return await get_web_search_client().search(query)
+
     except Exception as e:
         error_msg = f"검색 중 오류가 발생했습니다: {str(e)}"
         print(f"❌ [검색 오류] {error_msg}")
         logger.error(f"검색 오류 - 쿼리: {query}, 오류: {str(e)}")
         return error_msg
-
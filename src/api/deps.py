@@ -2,12 +2,13 @@
 FastAPI 의존성 주입 모듈
 """
 
-from typing import Generator
+from typing import AsyncGenerator, Generator
 
 from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from src.core.db import SessionLocal
+from src.core.db import SessionLocal, get_async_session_factory
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -17,3 +18,9 @@ def get_db() -> Generator[Session, None, None]:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """비동기 데이터베이스 세션 의존성 (DB I/O를 await하는 엔드포인트용)"""
+    async with get_async_session_factory()() as db:
+        yield db
@@ -2,23 +2,52 @@
 에이전트 로그 API 엔드포인트
 """
 
+from datetime import datetime, timedelta
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.api.deps import get_db
+from src.ai.agents.prompt_cache import get_prompt_cache_stats
+from src.ai.tools.web_search_tool import get_web_search_metrics
+from src.api.deps import get_async_db
 from src.core import schemas
+from src.repositories.agent_log_search import SearchUnavailableError
+from src.repositories.pagination import Cursor, decode_cursor, next_cursor
 from src.services.agent_log_service import AgentLogService
+from src.services.db_maintenance_service import get_db_maintenance_service
 
 router = APIRouter()
 
 
-def get_agent_log_service(db: Session = Depends(get_db)) -> AgentLogService:
+def get_agent_log_service(db: AsyncSession = Depends(get_async_db)) -> AgentLogService:
     """에이전트 로그 서비스 의존성"""
     return AgentLogService(db)
 
 
+# 다음 페이지 커서를 전달하는 응답 헤더 (마지막 페이지면 없음)
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def parse_cursor(cursor: Optional[str]) -> Optional[Cursor]:
+    """쿼리 파라미터의 커서 문자열을 (시각, id)로 변환 (형식 오류는 400)"""
+    if cursor is None:
+        return None
+    try:
+        return decode_cursor(cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+def set_next_cursor(response: Response, items: list, limit: int, timestamp_field: str) -> None:
+    """페이지가 가득 찼으면 마지막 항목의 (시각, id)를 다음 페이지 커서 헤더로 설정"""
+    if not items:
+        return
+    token = next_cursor(getattr(items[-1], timestamp_field), items[-1].id, len(items), limit)
+    if token:
+        response.headers[NEXT_CURSOR_HEADER] = token
+
+
 # ============================================================================
 # AgentRun 관련 엔드포인트
 # ============================================================================
@@ -29,26 +58,35 @@ async def create_run(
     service: AgentLogService = Depends(get_agent_log_service)
 ):
     """새로운 에이전트 실행 기록을 생성합니다."""
-    return service.create_run(run_data)
+    return await service.create_run(run_data)
 
 
-@router.get("/runs", response_model=List[schemas.AgentRunRead], summary="에이전트 실행 기록 목록 조회")
+@router.get("/runs", response_model=List[schemas.AgentRunSummary], summary="에이전트 실행 기록 목록 조회")
 async def list_runs(
+    response: Response,
     team_name: Optional[str] = Query(None, description="팀 이름으로 필터링"),
     limit: int = Query(50, ge=1, le=1000, description="조회할 최대 개수"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 헤더 값 (다음 페이지)"),
+    after_id: Optional[int] = Query(None, ge=0, description="이 id 이후에 생성된 실행만 오래된 순으로 조회 (증분 조회)"),
     service: AgentLogService = Depends(get_agent_log_service)
 ):
-    """에이전트 실행 기록 목록을 조회합니다."""
-    return service.list_runs(team_name=team_name, limit=limit)
+    """
+    에이전트 실행 기록 목록을 요약 형태(메시지 없음, 작업 내용은 앞부분만)로 조회합니다.
+    다음 페이지가 있으면 X-Next-Cursor 헤더로 커서를 반환합니다.
+    """
+    runs = await service.list_runs(team_name=team_name, limit=limit, cursor=parse_cursor(cursor), after_id=after_id)
+    set_next_cursor(response, runs, limit, "started_at")
+    return runs
 
 
 @router.get("/runs/{run_id}", response_model=schemas.AgentRunRead, summary="특정 실행 기록 조회")
 async def get_run(
     run_id: int,
+    include_messages: bool = Query(True, description="메시지 포함 여부 (메시지는 /runs/{run_id}/messages로 나눠 받을 수 있음)"),
     service: AgentLogService = Depends(get_agent_log_service)
 ):
-    """특정 실행 기록을 조회합니다 (메시지 포함)."""
-    run = service.get_run(run_id)
+    """특정 실행 기록을 조회합니다 (기본: 메시지 포함)."""
+    run = await service.get_run(run_id, include_messages=include_messages)
     if not run:
         raise HTTPException(status_code=404, detail="실행 기록을 찾을 수 없습니다")
     return run
@@ -61,7 +99,7 @@ async def finish_run(
     service: AgentLogService = Depends(get_agent_log_service)
 ):
     """실행 기록을 완료 상태로 변경합니다."""
-    run = service.finish_run(run_id, status)
+    run = await service.finish_run(run_id, status)
     if not run:
         raise HTTPException(status_code=404, detail="실행 기록을 찾을 수 없습니다")
     return run
@@ -77,16 +115,22 @@ async def add_message(
     service: AgentLogService = Depends(get_agent_log_service)
 ):
     """새로운 메시지를 추가합니다."""
-    return service.add_message(message_data)
+    return await service.add_message(message_data)
 
 
 @router.get("/runs/{run_id}/messages", response_model=List[schemas.AgentMessageRead], summary="실행 기록의 메시지 목록 조회")
 async def get_messages_by_run(
     run_id: int,
+    response: Response,
+    limit: int = Query(200, ge=1, le=1000, description="조회할 최대 개수"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 헤더 값 (다음 페이지)"),
+    after_id: Optional[int] = Query(None, ge=0, description="이 id 이후에 저장된 메시지만 조회 (증분 조회)"),
     service: AgentLogService = Depends(get_agent_log_service)
 ):
-    """특정 실행 기록의 모든 메시지를 조회합니다."""
-    return service.get_messages_by_run(run_id)
+    """특정 실행 기록의 메시지를 작성 순서대로 조회합니다. 다음 페이지가 있으면 X-Next-Cursor 헤더로 커서를 반환합니다."""
+    messages = await service.get_messages_by_run(run_id, limit=limit, cursor=parse_cursor(cursor), after_id=after_id)
+    set_next_cursor(response, messages, limit, "created_at")
+    return messages
 
 
 # ============================================================================
@@ -96,10 +140,87 @@ async def get_messages_by_run(
 @router.get("/teams/{team_name}/statistics", summary="팀별 통계 정보 조회")
 async def get_team_statistics(
     team_name: str,
+    window_hours: Optional[float] = Query(None, gt=0, description="최근 N시간 안에 시작된 실행만 집계"),
+    since: Optional[datetime] = Query(None, description="이 시각(UTC) 이후 시작된 실행만 집계"),
+    until: Optional[datetime] = Query(None, description="이 시각(UTC) 이전 시작된 실행만 집계"),
+    percentiles: List[float] = Query([50, 95], description="실행 시간 백분위 (0~100)"),
+    service: AgentLogService = Depends(get_agent_log_service)
+):
+    """특정 팀의 상태별 실행 수, 평균/백분위 실행 시간(초), 메시지 수를 조회합니다."""
+    if any(p < 0 or p > 100 for p in percentiles):
+        raise HTTPException(status_code=400, detail="백분위는 0~100 사이여야 합니다")
+    if window_hours is not None:
+        since = datetime.utcnow() - timedelta(hours=window_hours)
+    return await service.get_team_statistics(team_name, since=since, until=until, percentiles=percentiles)
+
+
+@router.get("/stats/overview", summary="전체 실행 현황 조회")
+async def get_run_overview(
+    team_name: Optional[str] = Query(None, description="팀 이름으로 필터링"),
+    service: AgentLogService = Depends(get_agent_log_service)
+):
+    """상태별/팀별 실행 수와 메시지·토큰·비용 합계를 실행 롤업에서 조회합니다."""
+    return await service.get_run_overview(team_name=team_name)
+
+
+@router.get("/stats/rollups", summary="시간/일 단위 실행 추이 조회")
+async def get_run_rollups(
+    granularity: str = Query("day", pattern="^(hour|day)$", description="집계 단위 (hour | day)"),
+    window_hours: Optional[float] = Query(None, gt=0, description="최근 N시간 안에 시작된 실행만 집계"),
+    since: Optional[datetime] = Query(None, description="이 시각(UTC)이 속한 버킷부터 포함"),
+    until: Optional[datetime] = Query(None, description="이 시각(UTC) 이전 버킷만 포함"),
+    team_name: Optional[str] = Query(None, description="팀 이름으로 필터링"),
+    service: AgentLogService = Depends(get_agent_log_service)
+):
+    """버킷(실행 시작 시각 기준)·상태별 실행 수, 메시지 수, 토큰, 실행 시간 합계를 조회합니다."""
+    if window_hours is not None:
+        since = datetime.utcnow() - timedelta(hours=window_hours)
+    return await service.get_run_rollups(granularity, since=since, until=until, team_name=team_name)
+
+
+@router.get("/search", response_model=schemas.AgentLogSearchResponse, summary="메시지/작업 내용 전문 검색")
+async def search_agent_logs(
+    q: str = Query(..., min_length=1, max_length=200, description="검색어 (모든 단어를 포함, 단어별 접두어 일치)"),
+    target: str = Query("messages", pattern="^(messages|runs)$", description="검색 대상 (messages | runs)"),
+    team_name: Optional[str] = Query(None, description="팀 이름으로 필터링"),
+    run_id: Optional[int] = Query(None, description="실행 ID로 필터링 (messages 검색)"),
+    limit: int = Query(20, ge=1, le=100, description="조회할 최대 개수"),
+    offset: int = Query(0, ge=0, le=10000, description="건너뛸 개수 (이전 응답의 next_offset)"),
+    sort: str = Query("relevance", pattern="^(relevance|recent)$", description="정렬 (relevance: 관련도 순 | recent: 최신순)"),
     service: AgentLogService = Depends(get_agent_log_service)
 ):
-    """특정 팀의 통계 정보를 조회합니다."""
-    return service.get_team_statistics(team_name)
+    """메시지 내용 또는 실행 작업 내용을 관련도 순으로 검색하고, 검색어를 <mark>로 강조한 스니펫을 반환합니다."""
+    try:
+        return await service.search(q, target=target, team_name=team_name, run_id=run_id, limit=limit, offset=offset, sort=sort)
+    except SearchUnavailableError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+
+
+@router.get("/maintenance/status", summary="메시지 보관/DB 정리 현황 조회")
+def get_maintenance_status():
+    """보관(압축)된 메시지 수와 크기, 정리 작업 예약 상태, 마지막 실행 결과를 조회합니다."""
+    return get_db_maintenance_service().get_status()
+
+
+@router.post("/maintenance/run", summary="메시지 보관/DB 정리 즉시 실행")
+def run_maintenance(
+    archive: bool = Query(True, description="오래된 메시지 압축 보관 여부"),
+    compact: bool = Query(True, description="VACUUM/ANALYZE 실행 여부"),
+):
+    """오래된 메시지를 압축 보관하고 VACUUM/ANALYZE로 DB를 정리합니다. (이미 실행 중이면 건너뜀)"""
+    return get_db_maintenance_service().run(archive=archive, compact=compact)
+
+
+@router.get("/tools/web-search/metrics", summary="웹 검색 도구 캐시/지연 시간 지표 조회")
+async def get_web_search_tool_metrics():
+    """웹 검색 도구의 캐시 적중률과 검색 지연 시간(p50/p95, 초)을 조회합니다."""
+    return get_web_search_metrics()
+
+
+@router.get("/models/prompt-cache/metrics", summary="모델별 프롬프트 캐시 적중 지표 조회")
+async def get_prompt_cache_metrics():
+    """모델별 입력 토큰 중 제공자 측 프롬프트 캐시에 적중한 토큰 수와 비율을 조회합니다."""
+    return get_prompt_cache_stats()
 
 
 @router.get("/runs/{run_id}/full", response_model=schemas.AgentRunRead, summary="실행 기록 전체 조회 (메시지 포함)")
@@ -108,7 +229,7 @@ async def get_run_with_messages(
     service: AgentLogService = Depends(get_agent_log_service)
 ):
     """실행 기록과 모든 메시지를 함께 조회합니다."""
-    run = service.get_run_with_messages(run_id)
+    run = await service.get_run_with_messages(run_id)
     if not run:
         raise HTTPException(status_code=404, detail="실행 기록을 찾을 수 없습니다")
     return run
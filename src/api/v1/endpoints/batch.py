@@ -1,5 +1,8 @@
 """
 배치 API 엔드포인트
+
+BatchService는 스케줄러 스레드에서 동기 세션으로 동작하므로 엔드포인트도 동기 함수로 두어
+FastAPI 스레드 풀에서 실행합니다. (이벤트 루프를 막지 않음)
 """
 
 from typing import Dict, Any
@@ -14,7 +17,7 @@ router = APIRouter()
 
 
 @router.post("/start", response_model=BatchStartResponse)
-async def start_batch(
+def start_batch(
     request: BatchStartRequest,
     db: Session = Depends(get_db)
 ) -> BatchStartResponse:
@@ -48,7 +51,7 @@ async def start_batch(
 
 
 @router.post("/stop/{notion_page_id}", response_model=BatchStopResponse)
-async def stop_batch(
+def stop_batch(
     notion_page_id: str,
     db: Session = Depends(get_db)
 ) -> BatchStopResponse:
@@ -81,7 +84,7 @@ async def stop_batch(
 
 
 @router.get("/status/{notion_page_id}", response_model=BatchStatusResponse)
-async def get_batch_status(
+def get_batch_status(
     notion_page_id: str,
     db: Session = Depends(get_db)
 ) -> BatchStatusResponse:
@@ -117,7 +120,7 @@ async def get_batch_status(
 
 
 @router.get("/status", response_model=Dict[str, Any])
-async def get_all_batch_status(
+def get_all_batch_status(
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
     """
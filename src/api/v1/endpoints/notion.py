@@ -4,10 +4,12 @@ Notion 관련 API 엔드포인트
 
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query, Path
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 import re
 
-from src.api.deps import get_db
+from src.api.deps import get_async_db, get_db
+from src.repositories import notion_batch_status_async
 from src.services.batch_service import BatchService
 from src.services.notion_service import NotionService
 from src.core.schemas import (
@@ -221,18 +223,14 @@ def update_page_active_status(
 
 
 @router.get("/pages/{notion_page_id}/batch-status", response_model=NotionBatchStatusRead | None)
-def get_batch_status(
+async def get_batch_status(
     notion_page_id: str = Path(..., description="Notion 페이지 ID (UUID 형식)"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
-    특정 페이지의 배치 상태를 조회합니다.
+    특정 페이지의 배치 상태를 조회합니다. (기록이 없으면 null)
     """
-    notion_service = NotionService(db)
-    result = notion_service.get_batch_status(notion_page_id)
-    if not result["success"]:
-        raise HTTPException(status_code=400, detail=result["message"])
-    return result.get("status")
+    return await notion_batch_status_async.get_status(db, notion_page_id)
 
 
 @router.put("/pages/{notion_page_id}/batch-status", response_model=NotionBatchStatusRead)
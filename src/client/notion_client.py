@@ -865,3 +865,183 @@ def append_completion_message(block_id: str, completion_text: str = None) -> dic
             "message": f"완료 메시지 추가 중 오류가 발생했습니다: {str(e)}"
         }
 
+
+
+# Notion API 제한: rich_text 항목 하나당 2000자, 한 번의 children.append 요청당 블록 100개
+NOTION_RICH_TEXT_MAX_CHARS = 2000
+NOTION_APPEND_MAX_BLOCKS = 100
+
+
+def split_text_for_blocks(text: str, max_chars: int = NOTION_RICH_TEXT_MAX_CHARS) -> List[str]:
+    """
+    긴 텍스트를 Notion 블록 하나에 들어가는 크기로 나눕니다.
+    
+    가능한 한 줄 단위로 나누고, 한 줄이 max_chars보다 길면 그 줄만 고정 길이로 자릅니다.
+    
+    Args:
+        text (str): 나눌 텍스트
+        max_chars (int): 조각 하나의 최대 문자 수
+        
+    Returns:
+        List[str]: 텍스트 조각 리스트
+    """
+    chunks: List[str] = []
+    current: List[str] = []
+    current_len = 0
+    
+    for line in text.split("\n"):
+        while len(line) > max_chars:
+            if current:
+                chunks.append("\n".join(current))
+                current, current_len = [], 0
+            chunks.append(line[:max_chars])
+            line = line[max_chars:]
+        
+        # 줄바꿈 문자 1자 포함
+        added_len = len(line) + (1 if current else 0)
+        if current and current_len + added_len > max_chars:
+            chunks.append("\n".join(current))
+            current, current_len = [], 0
+            added_len = len(line)
+        current.append(line)
+        current_len += added_len
+    
+    if current and any(current):
+        chunks.append("\n".join(current))
+    return chunks
+
+
+def _callout_block_content(text: str, emoji: str) -> Dict[str, Any]:
+    """콜아웃 블록 본문 구성 (rich_text 제한에 맞춰 잘라냄)"""
+    return {
+        "rich_text": [
+            {
+                "type": "text",
+                "text": {
+                    "content": text[:NOTION_RICH_TEXT_MAX_CHARS]
+                }
+            }
+        ],
+        "icon": {
+            "emoji": emoji
+        },
+        "color": "gray_background"
+    }
+
+
+def create_progress_callout(block_id: str, text: str, emoji: str = "⏳") -> Dict[str, Any]:
+    """
+    Notion 블록 아래에 진행 상황 콜아웃을 추가합니다. 이후 update_callout으로 내용을 갱신합니다.
+    
+    Args:
+        block_id (str): 콜아웃을 추가할 블록 ID
+        text (str): 콜아웃 내용
+        emoji (str): 콜아웃 아이콘
+        
+    Returns:
+        Dict: 추가 결과 (callout_id 포함)
+    """
+    try:
+        response = get_notion_client().blocks.children.append(
+            block_id=block_id,
+            children=[
+                {
+                    "type": "callout",
+                    "callout": _callout_block_content(text, emoji)
+                }
+            ]
+        )
+        results = response.get("results") or []
+        return {
+            "success": True,
+            "callout_id": results[-1]["id"] if results else None,
+            "message": "진행 상황 콜아웃이 추가되었습니다."
+        }
+        
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e),
+            "message": f"진행 상황 콜아웃 추가 중 오류가 발생했습니다: {str(e)}"
+        }
+
+
+def update_callout(callout_id: str, text: str, emoji: str = "⏳") -> Dict[str, Any]:
+    """
+    콜아웃 블록의 내용을 갱신합니다.
+    
+    Args:
+        callout_id (str): 갱신할 콜아웃 블록 ID
+        text (str): 새 콜아웃 내용
+        emoji (str): 콜아웃 아이콘
+        
+    Returns:
+        Dict: 갱신 결과
+    """
+    try:
+        get_notion_client().blocks.update(
+            block_id=callout_id,
+            callout=_callout_block_content(text, emoji)
+        )
+        return {
+            "success": True,
+            "message": "콜아웃이 갱신되었습니다."
+        }
+        
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e),
+            "message": f"콜아웃 갱신 중 오류가 발생했습니다: {str(e)}"
+        }
+
+
+def append_text_blocks(block_id: str, text: str) -> Dict[str, Any]:
+    """
+    긴 텍스트를 잘리지 않도록 여러 문단 블록으로 나누어 하위 블록으로 추가합니다.
+    
+    Args:
+        block_id (str): 하위 블록을 추가할 블록 ID (콜아웃 등)
+        text (str): 추가할 텍스트
+        
+    Returns:
+        Dict: 추가 결과 (block_count 포함)
+    """
+    try:
+        notion = get_notion_client()
+        blocks = [
+            {
+                "object": "block",
+                "type": "paragraph",
+                "paragraph": {
+                    "rich_text": [
+                        {
+                            "type": "text",
+                            "text": {
+                                "content": chunk
+                            }
+                        }
+                    ]
+                }
+            }
+            for chunk in split_text_for_blocks(text)
+        ]
+        
+        for start in range(0, len(blocks), NOTION_APPEND_MAX_BLOCKS):
+            notion.blocks.children.append(
+                block_id=block_id,
+                children=blocks[start:start + NOTION_APPEND_MAX_BLOCKS]
+            )
+        
+        return {
+            "success": True,
+            "block_count": len(blocks),
+            "message": f"{len(blocks)}개의 블록이 추가되었습니다."
+        }
+        
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e),
+            "message": f"블록 추가 중 오류가 발생했습니다: {str(e)}"
+        }
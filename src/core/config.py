@@ -19,6 +19,48 @@ TAVILY_API_KEY = os.getenv("TAVILY_API_KEY")
 NOTION_API_KEY = os.getenv("NOTION_API_KEY")
 DEFAULT_MODEL = "gemini-2.5-flash"
 
+# ============================================================================
+# 모델 티어 설정 (역할/작업 난이도별 모델 라우팅)
+# ============================================================================
+
+MODEL_ROUTING_ENABLED = os.getenv("MODEL_ROUTING_ENABLED", "true").lower() == "true"
+
+# 티어별 모델
+MODEL_TIERS = {
+    "lite": os.getenv("MODEL_TIER_LITE", "gemini-2.5-flash-lite"),
+    "standard": os.getenv("MODEL_TIER_STANDARD", DEFAULT_MODEL),
+    "pro": os.getenv("MODEL_TIER_PRO", "gemini-2.5-pro"),
+}
+
+# 역할별 티어 (복잡한 작업 기준, 단순 작업은 모든 역할이 lite 티어 사용)
+MODEL_ROLE_TIERS = {
+    "selector": os.getenv("MODEL_ROLE_SELECTOR_TIER", "lite"),
+    "tool_agent": os.getenv("MODEL_ROLE_TOOL_AGENT_TIER", "standard"),
+    "analyst": os.getenv("MODEL_ROLE_ANALYST_TIER", "standard"),
+    "summarizer": os.getenv("MODEL_ROLE_SUMMARIZER_TIER", "lite"),
+    "master": os.getenv("MODEL_ROLE_MASTER_TIER", "pro"),
+}
+
+# 이 길이(문자 수) 이하이고 분석 키워드가 없는 작업은 단순 작업으로 분류
+SIMPLE_TASK_MAX_CHARS = int(os.getenv("SIMPLE_TASK_MAX_CHARS", "80"))
+
+# ============================================================================
+# 모델 클라이언트 백엔드 설정
+# ============================================================================
+
+# "gemini": 실제 Gemini API / "scripted": API 호출 없이 정해진 규칙으로 응답하는 가짜 클라이언트 (벤치마크용)
+MODEL_CLIENT_BACKEND = os.getenv("MODEL_CLIENT_BACKEND", "gemini")
+# scripted 클라이언트 응답 지연 분포: "fixed", "uniform", "lognormal" (평균/표준편차 단위: 초)
+SCRIPTED_MODEL_LATENCY_DISTRIBUTION = os.getenv("SCRIPTED_MODEL_LATENCY_DISTRIBUTION", "lognormal")
+SCRIPTED_MODEL_LATENCY_MEAN_SECONDS = float(os.getenv("SCRIPTED_MODEL_LATENCY_MEAN_SECONDS", "0.3"))
+SCRIPTED_MODEL_LATENCY_STDDEV_SECONDS = float(os.getenv("SCRIPTED_MODEL_LATENCY_STDDEV_SECONDS", "0.1"))
+# 대화 메시지가 이 수 이상 쌓이면 응답에 TERMINATE를 붙여 팀 실행을 끝냄
+SCRIPTED_MODEL_TURNS_BEFORE_TERMINATE = int(os.getenv("SCRIPTED_MODEL_TURNS_BEFORE_TERMINATE", "4"))
+# 응답당 출력 토큰 수와 도구 호출 여부 (도구 호출 시 실제 도구가 실행되므로 SEARCH_BACKEND=local 권장)
+SCRIPTED_MODEL_COMPLETION_TOKENS = int(os.getenv("SCRIPTED_MODEL_COMPLETION_TOKENS", "150"))
+SCRIPTED_MODEL_TOOL_CALLS = os.getenv("SCRIPTED_MODEL_TOOL_CALLS", "false").lower() == "true"
+SCRIPTED_MODEL_SEED = int(os.getenv("SCRIPTED_MODEL_SEED", "42"))
+
 # ============================================================================
 # 시스템 제한 설정
 # ============================================================================
@@ -27,6 +69,124 @@ MAX_MESSAGES = 25
 MAX_SEARCH_RESULTS = 5
 TEAM_RUN_TIMEOUT_SECONDS = int(os.getenv("TEAM_RUN_TIMEOUT_SECONDS", "180"))
 DEVILS_ADVOCATE_PREVIEW_ROUNDS = int(os.getenv("DEVILS_ADVOCATE_PREVIEW_ROUNDS", "2"))
+# 계층적 팀 실행 시 동시에 실행할 하위 팀 수 (0 이하이면 제한 없음)
+SUB_TEAM_MAX_CONCURRENCY = int(os.getenv("SUB_TEAM_MAX_CONCURRENCY", "3"))
+# 팀 메시지 버스: 구독자별 큐 크기와 가득 찬 큐에 발행할 때 기다리는 최대 시간(초)
+MESSAGE_BUS_QUEUE_SIZE = int(os.getenv("MESSAGE_BUS_QUEUE_SIZE", "16"))
+MESSAGE_BUS_PUBLISH_TIMEOUT_SECONDS = float(os.getenv("MESSAGE_BUS_PUBLISH_TIMEOUT_SECONDS", "30"))
+# 고급 팀 관리자: 같은 팀에 대한 요청을 동시에 실행할 수 (팀 인스턴스 풀 크기와 버스 워커 수)
+TEAM_MAX_CONCURRENT_RUNS = int(os.getenv("TEAM_MAX_CONCURRENT_RUNS", "4"))
+# 검색 도구 공용 HTTP 클라이언트: 요청 제한 시간(초)과 연결 풀 크기
+WEB_SEARCH_TIMEOUT_SECONDS = float(os.getenv("WEB_SEARCH_TIMEOUT_SECONDS", "20"))
+WEB_SEARCH_MAX_CONNECTIONS = int(os.getenv("WEB_SEARCH_MAX_CONNECTIONS", "20"))
+# 웹 검색 결과 캐시: 유지 시간(초, 0 이하이면 캐시 안 함)과 최대 항목 수
+WEB_SEARCH_CACHE_TTL_SECONDS = float(os.getenv("WEB_SEARCH_CACHE_TTL_SECONDS", "600"))
+WEB_SEARCH_CACHE_MAX_ENTRIES = int(os.getenv("WEB_SEARCH_CACHE_MAX_ENTRIES", "256"))
+# google_search 결과 페이지 수집: 페이지당 최대 다운로드 바이트, 요청 제한 시간(초),
+# 호스트별 동시 요청 수와 같은 호스트 요청 사이의 최소 간격(초)
+PAGE_FETCH_MAX_BYTES = int(os.getenv("PAGE_FETCH_MAX_BYTES", "524288"))
+PAGE_FETCH_TIMEOUT_SECONDS = float(os.getenv("PAGE_FETCH_TIMEOUT_SECONDS", "10"))
+PAGE_FETCH_PER_HOST_CONCURRENCY = int(os.getenv("PAGE_FETCH_PER_HOST_CONCURRENCY", "2"))
+PAGE_FETCH_PER_HOST_INTERVAL_SECONDS = float(os.getenv("PAGE_FETCH_PER_HOST_INTERVAL_SECONDS", "0.5"))
+# 검색 백엔드: "live"(Tavily, Google CSE) 또는 "local"(로컬 문서 디렉터리 BM25 인덱스, 오프라인 실행/벤치마크용)
+SEARCH_BACKEND = os.getenv("SEARCH_BACKEND", "live")
+LOCAL_SEARCH_CORPUS_DIR = os.getenv("LOCAL_SEARCH_CORPUS_DIR", "./data/search_corpus")
+LOCAL_SEARCH_INDEX_DIR = os.getenv("LOCAL_SEARCH_INDEX_DIR", "./data/search_index")
+# 에이전트 도구 실행 제한 시간(초, 0 이하이면 제한 없음): 기본값, 검색 도구, 분석 도구
+TOOL_DEFAULT_TIMEOUT_SECONDS = float(os.getenv("TOOL_DEFAULT_TIMEOUT_SECONDS", "60"))
+TOOL_SEARCH_TIMEOUT_SECONDS = float(os.getenv("TOOL_SEARCH_TIMEOUT_SECONDS", "45"))
+TOOL_ANALYSIS_TIMEOUT_SECONDS = float(os.getenv("TOOL_ANALYSIS_TIMEOUT_SECONDS", "15"))
+# 같은 run 안에서 같은 인자로 호출된 순수/멱등 도구(검색, 분석)의 결과 재사용 여부
+TOOL_MEMOIZATION_ENABLED = os.getenv("TOOL_MEMOIZATION_ENABLED", "true").lower() == "true"
+
+# ============================================================================
+# 에이전트 대화 컨텍스트 압축 설정
+# ============================================================================
+
+# "compact": 최근 메시지만 원문 유지 + 오래된 도구 결과 요약 / "unbounded": 전체 기록 그대로 사용
+AGENT_CONTEXT_STRATEGY = os.getenv("AGENT_CONTEXT_STRATEGY", "compact")
+# 원문 그대로 유지할 최근 메시지 수
+CONTEXT_KEEP_RECENT_MESSAGES = int(os.getenv("CONTEXT_KEEP_RECENT_MESSAGES", "6"))
+# 오래된 도구 결과를 줄일 요약 길이 (문자 수)
+CONTEXT_TOOL_SUMMARY_CHARS = int(os.getenv("CONTEXT_TOOL_SUMMARY_CHARS", "400"))
+# 최근 도구 결과와 오래된 대화 메시지가 이 길이를 넘으면 발췌본으로 잘라냄 (문자 수)
+CONTEXT_MAX_MESSAGE_CHARS = int(os.getenv("CONTEXT_MAX_MESSAGE_CHARS", "6000"))
+# 오래된 메시지를 압축하는 경계를 이 메시지 수 단위로만 옮김
+# (경계가 매 턴 움직이지 않아 앞부분 프롬프트가 그대로 유지되므로 제공자 측 프롬프트 캐시가 계속 적중)
+CONTEXT_COMPACTION_STEP = int(os.getenv("CONTEXT_COMPACTION_STEP", "4"))
+
+# ============================================================================
+# 토큰 예산 설정 (0 이하이면 제한 없음)
+# ============================================================================
+
+# 팀 실행(run) 하나가 사용할 수 있는 최대 토큰 수 (TokenUsageTermination으로 적용)
+TEAM_MAX_TOTAL_TOKENS = int(os.getenv("TEAM_MAX_TOTAL_TOKENS", "200000"))
+# 배치에서 Notion 페이지 하나가 사용할 수 있는 누적 최대 토큰 수
+BATCH_PAGE_MAX_TOTAL_TOKENS = int(os.getenv("BATCH_PAGE_MAX_TOTAL_TOKENS", "2000000"))
+
+# 모델별 100만 토큰당 가격 (USD, 입력/출력). 목록에 없는 모델은 비용 0으로 계산
+MODEL_PRICING_PER_MILLION_TOKENS = {
+    "gemini-2.5-pro": (1.25, 10.00),
+    "gemini-2.5-flash": (0.30, 2.50),
+    "gemini-2.5-flash-lite": (0.10, 0.40),
+    "gemini-2.0-flash": (0.10, 0.40),
+    "gemini-2.0-flash-lite": (0.075, 0.30),
+}
+
+# ============================================================================
+# 데이터베이스 연결 설정
+# ============================================================================
+
+# SQLite 연결 프로필: "wal"(WAL 저널 + 동시 접근용 PRAGMA, 기본) / "default"(SQLite 기본 롤백 저널, 비교/문제 해결용)
+# WAL 모드에서는 읽기가 쓰기를 막지 않아 API, 배치 스레드, 메시지 쓰기 스레드가 동시에 DB를 사용해도 잠금 오류가 줄어듦
+SQLITE_PROFILE = os.getenv("SQLITE_PROFILE", "wal").lower()
+# 다른 연결이 쓰는 중일 때 "database is locked" 오류를 내기 전까지 기다리는 최대 시간(밀리초)
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "15000"))
+# 연결당 페이지 캐시 크기(KiB)와 메모리 매핑 크기(MiB, 0이면 사용 안 함)
+SQLITE_CACHE_SIZE_KB = int(os.getenv("SQLITE_CACHE_SIZE_KB", "16384"))
+SQLITE_MMAP_SIZE_MB = int(os.getenv("SQLITE_MMAP_SIZE_MB", "256"))
+# 연결 풀 크기와 풀이 가득 찼을 때 추가로 열 수 있는 연결 수
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+
+# ============================================================================
+# 에이전트 메시지 기록 설정
+# ============================================================================
+
+# 팀 실행 중 스트리밍되는 메시지는 전용 쓰기 스레드가 모아서 여러 행 INSERT로 저장
+# 한 번에 저장할 최대 메시지 수와 메시지를 모으는 최대 시간(초)
+AGENT_MESSAGE_BATCH_SIZE = int(os.getenv("AGENT_MESSAGE_BATCH_SIZE", "50"))
+AGENT_MESSAGE_FLUSH_INTERVAL_SECONDS = float(os.getenv("AGENT_MESSAGE_FLUSH_INTERVAL_SECONDS", "0.5"))
+# 실행 종료 시 남은 메시지 저장을 기다리는 최대 시간(초)
+AGENT_MESSAGE_FLUSH_TIMEOUT_SECONDS = float(os.getenv("AGENT_MESSAGE_FLUSH_TIMEOUT_SECONDS", "10"))
+# 실행 목록 응답에 포함할 작업(task) 내용 최대 길이 (문자 수, 전체 내용은 상세 조회에서 제공)
+RUN_LIST_TASK_PREVIEW_CHARS = int(os.getenv("RUN_LIST_TASK_PREVIEW_CHARS", "200"))
+
+# ============================================================================
+# 에이전트 메시지 보관/DB 정리 설정
+# ============================================================================
+
+# 이 일수보다 오래된 메시지 내용은 zstd로 압축해 content_zstd 컬럼으로 옮김 (0이면 보관 처리 안 함)
+# 압축된 메시지는 조회 시 자동으로 풀리지만 전문 검색 대상에서는 빠짐
+AGENT_MESSAGE_ARCHIVE_AFTER_DAYS = int(os.getenv("AGENT_MESSAGE_ARCHIVE_AFTER_DAYS", "30"))
+# 이 길이(문자 수) 미만의 짧은 메시지는 압축 이득이 작아 그대로 둠
+AGENT_MESSAGE_ARCHIVE_MIN_CHARS = int(os.getenv("AGENT_MESSAGE_ARCHIVE_MIN_CHARS", "256"))
+# 한 번에 압축/commit할 메시지 수와 zstd 압축 레벨 (1~22)
+AGENT_MESSAGE_ARCHIVE_BATCH_SIZE = int(os.getenv("AGENT_MESSAGE_ARCHIVE_BATCH_SIZE", "500"))
+AGENT_MESSAGE_ZSTD_LEVEL = int(os.getenv("AGENT_MESSAGE_ZSTD_LEVEL", "9"))
+# 메시지 보관 + VACUUM/ANALYZE 정리 작업 주기 (시간, 0이면 자동 실행 안 함)
+DB_MAINTENANCE_INTERVAL_HOURS = float(os.getenv("DB_MAINTENANCE_INTERVAL_HOURS", "24"))
+
+# ============================================================================
+# Notion 결과 기록 설정
+# ============================================================================
+
+# 팀 실행 중에도 진행 상황 콜아웃을 갱신하고, 완료 시 전체 결과를 하위 블록으로 기록
+NOTION_PROGRESSIVE_RESULTS = os.getenv("NOTION_PROGRESSIVE_RESULTS", "true").lower() == "true"
+# 진행 상황 콜아웃 갱신 최소 간격 (초) - Notion API 요청 제한(초당 약 3회) 보호
+NOTION_PROGRESS_UPDATE_INTERVAL_SECONDS = float(os.getenv("NOTION_PROGRESS_UPDATE_INTERVAL_SECONDS", "5"))
+# 진행 상황 콜아웃에 보여줄 최신 메시지 미리보기 길이 (문자 수)
+NOTION_PROGRESS_PREVIEW_CHARS = int(os.getenv("NOTION_PROGRESS_PREVIEW_CHARS", "500"))
 
 # ============================================================================
 # 사용 가능한 모델 목록
@@ -45,6 +205,24 @@ AVAILABLE_GEMINI_MODELS = [
 # 에이전트 시스템 메시지
 # ============================================================================
 
+# 시스템 메시지와 발화자 선택 프롬프트는 실행마다 바뀌는 내용 없이 고정된 앞부분으로 두고,
+# 대화 기록처럼 바뀌는 내용은 맨 뒤에 붙여 제공자 측 프롬프트 캐시가 앞부분을 재사용하도록 합니다.
+
+# SelectorGroupChat 발화자 선택 프롬프트
+# ({participants}는 직전 발화자를 뺀 후보 목록이라 매 턴 바뀌므로 {history} 뒤에 둠)
+SELECTOR_PROMPT = """다음 작업을 수행할 에이전트를 선택하세요.
+
+{roles}
+
+다른 에이전트가 작업을 시작하기 전에 플래너 에이전트가 작업을 할당했는지 확인하세요.
+한 명의 에이전트만 선택하고 에이전트 이름만 답하세요.
+
+현재 대화 맥락:
+{history}
+
+위 대화를 읽고, {participants} 중에서 다음 작업을 수행할 에이전트를 선택하세요.
+"""
+
 WEB_SEARCH_AGENT_SYSTEM_MESSAGE = """
 당신은 웹 검색 에이전트입니다.
 요청된 정보를 찾기 위해 search_web_tool을 사용하세요.
@@ -71,7 +249,10 @@ DEVIL_ADVOCATE_SYSTEM_MESSAGE = """
 DATA_ANALYST_AGENT_SYSTEM_MESSAGE = """
 당신은 통계적 계산에 특화된 데이터 분석가입니다.
 데이터가 필요할 때는 WebSearchAgent에게 검색을 요청하세요.
-퍼센트 변화를 계산하기 위해 percentage_change_tool을 사용하세요.
+두 값 사이의 퍼센트 변화 하나만 필요하면 percentage_change_tool을 사용하세요.
+여러 시점의 값(가격/매출 시계열 등)을 분석할 때는 값을 하나씩 계산하지 말고
+batch_analysis_tool에 전체 데이터를 JSON 또는 CSV로 한 번에 전달해
+퍼센트 변화, CAGR, 이동평균, 변동성, 최대 낙폭, 상관계수를 함께 계산하세요.
 모든 계산을 완료한 후, 최종 요약을 제공하고 마지막 줄에 정확히 "TERMINATE"라고 말하세요.
 """
 
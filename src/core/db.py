@@ -3,20 +3,88 @@ DB 엔진/세션/초기화 유틸리티
 """
 
 import os
-from typing import Generator
+from typing import Any, Dict, Generator, Optional
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, inspect, text
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from .config import (
+    DB_MAX_OVERFLOW,
+    DB_POOL_SIZE,
+    SQLITE_BUSY_TIMEOUT_MS,
+    SQLITE_CACHE_SIZE_KB,
+    SQLITE_MMAP_SIZE_MB,
+    SQLITE_PROFILE,
+)
 
 # SQLite 기본값. 필요 시 .env로 덮어쓰기: DATABASE_URL=sqlite:///./app.db
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./app.db")
 
-# SQLite에서 다중 스레드 사용 허용
-engine = create_engine(
-    DATABASE_URL,
-    connect_args={"check_same_thread": False} if DATABASE_URL.startswith("sqlite") else {},
-    pool_pre_ping=True,
-)
+# SQLite 연결 프로필별로 연결마다 실행할 PRAGMA (순서대로 실행)
+SQLITE_PROFILES: Dict[str, Dict[str, Any]] = {
+    # WAL 저널: 읽기와 쓰기가 서로 막지 않고, 쓰기끼리는 busy_timeout 동안 기다린 뒤 순서대로 처리
+    # synchronous=NORMAL은 WAL에서 안전하며(전원 장애 시 마지막 commit만 잃을 수 있음) commit마다 fsync하지 않음
+    "wal": {
+        "busy_timeout": SQLITE_BUSY_TIMEOUT_MS,
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -SQLITE_CACHE_SIZE_KB,
+        "mmap_size": SQLITE_MMAP_SIZE_MB * 1024 * 1024,
+        "temp_store": "MEMORY",
+    },
+    # SQLite 기본 롤백 저널 (WAL은 DB 파일에 기록되므로 되돌릴 때 명시적으로 지정)
+    "default": {
+        "journal_mode": "DELETE",
+    },
+}
+
+
+def _apply_sqlite_pragmas(engine: Engine, pragmas: Dict[str, Any]) -> None:
+    """새 DBAPI 연결이 만들어질 때마다 PRAGMA를 실행하도록 등록"""
+
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record):  # noqa: ARG001
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+
+def create_db_engine(database_url: str = DATABASE_URL, sqlite_profile: Optional[str] = None) -> Engine:
+    """
+    DB 엔진 생성
+
+    SQLite 파일 DB는 연결 프로필(SQLITE_PROFILE)의 PRAGMA를 연결마다 적용하고,
+    연결을 다시 열지 않도록 QueuePool로 재사용합니다. (PRAGMA는 연결 단위 설정)
+
+    Args:
+        database_url: DB URL
+        sqlite_profile: SQLite 연결 프로필 (없으면 SQLITE_PROFILE)
+    """
+    url = make_url(database_url)
+    if url.get_backend_name() != "sqlite":
+        return create_engine(database_url, pool_pre_ping=True, pool_size=DB_POOL_SIZE, max_overflow=DB_MAX_OVERFLOW)
+
+    profile = (sqlite_profile or SQLITE_PROFILE).lower()
+    if profile not in SQLITE_PROFILES:
+        raise ValueError(f"알 수 없는 SQLite 프로필입니다: {profile} (사용 가능: {', '.join(SQLITE_PROFILES)})")
+
+    # SQLite에서 다중 스레드 사용 허용
+    options: Dict[str, Any] = {"connect_args": {"check_same_thread": False}, "pool_pre_ping": True}
+    if url.database and url.database != ":memory:":
+        # 메모리 DB는 연결마다 별도 DB가 되므로 SQLAlchemy 기본 풀을 그대로 사용
+        options.update(poolclass=QueuePool, pool_size=DB_POOL_SIZE, max_overflow=DB_MAX_OVERFLOW)
+    engine = create_engine(database_url, **options)
+    _apply_sqlite_pragmas(engine, SQLITE_PROFILES[profile])
+    return engine
+
+
+engine = create_db_engine(DATABASE_URL)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -29,11 +97,185 @@ def get_db() -> Generator:
         db.close()
 
 
+# ============================================================================
+# 비동기 엔진/세션 (API 엔드포인트용, SQLite: aiosqlite / PostgreSQL: asyncpg)
+# ============================================================================
+
+# 비동기 드라이버용 DB URL (비워 두면 DATABASE_URL의 드라이버만 비동기 드라이버로 바꿔 사용)
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL") or None
+
+# 동기 드라이버 URL을 같은 DB의 비동기 드라이버 URL로 바꿀 때 사용할 드라이버
+_ASYNC_DRIVERS = {"sqlite": "sqlite+aiosqlite", "postgresql": "postgresql+asyncpg"}
+
+_async_engine: Optional[AsyncEngine] = None
+_async_session_factory: Optional[async_sessionmaker] = None
+
+
+def to_async_database_url(database_url: str) -> str:
+    """동기 드라이버 URL(sqlite://, postgresql+psycopg2:// 등)을 비동기 드라이버 URL로 변환"""
+    url = make_url(database_url)
+    if url.get_driver_name() in ("aiosqlite", "asyncpg"):
+        return database_url
+    driver = _ASYNC_DRIVERS.get(url.get_backend_name())
+    if driver is None:
+        raise ValueError(f"비동기 드라이버를 알 수 없는 DB입니다: {url.get_backend_name()} (ASYNC_DATABASE_URL로 직접 지정하세요)")
+    return url.set(drivername=driver).render_as_string(hide_password=False)
+
+
+def create_async_db_engine(database_url: str, sqlite_profile: Optional[str] = None) -> AsyncEngine:
+    """
+    비동기 DB 엔진 생성 (create_db_engine과 같은 SQLite 프로필/연결 풀 설정)
+
+    Args:
+        database_url: 비동기 드라이버 DB URL
+        sqlite_profile: SQLite 연결 프로필 (없으면 SQLITE_PROFILE)
+    """
+    url = make_url(database_url)
+    if url.get_backend_name() != "sqlite":
+        return create_async_engine(database_url, pool_pre_ping=True, pool_size=DB_POOL_SIZE, max_overflow=DB_MAX_OVERFLOW)
+
+    profile = (sqlite_profile or SQLITE_PROFILE).lower()
+    if profile not in SQLITE_PROFILES:
+        raise ValueError(f"알 수 없는 SQLite 프로필입니다: {profile} (사용 가능: {', '.join(SQLITE_PROFILES)})")
+
+    options: Dict[str, Any] = {"pool_pre_ping": True}
+    if url.database and url.database != ":memory:":
+        options.update(poolclass=AsyncAdaptedQueuePool, pool_size=DB_POOL_SIZE, max_overflow=DB_MAX_OVERFLOW)
+    async_engine = create_async_engine(database_url, **options)
+    # 연결 이벤트는 내부 동기 엔진에 등록 (aiosqlite 연결도 이벤트 안에서는 동기 커서처럼 사용 가능)
+    _apply_sqlite_pragmas(async_engine.sync_engine, SQLITE_PROFILES[profile])
+    return async_engine
+
+
+def get_async_engine() -> AsyncEngine:
+    """비동기 엔진 인스턴스 반환 (처음 사용할 때 생성하므로 비동기 드라이버가 없어도 동기 경로는 동작)"""
+    global _async_engine
+    if _async_engine is None:
+        _async_engine = create_async_db_engine(ASYNC_DATABASE_URL or to_async_database_url(DATABASE_URL))
+    return _async_engine
+
+
+def get_async_session_factory() -> async_sessionmaker:
+    """
+    비동기 세션 팩토리 반환
+
+    commit 후 속성을 만료시키지 않음(expire_on_commit=False): 비동기 세션은 지연 로딩을 할 수 없어
+    commit 뒤에 속성에 접근하면 오류가 나므로, 저장한 값을 그대로 응답에 사용합니다.
+    """
+    global _async_session_factory
+    if _async_session_factory is None:
+        _async_session_factory = async_sessionmaker(bind=get_async_engine(), autoflush=False, expire_on_commit=False)
+    return _async_session_factory
+
+
+async def dispose_async_engine() -> None:
+    """앱 종료 시 비동기 엔진의 연결 풀 정리"""
+    global _async_engine, _async_session_factory
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = None
+        _async_session_factory = None
+
+
+# Alembic 마이그레이션 디렉터리와 기준 리비전 (Alembic 도입 전 create_all로 만들던 스키마)
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "migrations")
+BASELINE_REVISION = "0001"
+
+
 def init_db() -> None:
-    """앱 시작 시 테이블 자동 생성"""
+    """앱 시작 시 Alembic 마이그레이션을 최신 리비전까지 적용"""
     from .models import Base  # noqa: WPS433 (지연 임포트로 순환 참조 방지)
 
-    Base.metadata.create_all(bind=engine)
+    existing_tables = set(inspect(engine).get_table_names())
+    # 실행 롤업 테이블이 새로 생기는 경우 기존 실행/메시지로 집계를 채움
+    needs_rollup_backfill = "agent_run_rollups" not in existing_tables
+    # Alembic 도입 전 create_all로 만든 DB: 빠진 테이블/컬럼/인덱스를 보충한 뒤 기준 리비전으로 표시하고 이어서 적용
+    is_legacy_db = bool(existing_tables) and "alembic_version" not in existing_tables
+    if is_legacy_db:
+        Base.metadata.create_all(bind=engine)
+        _add_missing_columns(Base.metadata)
+        _add_missing_indexes(Base.metadata)
+        print(f"🗄️ [DB] 기존 DB를 마이그레이션 기준 리비전({BASELINE_REVISION})으로 표시합니다.")
+    run_migrations(stamp_revision=BASELINE_REVISION if is_legacy_db else None)
+    if needs_rollup_backfill:
+        _backfill_run_rollups()
+    _ensure_search_index()
+
+
+def run_migrations(
+    revision: str = "head",
+    stamp_revision: Optional[str] = None,
+    db_engine: Optional[Engine] = None,
+) -> None:
+    """
+    앱 엔진의 연결로 Alembic 마이그레이션을 적용합니다. (alembic upgrade head와 같음)
+
+    Args:
+        revision: 적용할 리비전
+        stamp_revision: 지정하면 먼저 이 리비전이 적용된 것으로 표시 (기존 DB를 Alembic 관리로 가져올 때)
+        db_engine: 마이그레이션할 엔진 (기본: 앱 엔진)
+    """
+    from alembic import command  # noqa: WPS433
+    from alembic.config import Config  # noqa: WPS433
+
+    config = Config()
+    config.set_main_option("script_location", MIGRATIONS_DIR.replace("%", "%%"))
+    with (db_engine or engine).begin() as conn:
+        config.attributes["connection"] = conn
+        if stamp_revision:
+            command.stamp(config, stamp_revision)
+        command.upgrade(config, revision)
+
+
+def _ensure_search_index() -> None:
+    """메시지/작업 내용 전문 검색 인덱스(FTS5 또는 tsvector)와 동기화 트리거 생성"""
+    from src.repositories.agent_log_search import ensure_search_index  # noqa: WPS433 (지연 임포트로 순환 참조 방지)
+
+    ensure_search_index(engine)
+
+
+def _backfill_run_rollups() -> None:
+    """기존 실행 기록의 집계 컬럼과 롤업 행을 한 번 채웁니다."""
+    from src.repositories.agent_run_rollups import rebuild_run_rollups  # noqa: WPS433 (지연 임포트로 순환 참조 방지)
+
+    db = SessionLocal()
+    try:
+        rebuilt = rebuild_run_rollups(db)
+        if rebuilt:
+            print(f"📊 [실행 집계] 기존 실행 {rebuilt}개의 카운터와 롤업을 채웠습니다.")
+    finally:
+        db.close()
+
 
+def _add_missing_columns(metadata) -> None:
+    """
+    create_all은 기존 테이블에 새 컬럼을 추가하지 않으므로,
+    모델에 추가된 nullable 컬럼을 기존 DB에 ALTER TABLE로 보충합니다.
+    (Alembic 도입 전 DB를 가져올 때만 사용. 이후 스키마 변경은 migrations/versions에 리비전으로 추가)
+    """
+    inspector = inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+    with engine.begin() as conn:
+        for table in metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+            existing_columns = {col["name"] for col in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing_columns or not column.nullable:
+                    continue
+                column_type = column.type.compile(dialect=engine.dialect)
+                conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}"))
 
 
+def _add_missing_indexes(metadata) -> None:
+    """create_all은 기존 테이블에 새 인덱스를 추가하지 않으므로, 모델에 추가된 인덱스를 보충합니다."""
+    inspector = inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+    with engine.begin() as conn:
+        for table in metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+            existing_indexes = {index["name"] for index in inspector.get_indexes(table.name)}
+            for index in table.indexes:
+                if index.name not in existing_indexes:
+                    index.create(bind=conn)
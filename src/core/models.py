@@ -5,7 +5,7 @@ SQLAlchemy ORM 모델 정의
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import JSON, Column, DateTime, Float, ForeignKey, Index, Integer, LargeBinary, String, Text, UniqueConstraint
 from sqlalchemy.orm import declarative_base, relationship
 
 
@@ -14,28 +14,75 @@ Base = declarative_base()
 
 class AgentRun(Base):
     __tablename__ = "agent_runs"
+    __table_args__ = (
+        # 실행 목록 키셋 페이지네이션 (전체 / 팀별)
+        Index("ix_agent_runs_started_at_id", "started_at", "id"),
+        Index("ix_agent_runs_team_started_at_id", "team_name", "started_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    team_name = Column(String(255), nullable=False, index=True)
+    team_name = Column(String(255), nullable=False)  # 팀별 조회는 ix_agent_runs_team_started_at_id 사용
     task = Column(Text, nullable=False)
     started_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     ended_at = Column(DateTime, nullable=True)
     status = Column(String(50), default="running", nullable=False)
     model = Column(String(255), nullable=True)
+    # 토큰 사용량 (모델 클라이언트가 보고한 요청별 사용량 합계)
+    prompt_tokens = Column(Integer, default=0, nullable=True)
+    completion_tokens = Column(Integer, default=0, nullable=True)
+    total_tokens = Column(Integer, default=0, nullable=True)
+    max_prompt_tokens = Column(Integer, default=0, nullable=True)  # 단일 호출 최대 입력 토큰 (컨텍스트 크기)
+    estimated_cost = Column(Float, default=0.0, nullable=True)  # USD
+    model_calls = Column(JSON, nullable=True)  # 모델 티어별 호출 수/지연 시간/비용 (ModelCallLog.to_dict)
+    # 메시지 저장/실행 종료 시 함께 갱신하는 집계 값 (통계 조회 시 메시지를 다시 세지 않음)
+    message_count = Column(Integer, default=0, nullable=True)
+    total_chars = Column(Integer, default=0, nullable=True)
+    duration_seconds = Column(Float, nullable=True)
 
     messages = relationship("AgentMessage", back_populates="run", cascade="all, delete-orphan")
 
 
+class AgentRunRollup(Base):
+    """팀/상태별 실행 집계 (시작 시각 기준 시간/일 단위 및 전체 누적)"""
+    __tablename__ = "agent_run_rollups"
+    __table_args__ = (
+        UniqueConstraint("granularity", "bucket_start", "team_name", "status", name="uq_agent_run_rollup_bucket"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    granularity = Column(String(10), nullable=False)  # hour | day | total
+    bucket_start = Column(DateTime, nullable=False, index=True)
+    team_name = Column(String(255), nullable=False, index=True)
+    status = Column(String(50), nullable=False)
+    run_count = Column(Integer, default=0, nullable=False)
+    finished_count = Column(Integer, default=0, nullable=False)  # 종료 시각이 있는 실행 수 (평균 실행 시간 계산용)
+    message_count = Column(Integer, default=0, nullable=False)
+    total_chars = Column(Integer, default=0, nullable=False)
+    prompt_tokens = Column(Integer, default=0, nullable=False)
+    completion_tokens = Column(Integer, default=0, nullable=False)
+    total_tokens = Column(Integer, default=0, nullable=False)
+    estimated_cost = Column(Float, default=0.0, nullable=False)
+    total_duration_seconds = Column(Float, default=0.0, nullable=False)
+
+
 class AgentMessage(Base):
     __tablename__ = "agent_messages"
+    __table_args__ = (
+        # 실행별 메시지 키셋 페이지네이션
+        Index("ix_agent_messages_run_created_at_id", "run_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    run_id = Column(Integer, ForeignKey("agent_runs.id", ondelete="CASCADE"), nullable=False, index=True)
+    # 실행별 조회(외래 키 포함)는 ix_agent_messages_run_created_at_id 사용
+    run_id = Column(Integer, ForeignKey("agent_runs.id", ondelete="CASCADE"), nullable=False)
     agent_name = Column(String(255), nullable=False, index=True)
     role = Column(String(50), nullable=False)  # user | assistant | tool | system
-    content = Column(Text, nullable=False)
+    content = Column(Text, nullable=False)  # 보관 처리된 메시지는 빈 문자열 (원문은 content_zstd)
     tool_name = Column(String(255), nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+    # 오래된 메시지의 zstd 압축 원문과 보관 처리 시각
+    content_zstd = Column(LargeBinary, nullable=True)
+    archived_at = Column(DateTime, nullable=True)
 
     run = relationship("AgentRun", back_populates="messages")
 
@@ -57,9 +104,14 @@ class AgentMessage(Base):
 
 class NotionTodo(Base):
     __tablename__ = "notion_todos"
+    __table_args__ = (
+        # 배치 사이클의 pending 투두 조회 / 페이지 투두 목록 (block_index 순)
+        Index("ix_notion_todos_page_status_checked", "notion_page_id", "status", "checked"),
+        Index("ix_notion_todos_page_block_index", "notion_page_id", "block_index"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    notion_page_id = Column(String(255), ForeignKey("notion_batch_statuses.notion_page_id"), nullable=False, index=True)
+    notion_page_id = Column(String(255), ForeignKey("notion_batch_statuses.notion_page_id"), nullable=False)
     block_id = Column(String(255), nullable=False, unique=True, index=True)
     content = Column(Text, nullable=False)
     checked = Column(String(10), default="false", nullable=False)
@@ -73,6 +125,10 @@ class NotionTodo(Base):
 
 class NotionBatchStatus(Base):
     __tablename__ = "notion_batch_statuses"
+    __table_args__ = (
+        # 페이지별 최신 상태 조회 (updated_at 내림차순)
+        Index("ix_notion_batch_statuses_page_updated_at", "notion_page_id", "updated_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     notion_page_id = Column(String(255), nullable=False, unique=True, index=True)
@@ -3,7 +3,7 @@ Pydantic 스키마 정의
 """
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -49,6 +49,15 @@ class AgentRunRead(BaseModel):
     ended_at: Optional[datetime] = None
     status: str
     model: Optional[str] = None
+    prompt_tokens: Optional[int] = None
+    completion_tokens: Optional[int] = None
+    total_tokens: Optional[int] = None
+    max_prompt_tokens: Optional[int] = None
+    estimated_cost: Optional[float] = None
+    model_calls: Optional[Dict[str, Any]] = None
+    message_count: Optional[int] = None
+    total_chars: Optional[int] = None
+    duration_seconds: Optional[float] = None
     messages: List[AgentMessageRead] = Field(default_factory=list)
 
     model_config = {
@@ -56,6 +65,45 @@ class AgentRunRead(BaseModel):
     }
 
 
+class AgentRunSummary(BaseModel):
+    """실행 목록용 요약 (메시지 없음, task는 앞부분만)"""
+    id: int
+    team_name: str
+    task: str
+    task_truncated: bool = False
+    started_at: datetime
+    ended_at: Optional[datetime] = None
+    status: str
+    model: Optional[str] = None
+    total_tokens: Optional[int] = None
+    estimated_cost: Optional[float] = None
+    message_count: Optional[int] = None
+    duration_seconds: Optional[float] = None
+
+    model_config = {
+        "from_attributes": True,
+    }
+
+
+class AgentLogSearchHit(BaseModel):
+    """로그 검색 결과 (snippet의 검색어는 <mark>로 강조)"""
+    run_id: int
+    message_id: Optional[int] = None
+    team_name: str
+    agent_name: Optional[str] = None
+    role: Optional[str] = None
+    created_at: datetime
+    snippet: str
+    score: float
+
+
+class AgentLogSearchResponse(BaseModel):
+    query: str
+    target: str
+    items: List[AgentLogSearchHit] = Field(default_factory=list)
+    next_offset: Optional[int] = None
+
+
 # Notion 관련 스키마
 class NotionPageCreate(BaseModel):
     notion_page_id: str
@@ -0,0 +1,448 @@
+"""
+에이전트 로그 전문 검색 (메시지 내용 / 실행 작업 내용)
+
+SQLite는 FTS5 external-content 테이블, PostgreSQL은 tsvector 컬럼 + GIN 인덱스를 사용하며
+둘 다 트리거로 원본 테이블과 동기화합니다. 검색은 인덱스 MATCH로만 수행하고 LIKE '%..%' 스캔은 하지 않습니다.
+
+보관 처리(zstd 압축 후 content 비움)한 메시지도 계속 검색됩니다.
+SQLite는 보관 시 트리거가 원문을 별도의 contentless FTS5 테이블(agent_messages_archive_fts)로 옮기고,
+PostgreSQL은 보관 시 기존 search_vector를 그대로 둡니다. 보관된 메시지의 스니펫은 압축 원문을 풀어 만듭니다.
+
+한국어는 조사가 붙어 단어 형태가 바뀌므로(예: 마라톤 → 마라톤에) 검색어의 각 단어를 접두어 검색으로 바꿉니다.
+"""
+
+import logging
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+
+from src.repositories.agent_message_archive import ArchiveUnavailableError, decompress_content
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 검색 결과 스니펫의 강조 표시
+HIGHLIGHT_START = "<mark>"
+HIGHLIGHT_END = "</mark>"
+# 스니펫 길이 (토큰/단어 수)
+SNIPPET_TOKENS = 16
+
+
+class SearchUnavailableError(RuntimeError):
+    """현재 DB에서 전문 검색 인덱스를 사용할 수 없음"""
+
+
+@dataclass(frozen=True)
+class _SearchSource:
+    """검색 대상 원본 테이블"""
+    table: str
+    column: str
+    # 보관 처리(archived_at, content_zstd)를 지원하는 테이블인지 여부
+    archived: bool = False
+
+    @property
+    def fts_table(self) -> str:
+        return f"{self.table}_fts"
+
+    @property
+    def archive_fts_table(self) -> str:
+        return f"{self.table}_archive_fts"
+
+
+SEARCH_SORTS = ("relevance", "recent")
+
+_SOURCES = {
+    "messages": _SearchSource("agent_messages", "content", archived=True),
+    "runs": _SearchSource("agent_runs", "task"),
+}
+
+# 검색어에서 단어로 취급하지 않는 문자 (FTS5/tsquery 연산자 포함)
+_TERM_SPLIT = re.compile(r"[\s\"'&|!():*<>\\^+\-]+")
+_MAX_TERMS = 8
+# 보관된 메시지 스니펫에서 단어 앞뒤의 문장 부호는 검색어 비교 시 무시
+_SNIPPET_PUNCTUATION = "\"'()[]{}<>.,:;!?·…“”‘’「」『』"
+
+
+def search_terms(query: str) -> List[str]:
+    """검색어를 단어 목록으로 나눔 (연산자 문자 제거)"""
+    return [term for term in _TERM_SPLIT.split(query.strip()) if term][:_MAX_TERMS]
+
+
+# ============================================================================
+# 인덱스 생성 (init_db에서 호출)
+# ============================================================================
+
+def ensure_search_index(engine: Engine) -> bool:
+    """
+    전문 검색 인덱스와 동기화 트리거를 만듭니다. (이미 있으면 그대로 두고, 새로 만들면 기존 행을 색인)
+
+    Returns:
+        bool: 전문 검색 사용 가능 여부
+    """
+    dialect_name = engine.dialect.name
+    try:
+        with engine.begin() as conn:
+            if dialect_name == "sqlite":
+                for source in _SOURCES.values():
+                    _ensure_sqlite_fts(conn, source)
+            elif dialect_name == "postgresql":
+                for source in _SOURCES.values():
+                    _ensure_postgresql_tsvector(conn, source)
+            else:
+                print(f"⚠️ [로그 검색] {dialect_name} DB는 전문 검색 인덱스를 지원하지 않습니다.")
+                return False
+        return True
+    except Exception as e:
+        # FTS5가 빠진 SQLite 빌드 등: 검색만 비활성화하고 앱은 계속 실행
+        print(f"⚠️ [로그 검색] 전문 검색 인덱스를 만들지 못했습니다: {str(e)}")
+        logger.warning(f"전문 검색 인덱스 생성 실패 - DB: {dialect_name}, 오류: {str(e)}")
+        return False
+
+
+def _sqlite_table_exists(conn: Connection, name: str) -> bool:
+    return conn.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"), {"name": name}
+    ).first() is not None
+
+
+def _ensure_sqlite_fts(conn: Connection, source: _SearchSource) -> None:
+    if not _sqlite_table_exists(conn, source.fts_table):
+        _create_sqlite_fts(conn, source)
+    if source.archived:
+        _ensure_sqlite_archive_fts(conn, source)
+
+
+def _create_sqlite_fts(conn: Connection, source: _SearchSource) -> None:
+    fts, table, column = source.fts_table, source.table, source.column
+    conn.execute(text(
+        f"CREATE VIRTUAL TABLE {fts} USING fts5("
+        f"{column}, content='{table}', content_rowid='id', tokenize='unicode61 remove_diacritics 2')"
+    ))
+    conn.execute(text(
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN "
+        f"INSERT INTO {fts}(rowid, {column}) VALUES (new.id, new.{column}); END"
+    ))
+    conn.execute(text(
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {column}) VALUES ('delete', old.id, old.{column}); END"
+    ))
+    conn.execute(text(
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {column} ON {table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {column}) VALUES ('delete', old.id, old.{column}); "
+        f"INSERT INTO {fts}(rowid, {column}) VALUES (new.id, new.{column}); END"
+    ))
+    # 기존 행 색인
+    conn.execute(text(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')"))
+    print(f"🔎 [로그 검색] {table}.{column} 전문 검색 인덱스를 만들었습니다.")
+
+
+def _ensure_sqlite_archive_fts(conn: Connection, source: _SearchSource) -> None:
+    """
+    보관된 메시지 색인을 만듭니다.
+
+    보관 처리 UPDATE(content 비움)는 {fts}_au 트리거로 원문 색인에서 빠지고,
+    같은 UPDATE에서 이 테이블의 트리거가 이전 원문(old.content)을 보관 색인에 넣습니다.
+    원문을 다시 저장하지 않도록 contentless 테이블을 사용합니다. (rowid 삭제는 SQLite 3.43+ contentless_delete)
+    """
+    archive_fts, table, column = source.archive_fts_table, source.table, source.column
+    if _sqlite_table_exists(conn, archive_fts):
+        return
+
+    version = tuple(int(part) for part in conn.execute(text("SELECT sqlite_version()")).scalar().split("."))
+    storage = "content='', contentless_delete=1, " if version >= (3, 43, 0) else ""
+    conn.execute(text(
+        f"CREATE VIRTUAL TABLE {archive_fts} USING fts5("
+        f"{column}, {storage}tokenize='unicode61 remove_diacritics 2')"
+    ))
+    conn.execute(text(
+        f"CREATE TRIGGER IF NOT EXISTS {archive_fts}_ai AFTER UPDATE OF {column} ON {table} "
+        f"WHEN old.archived_at IS NULL AND new.archived_at IS NOT NULL BEGIN "
+        f"INSERT INTO {archive_fts}(rowid, {column}) VALUES (new.id, old.{column}); END"
+    ))
+    conn.execute(text(
+        f"CREATE TRIGGER IF NOT EXISTS {archive_fts}_ad AFTER DELETE ON {table} "
+        f"WHEN old.archived_at IS NOT NULL BEGIN DELETE FROM {archive_fts} WHERE rowid = old.id; END"
+    ))
+
+    # 이전 버전에서 보관되어 색인에서 빠진 메시지를 압축 원문으로 색인
+    indexed = 0
+    for message_id, content in _archived_rows(conn, source):
+        conn.execute(
+            text(f"INSERT INTO {archive_fts}(rowid, {column}) VALUES (:id, :content)"),
+            {"id": message_id, "content": content},
+        )
+        indexed += 1
+    print(f"🔎 [로그 검색] 보관된 {table}.{column} 전문 검색 인덱스를 만들었습니다. (기존 보관 행 {indexed}개 색인)")
+
+
+def _archived_rows(conn: Connection, source: _SearchSource):
+    """보관된 행의 (id, 원문) 목록 (zstandard가 없으면 건너뜀)"""
+    rows = conn.execute(
+        text(f"SELECT id, content_zstd FROM {source.table} WHERE archived_at IS NOT NULL AND content_zstd IS NOT NULL")
+    ).all()
+    try:
+        for message_id, blob in rows:
+            yield message_id, decompress_content(blob)
+    except ArchiveUnavailableError as e:
+        print(f"⚠️ [로그 검색] 기존 보관 메시지를 색인하지 못했습니다: {str(e)}")
+        logger.warning(f"보관 메시지 색인 생략 - 테이블: {source.table}, 오류: {str(e)}")
+
+
+def _ensure_postgresql_tsvector(conn: Connection, source: _SearchSource) -> None:
+    table, column = source.table, source.column
+    exists = conn.execute(
+        text(
+            "SELECT 1 FROM information_schema.columns "
+            "WHERE table_schema = current_schema() AND table_name = :table AND column_name = 'search_vector'"
+        ),
+        {"table": table},
+    ).first()
+    if not exists:
+        conn.execute(text(f"ALTER TABLE {table} ADD COLUMN search_vector tsvector"))
+        conn.execute(text(_postgresql_trigger_function(source)))
+        conn.execute(text(
+            f"CREATE TRIGGER {table}_search_vector_trigger BEFORE INSERT OR UPDATE OF {column} ON {table} "
+            f"FOR EACH ROW EXECUTE FUNCTION {table}_search_vector_update()"
+        ))
+        # 기존 행 색인 후 GIN 인덱스 생성
+        conn.execute(text(f"UPDATE {table} SET search_vector = to_tsvector('simple', coalesce({column}, ''))"))
+        conn.execute(text(f"CREATE INDEX IF NOT EXISTS ix_{table}_search_vector ON {table} USING GIN (search_vector)"))
+        print(f"🔎 [로그 검색] {table}.{column} 전문 검색 인덱스를 만들었습니다.")
+
+    if source.archived and (not exists or not _postgresql_function_keeps_archived(conn, source)):
+        # 이전 버전 트리거 함수 교체 후, 보관되어 빈 search_vector가 된 행을 압축 원문으로 색인
+        conn.execute(text(_postgresql_trigger_function(source)))
+        indexed = 0
+        for message_id, content in _archived_rows(conn, source):
+            conn.execute(
+                text(f"UPDATE {table} SET search_vector = to_tsvector('simple', :content) WHERE id = :id"),
+                {"id": message_id, "content": content},
+            )
+            indexed += 1
+        print(f"🔎 [로그 검색] 보관된 {table}.{column}도 검색되도록 트리거를 갱신했습니다. (기존 보관 행 {indexed}개 색인)")
+
+
+def _postgresql_trigger_function(source: _SearchSource) -> str:
+    table, column = source.table, source.column
+    # 보관 처리 UPDATE(content 비움)에서는 원문 기준 search_vector를 그대로 둠
+    keep_archived = (
+        "IF TG_OP = 'UPDATE' AND OLD.archived_at IS NULL AND NEW.archived_at IS NOT NULL THEN RETURN NEW; END IF; "
+        if source.archived else ""
+    )
+    return (
+        f"CREATE OR REPLACE FUNCTION {table}_search_vector_update() RETURNS trigger AS $$ "
+        f"BEGIN {keep_archived}NEW.search_vector := to_tsvector('simple', coalesce(NEW.{column}, '')); RETURN NEW; END "
+        f"$$ LANGUAGE plpgsql"
+    )
+
+
+def _postgresql_function_keeps_archived(conn: Connection, source: _SearchSource) -> bool:
+    body = conn.execute(
+        text("SELECT prosrc FROM pg_proc WHERE proname = :name"), {"name": f"{source.table}_search_vector_update"}
+    ).scalar()
+    return bool(body) and "archived_at" in body
+
+
+# ============================================================================
+# 검색
+# ============================================================================
+
+class AgentLogSearchRepository:
+    """메시지/실행 작업 내용 전문 검색"""
+
+    def __init__(self, db: Session) -> None:
+        self.db = db
+
+    def search(
+        self,
+        query: str,
+        target: str = "messages",
+        team_name: Optional[str] = None,
+        run_id: Optional[int] = None,
+        limit: int = 20,
+        offset: int = 0,
+        sort: str = "relevance",
+    ) -> List[Dict[str, Any]]:
+        """
+        관련도 순으로 검색하고 검색어를 강조한 스니펫을 함께 반환합니다.
+
+        Args:
+            query: 검색어 (공백으로 나눈 모든 단어를 포함하는 행, 각 단어는 접두어 일치)
+            target: messages | runs
+            team_name: 팀 이름으로 필터링
+            run_id: 실행 ID로 필터링 (messages 검색에서만 사용)
+            limit: 최대 개수
+            offset: 건너뛸 개수
+            sort: relevance(관련도 순) | recent(최신순, 흔한 단어도 전체 일치 행의 점수를 계산하지 않아 빠름)
+
+        Returns:
+            List[Dict]: run_id, message_id, team_name, agent_name, role, created_at, snippet, score
+                (runs 검색은 message_id/agent_name/role이 None)
+
+        Raises:
+            ValueError: 알 수 없는 검색 대상/정렬
+            SearchUnavailableError: 전문 검색 인덱스가 없는 DB
+        """
+        if target not in _SOURCES:
+            raise ValueError(f"알 수 없는 검색 대상입니다: {target}")
+        if sort not in SEARCH_SORTS:
+            raise ValueError(f"알 수 없는 정렬입니다: {sort}")
+        terms = search_terms(query)
+        if not terms:
+            return []
+
+        source = _SOURCES[target]
+        dialect_name = self.db.get_bind().dialect.name
+        if dialect_name == "sqlite":
+            match = " ".join('"{}"*'.format(term) for term in terms)
+            # 보관된 메시지는 별도 색인에 있으므로 두 색인을 각각 조회해 합침
+            fts_tables = [source.fts_table] + ([source.archive_fts_table] if source.archived else [])
+            statements = [self._sqlite_sql(target, sort, fts) for fts in fts_tables]
+            params = {"match": match}
+        elif dialect_name == "postgresql":
+            tsquery = " & ".join(f"{term}:*" for term in terms)
+            statements, params = [self._postgresql_sql(target, sort)], {"tsquery": tsquery}
+        else:
+            raise SearchUnavailableError(f"{dialect_name} DB는 전문 검색을 지원하지 않습니다")
+
+        filters = []
+        if team_name:
+            filters.append("r.team_name = :team_name")
+            params["team_name"] = team_name
+        if run_id is not None and target == "messages":
+            filters.append("m.run_id = :run_id")
+            params["run_id"] = run_id
+        filter_sql = "".join(f" AND {condition}" for condition in filters)
+        if len(statements) == 1:
+            params.update({"limit": limit, "offset": offset})
+        else:
+            # 각 색인에서 offset + limit개까지만 읽고 같은 정렬 기준으로 합친 뒤 자름
+            params.update({"limit": offset + limit, "offset": 0})
+
+        rows: List[Dict[str, Any]] = []
+        try:
+            for sql in statements:
+                rows += [dict(row) for row in self.db.execute(text(sql.format(filters=filter_sql)), params).mappings()]
+        except Exception as e:
+            if _is_missing_index_error(e):
+                raise SearchUnavailableError("전문 검색 인덱스가 없습니다") from e
+            raise
+        if len(statements) > 1:
+            id_key = "message_id" if target == "messages" else "run_id"
+            if sort == "relevance":
+                rows.sort(key=lambda row: (-row["score"], -row[id_key]))
+            else:
+                rows.sort(key=lambda row: -row[id_key])
+            rows = rows[offset:offset + limit]
+        if source.archived:
+            self._fill_archived_snippets(rows, terms)
+        return rows
+
+    def _fill_archived_snippets(self, rows: List[Dict[str, Any]], terms: List[str]) -> None:
+        """보관된 메시지(원문이 비어 스니펫이 없는 행)는 압축 원문을 풀어 스니펫을 만듦"""
+        missing = [row for row in rows if row["snippet"] is None and row["message_id"] is not None]
+        if not missing:
+            return
+        blobs = dict(self.db.execute(
+            text("SELECT id, content_zstd FROM agent_messages WHERE id IN :ids").bindparams(
+                bindparam("ids", expanding=True)
+            ),
+            {"ids": [row["message_id"] for row in missing]},
+        ).all())
+        for row in missing:
+            blob = blobs.get(row["message_id"])
+            try:
+                row["snippet"] = build_snippet(decompress_content(blob), terms) if blob is not None else ""
+            except ArchiveUnavailableError:
+                row["snippet"] = ""
+
+    @staticmethod
+    def _sqlite_sql(target: str, sort: str, fts: str) -> str:
+        # bm25는 관련도가 높을수록 작은 값이므로 부호를 바꿔 score로 반환
+        # 최신순은 FTS rowid(원본 id) 역순으로 읽다가 limit에서 멈춤
+        if target == "messages":
+            order = f"bm25({fts}), m.id DESC" if sort == "relevance" else f"{fts}.rowid DESC"
+            # 보관 색인은 원문을 저장하지 않으므로 스니펫은 압축 원문으로 따로 만듦
+            snippet = (
+                f"snippet({fts}, 0, '{HIGHLIGHT_START}', '{HIGHLIGHT_END}', '…', {SNIPPET_TOKENS})"
+                if fts == _SOURCES["messages"].fts_table else "NULL"
+            )
+            return (
+                "SELECT m.run_id, m.id AS message_id, r.team_name, m.agent_name, m.role, m.created_at, "
+                f"{snippet} AS snippet, "
+                f"-bm25({fts}) AS score "
+                f"FROM {fts} "
+                f"JOIN agent_messages m ON m.id = {fts}.rowid "
+                "JOIN agent_runs r ON r.id = m.run_id "
+                f"WHERE {fts} MATCH :match{{filters}} "
+                f"ORDER BY {order} LIMIT :limit OFFSET :offset"
+            )
+        order = "bm25(agent_runs_fts), r.id DESC" if sort == "relevance" else "agent_runs_fts.rowid DESC"
+        return (
+            "SELECT r.id AS run_id, NULL AS message_id, r.team_name, NULL AS agent_name, NULL AS role, "
+            "r.started_at AS created_at, "
+            f"snippet(agent_runs_fts, 0, '{HIGHLIGHT_START}', '{HIGHLIGHT_END}', '…', {SNIPPET_TOKENS}) AS snippet, "
+            "-bm25(agent_runs_fts) AS score "
+            "FROM agent_runs_fts "
+            "JOIN agent_runs r ON r.id = agent_runs_fts.rowid "
+            "WHERE agent_runs_fts MATCH :match{filters} "
+            f"ORDER BY {order} LIMIT :limit OFFSET :offset"
+        )
+
+    @staticmethod
+    def _postgresql_sql(target: str, sort: str) -> str:
+        headline_options = (
+            f"StartSel={HIGHLIGHT_START}, StopSel={HIGHLIGHT_END}, "
+            f"MaxWords={SNIPPET_TOKENS}, MinWords={SNIPPET_TOKENS // 2}, MaxFragments=2"
+        )
+        if target == "messages":
+            order = "score DESC, m.id DESC" if sort == "relevance" else "m.id DESC"
+            return (
+                "SELECT m.run_id, m.id AS message_id, r.team_name, m.agent_name, m.role, m.created_at, "
+                # 보관된 메시지는 content가 비어 있으므로 스니펫은 압축 원문으로 따로 만듦
+                f"CASE WHEN m.archived_at IS NULL THEN ts_headline('simple', m.content, q, '{headline_options}') END AS snippet, "
+                "ts_rank_cd(m.search_vector, q) AS score "
+                "FROM agent_messages m "
+                "JOIN agent_runs r ON r.id = m.run_id, "
+                "to_tsquery('simple', :tsquery) AS q "
+                "WHERE m.search_vector @@ q{filters} "
+                f"ORDER BY {order} LIMIT :limit OFFSET :offset"
+            )
+        order = "score DESC, r.id DESC" if sort == "relevance" else "r.id DESC"
+        return (
+            "SELECT r.id AS run_id, NULL AS message_id, r.team_name, NULL AS agent_name, NULL AS role, "
+            "r.started_at AS created_at, "
+            f"ts_headline('simple', r.task, q, '{headline_options}') AS snippet, "
+            "ts_rank_cd(r.search_vector, q) AS score "
+            "FROM agent_runs r, to_tsquery('simple', :tsquery) AS q "
+            "WHERE r.search_vector @@ q{filters} "
+            f"ORDER BY {order} LIMIT :limit OFFSET :offset"
+        )
+
+
+def build_snippet(content: str, terms: List[str], max_tokens: int = SNIPPET_TOKENS) -> str:
+    """
+    원문에서 첫 번째로 검색어(접두어)가 나오는 부분을 max_tokens 단어만큼 잘라 강조한 스니펫
+    (FTS snippet()/ts_headline을 쓸 수 없는 보관된 메시지용)
+    """
+    words = content.split()
+    prefixes = [term.lower() for term in terms]
+
+    def is_match(word: str) -> bool:
+        token = word.strip(_SNIPPET_PUNCTUATION).lower()
+        return any(token.startswith(prefix) for prefix in prefixes)
+
+    first = next((index for index, word in enumerate(words) if is_match(word)), 0)
+    start = max(0, min(first - max_tokens // 4, len(words) - max_tokens))
+    window = words[start:start + max_tokens]
+    snippet = " ".join(f"{HIGHLIGHT_START}{word}{HIGHLIGHT_END}" if is_match(word) else word for word in window)
+    return f"{'…' if start > 0 else ''}{snippet}{'…' if start + max_tokens < len(words) else ''}"
+
+
+def _is_missing_index_error(error: Exception) -> bool:
+    message = str(error).lower()
+    return ("no such table" in message and "_fts" in message) or ("search_vector" in message and "does not exist" in message)
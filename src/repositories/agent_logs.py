@@ -3,12 +3,81 @@
 """
 
 from datetime import datetime
-from typing import List, Optional, Sequence
+from typing import Any, Dict, List, Mapping, Optional, Sequence
 
-from sqlalchemy import select, desc
-from sqlalchemy.orm import Session
+from sqlalchemy import desc, func, select
+from sqlalchemy.orm import Session, noload
 
 from src.core import models as orm
+from src.core.config import RUN_LIST_TASK_PREVIEW_CHARS
+from src.repositories.agent_message_archive import restore_archived_content
+from src.repositories.agent_message_writer import AgentMessageWriter, get_agent_message_writer
+from src.repositories.agent_run_rollups import AgentRunRollupRepository, add_run_to_rollups, apply_message_counts
+from src.repositories.pagination import Cursor, keyset_condition
+
+
+def paginate_runs(stmt, team_name: Optional[str], cursor: Optional[Cursor], after_id: Optional[int]):
+    """실행 목록 조회문에 필터/키셋 조건/정렬을 적용 (기본 최신순, after_id를 주면 오래된 순)"""
+    run = orm.AgentRun
+    descending = after_id is None
+    if team_name:
+        stmt = stmt.where(run.team_name == team_name)
+    if after_id is not None:
+        stmt = stmt.where(run.id > after_id)
+    if cursor is not None:
+        stmt = stmt.where(keyset_condition(run.started_at, run.id, cursor, descending))
+    if descending:
+        return stmt.order_by(desc(run.started_at), desc(run.id))
+    return stmt.order_by(run.started_at, run.id)
+
+
+def run_summary_statement(task_chars: int = RUN_LIST_TASK_PREVIEW_CHARS):
+    """목록 화면용 요약 컬럼 조회문 (task는 잘림 여부를 알기 위해 task_chars보다 한 글자 더 가져옴)"""
+    run = orm.AgentRun
+    return select(
+        run.id,
+        run.team_name,
+        func.substr(run.task, 1, task_chars + 1).label("task"),
+        run.started_at,
+        run.ended_at,
+        run.status,
+        run.model,
+        run.total_tokens,
+        run.estimated_cost,
+        run.message_count,
+        run.duration_seconds,
+    )
+
+
+def to_run_summaries(rows: Sequence[Mapping[str, Any]], task_chars: int = RUN_LIST_TASK_PREVIEW_CHARS) -> List[Dict[str, Any]]:
+    """run_summary_statement 결과 행을 요약 dict로 변환 (task를 task_chars로 자르고 task_truncated 설정)"""
+    summaries = []
+    for row in rows:
+        summary = dict(row)
+        summary["task_truncated"] = len(summary["task"]) > task_chars
+        if summary["task_truncated"]:
+            summary["task"] = summary["task"][:task_chars]
+        summaries.append(summary)
+    return summaries
+
+
+def message_list_statement(
+    run_id: int,
+    limit: Optional[int] = None,
+    cursor: Optional[Cursor] = None,
+    after_id: Optional[int] = None,
+):
+    """실행의 메시지를 (created_at, id) 순서로 가져오는 조회문"""
+    message = orm.AgentMessage
+    stmt = select(message).where(message.run_id == run_id)
+    if after_id is not None:
+        stmt = stmt.where(message.id > after_id)
+    if cursor is not None:
+        stmt = stmt.where(keyset_condition(message.created_at, message.id, cursor, descending=False))
+    stmt = stmt.order_by(message.created_at, message.id)
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    return stmt
 
 
 class AgentRunRepository:
@@ -16,36 +85,185 @@ class AgentRunRepository:
         self.db = db
 
     def create(self, team_name: str, task: str, model: Optional[str] = None) -> orm.AgentRun:
-        run = orm.AgentRun(team_name=team_name, task=task, model=model)
+        run = orm.AgentRun(
+            team_name=team_name,
+            task=task,
+            model=model,
+            started_at=datetime.utcnow(),
+            status="running",
+            message_count=0,
+            total_chars=0,
+        )
         self.db.add(run)
+        add_run_to_rollups(self.db, run)
         self.db.commit()
         self.db.refresh(run)
         return run
 
-    def finish(self, run_id: int, status: str = "completed") -> Optional[orm.AgentRun]:
-        run = self.db.get(orm.AgentRun, run_id)
+    def finish(
+        self,
+        run_id: int,
+        status: str = "completed",
+        prompt_tokens: Optional[int] = None,
+        completion_tokens: Optional[int] = None,
+        max_prompt_tokens: Optional[int] = None,
+        estimated_cost: Optional[float] = None,
+        model_calls: Optional[Dict[str, Any]] = None,
+    ) -> Optional[orm.AgentRun]:
+        # 메시지 기록기가 같은 run의 카운터를 갱신 중일 수 있으므로 최신 값을 잠그고 읽음 (SQLite는 잠금 없음)
+        run = self.db.get(orm.AgentRun, run_id, with_for_update=True, populate_existing=True)
         if not run:
             return None
+        # 이전 상태의 롤업 행에서 이 실행의 기여분을 빼고, 갱신한 값을 새 상태의 행에 더함
+        add_run_to_rollups(self.db, run, sign=-1)
         run.ended_at = datetime.utcnow()
         run.status = status
+        run.duration_seconds = (run.ended_at - run.started_at).total_seconds()
+        if prompt_tokens is not None or completion_tokens is not None:
+            run.prompt_tokens = prompt_tokens or 0
+            run.completion_tokens = completion_tokens or 0
+            run.total_tokens = run.prompt_tokens + run.completion_tokens
+        if max_prompt_tokens is not None:
+            run.max_prompt_tokens = max_prompt_tokens
+        if estimated_cost is not None:
+            run.estimated_cost = estimated_cost
+        if model_calls is not None:
+            run.model_calls = model_calls
+        add_run_to_rollups(self.db, run)
         self.db.add(run)
         self.db.commit()
         self.db.refresh(run)
         return run
 
-    def get(self, run_id: int) -> Optional[orm.AgentRun]:
-        return self.db.get(orm.AgentRun, run_id)
+    def get(self, run_id: int, load_messages: bool = True) -> Optional[orm.AgentRun]:
+        """실행 조회 (load_messages가 False면 messages 관계를 불러오지 않고 빈 목록으로 둠)"""
+        if load_messages:
+            return self.db.get(orm.AgentRun, run_id)
+        return self.db.get(orm.AgentRun, run_id, options=[noload(orm.AgentRun.messages)], populate_existing=True)
+
+    def list(
+        self,
+        team_name: Optional[str] = None,
+        limit: int = 50,
+        cursor: Optional[Cursor] = None,
+        after_id: Optional[int] = None,
+    ) -> List[orm.AgentRun]:
+        """
+        실행 목록을 (started_at, id) 키셋 페이지네이션으로 조회합니다.
 
-    def list(self, team_name: Optional[str] = None, limit: int = 50) -> List[orm.AgentRun]:
-        stmt = select(orm.AgentRun).order_by(desc(orm.AgentRun.started_at)).limit(limit)
-        if team_name:
-            stmt = stmt.filter(orm.AgentRun.team_name == team_name)
+        Args:
+            team_name: 팀 이름으로 필터링
+            limit: 최대 개수
+            cursor: 이전 페이지 마지막 실행의 (started_at, id)
+            after_id: 이 id보다 뒤에 생성된 실행만 조회 (증분 조회, 오래된 것부터 정렬)
+
+        Returns:
+            List[AgentRun]: 기본은 최신순, after_id를 주면 오래된 순
+        """
+        stmt = paginate_runs(select(orm.AgentRun), team_name, cursor, after_id).limit(limit)
         return list(self.db.execute(stmt).scalars().all())
 
+    def list_summaries(
+        self,
+        team_name: Optional[str] = None,
+        limit: int = 50,
+        cursor: Optional[Cursor] = None,
+        after_id: Optional[int] = None,
+        task_chars: int = RUN_LIST_TASK_PREVIEW_CHARS,
+    ) -> List[Dict[str, Any]]:
+        """
+        목록 화면에 필요한 컬럼만 조회합니다. (메시지는 불러오지 않고, task는 DB에서 앞부분만 잘라 옴)
+
+        정렬/페이지네이션 규칙은 list와 같으며, task가 잘렸으면 task_truncated가 True입니다.
+        """
+        stmt = paginate_runs(run_summary_statement(task_chars), team_name, cursor, after_id).limit(limit)
+        return to_run_summaries(self.db.execute(stmt).mappings().all(), task_chars)
+
+    def team_statistics(
+        self,
+        team_name: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        percentiles: Sequence[float] = (50, 95),
+    ) -> Dict[str, Any]:
+        """
+        팀의 실행 통계를 계산합니다. (기간 조건이 없으면 롤업 행, 있으면 run 집계 컬럼의 SQL 집계)
+
+        Args:
+            team_name: 팀 이름
+            since: 이 시각 이후 시작된 실행만 포함
+            until: 이 시각 이전 시작된 실행만 포함
+            percentiles: 완료된 실행의 실행 시간 백분위 (0~100)
+
+        Returns:
+            Dict: runs_by_status, average_duration(완료된 실행 기준, 초), total_messages, duration_percentiles
+        """
+        run = orm.AgentRun
+        conditions = [run.team_name == team_name]
+        if since is None and until is None:
+            # 기간 조건이 없으면 전체 누적 롤업 행(상태 수만큼)만 읽음
+            rollups = AgentRunRollupRepository(self.db).totals_by_team_and_status(team_name)
+            runs_by_status = {row.status: row.run_count for row in rollups if row.run_count}
+            total_messages = sum(row.message_count for row in rollups)
+            completed = next((row for row in rollups if row.status == "completed"), None)
+            finished_completed = completed.finished_count if completed else 0
+            average_duration = completed.total_duration_seconds / finished_completed if finished_completed else None
+        else:
+            if since is not None:
+                conditions.append(run.started_at >= since)
+            if until is not None:
+                conditions.append(run.started_at < until)
+
+            # 상태별 실행 수, 실행 시간이 있는 실행 수, 평균 실행 시간, 메시지 수를 run 집계 컬럼으로 한 번에 계산
+            status_rows = self.db.execute(
+                select(
+                    run.status,
+                    func.count(run.id),
+                    func.count(run.duration_seconds),
+                    func.avg(run.duration_seconds),
+                    func.coalesce(func.sum(run.message_count), 0),
+                )
+                .where(*conditions)
+                .group_by(run.status)
+            ).all()
+            runs_by_status = {status: count for status, count, _, _, _ in status_rows}
+            total_messages = sum(messages for _, _, _, _, messages in status_rows)
+            finished_completed, average_duration = next(
+                ((finished, avg) for status, _, finished, avg, _ in status_rows if status == "completed"), (0, None)
+            )
+
+        # 백분위: 완료된 실행을 실행 시간 순으로 정렬해 해당 순위의 값 하나만 조회 (nearest-rank)
+        duration_percentiles: Dict[str, Optional[float]] = {}
+        completed_conditions = conditions + [run.status == "completed", run.duration_seconds.isnot(None)]
+        for percentile in percentiles:
+            value = None
+            if finished_completed:
+                offset = min(finished_completed - 1, int(round(percentile / 100 * (finished_completed - 1))))
+                value = self.db.execute(
+                    select(run.duration_seconds)
+                    .where(*completed_conditions)
+                    .order_by(run.duration_seconds)
+                    .offset(offset)
+                    .limit(1)
+                ).scalar()
+            duration_percentiles[f"p{percentile:g}"] = round(float(value), 2) if value is not None else None
+
+        return {
+            "runs_by_status": runs_by_status,
+            "average_duration": round(float(average_duration), 2) if average_duration is not None else 0,
+            "total_messages": total_messages,
+            "duration_percentiles": duration_percentiles,
+        }
+
 
 class AgentMessageRepository:
-    def __init__(self, db: Session) -> None:
+    def __init__(self, db: Session, writer: Optional[AgentMessageWriter] = None) -> None:
         self.db = db
+        self._writer = writer
+
+    @property
+    def writer(self) -> AgentMessageWriter:
+        return self._writer or get_agent_message_writer()
 
     def add(
         self,
@@ -63,12 +281,49 @@ class AgentMessageRepository:
             tool_name=tool_name,
         )
         self.db.add(msg)
+        apply_message_counts(self.db, {run_id: (1, len(content or ""))})
         self.db.commit()
         self.db.refresh(msg)
         return msg
 
-    def list_by_run(self, run_id: int) -> List[orm.AgentMessage]:
-        stmt = select(orm.AgentMessage).where(orm.AgentMessage.run_id == run_id).order_by(orm.AgentMessage.created_at)
-        return list(self.db.execute(stmt).scalars().all())
+    def enqueue(
+        self,
+        run_id: int,
+        agent_name: str,
+        role: str,
+        content: str,
+        tool_name: Optional[str] = None,
+    ) -> None:
+        """
+        팀 실행 중 스트리밍 메시지 기록용. 쓰기 스레드가 모아서 저장하므로 바로 반환합니다.
+        실행이 끝나면 flush를 호출해 저장 완료를 보장해야 합니다.
+        """
+        self.writer.add(run_id=run_id, agent_name=agent_name, role=role, content=content, tool_name=tool_name)
+
+    async def flush(self, run_id: Optional[int] = None) -> bool:
+        """enqueue한 메시지가 모두 저장될 때까지 기다림 (이벤트 루프를 막지 않음)"""
+        return await self.writer.flush_async(run_id)
+
+    def list_by_run(
+        self,
+        run_id: int,
+        limit: Optional[int] = None,
+        cursor: Optional[Cursor] = None,
+        after_id: Optional[int] = None,
+    ) -> List[orm.AgentMessage]:
+        """
+        실행의 메시지를 (created_at, id) 순서로 조회합니다.
+
+        Args:
+            run_id: 실행 ID
+            limit: 최대 개수 (None이면 전체)
+            cursor: 이전 페이지 마지막 메시지의 (created_at, id)
+            after_id: 이 id보다 뒤에 저장된 메시지만 조회 (증분 조회)
+        """
+        stmt = message_list_statement(run_id, limit=limit, cursor=cursor, after_id=after_id)
+        messages = list(self.db.execute(stmt).scalars().all())
+        # 보관 처리(압축)된 메시지는 원문을 풀어서 반환
+        restore_archived_content(messages)
+        return messages
 
 
@@ -0,0 +1,180 @@
+"""
+에이전트 실행 및 메시지 저장/조회 리포지토리 (비동기 세션)
+
+API 엔드포인트가 DB I/O를 await할 수 있도록 AgentRunRepository/AgentMessageRepository와 같은 동작을
+AsyncSession(aiosqlite/asyncpg)으로 제공합니다. 조회문과 결과 변환은 동기 리포지토리와 공유하고,
+롤업 갱신/통계처럼 여러 문장을 순서대로 실행하는 동기 구현은 AsyncSession.run_sync로 실행합니다.
+(run_sync 안의 I/O도 비동기 드라이버로 수행되므로 이벤트 루프를 막지 않음)
+
+비동기 세션에서는 지연 로딩을 할 수 없으므로 반환하는 AgentRun의 messages 관계는
+명시적으로 불러오거나(load_messages=True) 빈 목록으로 채워 둡니다.
+팀 실행 중 메시지 기록(enqueue/flush)은 세션과 무관한 쓰기 스레드를 사용하므로 AgentMessageRepository를 그대로 사용합니다.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import noload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+
+from src.core import models as orm
+from src.core.config import RUN_LIST_TASK_PREVIEW_CHARS
+from src.repositories.agent_logs import (
+    AgentRunRepository,
+    message_list_statement,
+    paginate_runs,
+    run_summary_statement,
+    to_run_summaries,
+)
+from src.repositories.agent_message_archive import restore_archived_content
+from src.repositories.agent_run_rollups import add_run_to_rollups, apply_message_counts
+from src.repositories.pagination import Cursor
+
+
+class AsyncAgentRunRepository:
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+
+    async def create(self, team_name: str, task: str, model: Optional[str] = None) -> orm.AgentRun:
+        run = orm.AgentRun(
+            team_name=team_name,
+            task=task,
+            model=model,
+            started_at=datetime.utcnow(),
+            status="running",
+            message_count=0,
+            total_chars=0,
+        )
+        self.db.add(run)
+        await self.db.run_sync(add_run_to_rollups, run)
+        await self.db.commit()
+        # 새 실행에는 메시지가 없으므로 조회 없이 빈 목록으로 둠 (기본값 컬럼은 flush 때 채워짐)
+        set_committed_value(run, "messages", [])
+        return run
+
+    async def finish(
+        self,
+        run_id: int,
+        status: str = "completed",
+        prompt_tokens: Optional[int] = None,
+        completion_tokens: Optional[int] = None,
+        max_prompt_tokens: Optional[int] = None,
+        estimated_cost: Optional[float] = None,
+        model_calls: Optional[Dict[str, Any]] = None,
+    ) -> Optional[orm.AgentRun]:
+        # 메시지 기록기가 같은 run의 카운터를 갱신 중일 수 있으므로 최신 값을 잠그고 읽음 (SQLite는 잠금 없음)
+        run = await self.db.get(
+            orm.AgentRun,
+            run_id,
+            options=[noload(orm.AgentRun.messages)],
+            with_for_update=True,
+            populate_existing=True,
+        )
+        if not run:
+            return None
+        # 이전 상태의 롤업 행에서 이 실행의 기여분을 빼고, 갱신한 값을 새 상태의 행에 더함
+        await self.db.run_sync(add_run_to_rollups, run, -1)
+        run.ended_at = datetime.utcnow()
+        run.status = status
+        run.duration_seconds = (run.ended_at - run.started_at).total_seconds()
+        if prompt_tokens is not None or completion_tokens is not None:
+            run.prompt_tokens = prompt_tokens or 0
+            run.completion_tokens = completion_tokens or 0
+            run.total_tokens = run.prompt_tokens + run.completion_tokens
+        if max_prompt_tokens is not None:
+            run.max_prompt_tokens = max_prompt_tokens
+        if estimated_cost is not None:
+            run.estimated_cost = estimated_cost
+        if model_calls is not None:
+            run.model_calls = model_calls
+        await self.db.run_sync(add_run_to_rollups, run)
+        await self.db.commit()
+        return run
+
+    async def get(self, run_id: int, load_messages: bool = True) -> Optional[orm.AgentRun]:
+        """실행 조회 (load_messages가 False면 messages 관계를 불러오지 않고 빈 목록으로 둠)"""
+        if not load_messages:
+            return await self.db.get(orm.AgentRun, run_id, options=[noload(orm.AgentRun.messages)], populate_existing=True)
+        run = await self.db.get(
+            orm.AgentRun, run_id, options=[selectinload(orm.AgentRun.messages)], populate_existing=True
+        )
+        if run:
+            restore_archived_content(run.messages)
+        return run
+
+    async def list(
+        self,
+        team_name: Optional[str] = None,
+        limit: int = 50,
+        cursor: Optional[Cursor] = None,
+        after_id: Optional[int] = None,
+    ) -> List[orm.AgentRun]:
+        """실행 목록 조회 (AgentRunRepository.list와 같은 정렬/페이지네이션, messages는 빈 목록)"""
+        stmt = paginate_runs(select(orm.AgentRun).options(noload(orm.AgentRun.messages)), team_name, cursor, after_id)
+        return list((await self.db.execute(stmt.limit(limit))).scalars().all())
+
+    async def list_summaries(
+        self,
+        team_name: Optional[str] = None,
+        limit: int = 50,
+        cursor: Optional[Cursor] = None,
+        after_id: Optional[int] = None,
+        task_chars: int = RUN_LIST_TASK_PREVIEW_CHARS,
+    ) -> List[Dict[str, Any]]:
+        """목록 화면용 요약 조회 (AgentRunRepository.list_summaries와 같은 결과)"""
+        stmt = paginate_runs(run_summary_statement(task_chars), team_name, cursor, after_id).limit(limit)
+        return to_run_summaries((await self.db.execute(stmt)).mappings().all(), task_chars)
+
+    async def team_statistics(
+        self,
+        team_name: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        percentiles: Sequence[float] = (50, 95),
+    ) -> Dict[str, Any]:
+        """팀의 실행 통계 (AgentRunRepository.team_statistics를 비동기 연결에서 실행)"""
+        return await self.db.run_sync(
+            lambda session: AgentRunRepository(session).team_statistics(
+                team_name, since=since, until=until, percentiles=percentiles
+            )
+        )
+
+
+class AsyncAgentMessageRepository:
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+
+    async def add(
+        self,
+        run_id: int,
+        agent_name: str,
+        role: str,
+        content: str,
+        tool_name: Optional[str] = None,
+    ) -> orm.AgentMessage:
+        msg = orm.AgentMessage(
+            run_id=run_id,
+            agent_name=agent_name,
+            role=role,
+            content=content,
+            tool_name=tool_name,
+        )
+        self.db.add(msg)
+        await self.db.run_sync(apply_message_counts, {run_id: (1, len(content or ""))})
+        await self.db.commit()
+        return msg
+
+    async def list_by_run(
+        self,
+        run_id: int,
+        limit: Optional[int] = None,
+        cursor: Optional[Cursor] = None,
+        after_id: Optional[int] = None,
+    ) -> List[orm.AgentMessage]:
+        """실행의 메시지를 (created_at, id) 순서로 조회 (보관 처리된 메시지는 원문을 풀어서 반환)"""
+        stmt = message_list_statement(run_id, limit=limit, cursor=cursor, after_id=after_id)
+        messages = list((await self.db.execute(stmt)).scalars().all())
+        restore_archived_content(messages)
+        return messages
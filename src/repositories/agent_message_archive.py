@@ -0,0 +1,213 @@
+"""
+에이전트 메시지 보관 (zstd 압축) 및 DB 정리
+
+오래된 메시지의 content를 zstd로 압축해 같은 행의 content_zstd 컬럼으로 옮기고 content는 비워 둡니다.
+AgentMessageRepository는 조회 시 압축된 원문을 자동으로 풀어 content에 채우므로 호출하는 쪽은 차이가 없습니다.
+보관 처리 후 VACUUM/ANALYZE로 비워진 공간을 돌려주고 통계를 갱신합니다.
+
+보관 처리된 메시지는 content가 비워지지만, 트리거가 원문을 보관 메시지 검색 인덱스로 옮기므로 전문 검색에는 계속 나옵니다.
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, Optional
+
+from sqlalchemy import bindparam, func, select, update
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
+
+from src.core import models as orm
+from src.core.config import (
+    AGENT_MESSAGE_ARCHIVE_AFTER_DAYS,
+    AGENT_MESSAGE_ARCHIVE_BATCH_SIZE,
+    AGENT_MESSAGE_ARCHIVE_MIN_CHARS,
+    AGENT_MESSAGE_ZSTD_LEVEL,
+)
+
+try:
+    import zstandard
+except ImportError:  # 선택 의존성: 없으면 보관 처리만 비활성화
+    zstandard = None
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+
+class ArchiveUnavailableError(RuntimeError):
+    """zstandard 패키지가 없어 압축/해제를 할 수 없음"""
+
+
+def _require_zstandard() -> Any:
+    if zstandard is None:
+        raise ArchiveUnavailableError("zstandard 패키지가 설치되지 않아 보관된 메시지를 처리할 수 없습니다 (pip install zstandard)")
+    return zstandard
+
+
+def compress_content(content: str, level: int = AGENT_MESSAGE_ZSTD_LEVEL) -> bytes:
+    """메시지 내용을 zstd로 압축"""
+    return _require_zstandard().ZstdCompressor(level=level).compress(content.encode("utf-8"))
+
+
+def decompress_content(blob: bytes) -> str:
+    """compress_content로 압축한 내용을 복원"""
+    return _require_zstandard().ZstdDecompressor().decompress(blob).decode("utf-8")
+
+
+def restore_archived_content(messages: Iterable[orm.AgentMessage]) -> None:
+    """
+    보관 처리된 메시지의 content를 압축 원문으로 채웁니다.
+
+    변경으로 기록되지 않게(set_committed_value) 채우므로 같은 세션에서 commit해도 다시 저장되지 않습니다.
+    """
+    for message in messages:
+        if message.content_zstd is not None:
+            set_committed_value(message, "content", decompress_content(message.content_zstd))
+
+
+@dataclass
+class ArchiveStats:
+    """보관 처리 결과"""
+    archived: int = 0
+    original_bytes: int = 0
+    compressed_bytes: int = 0
+    seconds: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "archived": self.archived,
+            "original_bytes": self.original_bytes,
+            "compressed_bytes": self.compressed_bytes,
+            "compression_ratio": round(self.compressed_bytes / self.original_bytes, 4) if self.original_bytes else None,
+            "seconds": round(self.seconds, 3),
+        }
+
+
+def archive_messages(
+    db: Session,
+    older_than: Optional[datetime] = None,
+    min_chars: int = AGENT_MESSAGE_ARCHIVE_MIN_CHARS,
+    batch_size: int = AGENT_MESSAGE_ARCHIVE_BATCH_SIZE,
+    level: int = AGENT_MESSAGE_ZSTD_LEVEL,
+) -> ArchiveStats:
+    """
+    오래된 메시지 내용을 압축해 content_zstd로 옮깁니다. (batch_size개씩 commit)
+
+    Args:
+        db: DB 세션
+        older_than: 이 시각 이전에 저장된 메시지만 (기본: AGENT_MESSAGE_ARCHIVE_AFTER_DAYS일 전)
+        min_chars: 이 길이 미만의 메시지는 그대로 둠
+        batch_size: 한 번에 처리할 메시지 수
+        level: zstd 압축 레벨
+
+    Returns:
+        ArchiveStats: 보관 처리한 메시지 수와 압축 전/후 크기
+    """
+    _require_zstandard()
+    if older_than is None:
+        older_than = datetime.utcnow() - timedelta(days=AGENT_MESSAGE_ARCHIVE_AFTER_DAYS)
+    table = orm.AgentMessage.__table__
+    compressor = zstandard.ZstdCompressor(level=level)
+    stats = ArchiveStats()
+    started = time.monotonic()
+    archive_stmt = (
+        update(table)
+        .where(table.c.id == bindparam("message_id"))
+        .values(content="", content_zstd=bindparam("blob"), archived_at=bindparam("archived_time"))
+    )
+
+    last_id = 0
+    while True:
+        rows = db.execute(
+            select(table.c.id, table.c.content)
+            .where(
+                table.c.id > last_id,
+                table.c.archived_at.is_(None),
+                table.c.created_at < older_than,
+                func.length(table.c.content) >= min_chars,
+            )
+            .order_by(table.c.id)
+            .limit(batch_size)
+        ).all()
+        if not rows:
+            break
+
+        archived_at = datetime.utcnow()
+        params = []
+        for message_id, content in rows:
+            raw = content.encode("utf-8")
+            blob = compressor.compress(raw)
+            params.append({"message_id": message_id, "blob": blob, "archived_time": archived_at})
+            stats.original_bytes += len(raw)
+            stats.compressed_bytes += len(blob)
+        db.execute(archive_stmt, params)
+        db.commit()
+        stats.archived += len(rows)
+        last_id = rows[-1][0]
+
+    stats.seconds = time.monotonic() - started
+    return stats
+
+
+def archive_summary(db: Session) -> Dict[str, Any]:
+    """보관 처리 현황 (메시지 수, 원문/압축 크기)"""
+    table = orm.AgentMessage.__table__
+    hot_count, hot_bytes, archived_count, archived_bytes = db.execute(
+        select(
+            func.count(table.c.id).filter(table.c.archived_at.is_(None)),
+            func.coalesce(func.sum(func.length(table.c.content)).filter(table.c.archived_at.is_(None)), 0),
+            func.count(table.c.id).filter(table.c.archived_at.isnot(None)),
+            func.coalesce(func.sum(func.length(table.c.content_zstd)).filter(table.c.archived_at.isnot(None)), 0),
+        )
+    ).one()
+    return {
+        "hot_messages": hot_count,
+        "hot_content_chars": hot_bytes,
+        "archived_messages": archived_count,
+        "archived_compressed_bytes": archived_bytes,
+    }
+
+
+def compact_database(engine: Engine) -> Dict[str, Any]:
+    """
+    보관 처리로 비워진 공간을 돌려주고 쿼리 플래너 통계를 갱신합니다.
+
+    SQLite: 전문 검색 인덱스 병합 후 VACUUM, ANALYZE, PRAGMA optimize, WAL 체크포인트
+    PostgreSQL: VACUUM (ANALYZE)
+
+    Returns:
+        Dict: 수행한 명령과 소요 시간
+    """
+    dialect_name = engine.dialect.name
+    started = time.monotonic()
+    statements = []
+    if dialect_name == "sqlite":
+        # FTS 세그먼트를 하나로 병합해 검색 인덱스 크기/조회 비용을 줄임
+        statements += [
+            "INSERT INTO agent_messages_fts(agent_messages_fts) VALUES ('optimize')",
+            "INSERT INTO agent_runs_fts(agent_runs_fts) VALUES ('optimize')",
+            "INSERT INTO agent_messages_archive_fts(agent_messages_archive_fts) VALUES ('optimize')",
+            "VACUUM",
+            "ANALYZE",
+            "PRAGMA optimize",
+            # WAL 모드에서는 VACUUM 결과가 WAL 파일에 쌓이므로 DB 파일에 반영하고 WAL 파일을 비움
+            "PRAGMA wal_checkpoint(TRUNCATE)",
+        ]
+    elif dialect_name == "postgresql":
+        statements += ["VACUUM (ANALYZE) agent_messages", "VACUUM (ANALYZE) agent_runs"]
+    else:
+        statements += ["ANALYZE TABLE agent_messages, agent_runs"]
+
+    executed = []
+    # VACUUM은 트랜잭션 안에서 실행할 수 없으므로 autocommit 연결 사용
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        for statement in statements:
+            try:
+                conn.exec_driver_sql(statement)
+                executed.append(statement)
+            except Exception as e:
+                # 전문 검색 인덱스가 없는 DB 등: 해당 명령만 건너뜀
+                logger.warning(f"DB 정리 명령 실패 - {statement}, 오류: {str(e)}")
+    return {"executed": executed, "seconds": round(time.monotonic() - started, 3)}
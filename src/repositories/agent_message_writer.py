@@ -0,0 +1,247 @@
+"""
+에이전트 메시지 비동기 기록기 (write-behind)
+
+팀 실행 루프에서 메시지마다 commit하면 이벤트 루프가 디스크 쓰기를 기다리게 되므로,
+메시지를 큐에 넣기만 하고 전용 쓰기 스레드가 개수/시간 기준으로 모아 여러 행 INSERT 한 번으로 저장합니다.
+실행이 끝나면 flush로 해당 run의 메시지가 모두 저장될 때까지 기다리고,
+프로세스 종료 시에는 atexit에서 남은 메시지를 모두 저장합니다.
+"""
+
+import asyncio
+import atexit
+import logging
+import queue
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from src.core import models as orm
+from src.core.config import (
+    AGENT_MESSAGE_BATCH_SIZE,
+    AGENT_MESSAGE_FLUSH_INTERVAL_SECONDS,
+    AGENT_MESSAGE_FLUSH_TIMEOUT_SECONDS,
+)
+from src.core.db import SessionLocal
+from src.repositories.agent_run_rollups import apply_message_counts, count_messages
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 저장 실패 시 재시도 횟수와 재시도 간격(초)
+_WRITE_ATTEMPTS = 3
+_RETRY_DELAY_SECONDS = 0.2
+
+# 쓰기 스레드에 즉시 저장을 요청하는 신호
+_FLUSH = object()
+
+
+@dataclass
+class WriterStats:
+    """메시지 기록 지표"""
+    enqueued: int = 0
+    written: int = 0
+    dropped: int = 0
+    batches: int = 0
+    write_seconds: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "enqueued": self.enqueued,
+            "written": self.written,
+            "dropped": self.dropped,
+            "batches": self.batches,
+            "write_seconds": round(self.write_seconds, 3),
+            "avg_batch_size": round(self.written / self.batches, 2) if self.batches else 0.0,
+        }
+
+
+class AgentMessageWriter:
+    """전용 스레드에서 메시지를 모아 저장하는 기록기"""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        batch_size: int = AGENT_MESSAGE_BATCH_SIZE,
+        flush_interval: float = AGENT_MESSAGE_FLUSH_INTERVAL_SECONDS,
+    ):
+        self.session_factory = session_factory
+        self.batch_size = max(batch_size, 1)
+        self.flush_interval = max(flush_interval, 0.0)
+        self.stats = WriterStats()
+        # 큐에 넣기만 하므로 팀 실행 루프는 디스크를 기다리지 않음 (크기 제한 없음)
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        # run_id별 아직 저장되지 않은 메시지 수 (flush 대기용)
+        self._pending: Counter = Counter()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    def add(
+        self,
+        run_id: int,
+        agent_name: str,
+        role: str,
+        content: str,
+        tool_name: Optional[str] = None,
+    ) -> None:
+        """
+        메시지를 저장 큐에 넣습니다. (즉시 반환)
+
+        created_at은 큐에 넣는 시점으로 기록해 묶어서 저장해도 메시지 순서가 유지됩니다.
+        """
+        row = {
+            "run_id": run_id,
+            "agent_name": agent_name,
+            "role": role,
+            "content": content,
+            "tool_name": tool_name,
+            "created_at": datetime.utcnow(),
+        }
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("메시지 기록기가 이미 종료되었습니다")
+            self._pending[run_id] += 1
+            self.stats.enqueued += 1
+            self._ensure_thread()
+        self._queue.put_nowait(row)
+
+    def flush(self, run_id: Optional[int] = None, timeout: Optional[float] = AGENT_MESSAGE_FLUSH_TIMEOUT_SECONDS) -> bool:
+        """
+        큐에 남은 메시지를 바로 저장하고 저장이 끝날 때까지 기다립니다.
+
+        Args:
+            run_id: 이 run의 메시지만 기다림 (None이면 전체)
+            timeout: 최대 대기 시간(초, None이면 무제한)
+
+        Returns:
+            bool: 시간 안에 모두 저장되었는지 여부
+        """
+        def drained() -> bool:
+            if run_id is None:
+                return not self._pending
+            return self._pending[run_id] <= 0
+
+        with self._condition:
+            if drained():
+                return True
+        self._queue.put_nowait(_FLUSH)
+        with self._condition:
+            done = self._condition.wait_for(drained, timeout=timeout)
+        if not done:
+            print(f"⚠️ [메시지 기록] 저장 대기 시간 초과 (run_id={run_id})")
+            logger.warning(f"메시지 저장 대기 시간 초과 - run_id: {run_id}")
+        return done
+
+    async def flush_async(self, run_id: Optional[int] = None, timeout: Optional[float] = AGENT_MESSAGE_FLUSH_TIMEOUT_SECONDS) -> bool:
+        """flush를 스레드에서 기다림 (이벤트 루프를 막지 않음)"""
+        return await asyncio.to_thread(self.flush, run_id, timeout)
+
+    def close(self, timeout: Optional[float] = AGENT_MESSAGE_FLUSH_TIMEOUT_SECONDS) -> None:
+        """남은 메시지를 모두 저장하고 쓰기 스레드를 종료"""
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+        if thread is not None:
+            self._queue.put_nowait(None)
+            thread.join(timeout)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """기록 지표 (대기 중인 메시지 수 포함)"""
+        data = self.stats.to_dict()
+        with self._condition:
+            data["pending"] = sum(self._pending.values())
+        return data
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="agent-message-writer", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        """큐에서 메시지를 꺼내 batch_size개가 모이거나 flush_interval이 지나면 저장"""
+        stopping = False
+        while not stopping:
+            batch: List[Dict[str, Any]] = []
+            item = self._queue.get()
+            deadline = time.monotonic() + self.flush_interval
+            while True:
+                if item is None:
+                    stopping = True
+                elif item is not _FLUSH:
+                    batch.append(item)
+                if stopping or item is _FLUSH or len(batch) >= self.batch_size:
+                    break
+                remaining = deadline - time.monotonic()
+                try:
+                    item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+            if stopping:
+                # 종료 신호 뒤에 남은 메시지까지 모두 저장
+                while True:
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is not None and item is not _FLUSH:
+                        batch.append(item)
+
+            for start in range(0, len(batch), self.batch_size):
+                self._write(batch[start:start + self.batch_size])
+
+    def _write(self, rows: List[Dict[str, Any]]) -> None:
+        started = time.monotonic()
+        written = False
+        for attempt in range(1, _WRITE_ATTEMPTS + 1):
+            session = self.session_factory()
+            try:
+                # 여러 행을 VALUES 목록 하나로 묶은 INSERT 한 번 + run별 카운터/롤업 갱신 + commit 한 번
+                session.execute(insert(orm.AgentMessage).values(rows))
+                apply_message_counts(session, count_messages(rows))
+                session.commit()
+                written = True
+                break
+            except Exception as e:
+                session.rollback()
+                logger.error(f"메시지 저장 실패 ({attempt}/{_WRITE_ATTEMPTS}) - {len(rows)}개, 오류: {str(e)}")
+                if attempt < _WRITE_ATTEMPTS:
+                    time.sleep(_RETRY_DELAY_SECONDS * attempt)
+            finally:
+                session.close()
+
+        with self._condition:
+            if written:
+                self.stats.written += len(rows)
+                self.stats.batches += 1
+            else:
+                self.stats.dropped += len(rows)
+                print(f"❌ [메시지 기록] {len(rows)}개 메시지를 저장하지 못했습니다.")
+            self.stats.write_seconds += time.monotonic() - started
+            for row in rows:
+                self._pending[row["run_id"]] -= 1
+                if self._pending[row["run_id"]] <= 0:
+                    del self._pending[row["run_id"]]
+            self._condition.notify_all()
+
+
+_message_writer: Optional[AgentMessageWriter] = None
+_message_writer_lock = threading.Lock()
+
+
+def get_agent_message_writer() -> AgentMessageWriter:
+    """에이전트 메시지 기록기 인스턴스 반환 (프로세스 종료 시 남은 메시지 저장)"""
+    global _message_writer
+    with _message_writer_lock:
+        if _message_writer is None:
+            _message_writer = AgentMessageWriter()
+            atexit.register(_message_writer.close)
+        return _message_writer
@@ -0,0 +1,257 @@
+"""
+에이전트 실행 집계 (run 카운터 + 팀/상태별 롤업)
+
+메시지를 저장하거나 실행을 시작/종료할 때 같은 트랜잭션 안에서
+AgentRun의 집계 컬럼(message_count, total_chars, duration_seconds)과
+팀/상태별 롤업 행(시간/일 단위 + 전체 누적)을 증분 갱신합니다.
+통계/홈 화면 지표는 실행·메시지 행을 다시 세지 않고 롤업 행만 읽습니다.
+
+롤업 규칙: 실행 하나는 현재 상태의 롤업 행에 자신의 카운터 전체를 기여하고,
+상태가 바뀌면 이전 상태 행에서 빼서 새 상태 행으로 옮깁니다. (버킷은 실행 시작 시각 기준)
+"""
+
+from collections import defaultdict
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from sqlalchemy import bindparam, delete, func, insert, select, text, update
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.elements import TextClause
+
+from src.core import models as orm
+
+ROLLUP_GRANULARITIES = ("hour", "day", "total")
+# 전체 누적 행의 버킷 시각 (고정값)
+TOTAL_BUCKET_START = datetime(1970, 1, 1)
+
+_ROLLUP_KEY_COLUMNS = ("granularity", "bucket_start", "team_name", "status")
+_ROLLUP_VALUE_COLUMNS = (
+    "run_count",
+    "finished_count",
+    "message_count",
+    "total_chars",
+    "prompt_tokens",
+    "completion_tokens",
+    "total_tokens",
+    "estimated_cost",
+    "total_duration_seconds",
+)
+
+
+def bucket_start(granularity: str, timestamp: datetime) -> datetime:
+    """시각을 롤업 버킷 시작 시각으로 내림"""
+    if granularity == "hour":
+        return timestamp.replace(minute=0, second=0, microsecond=0)
+    if granularity == "day":
+        return timestamp.replace(hour=0, minute=0, second=0, microsecond=0)
+    if granularity == "total":
+        return TOTAL_BUCKET_START
+    raise ValueError(f"알 수 없는 롤업 단위입니다: {granularity}")
+
+
+def run_rollup_values(run: orm.AgentRun, sign: int = 1) -> Dict[str, Any]:
+    """실행 하나가 현재 상태의 롤업 행에 기여하는 값"""
+    return {
+        "run_count": sign,
+        "finished_count": sign if run.ended_at is not None else 0,
+        "message_count": sign * (run.message_count or 0),
+        "total_chars": sign * (run.total_chars or 0),
+        "prompt_tokens": sign * (run.prompt_tokens or 0),
+        "completion_tokens": sign * (run.completion_tokens or 0),
+        "total_tokens": sign * (run.total_tokens or 0),
+        "estimated_cost": sign * (run.estimated_cost or 0.0),
+        "total_duration_seconds": sign * (run.duration_seconds or 0.0),
+    }
+
+
+def upsert_rollup(
+    db: Session,
+    granularity: str,
+    bucket: datetime,
+    team_name: str,
+    status: str,
+    deltas: Mapping[str, Any],
+) -> None:
+    """롤업 행 하나에 값을 더합니다. (행이 없으면 생성, commit은 호출하는 쪽에서)"""
+    deltas = {column: value for column, value in deltas.items() if value}
+    if not deltas:
+        return
+    table = orm.AgentRunRollup.__table__
+    keys = {"granularity": granularity, "bucket_start": bucket, "team_name": team_name, "status": status}
+    values = {**{column: 0 for column in _ROLLUP_VALUE_COLUMNS}, **keys, **deltas}
+
+    if db.get_bind().dialect.name in ("sqlite", "postgresql"):
+        db.execute(_upsert_statement(tuple(deltas)), values)
+        return
+
+    # ON CONFLICT를 지원하지 않는 DB: UPDATE 후 대상 행이 없으면 INSERT
+    result = db.execute(
+        update(table)
+        .where(*(table.c[column] == value for column, value in keys.items()))
+        .values({column: table.c[column] + value for column, value in deltas.items()})
+    )
+    if result.rowcount == 0:
+        db.execute(insert(table).values(values))
+
+
+@lru_cache(maxsize=None)
+def _upsert_statement(delta_columns: Tuple[str, ...]) -> TextClause:
+    """
+    롤업 행 upsert 문 (SQLite/PostgreSQL 공통 INSERT ... ON CONFLICT 문법)
+
+    방언별 insert().on_conflict_do_update()는 SQLAlchemy 컴파일 캐시를 쓰지 않아 호출마다 다시 컴파일되므로
+    (메시지 저장마다 3번, 쓰기 잠금을 잡은 채로) 갱신 컬럼 조합별로 한 번 만든 문을 재사용합니다.
+    """
+    table = orm.AgentRunRollup.__table__
+    columns = _ROLLUP_KEY_COLUMNS + _ROLLUP_VALUE_COLUMNS
+    updates = ", ".join(f"{column} = {table.name}.{column} + excluded.{column}" for column in delta_columns)
+    stmt = text(
+        f"INSERT INTO {table.name} ({', '.join(columns)}) "
+        f"VALUES ({', '.join(':' + column for column in columns)}) "
+        f"ON CONFLICT ({', '.join(_ROLLUP_KEY_COLUMNS)}) DO UPDATE SET {updates}"
+    )
+    # DateTime 등 컬럼 타입의 값 변환을 ORM 저장과 같게 적용 (SQLite 날짜 문자열 형식이 달라지지 않도록)
+    return stmt.bindparams(*(bindparam(column, type_=table.c[column].type) for column in columns))
+
+
+def add_run_to_rollups(db: Session, run: orm.AgentRun, sign: int = 1) -> None:
+    """실행의 현재 카운터를 현재 상태의 롤업 행(시간/일/전체)에 더하거나(sign=1) 뺍니다(sign=-1)."""
+    add_rollup_deltas(db, run.team_name, run.status, run.started_at, run_rollup_values(run, sign))
+
+
+def add_rollup_deltas(
+    db: Session,
+    team_name: str,
+    status: str,
+    started_at: datetime,
+    deltas: Mapping[str, Any],
+) -> None:
+    """실행 시작 시각이 속한 모든 단위의 롤업 행에 값을 더합니다."""
+    for granularity in ROLLUP_GRANULARITIES:
+        upsert_rollup(db, granularity, bucket_start(granularity, started_at), team_name, status, deltas)
+
+
+def apply_message_counts(db: Session, counts: Mapping[int, Tuple[int, int]]) -> None:
+    """
+    저장한 메시지 수/글자 수를 run 카운터와 롤업 행에 반영합니다. (메시지 INSERT와 같은 트랜잭션에서 호출)
+
+    Args:
+        counts: run_id별 (메시지 수, 글자 수)
+    """
+    if not counts:
+        return
+    run_table = orm.AgentRun.__table__
+    for run_id, (message_count, total_chars) in counts.items():
+        db.execute(
+            update(run_table)
+            .where(run_table.c.id == run_id)
+            .values(
+                message_count=func.coalesce(run_table.c.message_count, 0) + message_count,
+                total_chars=func.coalesce(run_table.c.total_chars, 0) + total_chars,
+            )
+        )
+
+    # 카운터를 갱신한 뒤 현재 상태를 읽어 해당 상태의 롤업 행에 반영
+    runs = db.execute(
+        select(run_table.c.id, run_table.c.team_name, run_table.c.status, run_table.c.started_at)
+        .where(run_table.c.id.in_(list(counts)))
+    ).all()
+    for run_id, team_name, status, started_at in runs:
+        message_count, total_chars = counts[run_id]
+        add_rollup_deltas(
+            db, team_name, status, started_at, {"message_count": message_count, "total_chars": total_chars}
+        )
+
+
+def count_messages(rows: Iterable[Mapping[str, Any]]) -> Dict[int, Tuple[int, int]]:
+    """메시지 행 목록을 run_id별 (메시지 수, 글자 수)로 묶음"""
+    counts: Dict[int, List[int]] = defaultdict(lambda: [0, 0])
+    for row in rows:
+        counts[row["run_id"]][0] += 1
+        counts[row["run_id"]][1] += len(row["content"] or "")
+    return {run_id: (count, chars) for run_id, (count, chars) in counts.items()}
+
+
+def rebuild_run_rollups(db: Session) -> int:
+    """
+    실행/메시지 행에서 run 카운터와 롤업 행을 다시 계산합니다.
+    (집계 컬럼이 없던 기존 DB의 최초 채우기 또는 불일치 복구용, commit 포함)
+
+    Returns:
+        int: 다시 집계한 실행 수
+    """
+    message_table = orm.AgentMessage.__table__
+    message_stats = (
+        select(
+            message_table.c.run_id,
+            func.count(message_table.c.id).label("message_count"),
+            func.coalesce(func.sum(func.length(message_table.c.content)), 0).label("total_chars"),
+        )
+        .group_by(message_table.c.run_id)
+    )
+    counts = {run_id: (count, chars) for run_id, count, chars in db.execute(message_stats).all()}
+
+    db.execute(delete(orm.AgentRunRollup.__table__))
+    rebuilt = 0
+    for run in db.execute(select(orm.AgentRun)).scalars().all():
+        run.message_count, run.total_chars = counts.get(run.id, (0, 0))
+        if run.ended_at is not None and run.started_at is not None:
+            run.duration_seconds = (run.ended_at - run.started_at).total_seconds()
+        add_run_to_rollups(db, run)
+        rebuilt += 1
+    db.commit()
+    return rebuilt
+
+
+class AgentRunRollupRepository:
+    """롤업 행 조회 (통계/홈 화면 지표용)"""
+
+    def __init__(self, db: Session) -> None:
+        self.db = db
+
+    def totals_by_team_and_status(self, team_name: Optional[str] = None) -> List[orm.AgentRunRollup]:
+        """전체 누적 롤업 행 (팀 수 x 상태 수 만큼만 읽음)"""
+        stmt = select(orm.AgentRunRollup).where(orm.AgentRunRollup.granularity == "total")
+        if team_name:
+            stmt = stmt.where(orm.AgentRunRollup.team_name == team_name)
+        return list(self.db.execute(stmt).scalars().all())
+
+    def series(
+        self,
+        granularity: str = "day",
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        team_name: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        시간/일 단위 롤업을 버킷·상태별로 합산한 시계열
+
+        Args:
+            granularity: hour | day
+            since: 이 시각이 속한 버킷부터 포함
+            until: 이 시각 이전 버킷만 포함
+            team_name: 팀 이름 (없으면 전체 팀 합산)
+        """
+        if granularity not in ("hour", "day"):
+            raise ValueError(f"시계열은 hour 또는 day 단위만 지원합니다: {granularity}")
+        rollup = orm.AgentRunRollup
+        conditions = [rollup.granularity == granularity]
+        if since is not None:
+            conditions.append(rollup.bucket_start >= bucket_start(granularity, since))
+        if until is not None:
+            conditions.append(rollup.bucket_start < until)
+        if team_name:
+            conditions.append(rollup.team_name == team_name)
+
+        rows = self.db.execute(
+            select(
+                rollup.bucket_start,
+                rollup.status,
+                *(func.sum(getattr(rollup, column)).label(column) for column in _ROLLUP_VALUE_COLUMNS),
+            )
+            .where(*conditions)
+            .group_by(rollup.bucket_start, rollup.status)
+            .order_by(rollup.bucket_start, rollup.status)
+        ).all()
+        return [row._asdict() for row in rows if row.run_count]
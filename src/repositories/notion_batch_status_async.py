@@ -0,0 +1,65 @@
+"""
+Notion 배치 상태 리포지토리 (비동기 세션)
+
+notion_batch_status 모듈과 같은 함수를 AsyncSession으로 제공합니다. (API 엔드포인트용)
+"""
+
+from typing import Dict, List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.models import NotionBatchStatus
+
+
+async def get_status_map_by_page_ids(db: AsyncSession, notion_page_ids: List[str]) -> Dict[str, NotionBatchStatus]:
+    if not notion_page_ids:
+        return {}
+    rows = (
+        await db.execute(
+            select(NotionBatchStatus)
+            .where(NotionBatchStatus.notion_page_id.in_(notion_page_ids))
+            .order_by(NotionBatchStatus.updated_at)
+        )
+    ).scalars().all()
+    # 페이지별로 가장 최근에 갱신된 행 (updated_at 오름차순이므로 마지막 행이 남음)
+    return {row.notion_page_id: row for row in rows}
+
+
+async def get_status(db: AsyncSession, notion_page_id: str) -> Optional[NotionBatchStatus]:
+    return (
+        await db.execute(
+            select(NotionBatchStatus)
+            .where(NotionBatchStatus.notion_page_id == notion_page_id)
+            .order_by(NotionBatchStatus.updated_at.desc())
+            .limit(1)
+        )
+    ).scalars().first()
+
+
+async def upsert_status(
+    db: AsyncSession,
+    notion_page_id: str,
+    status: str,
+    message: Optional[str] = None,
+    last_run_at=None,
+) -> NotionBatchStatus:
+    row = (
+        await db.execute(select(NotionBatchStatus).where(NotionBatchStatus.notion_page_id == notion_page_id))
+    ).scalars().first()
+    if row is None:
+        row = NotionBatchStatus(
+            notion_page_id=notion_page_id,
+            status=status,
+            message=message,
+            last_run_at=last_run_at,
+        )
+        db.add(row)
+    else:
+        row.status = status
+        row.message = message
+        if last_run_at is not None:
+            row.last_run_at = last_run_at
+    await db.commit()
+    await db.refresh(row)
+    return row
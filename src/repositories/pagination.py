@@ -0,0 +1,64 @@
+"""
+키셋(커서) 페이지네이션 유틸리티
+
+OFFSET 대신 마지막으로 받은 행의 (정렬 시각, id)를 커서로 넘겨
+다음 페이지를 인덱스 범위 조회로 가져옵니다. (앞 페이지 행을 건너뛰며 읽지 않음)
+"""
+
+import base64
+from datetime import datetime
+from typing import Optional, Tuple
+
+from sqlalchemy import and_, or_
+from sqlalchemy.sql.elements import ColumnElement
+
+Cursor = Tuple[datetime, int]
+
+
+def encode_cursor(timestamp: datetime, row_id: int) -> str:
+    """(정렬 시각, id)를 URL에 넣을 수 있는 불투명 문자열로 변환"""
+    raw = f"{timestamp.isoformat()}|{row_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Cursor:
+    """
+    encode_cursor로 만든 문자열을 (정렬 시각, id)로 되돌립니다.
+
+    Raises:
+        ValueError: 형식이 올바르지 않은 커서
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        timestamp, row_id = raw.rsplit("|", 1)
+        return datetime.fromisoformat(timestamp), int(row_id)
+    except Exception:
+        raise ValueError(f"올바르지 않은 커서입니다: {cursor}") from None
+
+
+def keyset_condition(
+    timestamp_column: ColumnElement,
+    id_column: ColumnElement,
+    cursor: Cursor,
+    descending: bool,
+) -> ColumnElement:
+    """
+    커서 다음 행을 고르는 조건 ((시각, id) 정렬 기준으로 커서보다 뒤)
+
+    Args:
+        timestamp_column: 정렬 시각 컬럼
+        id_column: 같은 시각의 순서를 정하는 id 컬럼
+        cursor: 이전 페이지 마지막 행의 (시각, id)
+        descending: 내림차순 정렬 여부
+    """
+    timestamp, row_id = cursor
+    if descending:
+        return or_(timestamp_column < timestamp, and_(timestamp_column == timestamp, id_column < row_id))
+    return or_(timestamp_column > timestamp, and_(timestamp_column == timestamp, id_column > row_id))
+
+
+def next_cursor(timestamp: Optional[datetime], row_id: int, page_size: int, limit: Optional[int]) -> Optional[str]:
+    """페이지가 가득 찼을 때만 다음 페이지 커서를 반환 (마지막 페이지면 None)"""
+    if limit is None or page_size < limit or timestamp is None:
+        return None
+    return encode_cursor(timestamp, row_id)
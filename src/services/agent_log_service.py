@@ -3,71 +3,86 @@
 """
 
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core import schemas
-from src.repositories.agent_logs import AgentRunRepository, AgentMessageRepository
+from src.repositories.agent_log_search import AgentLogSearchRepository
+from src.repositories.agent_logs_async import AsyncAgentMessageRepository, AsyncAgentRunRepository
+from src.repositories.agent_run_rollups import AgentRunRollupRepository
+from src.repositories.pagination import Cursor
 
 
 class AgentLogService:
-    """에이전트 실행 로그 및 메시지 관리 서비스"""
+    """
+    에이전트 실행 로그 및 메시지 관리 서비스 (비동기 세션)
+
+    실행/메시지 조회와 저장은 비동기 리포지토리로 await하고, 롤업/검색 조회는
+    동기 리포지토리를 AsyncSession.run_sync로 실행합니다. (어느 쪽도 이벤트 루프를 막지 않음)
+    """
     
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
-        self.run_repo = AgentRunRepository(db)
-        self.message_repo = AgentMessageRepository(db)
+        self.run_repo = AsyncAgentRunRepository(db)
+        self.message_repo = AsyncAgentMessageRepository(db)
     
     # ============================================================================
     # AgentRun 관련 서비스 메서드
     # ============================================================================
     
-    def create_run(self, run_data: schemas.AgentRunCreate) -> schemas.AgentRunRead:
+    async def create_run(self, run_data: schemas.AgentRunCreate) -> schemas.AgentRunRead:
         """새로운 에이전트 실행 기록 생성"""
-        run = self.run_repo.create(
+        run = await self.run_repo.create(
             team_name=run_data.team_name,
             task=run_data.task,
             model=run_data.model
         )
         return schemas.AgentRunRead.model_validate(run)
     
-    def get_run(self, run_id: int) -> Optional[schemas.AgentRunRead]:
-        """특정 실행 기록 조회 (메시지 포함)"""
-        run = self.run_repo.get(run_id)
+    async def get_run(self, run_id: int, include_messages: bool = True) -> Optional[schemas.AgentRunRead]:
+        """특정 실행 기록 조회 (include_messages가 False면 메시지 없이 실행 정보만)"""
+        # messages 관계는 불러오지 않고, 필요하면 작성 순서대로 따로 조회
+        run = await self.run_repo.get(run_id, load_messages=False)
         if not run:
             return None
         
-        # 메시지도 함께 조회
-        messages = self.message_repo.list_by_run(run_id)
         run_data = schemas.AgentRunRead.model_validate(run)
-        run_data.messages = [schemas.AgentMessageRead.model_validate(msg) for msg in messages]
+        if include_messages:
+            # 메시지도 함께 조회
+            messages = await self.message_repo.list_by_run(run_id)
+            run_data.messages = [schemas.AgentMessageRead.model_validate(msg) for msg in messages]
         
         return run_data
     
-    def list_runs(
+    async def list_runs(
         self, 
         team_name: Optional[str] = None, 
-        limit: int = 50
-    ) -> List[schemas.AgentRunRead]:
-        """실행 기록 목록 조회"""
-        runs = self.run_repo.list(team_name=team_name, limit=limit)
-        return [schemas.AgentRunRead.model_validate(run) for run in runs]
+        limit: int = 50,
+        cursor: Optional[Cursor] = None,
+        after_id: Optional[int] = None,
+    ) -> List[schemas.AgentRunSummary]:
+        """실행 기록 목록 조회 (요약 컬럼만, 최신순, after_id를 주면 그 이후 실행을 오래된 순으로)"""
+        runs = await self.run_repo.list_summaries(team_name=team_name, limit=limit, cursor=cursor, after_id=after_id)
+        return [schemas.AgentRunSummary.model_validate(run) for run in runs]
     
-    def finish_run(self, run_id: int, status: str = "completed") -> Optional[schemas.AgentRunRead]:
-        """실행 기록 완료 처리"""
-        run = self.run_repo.finish(run_id, status)
+    async def finish_run(self, run_id: int, status: str = "completed") -> Optional[schemas.AgentRunRead]:
+        """실행 기록 완료 처리 (응답에는 기존과 같이 메시지를 작성 순서대로 포함)"""
+        run = await self.run_repo.finish(run_id, status)
         if not run:
             return None
-        return schemas.AgentRunRead.model_validate(run)
+        run_data = schemas.AgentRunRead.model_validate(run)
+        messages = await self.message_repo.list_by_run(run_id)
+        run_data.messages = [schemas.AgentMessageRead.model_validate(msg) for msg in messages]
+        return run_data
     
     # ============================================================================
     # AgentMessage 관련 서비스 메서드
     # ============================================================================
     
-    def add_message(self, message_data: schemas.AgentMessageCreate) -> schemas.AgentMessageRead:
+    async def add_message(self, message_data: schemas.AgentMessageCreate) -> schemas.AgentMessageRead:
         """새로운 메시지 추가"""
-        message = self.message_repo.add(
+        message = await self.message_repo.add(
             run_id=message_data.run_id,
             agent_name=message_data.agent_name,
             role=message_data.role,
@@ -76,59 +91,156 @@ class AgentLogService:
         )
         return schemas.AgentMessageRead.model_validate(message)
     
-    def get_messages_by_run(self, run_id: int) -> List[schemas.AgentMessageRead]:
-        """특정 실행의 모든 메시지 조회"""
-        messages = self.message_repo.list_by_run(run_id)
+    async def get_messages_by_run(
+        self,
+        run_id: int,
+        limit: Optional[int] = None,
+        cursor: Optional[Cursor] = None,
+        after_id: Optional[int] = None,
+    ) -> List[schemas.AgentMessageRead]:
+        """특정 실행의 메시지 조회 (작성 순서, limit이 없으면 전체)"""
+        messages = await self.message_repo.list_by_run(run_id, limit=limit, cursor=cursor, after_id=after_id)
         return [schemas.AgentMessageRead.model_validate(msg) for msg in messages]
     
     # ============================================================================
     # 통합 조회 메서드
     # ============================================================================
     
-    def get_run_with_messages(self, run_id: int) -> Optional[schemas.AgentRunRead]:
+    async def get_run_with_messages(self, run_id: int) -> Optional[schemas.AgentRunRead]:
         """실행 기록과 모든 메시지를 함께 조회"""
-        return self.get_run(run_id)
+        return await self.get_run(run_id)
     
-    def get_team_statistics(self, team_name: str) -> dict:
-        """팀별 통계 정보 조회"""
-        runs = self.run_repo.list(team_name=team_name, limit=1000)  # 충분히 큰 수
-        
-        if not runs:
-            return {
-                "team_name": team_name,
-                "total_runs": 0,
-                "completed_runs": 0,
-                "running_runs": 0,
-                "failed_runs": 0,
-                "average_duration": 0,
-                "total_messages": 0
-            }
+    async def get_team_statistics(
+        self,
+        team_name: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        percentiles: Sequence[float] = (50, 95),
+    ) -> dict:
+        """
+        팀별 통계 정보 조회 (SQL 집계로 계산하므로 실행 기록이 늘어나도 실행/메시지 행을 불러오지 않음)
         
-        completed_runs = [r for r in runs if r.status == "completed"]
-        running_runs = [r for r in runs if r.status == "running"]
-        failed_runs = [r for r in runs if r.status == "failed"]
+        Args:
+            team_name: 팀 이름
+            since: 이 시각 이후 시작된 실행만 집계
+            until: 이 시각 이전 시작된 실행만 집계
+            percentiles: 완료된 실행의 실행 시간 백분위 (0~100)
+        """
+        stats = await self.run_repo.team_statistics(team_name, since=since, until=until, percentiles=percentiles)
+        runs_by_status = stats["runs_by_status"]
         
-        # 평균 실행 시간 계산 (완료된 실행만)
-        total_duration = 0
-        for run in completed_runs:
-            if run.ended_at and run.started_at:
-                duration = (run.ended_at - run.started_at).total_seconds()
-                total_duration += duration
+        return {
+            "team_name": team_name,
+            "total_runs": sum(runs_by_status.values()),
+            "completed_runs": runs_by_status.get("completed", 0),
+            "running_runs": runs_by_status.get("running", 0),
+            "failed_runs": runs_by_status.get("failed", 0),
+            "runs_by_status": runs_by_status,
+            "average_duration": stats["average_duration"],
+            "duration_percentiles": stats["duration_percentiles"],
+            "total_messages": stats["total_messages"],
+            "since": since,
+            "until": until,
+        }
+
+    async def get_run_overview(self, team_name: Optional[str] = None) -> dict:
+        """
+        전체/팀별 실행 현황 (전체 누적 롤업 행만 읽으므로 실행 기록 수와 무관)
         
-        average_duration = total_duration / len(completed_runs) if completed_runs else 0
+        Args:
+            team_name: 팀 이름 (없으면 전체 팀)
+        """
+        runs_by_status: dict = {}
+        teams: dict = {}
+        totals = {"total_messages": 0, "total_chars": 0, "total_tokens": 0, "estimated_cost": 0.0}
+        finished_duration = [0, 0.0]
+        rollups = await self.db.run_sync(
+            lambda session: AgentRunRollupRepository(session).totals_by_team_and_status(team_name)
+        )
+        for row in rollups:
+            if not row.run_count:
+                continue
+            runs_by_status[row.status] = runs_by_status.get(row.status, 0) + row.run_count
+            team = teams.setdefault(row.team_name, {"team_name": row.team_name, "total_runs": 0, "completed_runs": 0})
+            team["total_runs"] += row.run_count
+            if row.status == "completed":
+                team["completed_runs"] += row.run_count
+                finished_duration[0] += row.finished_count
+                finished_duration[1] += row.total_duration_seconds
+            totals["total_messages"] += row.message_count
+            totals["total_chars"] += row.total_chars
+            totals["total_tokens"] += row.total_tokens
+            totals["estimated_cost"] += row.estimated_cost
         
-        # 총 메시지 수 계산
-        total_messages = 0
-        for run in runs:
-            messages = self.message_repo.list_by_run(run.id)
-            total_messages += len(messages)
+        for team in teams.values():
+            team["completion_rate"] = round(team["completed_runs"] / team["total_runs"] * 100, 1)
         
+        finished, duration = finished_duration
         return {
-            "team_name": team_name,
-            "total_runs": len(runs),
-            "completed_runs": len(completed_runs),
-            "running_runs": len(running_runs),
-            "failed_runs": len(failed_runs),
-            "average_duration": round(average_duration, 2),
-            "total_messages": total_messages
+            "total_runs": sum(runs_by_status.values()),
+            "running_runs": runs_by_status.get("running", 0),
+            "completed_runs": runs_by_status.get("completed", 0),
+            "failed_runs": runs_by_status.get("failed", 0),
+            "runs_by_status": runs_by_status,
+            "average_duration": round(duration / finished, 2) if finished else 0,
+            **totals,
+            "estimated_cost": round(totals["estimated_cost"], 6),
+            "teams": sorted(teams.values(), key=lambda team: team["total_runs"], reverse=True),
         }
+    
+    async def get_run_rollups(
+        self,
+        granularity: str = "day",
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        team_name: Optional[str] = None,
+    ) -> List[dict]:
+        """
+        시간/일 단위 실행 추이 (버킷·상태별 롤업 합계)
+        
+        Args:
+            granularity: hour | day
+            since: 이 시각이 속한 버킷부터 포함
+            until: 이 시각 이전 버킷만 포함
+            team_name: 팀 이름 (없으면 전체 팀 합산)
+        """
+        return await self.db.run_sync(
+            lambda session: AgentRunRollupRepository(session).series(
+                granularity, since=since, until=until, team_name=team_name
+            )
+        )
+
+    async def search(
+        self,
+        query: str,
+        target: str = "messages",
+        team_name: Optional[str] = None,
+        run_id: Optional[int] = None,
+        limit: int = 20,
+        offset: int = 0,
+        sort: str = "relevance",
+    ) -> schemas.AgentLogSearchResponse:
+        """
+        메시지 또는 실행 작업 내용 전문 검색 (관련도 순, 강조 스니펫 포함)
+        
+        Args:
+            query: 검색어
+            target: messages | runs
+            team_name: 팀 이름으로 필터링
+            run_id: 실행 ID로 필터링 (messages 검색에서만 사용)
+            limit: 최대 개수
+            offset: 건너뛸 개수 (이전 응답의 next_offset)
+            sort: relevance | recent
+        """
+        # 다음 페이지 존재 여부 확인을 위해 하나 더 조회
+        rows = await self.db.run_sync(
+            lambda session: AgentLogSearchRepository(session).search(
+                query, target=target, team_name=team_name, run_id=run_id, limit=limit + 1, offset=offset, sort=sort
+            )
+        )
+        return schemas.AgentLogSearchResponse(
+            query=query,
+            target=target,
+            items=[schemas.AgentLogSearchHit.model_validate(row) for row in rows[:limit]],
+            next_offset=offset + limit if len(rows) > limit else None,
+        )
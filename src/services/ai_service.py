@@ -1,15 +1,19 @@
 
 
 
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from autogen_agentchat.teams import SelectorGroupChat
 from requests import Session
 
 from src.ai.agents.analysis_agent import create_devil_advocate_analyst_agent
-from src.ai.agents.base import create_model_client
+from src.ai.agents.model_router import classify_task_complexity, get_model_router, track_model_calls
 from src.ai.agents.analysis_agent import create_analysis_agent
 from src.ai.agents.data_analyst_agent import create_data_analyst_agent
 from src.ai.agents.insight_agent import create_insight_agent
 from src.ai.agents.web_search_agent import create_web_search_agent, create_google_search_agent
 from src.ai.orchestrator.team import create_team, run_team_task
+from src.ai.orchestrator.token_usage import TokenUsageTracker
 from src.core.models import NotionTodo
 from src.repositories.agent_logs import AgentMessageRepository, AgentRunRepository
 
@@ -21,34 +25,69 @@ class AIService:
         self.db = db
         self.run_repo = AgentRunRepository(db)
         self.msg_repo = AgentMessageRepository(db)
-        self.model_client = create_model_client()
-
+        self.model_router = get_model_router()
+        
+        # 작업 난이도별 팀 (첫 사용 시 생성)
+        self.teams: Dict[str, SelectorGroupChat] = {}
+    
+    def _get_team(self, complexity: str) -> SelectorGroupChat:
+        """작업 난이도에 맞는 모델 티어로 구성된 팀을 반환합니다."""
+        if complexity in self.teams:
+            return self.teams[complexity]
+        
+        router = self.model_router
+        tool_client = router.client_for_role("tool_agent", complexity)
+        
         # 에이전트 생성
-        self.web_search_agent = create_web_search_agent(self.model_client)
-        self.google_search_agent = create_google_search_agent(self.model_client)
-        self.data_analyst_agent = create_data_analyst_agent(self.model_client)
-        self.analysis_agent = create_analysis_agent(self.model_client)
-        self.insight_agent = create_insight_agent(self.model_client)
-        self.devil_advocate_analyst_agent = create_devil_advocate_analyst_agent(self.model_client)
+        web_search_agent = create_web_search_agent(tool_client)
+        google_search_agent = create_google_search_agent(tool_client)
+        data_analyst_agent = create_data_analyst_agent(tool_client)
+        # analysis_agent = create_analysis_agent(router.client_for_role("analyst", complexity))
+        # insight_agent = create_insight_agent(router.client_for_role("analyst", complexity))
+        # devil_advocate_analyst_agent = create_devil_advocate_analyst_agent(router.client_for_role("analyst", complexity))
         
         # 팀 생성
-        self.team = create_team(
+        team = create_team(
             [
-                self.web_search_agent, 
-                self.google_search_agent, 
-                self.data_analyst_agent, 
-                # self.analysis_agent, 
-                # self.insight_agent, 
-                # self.devil_advocate_analyst_agent
+                web_search_agent, 
+                google_search_agent, 
+                data_analyst_agent, 
+                # analysis_agent, 
+                # insight_agent, 
+                # devil_advocate_analyst_agent
             ],
-            self.model_client
+            tool_client,
+            selector_model_client=router.client_for_role("selector", complexity)
         )
+        self.teams[complexity] = team
+        return team
     
-    async def route_todo_to_agent(self, todo: NotionTodo):
-        from src.core.config import DEFAULT_MODEL
-        run = self.run_repo.create(team_name="투두 처리팀", task=todo.content, model=DEFAULT_MODEL)
-        ai_result = await run_team_task(self.team, todo.content, run.id, self.msg_repo)
-        self.run_repo.finish(run.id, status="completed")
+    async def route_todo_to_agent(
+        self,
+        todo: NotionTodo,
+        on_message: Optional[Callable[[Any], Awaitable[None]]] = None
+    ):
+        complexity = classify_task_complexity(todo.content)
+        team = self._get_team(complexity)
+        model = self.model_router.client_for_role("tool_agent", complexity).model
+        
+        run = self.run_repo.create(team_name="투두 처리팀", task=todo.content, model=model)
+        usage = TokenUsageTracker(model=model)
+        with track_model_calls(complexity) as call_log:
+            ai_result = await run_team_task(
+                team, todo.content, run.id, self.msg_repo, usage_tracker=usage, on_message=on_message
+            )
+        
+        # 티어별 지연 시간/비용은 메시지가 아닌 실행 기록의 model_calls에 저장
+        self.run_repo.finish(
+            run.id,
+            status="completed",
+            prompt_tokens=usage.total.prompt_tokens,
+            completion_tokens=usage.total.completion_tokens,
+            max_prompt_tokens=usage.total.max_prompt_tokens,
+            estimated_cost=call_log.estimated_cost,
+            model_calls=call_log.to_dict(),
+        )
         
         # AI 처리 결과를 요약해서 반환 (너무 길면 잘라내기)
         summary_result = ai_result[:200] + "..." if len(ai_result) > 200 else ai_result
@@ -57,5 +96,7 @@ class AIService:
             "success": True, 
             "message": f"투두 '{todo.content}' 처리가 완료되었습니다.",
             "ai_result": summary_result,
-            "full_result": ai_result
+            "full_result": ai_result,
+            "token_usage": usage.to_dict(),
+            "model_calls": call_log.to_dict()
         }
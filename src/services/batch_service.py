@@ -4,7 +4,6 @@
 Notion 배치 작업을 관리하는 서비스입니다.
 """
 
-import asyncio
 import logging
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
@@ -17,12 +16,15 @@ from apscheduler.triggers.interval import IntervalTrigger
 from apscheduler.triggers.date import DateTrigger
 
 from src.core.models import NotionBatchStatus, NotionTodo
+from src.ai.tools.http_client import run_with_http_client
 from src.client.notion_client import get_notion_client, append_completion_message
 from src.core.schemas import NotionBatchStatusRead
 from src.repositories.notion_batch_status import upsert_status, get_status
+from src.core.config import BATCH_PAGE_MAX_TOTAL_TOKENS, NOTION_PROGRESSIVE_RESULTS
 
 from src.services.ai_service import AIService
 from src.services.notion_service import NotionService
+from src.services.notion_progress import NotionProgressReporter
 
 class BatchService:
     """배치 서비스 클래스"""
@@ -93,7 +95,8 @@ class BatchService:
                 "notion_page_id": notion_page_id,
                 "start_time": datetime.utcnow(),
                 "end_time": datetime.utcnow() + timedelta(minutes=15),
-                "status": "running"
+                "status": "running",
+                "token_usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0, "estimated_cost": 0.0}
             }
             self.running_batches[notion_page_id] = batch_info
             
@@ -213,10 +216,14 @@ class BatchService:
             
             # 각 투두 항목 처리
             for todo in pending_todos:
+                if self._is_page_token_budget_exceeded(notion_page_id):
+                    self.logger.warning(f"페이지 토큰 예산 초과로 남은 투두 처리를 보류합니다: {notion_page_id}")
+                    break
                 try:
                     # TODO: 실제 작업 로직 구현
                     # 여기서는 간단히 상태를 done으로 변경
-                    self._process_todo_item(todo)
+                    result = self._process_todo_item(todo)
+                    self._add_page_token_usage(notion_page_id, result.get("token_usage"))
                     
                 except Exception as e:
                     self.logger.error(f"투두 처리 중 오류: {todo.block_id}, {str(e)}")
@@ -243,28 +250,54 @@ class BatchService:
                 datetime.utcnow()
             )
     
-    def _process_todo_item(self, todo: NotionTodo):
+    def _add_page_token_usage(self, notion_page_id: str, token_usage: Optional[Dict[str, Any]]):
+        """페이지별 누적 토큰 사용량에 투두 처리 사용량을 더합니다."""
+        batch_info = self.running_batches.get(notion_page_id)
+        if not batch_info or not token_usage:
+            return
+        
+        page_usage = batch_info["token_usage"]
+        for key in ("prompt_tokens", "completion_tokens", "total_tokens", "estimated_cost"):
+            page_usage[key] += token_usage.get(key, 0)
+        
+        self.logger.info(f"페이지 토큰 사용량: {notion_page_id}, 누적 {page_usage['total_tokens']} 토큰")
+    
+    def _is_page_token_budget_exceeded(self, notion_page_id: str) -> bool:
+        """페이지별 누적 토큰 사용량이 예산을 넘었는지 확인합니다."""
+        if BATCH_PAGE_MAX_TOTAL_TOKENS <= 0:
+            return False
+        batch_info = self.running_batches.get(notion_page_id)
+        if not batch_info:
+            return False
+        return batch_info["token_usage"]["total_tokens"] >= BATCH_PAGE_MAX_TOTAL_TOKENS
+    
+    def _process_todo_item(self, todo: NotionTodo) -> Dict[str, Any]:
         """
         개별 투두 항목을 처리합니다.
         
         Args:
             todo (NotionTodo): 처리할 투두 항목
+            
+        Returns:
+            Dict: AI 처리 결과 (token_usage 포함)
         """
         try:
             # AI Agent 랭그래프 호출해서 투두 내용을 처리
             self.logger.info(f"투두 라우팅 시작: {todo.content}")
             
-            # 팀 라우팅 실행 (비동기)
-            import asyncio
-            result = asyncio.run(self.ai_service.route_todo_to_agent(todo))
+            if NOTION_PROGRESSIVE_RESULTS:
+                result, append_result = self._run_todo_with_progress(todo)
+            else:
+                # 팀 라우팅 실행 (비동기)
+                result = run_with_http_client(self.ai_service.route_todo_to_agent(todo))
 
-            print(f"투두 처리 결과: {result}")
+                # AI 처리 결과를 Notion에 추가
+                ai_summary = result.get('ai_result', 'AI 처리 완료')
+                completion_message = f"{todo.content} 투두 처리 결과:\n{ai_summary}"
+                
+                append_result = append_completion_message(todo.block_id, completion_message)
 
-            # AI 처리 결과를 Notion에 추가
-            ai_summary = result.get('ai_result', 'AI 처리 완료')
-            completion_message = f"{todo.content} 투두 처리 결과:\n{ai_summary}"
-            
-            append_result = append_completion_message(todo.block_id, completion_message)
+            print(f"투두 처리 결과: {result}")
             
             if append_result.get('success'):
                 self.logger.info(f"Notion에 AI 처리 결과 추가 성공: {todo.block_id}")
@@ -278,11 +311,41 @@ class BatchService:
             self.db.commit()
             
             self.logger.info(f"투두 처리 완료: {todo.block_id}")
+            return result
             
         except Exception as e:
             self.logger.error(f"투두 처리 실패: {todo.block_id}, {str(e)}")
             raise
     
+    def _run_todo_with_progress(self, todo: NotionTodo):
+        """
+        진행 상황 콜아웃을 먼저 만들고 팀 실행 중 주기적으로 갱신한 뒤,
+        완료 시 전체 결과를 콜아웃의 하위 블록으로 기록합니다.
+        
+        Args:
+            todo (NotionTodo): 처리할 투두 항목
+            
+        Returns:
+            Tuple[Dict, Dict]: (AI 처리 결과, Notion 기록 결과)
+        """
+        reporter = NotionProgressReporter(todo.block_id, todo.content)
+        reporter.start()
+        
+        async def run_and_report():
+            # 백그라운드 중간 갱신은 루프가 끝나면 취소되므로 완료/실패 보고도 같은 루프에서 처리
+            try:
+                result = await self.ai_service.route_todo_to_agent(todo, on_message=reporter.on_message)
+            except Exception as e:
+                await reporter.fail(str(e))
+                raise
+            return result, await reporter.finish(result.get('full_result', ''))
+        
+        result, append_result = run_with_http_client(run_and_report())
+        self.logger.info(
+            f"진행 상황 콜아웃 갱신 {reporter.update_count}회, 메시지 {reporter.message_count}개: {todo.block_id}"
+        )
+        return result, append_result
+    
     def _add_completion_message_to_notion(self, notion_page_id: str, block_id: str):
         """
         Notion 페이지에 완료 메시지를 추가합니다.
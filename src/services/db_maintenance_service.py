@@ -0,0 +1,139 @@
+"""
+DB 정리 서비스
+
+주기적으로 오래된 에이전트 메시지를 압축 보관하고 VACUUM/ANALYZE로 DB를 정리합니다.
+(app.db를 공유하는 여러 컨테이너 중 백엔드 API 프로세스에서만 실행)
+"""
+
+import logging
+import threading
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.triggers.interval import IntervalTrigger
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from src.core.config import AGENT_MESSAGE_ARCHIVE_AFTER_DAYS, DB_MAINTENANCE_INTERVAL_HOURS
+from src.core.db import SessionLocal, engine
+from src.repositories.agent_message_archive import (
+    ArchiveUnavailableError,
+    archive_messages,
+    archive_summary,
+    compact_database,
+)
+
+_JOB_ID = "db_maintenance"
+
+
+class DBMaintenanceService:
+    """메시지 보관 + DB 정리 작업 관리"""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        db_engine: Engine = engine,
+        interval_hours: float = DB_MAINTENANCE_INTERVAL_HOURS,
+    ):
+        self.session_factory = session_factory
+        self.engine = db_engine
+        self.interval_hours = interval_hours
+        self.logger = logging.getLogger(__name__)
+        self.scheduler: Optional[BackgroundScheduler] = None
+        self.last_result: Optional[Dict[str, Any]] = None
+        # 예약 실행과 수동 실행이 겹치지 않도록 함
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        """정리 작업 예약 (interval_hours가 0 이하이면 예약하지 않음)"""
+        if self.interval_hours <= 0 or self.scheduler is not None:
+            return
+        self.scheduler = BackgroundScheduler()
+        self.scheduler.add_job(
+            func=self.run,
+            trigger=IntervalTrigger(hours=self.interval_hours),
+            id=_JOB_ID,
+            replace_existing=True,
+            max_instances=1,
+            coalesce=True,
+        )
+        self.scheduler.start()
+        print(f"🧹 [DB 정리] {self.interval_hours:g}시간마다 메시지 보관/DB 정리 작업을 실행합니다.")
+
+    def shutdown(self) -> None:
+        if self.scheduler is not None:
+            self.scheduler.shutdown(wait=False)
+            self.scheduler = None
+
+    def run(self, archive: bool = True, compact: bool = True) -> Dict[str, Any]:
+        """
+        메시지 보관과 DB 정리를 한 번 실행합니다.
+
+        Args:
+            archive: 오래된 메시지 압축 보관 여부 (AGENT_MESSAGE_ARCHIVE_AFTER_DAYS가 0이면 건너뜀)
+            compact: VACUUM/ANALYZE 실행 여부
+
+        Returns:
+            Dict: 보관/정리 결과 (이미 실행 중이면 skipped=True)
+        """
+        if not self._lock.acquire(blocking=False):
+            return {"skipped": True, "message": "DB 정리 작업이 이미 실행 중입니다."}
+        try:
+            result: Dict[str, Any] = {"started_at": datetime.utcnow().isoformat()}
+            if archive and AGENT_MESSAGE_ARCHIVE_AFTER_DAYS > 0:
+                result["archive"] = self._archive()
+            if compact:
+                result["compact"] = compact_database(self.engine)
+            self.last_result = result
+            self.logger.info(f"DB 정리 완료 - {result}")
+            return result
+        except Exception as e:
+            print(f"❌ [DB 정리] 작업 실패: {str(e)}")
+            self.logger.error(f"DB 정리 작업 실패 - 오류: {str(e)}")
+            raise
+        finally:
+            self._lock.release()
+
+    def _archive(self) -> Dict[str, Any]:
+        db = self.session_factory()
+        try:
+            stats = archive_messages(db)
+        except ArchiveUnavailableError as e:
+            print(f"⚠️ [DB 정리] {str(e)}")
+            return {"error": str(e)}
+        finally:
+            db.close()
+        if stats.archived:
+            print(
+                f"🗜️ [메시지 보관] {stats.archived}개 메시지 압축 "
+                f"({stats.original_bytes:,} → {stats.compressed_bytes:,} bytes)"
+            )
+        return stats.to_dict()
+
+    def get_status(self) -> Dict[str, Any]:
+        """보관 현황, 예약 상태, 마지막 실행 결과"""
+        db = self.session_factory()
+        try:
+            summary = archive_summary(db)
+        finally:
+            db.close()
+        job = self.scheduler.get_job(_JOB_ID) if self.scheduler is not None else None
+        return {
+            **summary,
+            "archive_after_days": AGENT_MESSAGE_ARCHIVE_AFTER_DAYS,
+            "interval_hours": self.interval_hours,
+            "next_run_at": job.next_run_time.isoformat() if job and job.next_run_time else None,
+            "last_result": self.last_result,
+        }
+
+
+_db_maintenance_service: Optional[DBMaintenanceService] = None
+
+
+def get_db_maintenance_service() -> DBMaintenanceService:
+    """DB 정리 서비스 인스턴스 반환"""
+    global _db_maintenance_service
+    if _db_maintenance_service is None:
+        _db_maintenance_service = DBMaintenanceService()
+    return _db_maintenance_service
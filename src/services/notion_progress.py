@@ -0,0 +1,122 @@
+"""
+Notion 진행 상황 보고 모듈
+
+투두 처리 팀이 실행되는 동안 투두 블록 아래의 콜아웃을 주기적으로 갱신하고,
+완료 시 전체 결과를 잘리지 않게 하위 블록으로 기록합니다.
+중간 갱신은 백그라운드 태스크로 보내므로 Notion 응답을 기다리느라 팀 스트림 소비가 늦어지지 않습니다.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Optional
+
+from src.client.notion_client import append_text_blocks, create_progress_callout, update_callout
+from src.core.config import NOTION_PROGRESS_PREVIEW_CHARS, NOTION_PROGRESS_UPDATE_INTERVAL_SECONDS
+
+
+class NotionProgressReporter:
+    """투두 하나의 처리 진행 상황을 Notion 콜아웃으로 보고"""
+
+    def __init__(
+        self,
+        block_id: str,
+        title: str,
+        update_interval: float = NOTION_PROGRESS_UPDATE_INTERVAL_SECONDS,
+        preview_chars: int = NOTION_PROGRESS_PREVIEW_CHARS
+    ):
+        self.block_id = block_id
+        self.title = title
+        self.update_interval = update_interval
+        self.preview_chars = preview_chars
+        self.callout_id: Optional[str] = None
+        self.message_count = 0
+        self.update_count = 0
+        self._started_at = time.monotonic()
+        self._last_update_at = 0.0
+        self._latest_source = ""
+        self._latest_content = ""
+        self._pending_update: Optional[asyncio.Task] = None
+        self.logger = logging.getLogger(__name__)
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self._started_at
+
+    def start(self) -> None:
+        """처리 시작 즉시 진행 상황 콜아웃 생성"""
+        self._started_at = time.monotonic()
+        result = create_progress_callout(self.block_id, f"{self.title} 처리 중...")
+        if result.get("success"):
+            self.callout_id = result.get("callout_id")
+            self._last_update_at = time.monotonic()
+        else:
+            self.logger.warning(f"진행 상황 콜아웃 생성 실패: {result.get('message')}")
+
+    async def on_message(self, message: Any) -> None:
+        """
+        팀 스트림 메시지마다 호출되며, update_interval 간격으로만 콜아웃 갱신을 백그라운드로 시작
+        (이전 갱신이 아직 진행 중이면 이번 갱신은 건너뜀)
+        """
+        self.message_count += 1
+        self._latest_source = str(getattr(message, "source", ""))
+        self._latest_content = str(getattr(message, "content", ""))
+
+        if self.callout_id is None:
+            return
+        if time.monotonic() - self._last_update_at < self.update_interval:
+            return
+        if self._pending_update is not None and not self._pending_update.done():
+            return
+
+        self._last_update_at = time.monotonic()
+        self._pending_update = asyncio.create_task(self._update_progress(self._progress_text()))
+
+    async def _update_progress(self, text: str) -> None:
+        # 동기 Notion 클라이언트가 이벤트 루프를 막지 않도록 스레드에서 호출
+        try:
+            result = await asyncio.to_thread(update_callout, self.callout_id, text)
+        except Exception as e:
+            self.logger.warning(f"진행 상황 콜아웃 갱신 실패: {str(e)}")
+            return
+        if result.get("success"):
+            self.update_count += 1
+        else:
+            self.logger.warning(f"진행 상황 콜아웃 갱신 실패: {result.get('message')}")
+
+    async def _wait_pending_update(self) -> None:
+        """진행 중인 중간 갱신이 끝날 때까지 대기 (완료/실패 표시가 중간 갱신에 덮어써지지 않도록)"""
+        if self._pending_update is not None:
+            await self._pending_update
+            self._pending_update = None
+
+    def _progress_text(self) -> str:
+        preview = " ".join(self._latest_content.split())
+        if len(preview) > self.preview_chars:
+            preview = preview[:self.preview_chars] + "..."
+        return (
+            f"{self.title} 처리 중... ({self.message_count}개 메시지, {self.elapsed:.0f}초 경과)\n"
+            f"최근 [{self._latest_source}] {preview}"
+        )
+
+    async def finish(self, full_result: str) -> dict:
+        """마지막 중간 갱신을 기다린 뒤 완료 표시로 콜아웃을 바꾸고 전체 결과를 하위 블록으로 추가"""
+        await self._wait_pending_update()
+        header = f"{self.title} 투두 처리 결과 ({self.elapsed:.0f}초)"
+        if self.callout_id is not None:
+            await asyncio.to_thread(update_callout, self.callout_id, header, emoji="🤖")
+        else:
+            # 시작 시 콜아웃 생성에 실패했으면 지금 생성
+            created = await asyncio.to_thread(create_progress_callout, self.block_id, header, emoji="🤖")
+            if not created.get("success") or not created.get("callout_id"):
+                return created
+            self.callout_id = created["callout_id"]
+
+        return await asyncio.to_thread(append_text_blocks, self.callout_id, full_result or "AI 처리 완료")
+
+    async def fail(self, error: str) -> None:
+        """마지막 중간 갱신을 기다린 뒤 처리 실패를 콜아웃에 표시"""
+        await self._wait_pending_update()
+        if self.callout_id is None:
+            return
+        await asyncio.to_thread(update_callout, self.callout_id, f"{self.title} 처리 실패: {error}", emoji="⚠️")
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+에이전트 로그 저장소 테스트
+
+마이그레이션을 적용한 임시 SQLite DB에서 확인합니다.
+- 메시지 비동기 기록기(write-behind)가 메시지를 모아 저장하고 run 카운터를 함께 갱신하는지
+- 쓰기 시점에 증분 갱신한 롤업 행이 실행/메시지 행에서 다시 계산한 값(rebuild_run_rollups)과 같은지
+- 메시지 저장/보관 처리 후에도 전문 검색 결과가 트리거로 동기화되고, 보관된 메시지도 계속 검색되는지
+- zstd로 보관 처리한 메시지를 list_by_run으로 조회하면 원문이 그대로 복원되는지
+
+실행 방법:
+    python test_agent_log_storage.py
+    python -m pytest test_agent_log_storage.py
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterator, Tuple
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from src.core import models as orm
+from src.core.db import create_db_engine, run_migrations
+from src.repositories.agent_log_search import AgentLogSearchRepository, ensure_search_index
+from src.repositories.agent_logs import AgentMessageRepository, AgentRunRepository
+from src.repositories.agent_message_archive import archive_messages, archive_summary
+from src.repositories.agent_message_writer import AgentMessageWriter
+from src.repositories.agent_run_rollups import TOTAL_BUCKET_START, rebuild_run_rollups
+
+SessionFactory = Callable[[], Session]
+
+
+@contextmanager
+def storage_db() -> Iterator[SessionFactory]:
+    """마이그레이션과 전문 검색 인덱스를 적용한 임시 SQLite DB의 세션 팩토리"""
+    with tempfile.TemporaryDirectory(prefix="agent_log_storage_") as tmp_dir:
+        db_engine = create_db_engine(f"sqlite:///{os.path.join(tmp_dir, 'storage.db')}")
+        run_migrations(db_engine=db_engine)
+        assert ensure_search_index(db_engine), "전문 검색 인덱스를 만들지 못했습니다"
+        try:
+            yield sessionmaker(bind=db_engine, autocommit=False, autoflush=False)
+        finally:
+            db_engine.dispose()
+
+
+@contextmanager
+def message_writer(session_factory: SessionFactory, batch_size: int = 4) -> Iterator[AgentMessageWriter]:
+    writer = AgentMessageWriter(session_factory=session_factory, batch_size=batch_size, flush_interval=0.05)
+    try:
+        yield writer
+    finally:
+        writer.close()
+
+
+def enqueue_messages(db: Session, writer: AgentMessageWriter, run_id: int, contents) -> None:
+    """메시지를 기록기 큐에 넣고 저장이 끝날 때까지 기다림"""
+    repo = AgentMessageRepository(db, writer=writer)
+    for index, content in enumerate(contents):
+        repo.enqueue(run_id, agent_name=f"agent_{index % 2}", role="assistant", content=content)
+    assert asyncio.run(repo.flush(run_id)), "메시지 저장 대기 시간 초과"
+
+
+def test_writer_flush_persists_rows_and_counters():
+    contents = [f"메시지 {index} " + "내용" * index for index in range(10)]
+    with storage_db() as session_factory, message_writer(session_factory) as writer:
+        db = session_factory()
+        try:
+            run = AgentRunRepository(db).create("writer_team", "기록기 테스트")
+            enqueue_messages(db, writer, run.id, contents)
+
+            messages = AgentMessageRepository(db, writer=writer).list_by_run(run.id)
+            assert [message.content for message in messages] == contents
+            assert [message.agent_name for message in messages][:2] == ["agent_0", "agent_1"]
+
+            db.expire_all()
+            run = db.get(orm.AgentRun, run.id)
+            assert run.message_count == len(contents)
+            assert run.total_chars == sum(len(content) for content in contents)
+
+            stats = writer.get_stats()
+            assert stats["enqueued"] == stats["written"] == len(contents)
+            assert stats["dropped"] == 0 and stats["pending"] == 0
+            # batch_size(4)개씩 묶어 저장
+            assert 3 <= stats["batches"] < len(contents)
+            assert db.execute(select(func.count(orm.AgentMessage.id))).scalar() == len(contents)
+        finally:
+            db.close()
+
+
+def rollup_snapshot(db: Session) -> Dict[Tuple[Any, ...], Tuple[Any, ...]]:
+    """롤업 행을 키별 값으로 정리 (상태가 바뀌어 모든 값이 0이 된 행은 제외)"""
+    rollup = orm.AgentRunRollup
+    snapshot = {}
+    for row in db.execute(select(rollup)).scalars().all():
+        values = (
+            row.run_count,
+            row.finished_count,
+            row.message_count,
+            row.total_chars,
+            row.prompt_tokens,
+            row.completion_tokens,
+            row.total_tokens,
+            round(row.estimated_cost or 0.0, 6),
+            round(row.total_duration_seconds or 0.0, 3),
+        )
+        if any(values):
+            snapshot[(row.granularity, row.bucket_start, row.team_name, row.status)] = values
+    return snapshot
+
+
+def test_rollups_match_rebuild_after_finish():
+    with storage_db() as session_factory, message_writer(session_factory) as writer:
+        db = session_factory()
+        try:
+            runs = AgentRunRepository(db)
+            finished = [
+                ("team_a", "completed", 120, 30, 0.012),
+                ("team_a", "failed", None, None, None),
+                ("team_b", "completed", 200, 50, 0.02),
+            ]
+            for index, (team_name, status, prompt_tokens, completion_tokens, cost) in enumerate(finished):
+                run = runs.create(team_name, f"작업 {index}")
+                enqueue_messages(db, writer, run.id, [f"{team_name} 메시지 {n}" for n in range(index + 3)])
+                # 동기 저장 경로도 같은 카운터/롤업을 갱신
+                AgentMessageRepository(db, writer=writer).add(run.id, "user", "user", "동기 저장 메시지")
+                runs.finish(
+                    run.id,
+                    status=status,
+                    prompt_tokens=prompt_tokens,
+                    completion_tokens=completion_tokens,
+                    estimated_cost=cost,
+                )
+            # 끝나지 않은 실행도 running 상태 행에 기여
+            running = runs.create("team_b", "진행 중인 작업")
+            enqueue_messages(db, writer, running.id, ["진행 중 메시지"])
+
+            db.expire_all()
+            incremental = rollup_snapshot(db)
+            statistics = runs.team_statistics("team_a")
+
+            rebuilt = rebuild_run_rollups(db)
+            db.expire_all()
+            assert rebuilt == len(finished) + 1
+            expected = rollup_snapshot(db)
+            mismatched = sorted(key for key in incremental.keys() | expected.keys() if incremental.get(key) != expected.get(key))
+            assert not mismatched, f"증분 롤업과 재계산 결과가 다른 행: {mismatched}"
+
+            assert statistics["runs_by_status"] == {"completed": 1, "failed": 1}
+            assert statistics["total_messages"] == (3 + 1) + (4 + 1)
+            # (run_count, finished_count, message_count) + 토큰 집계
+            completed_b = incremental[("total", TOTAL_BUCKET_START, "team_b", "completed")]
+            assert completed_b[:3] == (1, 1, 5 + 1) and completed_b[4:7] == (200, 50, 250)
+            assert incremental[("total", TOTAL_BUCKET_START, "team_b", "running")][:3] == (1, 0, 1)
+        finally:
+            db.close()
+
+
+def archive_all(db: Session, min_chars: int = 1):
+    """방금 저장한 메시지까지 모두 보관 처리"""
+    return archive_messages(db, older_than=datetime.utcnow() + timedelta(seconds=1), min_chars=min_chars)
+
+
+def test_search_index_follows_insert_and_archive():
+    with storage_db() as session_factory, message_writer(session_factory) as writer:
+        db = session_factory()
+        try:
+            run = AgentRunRepository(db).create("search_team", "마라톤 대회 기록 분석")
+            enqueue_messages(db, writer, run.id, [
+                "마라톤에 참가한 선수 기록을 정리했습니다 " + "세부 내용 " * 20,
+                "짧은 수영 메모",
+            ])
+            search = AgentLogSearchRepository(db)
+
+            hits = search.search("마라톤 기록")
+            assert [hit["run_id"] for hit in hits] == [run.id]
+            assert "<mark>" in hits[0]["snippet"]
+            assert [hit["run_id"] for hit in search.search("마라톤", target="runs")] == [run.id]
+            assert len(search.search("수영", run_id=run.id)) == 1
+            assert search.search("수영", team_name="other_team") == []
+
+            # 나중에 저장한 메시지도 바로 검색됨
+            enqueue_messages(db, writer, run.id, ["자전거 구간 추가"])
+            assert len(search.search("자전거")) == 1
+
+            # 보관 처리(content 비움)한 긴 메시지도 계속 검색되고, 스니펫은 압축 원문에서 만듦
+            stats = archive_all(db, min_chars=50)
+            assert stats.archived == 1
+            hits = search.search("마라톤 기록")
+            assert len(hits) == 1 and hits[0]["snippet"].startswith("<mark>마라톤에</mark>")
+            assert len(search.search("마라톤", sort="recent", run_id=run.id)) == 1
+            assert len(search.search("수영")) == 1
+            assert len(search.search("마라톤", target="runs")) == 1
+            # 보관 메시지와 일반 메시지가 함께 검색되고 정렬 기준대로 합쳐짐
+            enqueue_messages(db, writer, run.id, ["마라톤 완주 후기"])
+            recent = search.search("마라톤", sort="recent")
+            assert [hit["message_id"] for hit in recent] == sorted((hit["message_id"] for hit in recent), reverse=True)
+            assert len(recent) == 2 and all("<mark>" in hit["snippet"] for hit in recent)
+            assert len(search.search("마라톤", limit=1, offset=1)) == 1
+
+            # 보관된 메시지를 지우면 보관 검색 인덱스에서도 빠짐
+            db.query(orm.AgentMessage).filter(orm.AgentMessage.content == "").delete()
+            db.commit()
+            assert [hit["message_id"] for hit in search.search("마라톤")] == [recent[0]["message_id"]]
+        finally:
+            db.close()
+
+
+def test_archive_round_trip_through_list_by_run():
+    contents = [f"보관 메시지 {index}: " + "반복되는 도구 결과 " * (index * 10) for index in range(6)]
+    with storage_db() as session_factory, message_writer(session_factory) as writer:
+        db = session_factory()
+        try:
+            run = AgentRunRepository(db).create("archive_team", "보관 테스트")
+            enqueue_messages(db, writer, run.id, contents)
+
+            stats = archive_all(db, min_chars=100)
+            archived_count = sum(len(content) >= 100 for content in contents)
+            assert stats.archived == archived_count
+            assert stats.compressed_bytes < stats.original_bytes
+            # 이미 보관한 메시지는 다시 처리하지 않음
+            assert archive_all(db, min_chars=100).archived == 0
+
+            summary = archive_summary(db)
+            assert summary["archived_messages"] == archived_count
+            assert summary["hot_messages"] == len(contents) - archived_count
+
+            db.expire_all()
+            message = orm.AgentMessage
+            stored = db.execute(
+                select(message.content, message.content_zstd).where(message.run_id == run.id).order_by(message.id)
+            ).all()
+            assert sum(content == "" and blob is not None for content, blob in stored) == archived_count
+
+            repo = AgentMessageRepository(db, writer=writer)
+            assert [item.content for item in repo.list_by_run(run.id)] == contents
+            # 페이지 단위 조회도 원문으로 복원되고, 복원한 값은 변경으로 저장되지 않음
+            first_page = repo.list_by_run(run.id, limit=3)
+            second_page = repo.list_by_run(run.id, cursor=(first_page[-1].created_at, first_page[-1].id))
+            assert [item.content for item in first_page + second_page] == contents
+            db.commit()
+            assert archive_summary(db)["archived_messages"] == archived_count
+        finally:
+            db.close()
+
+
+TESTS = [
+    test_writer_flush_persists_rows_and_counters,
+    test_rollups_match_rebuild_after_finish,
+    test_search_index_follows_insert_and_archive,
+    test_archive_round_trip_through_list_by_run,
+]
+
+
+def main() -> None:
+    print("=" * 80)
+    print("🗄️ 에이전트 로그 저장소 테스트")
+    print("=" * 80)
+    failed = 0
+    for test in TESTS:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {test.__name__}: {e}")
+    print("=" * 80)
+    if failed:
+        print(f"❌ {failed}개 테스트 실패")
+        sys.exit(1)
+    print("✅ 모든 테스트 통과")
+
+
+if __name__ == "__main__":
+    main()
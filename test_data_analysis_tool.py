@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+배치 분석 도구 테스트
+
+연간 수치처럼 year/date 열이 있는 CSV, JSON 레코드 입력에서 라벨 열이 데이터 계열로 분석되지 않고
+인덱스로 사용되는지, 실제 데이터 열의 지표가 올바르게 계산되는지 확인합니다.
+
+실행 방법:
+    python test_data_analysis_tool.py
+    python -m pytest test_data_analysis_tool.py
+"""
+
+import json
+import os
+import sys
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from src.ai.tools.data_analysis_tool import batch_analysis_tool
+
+ANNUAL_CSV = "year,revenue,profit\n2021,100,10\n2022,110,12\n2023,121,15\n"
+ANNUAL_RECORDS = [
+    {"date": "2021", "revenue": "100"},
+    {"date": "2022", "revenue": "110"},
+    {"date": "2023", "revenue": "121"},
+]
+
+
+def analyze(data: str, metrics: str = "all") -> dict:
+    output = batch_analysis_tool(data, metrics=metrics)
+    assert output.startswith("{"), output
+    return json.loads(output)
+
+
+def test_csv_year_column_is_index():
+    result = analyze(ANNUAL_CSV)
+    assert set(result["columns"]) == {"revenue", "profit"}
+    revenue = result["columns"]["revenue"]
+    assert revenue["cagr_pct"] == 10.0
+    assert list(revenue["pct_change"]) == ["2021", "2022", "2023"]
+    assert set(result["correlation"]) == {"revenue", "profit"}
+
+
+def test_records_date_column_is_index():
+    result = analyze(json.dumps(ANNUAL_RECORDS), metrics="pct_change,cagr,drawdown")
+    assert set(result["columns"]) == {"revenue"}
+    revenue = result["columns"]["revenue"]
+    assert revenue["cagr_pct"] == 10.0
+    assert revenue["pct_change"] == {"2021": None, "2022": 10.0, "2023": 10.0}
+    assert revenue["max_drawdown_at"] == "2021"
+
+
+def test_records_numeric_year_column_is_index():
+    records = [{"연도": 2021 + i, "매출": value} for i, value in enumerate((100, 110, 121))]
+    result = analyze(json.dumps(records, ensure_ascii=False), metrics="pct_change")
+    assert set(result["columns"]) == {"매출"}
+    assert list(result["columns"]["매출"]["pct_change"]) == ["2021", "2022", "2023"]
+
+
+def test_unnamed_consecutive_integer_column_is_index():
+    result = analyze("n,price\n1,100\n2,90\n3,120\n", metrics="pct_change")
+    assert set(result["columns"]) == {"price"}
+    assert list(result["columns"]["price"]["pct_change"]) == ["1", "2", "3"]
+
+
+def test_plain_numeric_columns_are_data():
+    result = analyze("a,b\n1,10\n2,11\n", metrics="pct_change")
+    assert set(result["columns"]) == {"a", "b"}
+    result = analyze("[100, 110, 121]", metrics="cagr")
+    assert result["columns"]["value"]["cagr_pct"] == 10.0
+
+
+def main() -> None:
+    print("=" * 80)
+    print("📊 배치 분석 도구 테스트")
+    print("=" * 80)
+    tests = [
+        test_csv_year_column_is_index,
+        test_records_date_column_is_index,
+        test_records_numeric_year_column_is_index,
+        test_unnamed_consecutive_integer_column_is_index,
+        test_plain_numeric_columns_are_data,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {test.__name__}: {e}")
+    print("=" * 80)
+    if failed:
+        print(f"❌ {failed}개 테스트 실패")
+        sys.exit(1)
+    print("✅ 모든 테스트 통과")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+페이지 본문 추출 파서 테스트
+
+fetch_page_text는 응답을 네트워크 청크 단위로 파서에 넣습니다.
+HTML을 작은 청크로 나눠 넣어도 한 번에 넣은 것과 같은 텍스트가 나오는지(청크 경계에서 단어가 갈라지지 않는지) 확인합니다.
+배치처럼 여러 스레드가 각자 asyncio.run으로 루프를 돌릴 때 호스트별 요청 제한이 루프마다 따로 유지되는지도 확인합니다.
+
+실행 방법:
+    python test_page_fetcher.py
+    python -m pytest test_page_fetcher.py
+"""
+
+import asyncio
+import os
+import sys
+import threading
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from src.ai.tools.page_fetcher import HostRateLimiter, _TextExtractor
+
+SAMPLE_HTML = (
+    "<html><head><title>무시되는 제목</title><style>body { color: red; }</style></head>"
+    "<body><h1>Hello world,</h1><p>this is a test of chunk&nbsp;boundaries &amp; entities.</p>"
+    "<script>var skipped = 'script text';</script>"
+    "<div>첫째 단락</div><div>둘째</div><ul><li>항목1</li><li>항목2</li></ul>"
+    "<p>굵은<b>글씨</b>는 한 단어이고 줄바꿈<br>뒤는 새 단어입니다.</p></body></html>"
+)
+EXPECTED_TEXT = (
+    "Hello world, this is a test of chunk boundaries & entities. "
+    "첫째 단락 둘째 항목1 항목2 굵은글씨는 한 단어이고 줄바꿈 뒤는 새 단어입니다."
+)
+
+
+def extract(html: str, chunk_size: int, max_chars: int = 10_000) -> str:
+    """html을 chunk_size 글자씩 나눠 파서에 넣고 추출한 텍스트를 반환"""
+    extractor = _TextExtractor(max_chars)
+    for start in range(0, len(html), chunk_size):
+        extractor.feed(html[start:start + chunk_size])
+        if extractor.done:
+            break
+    extractor.close()
+    return extractor.text
+
+
+def test_whole_document():
+    assert extract(SAMPLE_HTML, len(SAMPLE_HTML)) == EXPECTED_TEXT
+
+
+def test_small_chunks_keep_words_intact():
+    for chunk_size in range(1, 12):
+        text = extract(SAMPLE_HTML, chunk_size)
+        assert text == EXPECTED_TEXT, f"청크 {chunk_size}자: {text!r}"
+
+
+def test_plain_text_chunks():
+    sentence = "Hello world, this is a test of chunk"
+    for chunk_size in (3, 5, 7):
+        assert extract(sentence, chunk_size) == sentence
+
+
+def test_max_chars_stops_at_word():
+    for chunk_size in (1, 4, len(SAMPLE_HTML)):
+        text = extract(SAMPLE_HTML, chunk_size, max_chars=20)
+        assert text == "Hello world, this is", f"청크 {chunk_size}자: {text!r}"
+
+
+def test_host_limiter_per_loop_threads():
+    limiter = HostRateLimiter(per_host_concurrency=1, min_interval=0.0)
+    errors = []
+    active = {}
+
+    async def use_host(host: str) -> None:
+        for _ in range(20):
+            semaphore = await limiter.acquire(host)
+            try:
+                active[host] = active.get(host, 0) + 1
+                assert active[host] == 1, f"{host} 동시 요청 {active[host]}개"
+                await asyncio.sleep(0)
+            finally:
+                active[host] -= 1
+                semaphore.release()
+
+    def worker(host: str) -> None:
+        # 스레드마다 루프를 여러 번 새로 만들어 다른 스레드의 루프 전환과 겹치게 함
+        try:
+            for _ in range(5):
+                asyncio.run(use_host(host))
+        except Exception as e:  # noqa: BLE001 - 스레드 예외를 메인 스레드로 전달
+            errors.append(repr(e))
+
+    threads = [threading.Thread(target=worker, args=(f"h{index}",)) for index in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors, errors
+
+
+def main() -> None:
+    print("=" * 80)
+    print("📄 페이지 본문 추출 파서 테스트")
+    print("=" * 80)
+    tests = [
+        test_whole_document,
+        test_small_chunks_keep_words_intact,
+        test_plain_text_chunks,
+        test_max_chars_stops_at_word,
+        test_host_limiter_per_loop_threads,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {test.__name__}: {e}")
+    print("=" * 80)
+    if failed:
+        print(f"❌ {failed}개 테스트 실패")
+        sys.exit(1)
+    print("✅ 모든 테스트 통과")
+
+
+if __name__ == "__main__":
+    main()
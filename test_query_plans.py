@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+핫 쿼리 실행 계획 회귀 테스트
+
+마이그레이션을 적용한 임시 SQLite DB에 샘플 데이터를 넣고, 리포지토리/서비스가 실제로 실행하는 조회문을
+EXPLAIN QUERY PLAN으로 확인합니다. 핫 쿼리가 인덱스 검색(SEARCH) 대신 테이블/인덱스 전체를 읽거나(SCAN <테이블>)
+인덱스 순서 대신 임시 B-트리로 정렬하면 실패합니다.
+
+ANALYZE 통계가 없을 때(새 DB)와 있을 때(DB 정리 작업 후) 두 번 확인합니다.
+
+실행 방법:
+    python test_query_plans.py
+    python -m pytest test_query_plans.py
+"""
+
+import os
+import re
+import sys
+import tempfile
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Callable, Iterator, List, Tuple
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import event, insert
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from src.core import models as orm
+from src.core.db import create_db_engine, run_migrations
+from src.repositories import notion_batch_status
+from src.repositories.agent_logs import AgentMessageRepository, AgentRunRepository
+
+TEAMS = 5
+RUNS_PER_TEAM = 200
+MESSAGES_PER_RUN = 10
+PAGES = 50
+TODOS_PER_PAGE = 30
+
+
+@dataclass
+class HotQuery:
+    """확인할 핫 쿼리"""
+    name: str
+    run: Callable[[Session], Any]
+    # 조건 없이 정렬 순서대로 LIMIT만큼 읽는 목록: 인덱스 전체 스캔(SCAN ... USING INDEX) 허용
+    allow_index_scan: bool = False
+    # 인덱스로 좁힌 범위 안에서의 정렬(집계/백분위 등) 허용
+    allow_sort: bool = False
+
+
+HOT_QUERIES: List[HotQuery] = [
+    HotQuery("실행 목록 (최신순)", lambda db: AgentRunRepository(db).list_summaries(limit=50), allow_index_scan=True),
+    HotQuery(
+        "실행 목록 (다음 페이지)",
+        lambda db: AgentRunRepository(db).list_summaries(limit=50, cursor=(datetime(2026, 1, 2), 500)),
+        allow_index_scan=True,
+    ),
+    HotQuery("실행 목록 (팀별)", lambda db: AgentRunRepository(db).list_summaries(team_name="team_1", limit=50)),
+    HotQuery("실행 메시지", lambda db: AgentMessageRepository(db).list_by_run(123, limit=50)),
+    HotQuery(
+        "실행 메시지 (다음 페이지)",
+        lambda db: AgentMessageRepository(db).list_by_run(123, limit=50, cursor=(datetime(2026, 1, 1), 1230)),
+    ),
+    HotQuery("팀 통계 (누적)", lambda db: AgentRunRepository(db).team_statistics("team_1"), allow_sort=True),
+    HotQuery(
+        "팀 통계 (기간)",
+        lambda db: AgentRunRepository(db).team_statistics("team_1", since=datetime(2026, 1, 1, 12)),
+        allow_sort=True,
+    ),
+    # BatchService.run_cycle의 pending 투두 조회
+    HotQuery(
+        "pending 투두",
+        lambda db: db.query(orm.NotionTodo).filter(
+            orm.NotionTodo.notion_page_id == "page_7",
+            orm.NotionTodo.status == "pending",
+            orm.NotionTodo.checked == "false",
+        ).all(),
+    ),
+    # NotionService.get_page_todos_from_db의 페이지 투두 목록
+    HotQuery(
+        "페이지 투두 목록",
+        lambda db: db.query(orm.NotionTodo).filter(
+            orm.NotionTodo.notion_page_id == "page_7"
+        ).order_by(orm.NotionTodo.block_index).all(),
+    ),
+    HotQuery("페이지 배치 상태", lambda db: notion_batch_status.get_status(db, "page_7")),
+    HotQuery(
+        "페이지 배치 상태 (여러 페이지)",
+        lambda db: notion_batch_status.get_status_map_by_page_ids(db, ["page_1", "page_2", "page_3"]),
+        allow_sort=True,
+    ),
+]
+
+# SCAN <테이블> (테이블 전체) / SCAN <테이블> USING [COVERING] INDEX <인덱스> (인덱스 전체)
+_SCAN = re.compile(r"^SCAN (\w+)( USING (COVERING )?INDEX)?")
+
+
+def build_sample_db(path: str) -> Engine:
+    """마이그레이션을 적용한 SQLite DB에 샘플 실행/메시지/투두를 채움"""
+    db_engine = create_db_engine(f"sqlite:///{path}")
+    run_migrations(db_engine=db_engine)
+
+    started = datetime(2026, 1, 1)
+    runs, messages = [], []
+    for index in range(TEAMS * RUNS_PER_TEAM):
+        run_id = index + 1
+        started_at = started + timedelta(minutes=index)
+        runs.append({
+            "id": run_id,
+            "team_name": f"team_{index % TEAMS}",
+            "task": f"작업 {run_id}",
+            "started_at": started_at,
+            "ended_at": started_at + timedelta(seconds=30),
+            "status": "completed" if index % 10 else "failed",
+            "message_count": MESSAGES_PER_RUN,
+            "total_chars": MESSAGES_PER_RUN * 20,
+            "duration_seconds": 30.0 + index % 17,
+        })
+        for offset in range(MESSAGES_PER_RUN):
+            messages.append({
+                "run_id": run_id,
+                "agent_name": f"agent_{offset % 3}",
+                "role": "assistant",
+                "content": f"메시지 {run_id}-{offset}",
+                "created_at": started_at + timedelta(seconds=offset),
+            })
+
+    statuses, todos = [], []
+    for page in range(PAGES):
+        page_id = f"page_{page}"
+        statuses.append({"notion_page_id": page_id, "status": "idle", "created_at": started, "updated_at": started})
+        for block in range(TODOS_PER_PAGE):
+            todos.append({
+                "notion_page_id": page_id,
+                "block_id": f"{page_id}_block_{block}",
+                "content": f"투두 {block}",
+                "checked": "true" if block % 3 == 0 else "false",
+                "status": ("pending", "skipped", "done")[block % 3],
+                "block_index": block,
+                "created_at": started,
+                "updated_at": started,
+            })
+
+    with db_engine.begin() as conn:
+        conn.execute(insert(orm.AgentRun), runs)
+        conn.execute(insert(orm.AgentMessage), messages)
+        conn.execute(insert(orm.NotionBatchStatus), statuses)
+        conn.execute(insert(orm.NotionTodo), todos)
+    return db_engine
+
+
+@contextmanager
+def capture_selects(db_engine: Engine) -> Iterator[List[Tuple[str, Any]]]:
+    """블록 안에서 실행된 SELECT 문과 파라미터를 기록"""
+    captured: List[Tuple[str, Any]] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):  # noqa: ARG001
+        if statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            captured.append((statement, parameters))
+
+    event.listen(db_engine, "before_cursor_execute", _record)
+    try:
+        yield captured
+    finally:
+        event.remove(db_engine, "before_cursor_execute", _record)
+
+
+def explain(db_engine: Engine, statement: str, parameters: Any) -> List[str]:
+    with db_engine.connect() as conn:
+        return [row[-1] for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()]
+
+
+def plan_problems(plan: List[str], query: HotQuery) -> List[str]:
+    """실행 계획에서 전체 스캔과 (허용하지 않은 경우) 정렬용 임시 B-트리를 찾음"""
+    tables = set(orm.Base.metadata.tables)
+    problems = []
+    for detail in plan:
+        match = _SCAN.match(detail.strip())
+        if match and match.group(1) in tables:
+            if not match.group(2):
+                problems.append(f"테이블 전체 스캔: {detail}")
+            elif not query.allow_index_scan:
+                problems.append(f"인덱스 전체 스캔: {detail}")
+        elif not query.allow_sort and "USE TEMP B-TREE FOR ORDER BY" in detail:
+            problems.append(f"인덱스 없이 정렬: {detail}")
+    return problems
+
+
+def check_hot_queries(db_engine: Engine, verbose: bool = False) -> List[str]:
+    """모든 핫 쿼리의 실행 계획을 확인하고 문제 목록을 반환"""
+    session_factory = sessionmaker(bind=db_engine, autocommit=False, autoflush=False)
+    failures = []
+    for query in HOT_QUERIES:
+        db = session_factory()
+        try:
+            with capture_selects(db_engine) as captured:
+                query.run(db)
+        finally:
+            db.close()
+        if not captured:
+            failures.append(f"[{query.name}] 실행된 조회문이 없습니다.")
+        for statement, parameters in captured:
+            plan = explain(db_engine, statement, parameters)
+            problems = plan_problems(plan, query)
+            if verbose:
+                print(f"{'❌' if problems else '✅'} {query.name}")
+                for detail in plan:
+                    print(f"     {detail}")
+            failures += [f"[{query.name}] {problem}\n    {' '.join(statement.split())}" for problem in problems]
+    return failures
+
+
+def run_plan_checks(verbose: bool = False) -> List[str]:
+    """통계 없는 새 DB와 ANALYZE 후 DB에서 각각 확인"""
+    with tempfile.TemporaryDirectory(prefix="query_plans_") as tmp_dir:
+        db_engine = build_sample_db(os.path.join(tmp_dir, "plans.db"))
+        try:
+            failures = []
+            for label in ("통계 없음", "ANALYZE 후"):
+                if label == "ANALYZE 후":
+                    with db_engine.begin() as conn:
+                        conn.exec_driver_sql("ANALYZE")
+                if verbose:
+                    print(f"\n📋 [{label}]")
+                failures += [f"({label}) {failure}" for failure in check_hot_queries(db_engine, verbose)]
+            return failures
+        finally:
+            db_engine.dispose()
+
+
+def test_hot_queries_use_indexes():
+    failures = run_plan_checks()
+    assert not failures, "\n".join(failures)
+
+
+def main() -> None:
+    print("=" * 80)
+    print("🔍 핫 쿼리 실행 계획 확인 (SQLite EXPLAIN QUERY PLAN)")
+    print("=" * 80)
+    failures = run_plan_checks(verbose=True)
+    print("\n" + "=" * 80)
+    if failures:
+        print(f"❌ 인덱스를 타지 않는 핫 쿼리 {len(failures)}건")
+        for failure in failures:
+            print(f"   - {failure}")
+        sys.exit(1)
+    print("✅ 모든 핫 쿼리가 인덱스를 사용합니다.")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    main()